@@ -0,0 +1,473 @@
+# ai_entity_system.py
+"""
+Entity-component core for the AI world simulation.
+
+AI traveler teams, their host bodies, faction operatives and government agents
+are registered as entities. Per-entity state that every turn touches (host
+stress and happiness, which teams run missions, which agents investigate) lives
+in column-oriented component stores, and each turn runs a fixed sequence of
+systems as batched passes over those columns instead of a deep per-object
+take_turn chain.
+
+The existing AITravelerTeam / AIFactionOperative / AIGovernmentAgent classes
+remain the façades: host-life dicts are still their authoritative view, the
+stress columns are pulled from and pushed back to those dicts around each
+numeric pass, and anything that produces narrative or touches world state is
+dispatched back to the façade's own methods. Team missions, faction operations
+and agent investigations are all narrative and world-state work, so those
+passes are deliberately façade loops; their stores only carry membership.
+"""
+
+import random
+import time
+
+try:
+    from d20_decision_system import d20_system
+except ImportError:
+    d20_system = None
+
+# Entity kinds
+TEAM = "team"
+HOST = "host"
+OPERATIVE = "operative"
+AGENT = "agent"
+
+# Hosts crossing these this turn get a narrative event in the batched pass
+STRESS_ALERT = 0.7
+LOW_HAPPINESS = 0.3
+
+# Narrated entities per pass that get a reading pause; the rest run without sleeping
+PACED_ENTITIES = 3
+
+
+def _outcomes(*weighted):
+    """(chance, happiness delta, stress delta[, job satisfaction delta]) -> cumulative table"""
+    table = []
+    cumulative = 0.0
+    for chance, dh, ds, *dsat in weighted:
+        cumulative += chance
+        table.append((cumulative, dh, ds, dsat[0] if dsat else 0.0))
+    return tuple(table)
+
+
+# Host-life rules for the batched pass: (trigger chance, stressor label, outcomes).
+# Each mirrors the AITravelerTeam handler it replaces for quiet hosts.
+LIFE_EVENT = (0.15, "family and work demands", _outcomes(
+    (2 / 15 * 0.7, 0.1, -0.05), (2 / 15 * 0.3, 0.0, 0.1),    # social/family
+    (2 / 15 * 0.6, 0.05, 0.0), (2 / 15 * 0.4, 0.0, 0.15),    # work/career
+    (2 / 15 * 0.8, 0.08, -0.05), (2 / 15 * 0.2, 0.0, 0.08),  # health/medical
+    (9 / 15 * 0.7, 0.05, 0.0), (9 / 15 * 0.3, 0.0, 0.05),    # general
+))
+LIFE_COMPLICATION = (0.10, "everyday complications", _outcomes((0.7, 0.02, 0.0), (0.3, 0.0, 0.1)))
+RELATIONSHIP_EVENT = (0.10, "relationship conflict", _outcomes(
+    (0.3 * 0.6, 0.05, 0.0), (0.3 * 0.4, 0.0, 0.15), (0.7, 0.1, 0.0),
+))
+CAREER_CHALLENGE = (0.10, "career pressure", _outcomes(
+    (3 / 15 * 0.7, 0.1, 0.0, 0.05), (3 / 15 * 0.3, 0.0, 0.15), (12 / 15, 0.08, 0.0, 0.1),
+))
+SPECIAL_DATE = (0.05, "a celebration", _outcomes((1.0, 0.2, -0.1)))
+PERSONAL_EVENT = (0.10, "personal plans", _outcomes((0.8, 0.1, 0.0), (0.2, 0.0, 0.05)))
+WEEKEND_EVENT = (1.0, "weekend plans", _outcomes((0.8, 0.12, -0.08), (0.2, 0.0, 0.05)))
+WEEKDAY_EVENT = (1.0, "the weekday grind", _outcomes((0.6, 0.05, 0.0), (0.4, 0.0, 0.1)))
+FAMILY_INTERACTION = (1.0, "family friction", _outcomes((0.3, 0.1, -0.05), (0.3, 0.0, 0.0), (0.4, 0.0, 0.1)))
+WORK_RELATIONS = (1.0, "workplace tension", _outcomes((0.3, 0.05, 0.0), (0.4, 0.0, 0.0), (0.3, 0.0, 0.1)))
+SOCIAL_CONNECTION = (0.6, "friends", _outcomes((1.0, 0.05, 0.0)))
+COMMUNITY_EVENT = (0.2, "community events", _outcomes((1.0, 0.08, -0.03)))
+HOBBY_EVENT = (0.25, "hobbies", _outcomes((1.0, 0.12, -0.08)))
+WORK_TASK = (0.8, "work tasks", _outcomes((0.75, 0.03, 0.0), (0.25, 0.0, 0.1)))
+CAREER_EVENT = (0.2, "career setbacks", _outcomes((0.7, 0.1, 0.0), (0.3, 0.0, 0.1)))
+FINANCIAL_EVENT = (0.15, "money worries", _outcomes((0.7, 0.05, -0.03), (0.3, 0.0, 0.1)))
+HEALTH_EVENT = (0.10, "health concerns", _outcomes((0.8, 0.08, -0.05), (0.2, 0.0, 0.08)))
+
+LIFE_RULES = (LIFE_EVENT, LIFE_COMPLICATION, RELATIONSHIP_EVENT, CAREER_CHALLENGE)
+WORK_RULES = (WORK_TASK, CAREER_EVENT, FINANCIAL_EVENT, HEALTH_EVENT)
+
+# (happiness, stress) change for hosts on a seasonal celebration
+SEASONAL_HOST_EFFECTS = {
+    "Christmas": (0.15, -0.1),
+    "New Year's Eve": (0.1, 0.0),
+    "Independence Day": (0.12, 0.0),
+    "Thanksgiving": (0.18, -0.08),
+}
+DEFAULT_SEASONAL_EFFECT = (0.08, 0.0)
+
+
+def host_rules(host_life):
+    """Relationship and work rules that apply to a host, from its (static) relationships"""
+    relationships = host_life.get("relationships") or {}
+    family = relationships.get("family") or {}
+    social = relationships.get("social") or {}
+    rules = []
+    if family.get("spouse"):
+        rules.append(FAMILY_INTERACTION)
+    if (family.get("children") or 0) > 0:
+        rules.append(FAMILY_INTERACTION)
+    rules.append(WORK_RELATIONS)
+    if (social.get("friends") or 0) > 0:
+        rules.append(SOCIAL_CONNECTION)
+    if social.get("community_involvement", "None") != "None":
+        rules.append(COMMUNITY_EVENT)
+    if (social.get("hobbies") or 0) > 0:
+        rules.append(HOBBY_EVENT)
+    return tuple(rules) + WORK_RULES
+
+
+class ComponentStore:
+    """Column-oriented storage for one component type
+
+    Each field is a parallel list indexed by row; `entities[row]` is the
+    entity owning that row. Removal swaps the last row into the hole so the
+    columns stay dense.
+    """
+
+    def __init__(self, *fields):
+        self.fields = fields
+        self.entities = []
+        self.columns = {name: [] for name in fields}
+        self._rows = {}
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, entity):
+        return entity in self._rows
+
+    def row_of(self, entity):
+        return self._rows.get(entity)
+
+    def add(self, entity, **values):
+        """Attach the component to an entity (or overwrite its values)"""
+        row = self._rows.get(entity)
+        if row is None:
+            row = len(self.entities)
+            self._rows[entity] = row
+            self.entities.append(entity)
+            for name in self.fields:
+                self.columns[name].append(values.get(name))
+        else:
+            for name, value in values.items():
+                self.columns[name][row] = value
+        return row
+
+    def remove(self, entity):
+        """Detach the component from an entity"""
+        row = self._rows.pop(entity, None)
+        if row is None:
+            return False
+        last = len(self.entities) - 1
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self._rows[moved] = row
+            for column in self.columns.values():
+                column[row] = column[last]
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+        return True
+
+    def get(self, entity, field, default=None):
+        row = self._rows.get(entity)
+        return default if row is None else self.columns[field][row]
+
+
+class AIEntityWorld:
+    """Entity registry plus the batched per-turn systems"""
+
+    def __init__(self):
+        self.facades = {}        # entity id -> façade object
+        self.kinds = {}          # entity id -> entity kind
+        self._by_facade = {}     # id(façade) -> entity id
+        self._team_hosts = {}    # team entity -> (host_lives list, host entity ids)
+        self._next_entity = 1
+
+        self.host_life = ComponentStore("view", "team", "member", "rules")
+        self.stress = ComponentStore("stress", "happiness")
+        # Membership only: the turn passes for these dispatch to the façades
+        self.mission = ComponentStore()
+        self.operation = ComponentStore()
+        self.investigation = ComponentStore()
+
+        self._team_mode = {}     # team entity -> None (inactive) / False (quiet) / True (verbose)
+
+    # ------------------------------------------------------------------
+    # Entity registration
+    # ------------------------------------------------------------------
+
+    def create_entity(self, kind, facade):
+        entity = self._next_entity
+        self._next_entity += 1
+        self.facades[entity] = facade
+        self.kinds[entity] = kind
+        self._by_facade[id(facade)] = entity
+        return entity
+
+    def entity_of(self, facade):
+        return self._by_facade.get(id(facade))
+
+    def register_team(self, team):
+        entity = self.entity_of(team)
+        if entity is None:
+            entity = self.create_entity(TEAM, team)
+            self.mission.add(entity)
+        self._register_hosts(entity, team)
+        return entity
+
+    def register_operative(self, operative):
+        entity = self.entity_of(operative)
+        if entity is None:
+            entity = self.create_entity(OPERATIVE, operative)
+            self.operation.add(entity)
+        return entity
+
+    def register_agent(self, agent):
+        entity = self.entity_of(agent)
+        if entity is None:
+            entity = self.create_entity(AGENT, agent)
+            self.investigation.add(entity)
+        return entity
+
+    def remove_entity(self, entity):
+        facade = self.facades.pop(entity, None)
+        if facade is None:
+            return False
+        self.kinds.pop(entity, None)
+        self._by_facade.pop(id(facade), None)
+        for host in self._team_hosts.pop(entity, (None, []))[1]:
+            self.remove_entity(host)
+        for store in (self.host_life, self.stress, self.mission, self.operation, self.investigation):
+            store.remove(entity)
+        return True
+
+    def _register_hosts(self, team_entity, team):
+        """(Re)attach host-life components when a team's host list changed"""
+        lives = team.host_lives
+        known = self._team_hosts.get(team_entity)
+        if known and known[0] is lives and len(known[1]) == len(lives):
+            return
+        for host in (known[1] if known else []):
+            self.remove_entity(host)
+        hosts = []
+        for member, view in enumerate(lives):
+            host = self.create_entity(HOST, view)
+            self.host_life.add(host, view=view, team=team_entity, member=member, rules=host_rules(view))
+            self.stress.add(host, stress=0.0, happiness=0.0)
+            hosts.append(host)
+        self._team_hosts[team_entity] = (lives, hosts)
+
+    def refresh(self, controller):
+        """Register new façades and drop ones the controller no longer holds"""
+        live = set()
+        for team in controller.ai_teams:
+            live.add(self.register_team(team))
+        for operative in controller.faction_operatives:
+            live.add(self.register_operative(operative))
+        for agent in controller.government_agents:
+            live.add(self.register_agent(agent))
+        for entity, kind in list(self.kinds.items()):
+            if kind != HOST and entity not in live:
+                self.remove_entity(entity)
+
+    # ------------------------------------------------------------------
+    # Host-life column sync
+    # ------------------------------------------------------------------
+
+    def pull_stress(self):
+        """Copy stress/happiness from the host-life dicts into the columns"""
+        views = self.host_life.columns["view"]
+        stress = self.stress.columns["stress"]
+        happiness = self.stress.columns["happiness"]
+        stress_rows = self.stress._rows
+        for host, view in zip(self.host_life.entities, views):
+            row = stress_rows[host]
+            stress[row] = view.get("stress_level", 0.3)
+            happiness[row] = view.get("happiness", 0.5)
+
+    def push_stress(self):
+        """Write the stress/happiness columns back to the host-life dicts"""
+        views = self.host_life.columns["view"]
+        stress = self.stress.columns["stress"]
+        happiness = self.stress.columns["happiness"]
+        stress_rows = self.stress._rows
+        for host, view in zip(self.host_life.entities, views):
+            row = stress_rows[host]
+            view["stress_level"] = stress[row]
+            view["happiness"] = happiness[row]
+
+    # ------------------------------------------------------------------
+    # Systems
+    # ------------------------------------------------------------------
+
+    def begin_turn(self):
+        """Decide per team whether it is active and whether it narrates this turn"""
+        self._team_mode = {}
+        for team_entity in self.mission.entities:
+            team = self.facades[team_entity]
+            if team.status == "active":
+                self._team_mode[team_entity] = team._ai_begin_turn(buffer_host_log=True)
+            else:
+                self._team_mode[team_entity] = None
+
+    def _host_rows(self, verbose=None):
+        """Yield (host, team, view, member, rules) for hosts of active teams"""
+        columns = self.host_life.columns
+        modes = self._team_mode
+        for host, team_entity, view, member, rules in zip(
+            self.host_life.entities, columns["team"], columns["view"], columns["member"], columns["rules"]
+        ):
+            mode = modes.get(team_entity)
+            if mode is None or (verbose is not None and mode != verbose):
+                continue
+            yield host, self.facades[team_entity], view, member, rules
+
+    def host_life_system(self, time_system):
+        """Routine, life events, mood and daily events for every host in one pass
+
+        The day's calendar attributes come from the TimeSystem's shared
+        context. Hosts of quiet teams are updated in a single numeric pass over
+        the stress columns using the module-level outcome tables, and only hosts
+        that cross a stress or morale threshold get a narrative event; hosts of
+        teams narrating this turn go through the façade so their log is
+        unchanged.
+        """
+        calendar = time_system.context
+        if d20_system is not None:
+            self._batched_host_life(time_system, calendar)
+            narrated = self._host_rows(verbose=True)
+        else:
+            narrated = self._host_rows()
+        seasonal = calendar.seasonal_event is not None
+        for _, team, view, member, _ in narrated:
+            team.execute_daily_routine(view, member, time_system)
+            team._ai_host_life_events(view, member)
+            team.update_host_emotional_state(view)
+            team._ai_host_personal_events(view, member, calendar.current_date, calendar.is_weekend, seasonal)
+            team._ai_host_relationships(view, member)
+            team._ai_host_work(view, member)
+
+    def _batched_host_life(self, time_system, calendar):
+        self.pull_stress()
+        stress = self.stress.columns["stress"]
+        happiness = self.stress.columns["happiness"]
+        stress_rows = self.stress._rows
+        rand = random.random
+        randint = random.randint
+
+        # Rules shared by every host today; None marks the mood update step
+        day_rules = LIFE_RULES + (None, SPECIAL_DATE, PERSONAL_EVENT)
+        if calendar.seasonal_event:
+            dh, ds = SEASONAL_HOST_EFFECTS.get(calendar.seasonal_event, DEFAULT_SEASONAL_EFFECT)
+            day_rules += ((1.0, calendar.seasonal_event, ((1.0, dh, ds, 0.0),)),)
+        day_rules += (WEEKEND_EVENT if calendar.is_weekend else WEEKDAY_EVENT,)
+
+        crossed = []
+        for host, team, view, member, host_rules in self._host_rows(verbose=False):
+            row = stress_rows[host]
+            s = s0 = stress[row]
+            h = h0 = happiness[row]
+
+            # Daily routine: same check as execute_daily_routine (social DC -1,
+            # routine bonus, stress/happiness modifiers) without the roll log
+            schedule = team.daily_schedules[member]
+            hour = time_system.get_current_hour()
+            if 6 <= hour < 12:
+                activities = schedule["morning"]
+            elif 12 <= hour < 18:
+                activities = schedule["afternoon"]
+            else:
+                activities = schedule["evening"]
+            for _ in range(min(2, len(activities))):
+                dc = 11 if s > 0.7 else 9 if s > 0.5 else 7
+                roll = randint(1, 20)
+                if roll == 20:
+                    h = min(1.0, h + 0.1)
+                elif roll == 1:
+                    s = min(1.0, s + 0.2)
+                elif roll + 2 - int(s * 4) + int(h * 2) >= dc:
+                    h = min(1.0, h + 0.02)
+                else:
+                    s = min(1.0, s + 0.05)
+
+            stressors = []
+            for rules in (day_rules, host_rules):
+                for rule in rules:
+                    if rule is None:
+                        # Natural stress recovery, then stress-driven mood drift
+                        s = max(0.0, s - 0.02)
+                        if s > 0.7:
+                            h = max(0.1, h - 0.03)
+                        elif s < 0.3:
+                            h = min(1.0, h + 0.02)
+                        continue
+                    chance, label, outcomes = rule
+                    if chance < 1.0 and rand() >= chance:
+                        continue
+                    r = rand()
+                    for cumulative, dh, ds, dsat in outcomes:
+                        if r < cumulative:
+                            break
+                    if dh:
+                        h = min(1.0, h + dh)
+                    if ds > 0:
+                        s = min(1.0, s + ds)
+                        stressors.append(label)
+                    elif ds < 0:
+                        s = max(0.0, s + ds)
+                    if dsat:
+                        work = view["relationships"]["work"]
+                        work["job_satisfaction"] = min(1.0, work["job_satisfaction"] + dsat)
+
+            stress[row] = s
+            happiness[row] = h
+            if s0 <= STRESS_ALERT < s or h0 >= LOW_HAPPINESS > h:
+                crossed.append((team, view, stressors))
+        self.push_stress()
+
+        for team, view, stressors in crossed:
+            team._ai_host_strain_event(view, stressors, calendar.date)
+
+    def mission_system(self, world_state, pause=0.0):
+        """Team-level decisions: burnout response, interceptions and missions"""
+        paced = 0
+        for team_entity in self.mission.entities:
+            verbose = self._team_mode.get(team_entity)
+            if verbose is None:
+                continue
+            team = self.facades[team_entity]
+            team._ai_flush_host_log()
+            team._ai_team_turn(world_state)
+            if verbose and pause and paced < PACED_ENTITIES:
+                paced += 1
+                time.sleep(pause)
+
+    def operation_system(self, world_state, time_system, pause=0.0):
+        """Faction operatives plan and execute operations"""
+        paced = 0
+        for entity in self.operation.entities:
+            operative = self.facades[entity]
+            if operative.status == "active":
+                operative.take_turn(world_state, time_system)
+                if pause and paced < PACED_ENTITIES:
+                    paced += 1
+                    time.sleep(pause)
+
+    def investigation_system(self, world_state, time_system, world_memory=None, peer_agents=None, pause=0.0):
+        """Government agents review intelligence and work their cases"""
+        paced = 0
+        for entity in self.investigation.entities:
+            agent = self.facades[entity]
+            if agent.status != "active":
+                continue
+            try:
+                agent.take_turn(world_state, time_system, world_memory=world_memory, peer_agents=peer_agents)
+            except TypeError:
+                agent.take_turn(world_state, time_system, world_memory=world_memory)
+            if pause and paced < PACED_ENTITIES:
+                paced += 1
+                time.sleep(pause)
+
+    def run_traveler_turn(self, world_state, time_system, pause=0.0):
+        """Run every AI traveler team's turn as batched passes"""
+        self.begin_turn()
+        self.host_life_system(time_system)
+        self.mission_system(world_state, pause=pause)
@@ -1,9 +1,18 @@
 # ai_world_controller.py
+import heapq
+import itertools
 import random
 import time
 from datetime import datetime, timedelta
 from typing import Optional
 
+from ai_entity_system import AIEntityWorld
+from mission_odds import MISSION_PHASES, ai_mission_odds
+from time_system import SEASONAL_EVENTS
+
+# Most recent narrated host-life events kept per AI team
+PERSONAL_EVENT_LOG_LIMIT = 20
+
 # D20 Decision System Integration
 try:
     from d20_decision_system import d20_system, CharacterDecision
@@ -79,6 +88,17 @@ class AITravelerTeam(AIEntity):
 
     def _ai_host_log(self, *args, **kwargs):
         if getattr(self, "_ai_host_log_verbose", True):
+            buffer = getattr(self, "_ai_host_log_buffer", None)
+            if buffer is not None:
+                buffer.append((args, kwargs))
+            else:
+                print(*args, **kwargs)
+
+    def _ai_flush_host_log(self):
+        """Print host-life lines held back while the entity systems ran"""
+        buffer = getattr(self, "_ai_host_log_buffer", None)
+        self._ai_host_log_buffer = None
+        for args, kwargs in buffer or []:
             print(*args, **kwargs)
 
     def _ai_any_host_stress_above(self, threshold: float) -> bool:
@@ -239,12 +259,21 @@ class AITravelerTeam(AIEntity):
                     "contacts": getattr(npc, "contacts", []),
                     "npc_relationships": {cid: random.uniform(0.5, 0.9) for cid in (getattr(npc, "contacts", []) or [])},
                 }
+                self._register_host_bonds(life)
                 lives.append(life)
             return lives
         except Exception:
             # If anything goes wrong, stay playable
             return self.generate_host_lives()
         
+    def _register_host_bonds(self, life):
+        """Layer a host's personal relationships onto the world's relationship graph"""
+        register = getattr(self.world_generator, "register_host_bonds", None)
+        host_id = life.get("npc_id")
+        if register is None or host_id is None:
+            return
+        register(host_id, life["npc_relationships"])
+    
     def generate_host_lives(self):
         """Generate detailed host body lives for each team member"""
         lives = []
@@ -369,11 +398,7 @@ class AITravelerTeam(AIEntity):
         
     def take_turn(self, world_state, time_system):
         """AI Traveler team takes turn (reduced noise; only prints important events)."""
-        show_output = (self.life_balance_score < 0.5) or bool(self.active_missions)
-        self._ai_host_log_verbose = show_output
-        if show_output:
-            print(f"\n🕵️ Team {self.team_id}:")
-            print("  🏠 Managing host lives...")
+        self._ai_begin_turn()
         
         # Do all the work (mostly silently)
         self.manage_host_lives(time_system)
@@ -381,6 +406,23 @@ class AITravelerTeam(AIEntity):
         self.manage_relationships()
         self.manage_work_responsibilities()
 
+        self._ai_team_turn(world_state)
+
+    def _ai_begin_turn(self, buffer_host_log=False):
+        """Decide whether this team narrates its turn; returns True if it does.
+
+        With buffer_host_log, host-life lines are held until _ai_flush_host_log so
+        batched host passes across teams still print grouped per team.
+        """
+        show_output = (self.life_balance_score < 0.5) or bool(self.active_missions)
+        self._ai_host_log_verbose = show_output
+        self._ai_host_log_buffer = [] if buffer_host_log and show_output else None
+        self._ai_host_log(f"\n🕵️ Team {self.team_id}:")
+        self._ai_host_log("  🏠 Managing host lives...")
+        return show_output
+
+    def _ai_team_turn(self, world_state):
+        """Team-level part of the turn, after every host has lived its day"""
         # Burnout protocol after routine life (before new ops)
         self._ai_team_crisis_recovery(world_state)
         
@@ -393,7 +435,7 @@ class AITravelerTeam(AIEntity):
                 self.generate_ai_mission(world_state)
         
         # Only show missions
-        if self.active_missions and show_output:
+        if self.active_missions and self._ai_host_log_verbose:
             print(f"  📋 Active missions: {len(self.active_missions)}")
             for mission in self.active_missions:
                 try:
@@ -469,25 +511,29 @@ class AITravelerTeam(AIEntity):
             # Execute daily routine
             self.execute_daily_routine(host_life, i, time_system)
             
-            # Handle random life events
-            if random.randint(1, 20) <= 3:  # D20 roll: 1-3 (15% chance of life event)
-                self.generate_life_event(host_life, i)
-            
-            # Handle random life complications
-            if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (10% chance of random complication)
-                self.generate_random_life_complication(host_life)
-            
-            # Handle relationship events
-            if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (12% chance of relationship event)
-                self.generate_relationship_event(host_life)
-            
-            # Handle career events
-            if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (8% chance of career event)
-                self.generate_career_event(host_life)
+            self._ai_host_life_events(host_life, i)
             
             # Update stress and happiness levels
             self.update_host_emotional_state(host_life)
     
+    def _ai_host_life_events(self, host_life, member_index):
+        """Random life events, complications, relationship and career events for one host"""
+        # Handle random life events
+        if random.randint(1, 20) <= 3:  # D20 roll: 1-3 (15% chance of life event)
+            self.generate_life_event(host_life, member_index)
+        
+        # Handle random life complications
+        if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (10% chance of random complication)
+            self.generate_random_life_complication(host_life)
+        
+        # Handle relationship events
+        if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (12% chance of relationship event)
+            self.generate_relationship_event(host_life)
+        
+        # Handle career events
+        if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (8% chance of career event)
+            self.generate_career_event(host_life)
+    
     def execute_daily_routine(self, host_life, member_index, time_system):
         """Execute the daily routine for a host body with D20 rolls"""
         if not d20_system or not CharacterDecision:
@@ -712,31 +758,55 @@ class AITravelerTeam(AIEntity):
         elif host_life['stress_level'] < 0.3:
             host_life['happiness'] = min(1.0, host_life['happiness'] + 0.02)
     
+    def _ai_host_strain_event(self, host_life, stressors, date_string):
+        """Narrate a host who slid into high stress or low morale during a batched turn"""
+        name = host_life.get('name', 'Unknown')
+        if host_life.get('stress_level', 0.0) > 0.7:
+            causes = ", ".join(dict.fromkeys(stressors)) or "the daily grind"
+            text = f"{name} is buckling under {causes}"
+        else:
+            text = f"{name} is losing heart"
+        self.personal_events.append({
+            "date": date_string,
+            "host": name,
+            "event": text,
+            "stress_level": host_life.get('stress_level', 0.0),
+            "happiness": host_life.get('happiness', 0.0),
+        })
+        del self.personal_events[:-PERSONAL_EVENT_LOG_LIMIT]
+        self._ai_host_log(f"    ⚠️  {text}")
+    
     def handle_personal_events(self, time_system):
         """Handle personal life events for the team"""
         self._ai_host_log(f"  📅 Managing personal life events...")
         
         # Check for special dates
         current_date = time_system.current_date
+        weekend = time_system.is_weekend()
+        seasonal = self.is_seasonal_event(current_date)
         
         for i, host_life in enumerate(self.host_lives):
-            # Check for birthdays, anniversaries, etc.
-            if self.is_special_date(host_life, current_date):
-                self.celebrate_special_date(host_life, i)
-            
-            # Generate random personal events
-            if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (10% chance of personal event)
-                self.generate_personal_event(host_life, i)
-            
-            # Check for seasonal events
-            if self.is_seasonal_event(current_date):
-                self.handle_seasonal_event(host_life, i, current_date)
-            
-            # Check for weekend vs weekday events
-            if time_system.is_weekend():
-                self.handle_weekend_event(host_life, i)
-            else:
-                self.handle_weekday_event(host_life, i)
+            self._ai_host_personal_events(host_life, i, current_date, weekend, seasonal)
+    
+    def _ai_host_personal_events(self, host_life, member_index, current_date, weekend, seasonal):
+        """Special-date, personal, seasonal and weekday/weekend events for one host"""
+        # Check for birthdays, anniversaries, etc.
+        if self.is_special_date(host_life, current_date):
+            self.celebrate_special_date(host_life, member_index)
+        
+        # Generate random personal events
+        if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (10% chance of personal event)
+            self.generate_personal_event(host_life, member_index)
+        
+        # Check for seasonal events
+        if seasonal:
+            self.handle_seasonal_event(host_life, member_index, current_date)
+        
+        # Check for weekend vs weekday events
+        if weekend:
+            self.handle_weekend_event(host_life, member_index)
+        else:
+            self.handle_weekday_event(host_life, member_index)
     
     def is_special_date(self, host_life, current_date):
         """Check if current date is special for the host body"""
@@ -781,29 +851,33 @@ class AITravelerTeam(AIEntity):
         self._ai_host_log(f"  👥 Managing relationships and social connections...")
         
         for i, host_life in enumerate(self.host_lives):
-            relationships = host_life['relationships']
-            
-            # Family interactions
-            if relationships['family']['spouse']:
-                self.handle_family_interaction(host_life, i, "spouse")
-            
-            if relationships['family']['children'] > 0:
-                self.handle_family_interaction(host_life, i, "children")
-            
-            # Work relationships
-            self.handle_work_relationships(host_life, i)
-            
-            # Social connections
-            if relationships['social']['friends'] > 0:
-                self.handle_social_connections(host_life, i)
-            
-            # Community involvement
-            if relationships['social']['community_involvement'] != "None":
-                self.handle_community_event(host_life, i)
-            
-            # Hobby activities
-            if relationships['social']['hobbies'] > 0:
-                self.handle_hobby_event(host_life, i)
+            self._ai_host_relationships(host_life, i)
+    
+    def _ai_host_relationships(self, host_life, member_index):
+        """Family, work, social, community and hobby interactions for one host"""
+        relationships = host_life['relationships']
+        
+        # Family interactions
+        if relationships['family']['spouse']:
+            self.handle_family_interaction(host_life, member_index, "spouse")
+        
+        if relationships['family']['children'] > 0:
+            self.handle_family_interaction(host_life, member_index, "children")
+        
+        # Work relationships
+        self.handle_work_relationships(host_life, member_index)
+        
+        # Social connections
+        if relationships['social']['friends'] > 0:
+            self.handle_social_connections(host_life, member_index)
+        
+        # Community involvement
+        if relationships['social']['community_involvement'] != "None":
+            self.handle_community_event(host_life, member_index)
+        
+        # Hobby activities
+        if relationships['social']['hobbies'] > 0:
+            self.handle_hobby_event(host_life, member_index)
     
     def handle_family_interaction(self, host_life, member_index, family_type):
         """Handle family interactions"""
@@ -873,21 +947,25 @@ class AITravelerTeam(AIEntity):
         self._ai_host_log(f"  💼 Managing work responsibilities...")
         
         for i, host_life in enumerate(self.host_lives):
-            # Handle daily work tasks
-            if random.randint(1, 20) <= 16:  # D20 roll: 1-16 (80% chance of work task)
-                self.handle_work_task(host_life, i)
-            
-            # Handle career development
-            if random.randint(1, 20) <= 4:  # D20 roll: 1-4 (20% chance of career event)
-                self.handle_career_event(host_life, i)
-            
-            # Handle financial management
-            if random.randint(1, 20) <= 3:  # D20 roll: 1-3 (15% chance of financial event)
-                self.handle_financial_event(host_life, i)
-            
-            # Handle health and wellness
-            if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (12% chance of health event)
-                self.handle_health_event(host_life, i)
+            self._ai_host_work(host_life, i)
+    
+    def _ai_host_work(self, host_life, member_index):
+        """Work tasks, career, financial and health events for one host"""
+        # Handle daily work tasks
+        if random.randint(1, 20) <= 16:  # D20 roll: 1-16 (80% chance of work task)
+            self.handle_work_task(host_life, member_index)
+        
+        # Handle career development
+        if random.randint(1, 20) <= 4:  # D20 roll: 1-4 (20% chance of career event)
+            self.handle_career_event(host_life, member_index)
+        
+        # Handle financial management
+        if random.randint(1, 20) <= 3:  # D20 roll: 1-3 (15% chance of financial event)
+            self.handle_financial_event(host_life, member_index)
+        
+        # Handle health and wellness
+        if random.randint(1, 20) <= 2:  # D20 roll: 1-2 (12% chance of health event)
+            self.handle_health_event(host_life, member_index)
     
     def handle_financial_event(self, host_life, member_index):
         """Handle financial events and management"""
@@ -1019,7 +1097,7 @@ class AITravelerTeam(AIEntity):
                     candidates = list(self.world_generator.locations or [])
 
                 if candidates:
-                    target = random.choice(candidates)
+                    target = self._ai_pick_mission_target(mission_type, candidates)
                     location_name = getattr(target, "name", None)
                     location_id = getattr(target, "id", None)
                     security_level = getattr(getattr(target, "security_level", None), "value", None)
@@ -1053,6 +1131,22 @@ class AITravelerTeam(AIEntity):
         if mission.get("security_level") or mission.get("surveillance_cameras") is not None:
             print(f"       Security: {mission.get('security_level') or 'unknown'}, Cameras: {mission.get('surveillance_cameras') or 'unknown'}")
     
+    def _ai_pick_mission_target(self, mission_type, candidates):
+        """Pick a target location, weighted by the team's exact odds of pulling the mission off
+
+        Odds depend only on a location's security level, so each distinct level
+        is evaluated once (and the tables themselves are memoized).
+        """
+        by_level = {}
+        for loc in candidates:
+            by_level.setdefault(getattr(getattr(loc, "security_level", None), "value", None), []).append(loc)
+        weights = []
+        for level, locations in by_level.items():
+            odds = self.estimate_ai_mission_odds({"type": mission_type, "location": "", "security_level": level})
+            weights.append(len(locations) * (max(0.05, odds["success"]) if odds else 1.0))
+        level_locations = random.choices(list(by_level.values()), weights=weights)[0]
+        return random.choice(level_locations)
+
     def execute_ai_mission(self, mission, world_state):
         """Execute mission with D20 rolls for each phase"""
         if not d20_system or not CharacterDecision:
@@ -1076,48 +1170,11 @@ class AITravelerTeam(AIEntity):
             print(f"    ⚠️  Team too stressed to execute missions effectively")
             return False
         
-        # Determine mission phases based on type
-        phases = ['infiltration', 'execution', 'extraction']
-        
-        # Calculate base DC from mission difficulty
-        security_level = mission.get('security_level', 'medium')
-        if isinstance(security_level, str):
-            security_dc = {
-                'low': 10,
-                'medium': 15,
-                'high': 20,
-                'critical': 25
-            }.get(security_level.lower(), 15)
-        else:
-            # Numeric security level
-            security_dc = min(25, max(10, int(security_level * 20) + 10))
-        
         phase_results = []
         
         print(f"\n    🎯 Executing mission: {mission['type']} at {mission['location']}")
         
-        for phase in phases:
-            # Create character decision
-            decision_type_map = {
-                "infiltration": "stealth",
-                "execution": "technical",
-                "extraction": "combat"
-            }
-            
-            decision = CharacterDecision(
-                character_name=f"Team {self.team_id}",
-                character_type="traveler",
-                decision_type=decision_type_map.get(phase, "stealth"),
-                context=f"{phase} phase at {mission['location']}",
-                difficulty_class=security_dc,
-                modifiers={
-                    'team_cohesion': int(self.relationship_status.get('team_cohesion', 0.5) * 5),
-                    'life_balance': int(self.life_balance_score * 3),
-                    'stress_penalty': -int(sum(h.get('stress_level', 0.5) for h in self.host_lives) / max(1, len(self.host_lives)) * 3)
-                },
-                consequences={}
-            )
-            
+        for phase, decision in zip(MISSION_PHASES, self._ai_phase_decisions(mission)):
             # Make D20 roll!
             result = d20_system.resolve_character_decision(decision)
             roll_result = result['roll_result']
@@ -1169,6 +1226,57 @@ class AITravelerTeam(AIEntity):
             self.handle_mission_failure(mission, world_state)
             return True
     
+    @staticmethod
+    def _ai_security_dc(security_level):
+        """Base mission DC from a location's security level (name or 0-1 number)"""
+        if isinstance(security_level, str):
+            return {
+                'low': 10,
+                'medium': 15,
+                'high': 20,
+                'critical': 25
+            }.get(security_level.lower(), 15)
+        if security_level is None:
+            return 15
+        # Numeric security level
+        return min(25, max(10, int(security_level * 20) + 10))
+    
+    def _ai_phase_decisions(self, mission):
+        """One CharacterDecision per mission phase for the team's current state"""
+        security_dc = self._ai_security_dc(mission.get('security_level', 'medium'))
+        modifiers = {
+            'team_cohesion': int(self.relationship_status.get('team_cohesion', 0.5) * 5),
+            'life_balance': int(self.life_balance_score * 3),
+            'stress_penalty': -int(sum(h.get('stress_level', 0.5) for h in self.host_lives) / max(1, len(self.host_lives)) * 3)
+        }
+        decision_type_map = {
+            "infiltration": "stealth",
+            "execution": "technical",
+            "extraction": "combat"
+        }
+        return [
+            CharacterDecision(
+                character_name=f"Team {self.team_id}",
+                character_type="traveler",
+                decision_type=decision_type_map.get(phase, "stealth"),
+                context=f"{phase} phase at {mission['location']}",
+                difficulty_class=security_dc,
+                modifiers=dict(modifiers),
+                consequences={}
+            )
+            for phase in MISSION_PHASES
+        ]
+    
+    def estimate_ai_mission_odds(self, mission):
+        """Exact success/partial/failure odds for this team attempting `mission` now"""
+        if not d20_system or not CharacterDecision:
+            return None
+        checks = tuple(
+            (d20_system._calculate_dc(decision), sum(d20_system._apply_character_modifiers(decision).values()))
+            for decision in self._ai_phase_decisions(mission)
+        )
+        return ai_mission_odds(checks)
+    
     def handle_mission_success(self, mission, world_state):
         """Handle successful mission completion"""
         # Success reduces stress and increases happiness
@@ -1242,23 +1350,7 @@ class AITravelerTeam(AIEntity):
 
     def is_seasonal_event(self, current_date):
         """Check if current date is a seasonal event"""
-        month = current_date.month
-        day = current_date.day
-        
-        seasonal_events = {
-            (12, 25): "Christmas",
-            (12, 31): "New Year's Eve",
-            (1, 1): "New Year's Day",
-            (7, 4): "Independence Day",
-            (11, 25): "Thanksgiving",
-            (10, 31): "Halloween",
-            (2, 14): "Valentine's Day",
-            (3, 17): "St. Patrick's Day",
-            (5, 5): "Cinco de Mayo",
-            (6, 19): "Juneteenth"
-        }
-        
-        return (month, day) in seasonal_events
+        return (current_date.month, current_date.day) in SEASONAL_EVENTS
 
     def handle_seasonal_event(self, host_life, member_index, current_date):
         """Handle seasonal events for a host body"""
@@ -1542,6 +1634,90 @@ class AIFactionOperative(AIEntity):
         if self.current_operation:
             world_state['faction_influence'] = min(1.0, world_state.get('faction_influence', 0.3) + 0.01)
 
+class InvestigationAssignmentRegistry:
+    """Shared record of which location each government agent is investigating
+
+    Keeps a per-location load counter that agents update as investigations
+    start and finish, plus a priority queue of the turn's player hotspots keyed
+    by (load, -heat) so each agent claims the least-covered, hottest spot
+    without counting peers.
+    """
+
+    def __init__(self):
+        self.load = {}            # location -> number of agents investigating there
+        self._claims = {}         # id(agent) -> location claimed
+        self._hot_locations = None
+        self._heat = {}           # hotspot location -> (heat, hotspot dict)
+        self._queue = []          # heap of (load, -heat, seq, location)
+        self._seq = itertools.count()
+
+    def load_on(self, location):
+        return self.load.get(location, 0)
+
+    def assign(self, agent, location):
+        """Move an agent's claim to `location` (None releases it)"""
+        previous = self._claims.pop(id(agent), None)
+        if previous == location:
+            if location:
+                self._claims[id(agent)] = location
+            return
+        if previous:
+            remaining = self.load.get(previous, 0) - 1
+            if remaining > 0:
+                self.load[previous] = remaining
+            else:
+                self.load.pop(previous, None)
+            self._requeue(previous)
+        if location:
+            self._claims[id(agent)] = location
+            self.load[location] = self.load.get(location, 0) + 1
+            self._requeue(location)
+
+    def begin_turn(self):
+        """Drop the cached hotspot snapshot; heat is re-read on first use"""
+        self._hot_locations = None
+        self._heat = {}
+        self._queue = []
+
+    @property
+    def current_hot_locations(self):
+        """Hotspot snapshot the claim queue was built from (None until read this turn)"""
+        return self._hot_locations
+
+    def hot_locations(self, world_memory):
+        """The turn's player hotspots, fetched from world memory once per turn"""
+        if self._hot_locations is None:
+            self.set_hot_locations(world_memory.get_hot_locations_for_government())
+        return self._hot_locations
+
+    def set_hot_locations(self, hot_locations):
+        """Rebuild the claim queue for a new hotspot snapshot"""
+        self._hot_locations = hot_locations
+        self._heat = {}
+        self._queue = []
+        for h in hot_locations or []:
+            loc = h.get("location")
+            if loc and loc not in self._heat:
+                self._heat[loc] = (float(h.get("heat_level", 0.0) or 0.0), h)
+                self._queue.append((self.load_on(loc), -self._heat[loc][0], next(self._seq), loc))
+        heapq.heapify(self._queue)
+
+    def next_hotspot(self, max_agents_per_hotspot=3):
+        """Least-loaded, hottest hotspot still under the cap (not yet claimed)"""
+        queue = self._queue
+        while queue:
+            load, _, _, loc = queue[0]
+            if loc in self._heat and load == self.load_on(loc):
+                return self._heat[loc][1] if load < max_agents_per_hotspot else None
+            heapq.heappop(queue)  # stale entry; a fresher one was pushed when the load changed
+        return None
+
+    def _requeue(self, location):
+        entry = self._heat.get(location)
+        if entry is not None:
+            heapq.heappush(self._queue, (self.load_on(location), -entry[0], next(self._seq), location))
+
+
 class AIGovernmentAgent(AIEntity):
     """AI-controlled US government agent (FBI/CIA)"""
     def __init__(self, agent_id, agency, specialization, base_location, clearance_level, world_generator=None):
@@ -1552,6 +1728,8 @@ class AIGovernmentAgent(AIEntity):
         self.agency = agency  # "FBI" or "CIA"
         self.specialization = specialization
         self.clearance_level = clearance_level  # 1-5, higher = more access
+        self.assignments = None  # Shared InvestigationAssignmentRegistry, set by the controller
+        self._witness_pools = {}  # location name -> NPC ids in the social circle of its staff
         self.current_investigation = None
         self.suspicious_activity_reports = []
         self.intelligence_contacts = []
@@ -1562,6 +1740,25 @@ class AIGovernmentAgent(AIEntity):
             "backup_teams": random.randint(1, 4)
         }
         
+    @property
+    def current_investigation(self):
+        return self._current_investigation
+
+    @current_investigation.setter
+    def current_investigation(self, investigation):
+        # Keep the shared per-location load counters in step with every start/finish
+        if self.assignments is not None:
+            self.assignments.assign(self, (investigation or {}).get("location"))
+        self._current_investigation = investigation
+
+    def join_assignments(self, registry):
+        """Attach to a shared assignment registry, registering any case in progress"""
+        if self.assignments is not None:
+            self.assignments.assign(self, None)
+        self.assignments = registry
+        if registry is not None:
+            registry.assign(self, (self._current_investigation or {}).get("location"))
+
     def generate_jurisdiction(self):
         """Generate jurisdiction for the agent"""
         if self.agency == "FBI":
@@ -1695,6 +1892,11 @@ class AIGovernmentAgent(AIEntity):
         if not hot_locations:
             return None
 
+        if self.assignments is not None:
+            if hot_locations is not self.assignments.current_hot_locations:
+                self.assignments.set_hot_locations(hot_locations)
+            return self.assignments.next_hotspot(max_agents_per_hotspot)
+
         def peer_count_on(loc):
             if not peer_agents or not loc:
                 return 0
@@ -1725,7 +1927,10 @@ class AIGovernmentAgent(AIEntity):
         # 0) If we have player-linked hot locations, investigate those FIRST
         try:
             if world_memory:
-                hot_locations = world_memory.get_hot_locations_for_government()
+                if self.assignments is not None:
+                    hot_locations = self.assignments.hot_locations(world_memory)
+                else:
+                    hot_locations = world_memory.get_hot_locations_for_government()
                 if hot_locations:
                     target = self._pick_player_hotspot_investigation(hot_locations, peer_agents)
                     if target is not None:
@@ -1977,6 +2182,9 @@ class AIGovernmentAgent(AIEntity):
             ]
             
             witness_type = random.choice(witness_types)
+            witness = self._network_witness(investigation)
+            if witness is not None:
+                witness_type = f"{witness_type} {witness.name}"
             
             # Ensure suspects list exists
             if "suspects" not in investigation:
@@ -1985,6 +2193,24 @@ class AIGovernmentAgent(AIEntity):
             investigation["suspects"].append(f"{witness_type} testimony")
             print(f"      👥 Interviewed: {witness_type}")
     
+    def _network_witness(self, investigation):
+        """Pick a real NPC from the social circle of the people working at the investigated location"""
+        graph = getattr(self.world_generator, "relationship_graph", None)
+        location = investigation.get("location")
+        if graph is None or not location:
+            return None
+        pool = self._witness_pools.get(location)
+        if pool is None:
+            staff = [
+                npc.id for npc in (getattr(self.world_generator, "npcs", None) or [])
+                if getattr(npc, "work_location", None) == location
+            ]
+            pool = staff + list(graph.within_hops(staff, 1, edge_type="contact")) if staff else []
+            self._witness_pools[location] = pool
+        if not pool:
+            return None
+        return self.world_generator.get_npc_by_id(random.choice(pool))
+    
     def analyze_data(self, investigation):
         """Analyze collected data and evidence"""
         if random.random() < 0.5:  # 50% chance of analysis breakthrough
@@ -2044,7 +2270,9 @@ class AIGovernmentAgent(AIEntity):
         if world_memory and triggered and loc:
             try:
                 others = 0
-                if peer_agents:
+                if self.assignments is not None:
+                    others = self.assignments.load_on(loc)
+                elif peer_agents:
                     for a in peer_agents:
                         inv = getattr(a, "current_investigation", None) or {}
                         if inv.get("location") == loc:
@@ -2145,6 +2373,10 @@ class AIWorldController:
         self.turn_count = 0
         self.world_events = []
         self.faction_activities = []
+        # Entity-component core; the entity lists above remain the façades
+        self.ecs = AIEntityWorld()
+        # Who is investigating where, shared by all government agents
+        self.investigation_assignments = InvestigationAssignmentRegistry()
         
     def initialize_world(self, ai_teams=None, faction_ops=None, gov_agents=None):
         """Initialize the AI-controlled world with entities"""
@@ -2223,6 +2455,7 @@ class AIWorldController:
                 clearance_level=random.randint(2, 5),
                 world_generator=self.world_generator
             )
+            agent.join_assignments(self.investigation_assignments)
             self.government_agents.append(agent)
         
         cia_agents = max(1, gov_agents - fbi_agents)  # Remaining agents are CIA
@@ -2238,6 +2471,7 @@ class AIWorldController:
                 clearance_level=random.randint(3, 5),  # CIA agents have higher clearance
                 world_generator=self.world_generator
             )
+            agent.join_assignments(self.investigation_assignments)
             self.government_agents.append(agent)
         
         # Output is now handled by the calling game.py method
@@ -2253,34 +2487,31 @@ class AIWorldController:
         if player_team:
             self._process_player_team_host_bodies(player_team, world_state, time_system)
         
-        # AI Traveler teams take their turns
+        # Pick up entities added to (or dropped from) the façade lists
+        self.ecs.refresh(self)
+        for agent in self.government_agents:
+            if agent.assignments is not self.investigation_assignments:
+                agent.join_assignments(self.investigation_assignments)
+        self.investigation_assignments.begin_turn()
+        
+        # AI Traveler teams take their turns (host lives run as batched passes;
+        # pause only after teams that actually printed something)
         print(f"\n🕵️  AI TRAVELER TEAMS:")
-        for team in self.ai_teams:
-            if team.status == "active":
-                team.take_turn(world_state, time_system)
-                time.sleep(0.5)  # Brief pause for readability
+        self.ecs.run_traveler_turn(world_state, time_system, pause=0.5)
         
         # Faction operatives take their turns
         print(f"\n🦹 FACTION OPERATIVES:")
-        for operative in self.faction_operatives:
-            if operative.status == "active":
-                operative.take_turn(world_state, time_system)
-                time.sleep(0.5)
+        self.ecs.operation_system(world_state, time_system, pause=0.5)
         
         # Government agents take their turns
         print(f"\n🏛️  GOVERNMENT AGENCIES:")
-        for agent in self.government_agents:
-            if agent.status == "active":
-                try:
-                    agent.take_turn(
-                        world_state,
-                        time_system,
-                        world_memory=world_memory,
-                        peer_agents=self.government_agents,
-                    )
-                except TypeError:
-                    agent.take_turn(world_state, time_system, world_memory=world_memory)
-                time.sleep(0.5)
+        self.ecs.investigation_system(
+            world_state,
+            time_system,
+            world_memory=world_memory,
+            peer_agents=self.government_agents,
+            pause=0.5,
+        )
         
         # Generate world events
         self.generate_world_events(world_state, time_system)
@@ -2288,6 +2519,13 @@ class AIWorldController:
         # Update faction activities
         self.update_faction_activities(world_state)
         
+        # Persist skirmish outcome tables built during this turn in one write
+        try:
+            from combat_death_system import flush_skirmish_outcome_table
+            flush_skirmish_outcome_table()
+        except Exception:
+            pass
+        
         # Show AI turn summary
         self.show_ai_turn_summary()
         
@@ -11,9 +11,16 @@ and one **Director Lockstep** correction (a single reroll bought with a small ti
 """
 from __future__ import annotations
 
+import atexit
+import json
+import os
 import random
+from array import array
+from itertools import accumulate
 from typing import Any, Dict, List, Optional, Tuple
 
+from dice_math import check_probability, expected_value, outcome_pmf
+
 try:
     from d20_decision_system import d20_system
 except ImportError:
@@ -29,6 +36,13 @@ SHEAR_MILESTONES = (
     (75, "Probability bleed: the Director's future-state overlaps this instant."),
 )
 
+# Attack bonus by attacker type, applied unless the caller already set it
+_ATTACKER_BONUS = {
+    "traveler": ("traveler_bonus", 2),
+    "faction": ("faction_bonus", 1),
+    "government": ("government_bonus", 1),
+}
+
 
 def normalize_faction(raw: Optional[str]) -> str:
     if not raw:
@@ -293,17 +307,38 @@ def _strike(
         roll = random.randint(1, 20) + sum(extra_mods.values())
         hit = roll >= target_ac
         return hit, None
-    mods = dict(extra_mods)
-    if attacker_type == "traveler":
-        mods.setdefault("traveler_bonus", 2)
-    elif attacker_type == "faction":
-        mods.setdefault("faction_bonus", 1)
-    elif attacker_type == "government":
-        mods.setdefault("government_bonus", 1)
+    mods = _strike_mods(attacker_type, extra_mods)
     rr = d20_system.roll_d20(attacker_label, "combat", context, base_dc=target_ac, modifiers=mods)
     return bool(rr.success), rr
 
 
+def _strike_mods(attacker_type: str, extra_mods: Dict[str, int]) -> Dict[str, int]:
+    mods = dict(extra_mods)
+    bonus = _ATTACKER_BONUS.get(attacker_type)
+    if bonus:
+        mods.setdefault(*bonus)
+    return mods
+
+
+def _strike_damage(face: int, total: int, target_ac: int, max_damage: int) -> int:
+    """Damage dealt by one _strike + _damage_from_hit exchange for a given die face"""
+    if total < target_ac:
+        return 0
+    # Natural 20 adds two; every other hit (including a grazing partial) deals one
+    return min(max_damage, 3 if face == 20 else 1)
+
+
+def strike_odds(attacker_type: str, target_ac: int, extra_mods: Dict[str, int],
+                *, max_damage: int = 3) -> Dict[str, float]:
+    """Exact hit chance and expected damage for one attack exchange (no rolling)."""
+    modifier = sum(_strike_mods(attacker_type, extra_mods).values())
+    damage = outcome_pmf(_strike_damage, modifier, 0, (target_ac, max_damage))
+    return {
+        "hit": 1.0 - damage.get(0, 0.0),
+        "expected_damage": expected_value(damage, {d: float(d) for d in damage}),
+    }
+
+
 def _damage_from_hit(hit: bool, roll_result: Any, *, max_damage: int = 3) -> int:
     if not hit:
         return 0
@@ -1337,6 +1372,356 @@ def ai_team_post_combat_recovery(
         pass
 
 
+# ---------------------------------------------------------------------------
+# Batched AI skirmish kernel
+# ---------------------------------------------------------------------------
+# Unobserved AI skirmishes follow the same rules as the verbose loop in
+# ai_team_mission_combat, but fighter state lives in flat arrays and each strike
+# is one uniform draw against an exact hit probability: no roll objects, roll
+# history or transcript strings.
+
+_AI_HOST_ATTACK_MOD = 4  # "Combat" training +2, traveler bonus +2 (−2 per wound level)
+_AI_RETURN_FIRE_MOD = 2  # pressure +1, faction/government bonus +1
+_AI_KIA_WOUNDS = 3
+_AI_ROUNDS_MAX = 6
+
+
+class SkirmishBatch:
+    """Struct-of-arrays state for many independent AI skirmishes
+
+    Fighters of fight ``f`` occupy ``start[f]:split[f]`` (hosts) and
+    ``split[f]:end[f]`` (hostiles) in the per-fighter arrays.
+    """
+
+    def __init__(self) -> None:
+        self.wounds = array("b")
+        self.cover = array("b")
+        self.host_hits = array("b")  # return-fire hits taken (stress +0.2 each)
+        self.start = array("l")
+        self.split = array("l")
+        self.end = array("l")
+        self.rounds = array("b")
+        self.volleys = array("b")  # rounds that reached return fire (timeline stability −0.01 each)
+        self.shear = array("l")
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def add_fight(self, host_wounds: List[int], enemy_covers: List[int],
+                  enemy_wounds: Optional[List[int]] = None) -> int:
+        """Queue a skirmish; returns its index (fighters at _AI_KIA_WOUNDS sit it out)"""
+        self.start.append(len(self.wounds))
+        for wl in host_wounds:
+            self.wounds.append(min(_AI_KIA_WOUNDS, int(wl)))
+            self.cover.append(0)
+            self.host_hits.append(0)
+        self.split.append(len(self.wounds))
+        for i, cover in enumerate(enemy_covers):
+            self.wounds.append(min(_AI_KIA_WOUNDS, int(enemy_wounds[i])) if enemy_wounds else 0)
+            self.cover.append(int(cover))
+            self.host_hits.append(0)
+        self.end.append(len(self.wounds))
+        self.rounds.append(0)
+        self.volleys.append(0)
+        self.shear.append(0)
+        return len(self.start) - 1
+
+    def resolve(self, rounds_max: int = _AI_ROUNDS_MAX) -> None:
+        """Fight every queued skirmish to its conclusion"""
+        rand = random.random
+        wounds, cover, host_hits = self.wounds, self.cover, self.host_hits
+        host_hit = {}
+        enemy_hit = {}
+        for f in range(len(self.start)):
+            hosts = [i for i in range(self.start[f], self.split[f]) if wounds[i] < _AI_KIA_WOUNDS]
+            enemies = [i for i in range(self.split[f], self.end[f]) if wounds[i] < _AI_KIA_WOUNDS]
+            shear = 0
+            rounds = 0
+            volleys = 0
+            for rnd in range(1, rounds_max + 1):
+                if not hosts or not enemies:
+                    break
+                rounds = rnd
+                shear += 5 + int(rand() * 8)
+
+                # Move 1 — host strike
+                h = hosts[int(rand() * len(hosts))]
+                e = enemies[int(rand() * len(enemies))]
+                ac = max(8, min(22, 12 + cover[e] - wounds[e]))
+                key = (wounds[h], ac)
+                p = host_hit.get(key)
+                if p is None:
+                    p = host_hit[key] = check_probability(ac, _AI_HOST_ATTACK_MOD - 2 * wounds[h])
+                if rand() < p:
+                    wounds[e] += 1 if rand() < 0.5 else 2
+                    if wounds[e] >= _AI_KIA_WOUNDS:
+                        enemies.remove(e)
+                        if not enemies:
+                            break
+
+                # Move 2 — enemy return fire
+                volleys += 1
+                h = hosts[int(rand() * len(hosts))]
+                ac = 11 + wounds[h]
+                p = enemy_hit.get(ac)
+                if p is None:
+                    p = enemy_hit[ac] = check_probability(ac, _AI_RETURN_FIRE_MOD)
+                if rand() < p:
+                    wounds[h] += 1 if rand() < 0.5 else 2
+                    host_hits[h] += 1
+                    if wounds[h] >= _AI_KIA_WOUNDS:
+                        hosts.remove(h)
+            self.rounds[f] = rounds
+            self.volleys[f] = volleys
+            self.shear[f] = shear
+
+
+def resolve_ai_skirmishes(
+    engagements: List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]],
+    world_state: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Resolve many unobserved AI skirmishes at once.
+
+    ``engagements`` holds (host_lives, enemy_fighters) pairs; host dicts and
+    enemy dicts are updated in place (wound_level, alive, stress_level) exactly as
+    the verbose loop would. Returns one ``{"rounds", "shear_peak", "host_kia_names"}``
+    dict per engagement.
+    """
+    batch = SkirmishBatch()
+    for hosts, enemies in engagements:
+        batch.add_fight(
+            [int(h.get("wound_level", 0) or 0) if h.get("alive", True) else _AI_KIA_WOUNDS for h in hosts],
+            [int(e.get("cover", 1)) for e in enemies],
+            [int(e.get("wound_level", 0) or 0) if e.get("alive", True) else _AI_KIA_WOUNDS for e in enemies],
+        )
+    batch.resolve()
+
+    results = []
+    volleys = 0
+    for f, (hosts, enemies) in enumerate(engagements):
+        kia = []
+        for i, h in enumerate(hosts, batch.start[f]):
+            if not h.get("alive", True):
+                continue
+            h["wound_level"] = int(batch.wounds[i])
+            if batch.host_hits[i]:
+                h["stress_level"] = min(1.0, float(h.get("stress_level", 0.3)) + 0.2 * batch.host_hits[i])
+            if batch.wounds[i] >= _AI_KIA_WOUNDS:
+                h["alive"] = False
+                kia.append(str(h.get("name", "Unknown")))
+        for i, e in enumerate(enemies, batch.split[f]):
+            if not e.get("alive", True):
+                continue
+            e["wound_level"] = int(batch.wounds[i])
+            if batch.wounds[i] >= _AI_KIA_WOUNDS:
+                e["alive"] = False
+        volleys += batch.volleys[f]
+        results.append({"rounds": int(batch.rounds[f]), "shear_peak": int(batch.shear[f]), "host_kia_names": kia})
+
+    if world_state is not None and volleys:
+        try:
+            world_state["timeline_stability"] = max(
+                0.0, float(world_state.get("timeline_stability", 0.8)) - 0.01 * volleys
+            )
+        except Exception:
+            pass
+    return results
+
+
+# Unobserved AI skirmishes are sampled from precomputed outcome tables instead of fought
+# round by round; set True (debug) to force the full kernel for every AI fight.
+FULL_AI_COMBAT_SIMULATION = False
+
+
+
+def _user_cache_dir() -> str:
+    """Per-user cache directory for files the game can rebuild (not the package directory)"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "travelers")
+
+
+SKIRMISH_OUTCOME_CACHE = os.path.join(_user_cache_dir(), "combat_outcome_cache.json")
+_OUTCOME_TABLE_VERSION = 2
+_OUTCOME_SAMPLES = 512
+
+
+class SkirmishOutcomeTable:
+    """
+    Final-outcome distributions for unobserved AI skirmishes.
+
+    A table is keyed by the living hosts' wound levels (sorted -- this is the
+    modifier band, since each wound costs the host -2 to hit) and the hostiles'
+    cover values (sorted). The opposing faction is not part of the key: the
+    kernel gives every foe the same return-fire modifier. Each table is built
+    once by fighting ``samples`` skirmishes through SkirmishBatch, collapsed
+    into distinct outcomes with weights, and kept in memory. New tables are
+    written to a JSON file in the user cache directory by ``flush`` (once per
+    AI turn and at exit) so later sessions start warm. The cache is discarded
+    when the combat constants it was built from change.
+    """
+
+    def __init__(self, path: Optional[str] = SKIRMISH_OUTCOME_CACHE, samples: int = _OUTCOME_SAMPLES) -> None:
+        self.path = path
+        self.samples = samples
+        self.signature = (
+            f"v{_OUTCOME_TABLE_VERSION}/atk{_AI_HOST_ATTACK_MOD}/ret{_AI_RETURN_FIRE_MOD}"
+            f"/kia{_AI_KIA_WOUNDS}/r{_AI_ROUNDS_MAX}/n{samples}"
+        )
+        # key -> (outcomes, cumulative weights); outcome = (host wounds, host hits, enemy wounds, rounds, volleys)
+        # Enemy wounds follow sorted(enemy_covers) order
+        self._tables: Dict[str, Tuple[List[Tuple], List[int]]] = {}
+        self._dirty = False  # tables built since the last save
+        self._load()
+
+    @staticmethod
+    def key(host_wounds: List[int], enemy_covers: List[int]) -> str:
+        band = ",".join(str(w) for w in sorted(host_wounds))
+        covers = ",".join(str(c) for c in sorted(enemy_covers))
+        return f"{band}|{covers}"
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("signature") != self.signature:
+            return
+        for key, rows in data.get("tables", {}).items():
+            outcomes = [(tuple(hw), tuple(hh), tuple(ew), rounds, volleys) for hw, hh, ew, rounds, volleys, _ in rows]
+            self._tables[key] = (outcomes, list(accumulate(row[-1] for row in rows)))
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tables = {}
+        for key, (outcomes, cum) in self._tables.items():
+            weights = [b - a for a, b in zip([0] + cum[:-1], cum)]
+            tables[key] = [[list(hw), list(hh), list(ew), rounds, volleys, w]
+                           for (hw, hh, ew, rounds, volleys), w in zip(outcomes, weights)]
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump({"signature": self.signature, "tables": tables}, f)
+        except OSError:
+            pass
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Save only if tables were built since the last save"""
+        if self._dirty:
+            self.save()
+
+    def distribution(self, host_wounds: List[int], enemy_covers: List[int]) -> Tuple[List[Tuple], List[int]]:
+        """Outcomes and cumulative weights for a matchup, building the table on first use"""
+        band = sorted(min(_AI_KIA_WOUNDS, int(w)) for w in host_wounds)
+        covers = sorted(int(c) for c in enemy_covers)
+        key = self.key(band, covers)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = self._build(band, covers)
+            self._dirty = True
+        return table
+
+    def _build(self, band: List[int], covers: List[int]) -> Tuple[List[Tuple], List[int]]:
+        batch = SkirmishBatch()
+        for _ in range(self.samples):
+            batch.add_fight(band, covers)
+        batch.resolve(_AI_ROUNDS_MAX)
+
+        counts: Dict[Tuple, int] = {}
+        for f in range(len(batch)):
+            hosts = range(batch.start[f], batch.split[f])
+            outcome = (
+                tuple(batch.wounds[i] for i in hosts),
+                tuple(batch.host_hits[i] for i in hosts),
+                tuple(min(_AI_KIA_WOUNDS, batch.wounds[i]) for i in range(batch.split[f], batch.end[f])),
+                batch.rounds[f],
+                batch.volleys[f],
+            )
+            counts[outcome] = counts.get(outcome, 0) + 1
+        outcomes = sorted(counts)
+        return outcomes, list(accumulate(counts[o] for o in outcomes))
+
+    def sample(self, host_wounds: List[int], enemy_covers: List[int]) -> Tuple:
+        """Draw one final outcome; host and enemy entries follow sorted(host_wounds) / sorted(enemy_covers)"""
+        outcomes, cum = self.distribution(host_wounds, enemy_covers)
+        return random.choices(outcomes, cum_weights=cum)[0]
+
+
+_outcome_table: Optional[SkirmishOutcomeTable] = None
+
+
+def skirmish_outcome_table() -> SkirmishOutcomeTable:
+    global _outcome_table
+    if _outcome_table is None:
+        _outcome_table = SkirmishOutcomeTable()
+        atexit.register(_outcome_table.flush)
+    return _outcome_table
+
+
+def flush_skirmish_outcome_table() -> None:
+    """Write tables built this turn to the cache file (no-op if none were built)"""
+    if _outcome_table is not None:
+        _outcome_table.flush()
+
+
+def fast_forward_ai_skirmish(
+    hosts: List[Dict[str, Any]],
+    enemies: List[Dict[str, Any]],
+    world_state: Optional[Dict[str, Any]] = None,
+    table: Optional[SkirmishOutcomeTable] = None,
+) -> Dict[str, Any]:
+    """
+    Settle one unobserved AI skirmish by sampling its final outcome.
+
+    Writes the same fields back to the host / enemy dicts as resolve_ai_skirmishes
+    and returns the same ``{"rounds", "shear_peak", "host_kia_names"}`` shape.
+    Hosts on equal wounds (and enemies in equal cover) are interchangeable, so
+    ties are shuffled before the sampled per-fighter results are dealt out.
+    """
+    if table is None:
+        table = skirmish_outcome_table()
+    living = [h for h in hosts if h.get("alive", True)]
+    living.sort(key=lambda h: (min(_AI_KIA_WOUNDS, int(h.get("wound_level", 0) or 0)), random.random()))
+    foes = sorted((e for e in enemies if e.get("alive", True)), key=lambda e: (int(e.get("cover", 1)), random.random()))
+    host_wounds, host_hits, enemy_wounds, rounds, volleys = table.sample(
+        [int(h.get("wound_level", 0) or 0) for h in living], [int(e.get("cover", 1)) for e in foes]
+    )
+
+    kia = []
+    for h, wounds, hits in zip(living, host_wounds, host_hits):
+        h["wound_level"] = int(wounds)
+        if hits:
+            h["stress_level"] = min(1.0, float(h.get("stress_level", 0.3)) + 0.2 * hits)
+        if wounds >= _AI_KIA_WOUNDS:
+            h["alive"] = False
+            kia.append(str(h.get("name", "Unknown")))
+    kia.sort(key=[str(h.get("name", "Unknown")) for h in hosts].index)
+    for e, wounds in zip(foes, enemy_wounds):
+        e["wound_level"] = int(wounds)
+        if wounds >= _AI_KIA_WOUNDS:
+            e["alive"] = False
+
+    if world_state is not None and volleys:
+        try:
+            world_state["timeline_stability"] = max(
+                0.0, float(world_state.get("timeline_stability", 0.8)) - 0.01 * volleys
+            )
+        except Exception:
+            pass
+    shear = sum(random.randint(5, 12) for _ in range(rounds))
+    return {"rounds": int(rounds), "shear_peak": shear, "host_kia_names": kia}
+
+
 def ai_team_mission_combat(
     ai_team: Any,
     mission: Dict[str, Any],
@@ -1349,8 +1734,10 @@ def ai_team_mission_combat(
     Simulated firefight for AI Traveler teams vs Faction or Government opposition.
     Mutates host_lives entries with wound_level / alive=False on death.
 
-    verbose=True: full round-by-round transcript. verbose=False (default): same simulation,
-    one compact outcome line plus structured return for post-combat recovery.
+    verbose=True: full round-by-round transcript. verbose=False (default): the final outcome is
+    sampled from SkirmishOutcomeTable (or fought through the batched kernel when
+    FULL_AI_COMBAT_SIMULATION is set), one compact outcome line plus structured return for
+    post-combat recovery.
 
     hot_mission: partial / messy ops or stressed hosts — much higher chance armed contact occurs
     (still skipped rarely so not every run is identical).
@@ -1382,103 +1769,113 @@ def ai_team_mission_combat(
             f"each round is Move 1 (AI strike) then Move 2 (enemy return fire)."
         )
 
-    shear = 0
-    rounds_max_ai = 6
-    rounds_fought = 0
-    host_kia_names: List[str] = []
-
-    for rnd in range(1, rounds_max_ai + 1):
-        living_h = [h for h in hosts if h.get("alive", True)]
-        living_e = [e for e in enemies if e.get("alive")]
-        if not living_h or not living_e:
-            break
-        rounds_fought = rnd
-        shear += random.randint(5, 12)
-        if verbose:
-            _apply_shear_narrative(shear, log)
-
-            log.append(
-                f"    ══ Round {rnd}/{rounds_max_ai} — AI hosts {len(living_h)} standing · "
-                f"hostiles {len(living_e)} standing ══"
-            )
-
-            log.append("       Move 1 — AI / Traveler-aligned strike")
-        h = random.choice(living_h)
-        e = random.choice(living_e)
-        fake_member = type("M", (), {})()
-        fake_member.skills = ["Combat", "Tactics"]
-        fake_member.occupation = h.get("occupation", "Operative")
-        fake_member.consciousness_stability = 0.9
-        fake_member.wound_level = int(h.get("wound_level", 0) or 0)
-        fake_member.designation = h.get("name", "Host")
-        fake_member.name = h.get("name", "Host")
-        fake_member.alive = True
-        atk_mods = _traveler_combat_mods(fake_member)
-        ac_en = _enemy_ac(e)
-        hit, rr = _strike(h.get("name", "Host"), "traveler", f"AI op vs {e['label']}", ac_en, atk_mods)
-        if hit:
-            dmg_ai = random.randint(1, 2)
-            ew0 = int(e.get("wound_level", 0) or 0)
-            e["wound_level"] = ew0 + dmg_ai
-            ew1 = int(e["wound_level"])
+    if not verbose:
+        # Nobody is watching: sample the final outcome (or, for debugging, fight it through the kernel)
+        if FULL_AI_COMBAT_SIMULATION:
+            result = resolve_ai_skirmishes([(hosts, enemies)], world_state)[0]
+        else:
+            result = fast_forward_ai_skirmish(hosts, enemies, world_state)
+        shear = result["shear_peak"]
+        rounds_fought = result["rounds"]
+        host_kia_names = result["host_kia_names"]
+    else:
+        shear = 0
+        rounds_max_ai = 6
+        rounds_fought = 0
+        host_kia_names: List[str] = []
+
+        for rnd in range(1, rounds_max_ai + 1):
+            living_h = [h for h in hosts if h.get("alive", True)]
+            living_e = [e for e in enemies if e.get("alive")]
+            if not living_h or not living_e:
+                break
+            rounds_fought = rnd
+            shear += random.randint(5, 12)
             if verbose:
+                _apply_shear_narrative(shear, log)
+
                 log.append(
-                    f"         {h.get('name', 'Host')} → {e['label']}{_strike_log_suffix(rr, hit, ac_en)} "
-                    f"| damage +{dmg_ai} | hostile wounds {ew0}→{ew1}"
+                    f"    ══ Round {rnd}/{rounds_max_ai} — AI hosts {len(living_h)} standing · "
+                    f"hostiles {len(living_e)} standing ══"
                 )
-            if e["wound_level"] >= 3:
-                e["alive"] = False
+
+                log.append("       Move 1 — AI / Traveler-aligned strike")
+            h = random.choice(living_h)
+            e = random.choice(living_e)
+            fake_member = type("M", (), {})()
+            fake_member.skills = ["Combat", "Tactics"]
+            fake_member.occupation = h.get("occupation", "Operative")
+            fake_member.consciousness_stability = 0.9
+            fake_member.wound_level = int(h.get("wound_level", 0) or 0)
+            fake_member.designation = h.get("name", "Host")
+            fake_member.name = h.get("name", "Host")
+            fake_member.alive = True
+            atk_mods = _traveler_combat_mods(fake_member)
+            ac_en = _enemy_ac(e)
+            hit, rr = _strike(h.get("name", "Host"), "traveler", f"AI op vs {e['label']}", ac_en, atk_mods)
+            if hit:
+                dmg_ai = random.randint(1, 2)
+                ew0 = int(e.get("wound_level", 0) or 0)
+                e["wound_level"] = ew0 + dmg_ai
+                ew1 = int(e["wound_level"])
                 if verbose:
-                    log.append(f"         💀 HOSTILE KIA: {e['label']} — down during AI skirmish.")
-        elif verbose:
-            log.append(f"         {h.get('name', 'Host')} → {e['label']}{_strike_log_suffix(rr, hit, ac_en)}")
-
-        living_e = [x for x in enemies if x.get("alive")]
-        living_h = [x for x in hosts if x.get("alive", True)]
-        if not living_e or not living_h:
-            if verbose and not living_e:
-                log.append("       …Hostiles eliminated; no return fire.")
-            break
+                    log.append(
+                        f"         {h.get('name', 'Host')} → {e['label']}{_strike_log_suffix(rr, hit, ac_en)} "
+                        f"| damage +{dmg_ai} | hostile wounds {ew0}→{ew1}"
+                    )
+                if e["wound_level"] >= 3:
+                    e["alive"] = False
+                    if verbose:
+                        log.append(f"         💀 HOSTILE KIA: {e['label']} — down during AI skirmish.")
+            elif verbose:
+                log.append(f"         {h.get('name', 'Host')} → {e['label']}{_strike_log_suffix(rr, hit, ac_en)}")
+
+            living_e = [x for x in enemies if x.get("alive")]
+            living_h = [x for x in hosts if x.get("alive", True)]
+            if not living_e or not living_h:
+                if verbose and not living_e:
+                    log.append("       …Hostiles eliminated; no return fire.")
+                break
 
-        if verbose:
-            log.append("       Move 2 — Enemy return fire")
-        e2 = random.choice(living_e)
-        h2 = random.choice(living_h)
-        ac = 11 + int(h2.get("wound_level", 0) or 0)
-        hit2, rr2 = _strike(
-            e2["label"],
-            "faction" if foe == FACTION_THE_FACTION else "government",
-            "return fire",
-            ac,
-            {"pressure": 1},
-        )
-        if hit2:
-            dmg_h = random.randint(1, 2)
-            hw0 = int(h2.get("wound_level", 0) or 0)
-            h2["wound_level"] = hw0 + dmg_h
-            hw1 = int(h2["wound_level"])
-            h2["stress_level"] = min(1.0, float(h2.get("stress_level", 0.3)) + 0.2)
             if verbose:
-                log.append(
-                    f"         {e2['label']} → {h2.get('name', 'Unknown')}{_strike_log_suffix(rr2, hit2, ac)} "
-                    f"| damage +{dmg_h} | host wounds {hw0}→{hw1} (KIA at wound level 3+)"
-                )
-            if h2["wound_level"] >= 3:
-                h2["alive"] = False
-                nm = h2.get("name", "Unknown")
-                host_kia_names.append(str(nm))
+                log.append("       Move 2 — Enemy return fire")
+            e2 = random.choice(living_e)
+            h2 = random.choice(living_h)
+            ac = 11 + int(h2.get("wound_level", 0) or 0)
+            hit2, rr2 = _strike(
+                e2["label"],
+                "faction" if foe == FACTION_THE_FACTION else "government",
+                "return fire",
+                ac,
+                {"pressure": 1},
+            )
+            if hit2:
+                dmg_h = random.randint(1, 2)
+                hw0 = int(h2.get("wound_level", 0) or 0)
+                h2["wound_level"] = hw0 + dmg_h
+                hw1 = int(h2["wound_level"])
+                h2["stress_level"] = min(1.0, float(h2.get("stress_level", 0.3)) + 0.2)
                 if verbose:
                     log.append(
-                        f"         💀 AI HOST KIA: {nm} — hostile fire ends this host during skirmish."
+                        f"         {e2['label']} → {h2.get('name', 'Unknown')}{_strike_log_suffix(rr2, hit2, ac)} "
+                        f"| damage +{dmg_h} | host wounds {hw0}→{hw1} (KIA at wound level 3+)"
                     )
-        elif verbose:
-            log.append(
-                f"         {e2['label']} → {h2.get('name', 'Unknown')}{_strike_log_suffix(rr2, hit2, ac)}"
-            )
-        try:
-            world_state["timeline_stability"] = max(0.0, float(world_state.get("timeline_stability", 0.8)) - 0.01)
-        except Exception:
-            pass
+                if h2["wound_level"] >= 3:
+                    h2["alive"] = False
+                    nm = h2.get("name", "Unknown")
+                    host_kia_names.append(str(nm))
+                    if verbose:
+                        log.append(
+                            f"         💀 AI HOST KIA: {nm} — hostile fire ends this host during skirmish."
+                        )
+            elif verbose:
+                log.append(
+                    f"         {e2['label']} → {h2.get('name', 'Unknown')}{_strike_log_suffix(rr2, hit2, ac)}"
+                )
+            try:
+                world_state["timeline_stability"] = max(0.0, float(world_state.get("timeline_stability", 0.8)) - 0.01)
+            except Exception:
+                pass
 
     enemy_kia = sum(1 for e in enemies if not e.get("alive"))
     living_hosts = [h for h in hosts if h.get("alive", True)]
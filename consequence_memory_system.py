@@ -1,8 +1,16 @@
 # consequence_memory_system.py
 # Save this as a new file in your Travelers game folder
 
+import bisect
+import heapq
+import itertools
 import random
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+# Heat lost by every location per turn without a new incident
+HEAT_DECAY_PER_TURN = 0.05
+# Minimum heat before a location is handed to government agents
+GOVERNMENT_HEAT_THRESHOLD = 0.3
 
 
 class WorldMemory:
@@ -10,10 +18,68 @@ class WorldMemory:
     
     def __init__(self):
         self.player_actions = []
-        self.hot_locations = {}
-        self.scheduled_consequences = []
         self.turn_count = 0
-        
+        # Scheduled consequences live in a min-heap of (trigger_turn, seq, consequence)
+        self._consequence_heap = []
+        self._consequence_seq = itertools.count()
+        # Hot locations store heat as of 'heat_turn' and decay lazily on read.
+        # Every location cools at the same rate, so ranking by
+        # heat_level + decay * heat_turn never changes between incidents.
+        self._hot_locations = {}
+        self._heat_index = []  # sorted list of (-decay_key, location)
+        self._heat_keys = {}
+        
+    @property
+    def scheduled_consequences(self) -> List[Dict[str, Any]]:
+        """Pending consequences ordered by trigger turn"""
+        return [entry[2] for entry in sorted(self._consequence_heap)]
+
+    @scheduled_consequences.setter
+    def scheduled_consequences(self, consequences):
+        self._consequence_heap = []
+        for consequence in consequences or []:
+            self.schedule_consequence(consequence)
+
+    def schedule_consequence(self, consequence: Dict[str, Any]):
+        """Queue a consequence to fire at its 'trigger_turn'"""
+        trigger_turn = int(consequence.get('trigger_turn', self.turn_count + 1))
+        heapq.heappush(self._consequence_heap, (trigger_turn, next(self._consequence_seq), consequence))
+
+    @property
+    def hot_locations(self) -> Dict[str, Dict[str, Any]]:
+        """Raw location heat records (use get_location_heat for the decayed value)"""
+        return self._hot_locations
+
+    @hot_locations.setter
+    def hot_locations(self, locations):
+        self._hot_locations = dict(locations or {})
+        self._heat_index = []
+        self._heat_keys = {}
+        for location, data in self._hot_locations.items():
+            # Records from older saves hold heat already decayed to the current turn
+            data.setdefault('heat_turn', self.turn_count)
+            self._reindex_location(location)
+
+    def _reindex_location(self, location: str):
+        """Move a location to its new position in the heat ranking"""
+        old_key = self._heat_keys.pop(location, None)
+        if old_key is not None:
+            i = bisect.bisect_left(self._heat_index, (-old_key, location))
+            if i < len(self._heat_index) and self._heat_index[i] == (-old_key, location):
+                del self._heat_index[i]
+        data = self._hot_locations[location]
+        key = data['heat_level'] + HEAT_DECAY_PER_TURN * data['heat_turn']
+        self._heat_keys[location] = key
+        bisect.insort(self._heat_index, (-key, location))
+
+    def get_location_heat(self, location: str) -> float:
+        """Current heat for a location after lazy per-turn cooling"""
+        data = self._hot_locations.get(location)
+        if not data:
+            return 0.0
+        turns_since = max(0, self.turn_count - data['heat_turn'])
+        return max(0.0, data['heat_level'] - HEAT_DECAY_PER_TURN * turns_since)
+
     def record_player_mission(self, mission: Dict[str, Any]):
         """Record player mission with DYNAMIC heat calculation"""
         location = mission['location']
@@ -85,17 +151,19 @@ class WorldMemory:
         if location not in self.hot_locations:
             self.hot_locations[location] = {
                 'heat_level': 0.0,
+                'heat_turn': self.turn_count,
                 'incident_count': 0,
                 'last_incident_turn': self.turn_count,
                 'worst_incident': 'none'
             }
         
         # Apply heat (cumulative). Positive values increase heat; negative values cool the area.
-        previous_heat = self.hot_locations[location]['heat_level']
-        self.hot_locations[location]['heat_level'] = max(0.0, min(1.0,
-            self.hot_locations[location]['heat_level'] + base_heat))
+        previous_heat = self.get_location_heat(location)
+        self.hot_locations[location]['heat_level'] = max(0.0, min(1.0, previous_heat + base_heat))
+        self.hot_locations[location]['heat_turn'] = self.turn_count
         self.hot_locations[location]['incident_count'] += 1
         self.hot_locations[location]['last_incident_turn'] = self.turn_count
+        self._reindex_location(location)
         
         # Track worst incident type only for positive heat spikes
         if base_heat > 0.6:
@@ -127,7 +195,7 @@ class WorldMemory:
         if not success and heat_level > 0.0:
             response_intensity = min(1.0, heat_level * 1.2)
             
-            self.scheduled_consequences.append({
+            self.schedule_consequence({
                 'trigger_turn': self.turn_count + 1,
                 'description': f"🚨 {'URGENT' if response_intensity > 0.7 else 'Priority'} federal response to {location}",
                 'location': location,
@@ -142,7 +210,7 @@ class WorldMemory:
             forensic_depth = 'full' if heat_level > 0.7 else 'standard'
             turns_until = 2 if heat_level > 0.7 else 3
             
-            self.scheduled_consequences.append({
+            self.schedule_consequence({
                 'trigger_turn': self.turn_count + turns_until,
                 'description': f"🔬 {forensic_depth.title()} forensic analysis at {location}",
                 'location': location,
@@ -158,7 +226,7 @@ class WorldMemory:
             media_turns = random.randint(2, 4)
             media_intensity = 'breaking news' if heat_level > 0.8 else 'local coverage'
             
-            self.scheduled_consequences.append({
+            self.schedule_consequence({
                 'trigger_turn': self.turn_count + media_turns,
                 'description': f"📺 {media_intensity.title()}: Incident at {location}",
                 'location': location,
@@ -174,7 +242,7 @@ class WorldMemory:
             witness_count = len(mission['witnesses'])
             witness_turns = random.randint(1, 3)
             
-            self.scheduled_consequences.append({
+            self.schedule_consequence({
                 'trigger_turn': self.turn_count + witness_turns,
                 'description': f"👁️ {witness_count} witness(es) providing statements about {location}",
                 'location': location,
@@ -189,7 +257,7 @@ class WorldMemory:
         if self.hot_locations[location]['incident_count'] >= 2 and heat_level > 0.6 and not success:
             surveillance_turns = random.randint(3, 6)
             
-            self.scheduled_consequences.append({
+            self.schedule_consequence({
                 'trigger_turn': self.turn_count + surveillance_turns,
                 'description': f"📹 24/7 surveillance network deployed at {location}",
                 'location': location,
@@ -204,7 +272,7 @@ class WorldMemory:
         if heat_level > 0.85 and not success:
             task_force_turns = random.randint(4, 7)
             
-            self.scheduled_consequences.append({
+            self.schedule_consequence({
                 'trigger_turn': self.turn_count + task_force_turns,
                 'description': f"🚨 FEDERAL TASK FORCE established targeting {location} area",
                 'location': location,
@@ -219,7 +287,7 @@ class WorldMemory:
         if mission.get('casualties', 0) > 0:
             casualties = mission['casualties']
             
-            self.scheduled_consequences.append({
+            self.schedule_consequence({
                 'trigger_turn': self.turn_count + 1,
                 'description': f"💀 HOMICIDE INVESTIGATION: {casualties} death(s) at {location}",
                 'location': location,
@@ -239,30 +307,26 @@ class WorldMemory:
         self.turn_count += 1
         
         triggered = []
-        for c in self.scheduled_consequences[:]:
-            if c['trigger_turn'] <= self.turn_count:
-                triggered.append(c)
-                self.scheduled_consequences.remove(c)
-        
-        # Cool down locations
-        for loc_data in self.hot_locations.values():
-            turns_since = self.turn_count - loc_data['last_incident_turn']
-            if turns_since > 0:
-                loc_data['heat_level'] = max(0.0, loc_data['heat_level'] - 0.05)
+        while self._consequence_heap and self._consequence_heap[0][0] <= self.turn_count:
+            triggered.append(heapq.heappop(self._consequence_heap)[2])
         
+        # Locations cool down lazily in get_location_heat
         return triggered
     
-    def get_hot_locations_for_government(self):
-        """Get locations for government to investigate"""
+    def get_hot_locations_for_government(self, limit: Optional[int] = None):
+        """Get locations for government to investigate, hottest first"""
+        # Effective heat >= threshold <=> decay key >= threshold + decay * turn
+        min_key = GOVERNMENT_HEAT_THRESHOLD + HEAT_DECAY_PER_TURN * self.turn_count
         hot = []
-        for location, data in self.hot_locations.items():
-            if data['heat_level'] >= 0.3:
-                hot.append({
-                    'location': location,
-                    'heat_level': data['heat_level'],
-                    'incident_count': data['incident_count']
-                })
-        return sorted(hot, key=lambda x: x['heat_level'], reverse=True)
+        for neg_key, location in self._heat_index:
+            if -neg_key < min_key - 1e-9 or (limit is not None and len(hot) >= limit):
+                break
+            hot.append({
+                'location': location,
+                'heat_level': self.get_location_heat(location),
+                'incident_count': self.hot_locations[location]['incident_count']
+            })
+        return hot
 
 
 class ConsequenceIntegrator:
@@ -289,7 +353,7 @@ class ConsequenceIntegrator:
                 print(f"  • {c['description']}")
         
         # Show hot locations
-        hot = self.memory.get_hot_locations_for_government()
+        hot = self.memory.get_hot_locations_for_government(limit=3)
         if hot:
             print(f"\n🔥 HOT LOCATIONS:")
             for loc in hot[:3]:
@@ -299,7 +363,8 @@ class ConsequenceIntegrator:
     
     def target_government_agents(self, agents):
         """Direct agents to player locations"""
-        hot = self.memory.get_hot_locations_for_government()
+        idle_agents = [agent for agent in agents if not agent.current_investigation]
+        hot = self.memory.get_hot_locations_for_government(limit=len(idle_agents))
 
         if not hot:
             return
@@ -307,9 +372,9 @@ class ConsequenceIntegrator:
         print(f"\\n🎯 TARGETING INVESTIGATIONS:")
 
         assigned = 0
-        for agent in agents:
-            if agent.current_investigation or assigned >= len(hot):
-                continue
+        for agent in idle_agents:
+            if assigned >= len(hot):
+                break
 
             target = hot[assigned]
             agent.current_investigation = {
@@ -326,7 +391,7 @@ class ConsequenceIntegrator:
 
     def get_turn_summary(self):
         """Get a formatted summary of the consequence system state for display to player"""
-        hot = self.memory.get_hot_locations_for_government()
+        hot = self.memory.get_hot_locations_for_government(limit=5)
         scheduled = self.memory.scheduled_consequences
         lines = []
         
@@ -346,9 +411,8 @@ class ConsequenceIntegrator:
         # Scheduled Consequences
         if scheduled:
             lines.append("\\n⏰ UPCOMING CONSEQUENCES:")
-            # Sort by trigger turn
-            sorted_scheduled = sorted(scheduled, key=lambda x: x['trigger_turn'])
-            for cons in sorted_scheduled[:5]:  # Show next 5
+            # Already ordered by trigger turn
+            for cons in scheduled[:5]:  # Show next 5
                 turns_until = cons['trigger_turn'] - self.memory.turn_count
                 if turns_until < 0:
                     turns_until = 0  # Shouldn't happen, but just in case
@@ -376,10 +440,10 @@ class ConsequenceIntegrator:
         # World Impact Summary
         lines.append("\\n🌍 WORLD IMPACT INDICATORS:")
         # Calculate overall heat
-        total_heat = sum(loc['heat_level'] for loc in self.memory.hot_locations.values())
-        avg_heat = total_heat / len(self.memory.hot_locations) if self.memory.hot_locations else 0
+        heats = [self.memory.get_location_heat(loc) for loc in self.memory.hot_locations]
+        avg_heat = sum(heats) / len(heats) if heats else 0
         lines.append(f"   • Overall Alert Level: {int(avg_heat * 100)}%")
-        lines.append(f"   • Active Hotspots: {len([l for l in self.memory.hot_locations.values() if l['heat_level'] > 0.3])}")
+        lines.append(f"   • Active Hotspots: {len([h for h in heats if h > 0.3])}")
         lines.append(f"   • Total Missions Tracked: {len(self.memory.player_actions)}")
         
         return "\\n".join(lines)
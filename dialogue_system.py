@@ -2,6 +2,11 @@
 import random
 import time
 
+from relationship_graph import RelationshipGraph
+
+# The player's node in the relationship graph; dialogue ties are "dialogue" edges from it
+PLAYER_NODE = "player"
+
 class DialogueNode:
     """Represents a single dialogue exchange"""
     def __init__(self, text, speaker, responses=None, consequences=None):
@@ -332,10 +337,29 @@ class DialogueGenerator:
 class DialogueManager:
     """Manages all dialogue interactions in the game"""
     
-    def __init__(self):
+    def __init__(self, relationship_graph=None, npc_lookup=None):
         self.generator = DialogueGenerator()
         self.active_conversations = {}
-        self.npc_relationships = {}
+        self.relationship_graph = relationship_graph if relationship_graph is not None else RelationshipGraph()
+        self.relationship_graph.add_node(PLAYER_NODE, kind="player")
+        # name -> world NPC id (or None); ties to world NPCs are keyed by id in the shared graph
+        self.npc_lookup = npc_lookup
+        self._npc_names = {}  # graph node -> NPC name
+    
+    @property
+    def npc_relationships(self):
+        """Relationship level per NPC name the player has talked to"""
+        return {
+            self._npc_names.get(node, node): level
+            for node, _, level in self.relationship_graph.neighbors(PLAYER_NODE, "dialogue")
+        }
+    
+    def _npc_node(self, npc_name):
+        """Graph node for an NPC: its world id when the world knows the name, else the name"""
+        npc_id = self.npc_lookup(npc_name) if self.npc_lookup else None
+        node = npc_id if npc_id is not None else npc_name
+        self._npc_names[node] = npc_name
+        return node
         
     def start_conversation(self, npc_name, npc_type, context=None):
         """Start a conversation with an NPC"""
@@ -343,10 +367,11 @@ class DialogueManager:
             return self.active_conversations[npc_name]
         
         # Get or create relationship level
-        if npc_name not in self.npc_relationships:
-            self.npc_relationships[npc_name] = 0.5
-        
-        relationship = self.npc_relationships[npc_name]
+        node = self._npc_node(npc_name)
+        relationship = self.relationship_graph.weight(PLAYER_NODE, node, "dialogue")
+        if relationship is None:
+            relationship = 0.5
+            self.relationship_graph.add_edge(PLAYER_NODE, node, "dialogue", relationship)
         
         # Generate appropriate dialogue
         if npc_type == "family_member":
@@ -374,7 +399,8 @@ class DialogueManager:
         
         # Update relationship
         if hasattr(dialogue, 'relationship_level'):
-            self.npc_relationships[npc_name] = dialogue.relationship_level
+            self.relationship_graph.add_edge(PLAYER_NODE, self._npc_node(npc_name), "dialogue",
+                                             dialogue.relationship_level)
         
         # Remove completed conversations
         if result and result.get("node_id") == "end":
@@ -384,14 +410,11 @@ class DialogueManager:
     
     def get_npc_relationship(self, npc_name):
         """Get the current relationship level with an NPC"""
-        return self.npc_relationships.get(npc_name, 0.5)
+        return self.relationship_graph.weight(PLAYER_NODE, self._npc_node(npc_name), "dialogue", 0.5)
     
     def update_relationship(self, npc_name, change):
         """Update relationship with an NPC"""
-        if npc_name not in self.npc_relationships:
-            self.npc_relationships[npc_name] = 0.5
-        
-        self.npc_relationships[npc_name] = max(0.0, min(1.0, self.npc_relationships[npc_name] + change))
+        self.relationship_graph.adjust_weight(PLAYER_NODE, self._npc_node(npc_name), "dialogue", change)
     
     def get_relationship_status(self, relationship_level):
         """Get a human-readable relationship status"""
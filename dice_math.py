@@ -0,0 +1,108 @@
+# dice_math.py
+"""
+Exact probability math for the project's d20 checks.
+
+Systems that want to know how likely a roll is -- balance analysis, AI
+decisions, "expected value" readouts -- should ask here instead of rolling
+many times. Every table is a few dozen float operations over the twenty faces
+and is memoized, so repeat queries are dictionary lookups.
+
+Advantage is an integer: +n keeps the highest of n + 1 dice, -n keeps the
+lowest of n + 1 dice, 0 is a single die.
+"""
+
+import random
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+FACES = range(1, 21)
+
+
+@lru_cache(maxsize=None)
+def d20_pmf(advantage: int = 0) -> Tuple[float, ...]:
+    """Probability of each kept face; index 0 is a natural 1"""
+    dice = 1 + abs(advantage)
+    if advantage >= 0:
+        return tuple((face / 20) ** dice - ((face - 1) / 20) ** dice for face in FACES)
+    return tuple(((21 - face) / 20) ** dice - ((20 - face) / 20) ** dice for face in FACES)
+
+
+def roll_d20(advantage: int = 0) -> int:
+    """Roll the kept d20 for the given advantage"""
+    rolls = [random.randint(1, 20) for _ in range(1 + abs(advantage))]
+    return max(rolls) if advantage >= 0 else min(rolls)
+
+
+@lru_cache(maxsize=4096)
+def check_probability(dc: float, modifier: float = 0, advantage: int = 0,
+                      nat20_succeeds: bool = False, nat1_fails: bool = False) -> float:
+    """Chance that kept d20 + modifier >= dc, with optional natural 20 / natural 1 overrides"""
+    pmf = d20_pmf(advantage)
+    chance = 0.0
+    for face, p in zip(FACES, pmf):
+        if face == 20 and nat20_succeeds:
+            chance += p
+        elif face == 1 and nat1_fails:
+            continue
+        elif face + modifier >= dc:
+            chance += p
+    return chance
+
+
+@lru_cache(maxsize=4096)
+def check_outcomes(dc: float, modifier: float = 0, advantage: int = 0) -> Dict[str, float]:
+    """Success / critical odds for D20DecisionSystem-style checks
+
+    Criticals are natural 20 / natural 1 and are reported alongside the plain
+    pass/fail split (a natural 20 can still miss a DC it cannot reach).
+    """
+    pmf = d20_pmf(advantage)
+    success = sum(p for face, p in zip(FACES, pmf) if face + modifier >= dc)
+    return {
+        "success": success,
+        "failure": 1.0 - success,
+        "critical_success": pmf[19],
+        "critical_failure": pmf[0],
+    }
+
+
+@lru_cache(maxsize=4096)
+def outcome_pmf(classify: Callable[..., Hashable], modifier: float = 0, advantage: int = 0,
+                args: Tuple = ()) -> Dict[Hashable, float]:
+    """Distribution of `classify(face, total, *args)` over the kept d20
+
+    `classify` must be a module-level function (or other stable callable) so
+    the memo table is reused across calls; pass per-call parameters such as a
+    DC through `args`.
+    """
+    pmf = d20_pmf(advantage)
+    odds = {}
+    for face, p in zip(FACES, pmf):
+        outcome = classify(face, face + modifier, *args)
+        odds[outcome] = odds.get(outcome, 0.0) + p
+    return odds
+
+
+@lru_cache(maxsize=4096)
+def band_pmf(bands: Tuple[Tuple[float, Hashable], ...], modifier: float = 0, advantage: int = 0,
+             below: Optional[Hashable] = None) -> Dict[Hashable, float]:
+    """Distribution over result bands given as ((minimum total, label), ...) highest first
+
+    Totals under every band land in `below`.
+    """
+    pmf = d20_pmf(advantage)
+    odds = {}
+    for face, p in zip(FACES, pmf):
+        total = face + modifier
+        label = below
+        for minimum, band in bands:
+            if total >= minimum:
+                label = band
+                break
+        odds[label] = odds.get(label, 0.0) + p
+    return odds
+
+
+def expected_value(odds: Dict[Hashable, float], values: Dict[Hashable, float]) -> float:
+    """Expected payoff of an outcome distribution, with `values` per outcome (missing = 0)"""
+    return sum(p * values.get(outcome, 0.0) for outcome, p in odds.items())
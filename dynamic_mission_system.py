@@ -5,12 +5,20 @@ Creates missions in response to real-time world conditions, threats, and events.
 The Director is always watching and adapting tactics based on what's happening.
 """
 
+import heapq
 import random
 import math
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from metric_series import campaign_metrics
+from mission_odds import format_odds, success_chance
+
+# Turns of metric history a threat's trend is read over
+TREND_WINDOW = 5
+
+
 @dataclass
 class ThreatAssessment:
     """Assessment of current threats and world conditions"""
@@ -37,6 +45,62 @@ class MissionTemplate:
     timeline_effects: Dict[str, float]
     faction_effects: Dict[str, float]
 
+def _cyber_threat_event(op: Dict) -> Optional[Dict]:
+    """Recent hacking operation -> event, if it raised enough alarm"""
+    if op.get("alert_level", 0) <= 0.7:
+        return None
+    return {
+        "type": "cyber_threat",
+        "location": op.get("target", "Unknown"),
+        "threat_level": op.get("alert_level", 0),
+        "urgency": 0.8,
+        "complexity": 0.7,
+        "entities": ["hackers", "government", "target_system"],
+        "timeline_impact": 0.3,
+        "faction_involvement": 0.6
+    }
+
+
+def _government_response_event(response: Dict) -> Optional[Dict]:
+    """Recent government response -> event, if it was intense enough"""
+    if response.get("intensity", 0) <= 0.6:
+        return None
+    return {
+        "type": "government_response",
+        "location": response.get("location", "Unknown"),
+        "threat_level": response.get("intensity", 0),
+        "urgency": 0.9,
+        "complexity": 0.8,
+        "entities": ["government", "fbi", "cia", "local_police"],
+        "timeline_impact": 0.4,
+        "faction_involvement": 0.2
+    }
+
+
+def _traveler_exposure_event(activity: Dict) -> Optional[Dict]:
+    """Recent Traveler activity -> event, if it risked exposure"""
+    if activity.get("exposure_risk", 0) <= 0.5:
+        return None
+    return {
+        "type": "traveler_exposure",
+        "location": activity.get("location", "Unknown"),
+        "threat_level": activity.get("exposure_risk", 0),
+        "urgency": 0.7,
+        "complexity": 0.6,
+        "entities": ["travelers", "host_bodies", "witnesses"],
+        "timeline_impact": 0.3,
+        "faction_involvement": 0.1
+    }
+
+
+# game_state event list -> per-item analyzer
+RECENT_EVENT_ANALYZERS = {
+    "hacking_operations": _cyber_threat_event,
+    "government_responses": _government_response_event,
+    "traveler_activities": _traveler_exposure_event,
+}
+
+
 class DynamicMissionSystem:
     """
     Sophisticated mission generation system that responds to real-time world conditions.
@@ -64,6 +128,7 @@ class DynamicMissionSystem:
         
         # Initialize mission templates
         self._initialize_mission_templates()
+        self._initialize_threat_model()
         
     def _initialize_mission_templates(self):
         """Initialize comprehensive mission templates"""
@@ -241,93 +306,139 @@ class DynamicMissionSystem:
             ]
         }
     
+    # ------------------------------------------------------------------
+    # Threat model
+    # ------------------------------------------------------------------
+    def _initialize_threat_model(self):
+        """Set up the incremental threat model used by assess_world_threats
+
+        Scalar sources subscribe to the world-state keys they read, and to the
+        recent trend of the metric that sets their urgency; event sources
+        (RECENT_EVENT_ANALYZERS) follow a game_state list item by item.
+        """
+        self.threat_sources = {
+            "timeline_crisis": (("timeline_stability",), self._timeline_crisis_threats),
+            "faction_operation": (("faction_influence",), self._faction_operation_threats),
+            "traveler_detection": (("traveler_exposure_risk",), self._traveler_detection_threats),
+            "faction_detection": (("faction_exposure_risk",), self._faction_detection_threats),
+        }
+        # Source -> campaign metric whose trend feeds its urgency
+        self.threat_trends = {
+            "timeline_crisis": "timeline_stability",
+            "faction_operation": "faction_influence",
+            "traveler_detection": "traveler_exposure_risk",
+            "faction_detection": "faction_exposure_risk",
+        }
+        self.metrics = campaign_metrics
+        self._threat_subscribers: Dict[str, List[str]] = {}
+        for name, (keys, _) in self.threat_sources.items():
+            for key in keys:
+                self._threat_subscribers.setdefault(key, []).append(name)
+
+        self._threat_inputs: Dict[str, object] = {}      # key -> last value seen
+        self._source_threats: Dict[str, List[ThreatAssessment]] = {}
+        self._threat_versions: Dict[str, int] = {}
+        # event key -> (the list last seen, items analysed, threats found so far)
+        self._event_cursors: Dict[str, Tuple[Optional[List], int, List[ThreatAssessment]]] = {}
+        # Ranked threats: (-priority, seq, source, version, threat); stale versions are dropped lazily
+        self._threat_queue: List[Tuple[float, int, str, int, ThreatAssessment]] = []
+        self._threat_seq = 0
+        self._stale_threats = 0
+
+    def _trend_urgency(self, metric: str, base: float, direction: float = 1.0) -> float:
+        """`base` urgency shifted by how far `metric` moved (in `direction`) over the trend window"""
+        drift = self.metrics.slope(metric, TREND_WINDOW) * TREND_WINDOW * direction
+        return min(1.0, max(0.0, base + drift))
+
+    @staticmethod
+    def _threat_priority(threat: ThreatAssessment) -> float:
+        level = float(threat.threat_level) if isinstance(threat.threat_level, (int, float)) else 0.5
+        urgency = float(threat.urgency) if isinstance(threat.urgency, (int, float)) else 0.5
+        return level * urgency
+
+    def _set_source_threats(self, source: str, threats: List[ThreatAssessment]):
+        """Replace one source's threats in the ranked queue"""
+        self._stale_threats += len(self._source_threats.get(source, ()))
+        version = self._threat_versions.get(source, 0) + 1
+        self._threat_versions[source] = version
+        self._source_threats[source] = threats
+        for threat in threats:
+            self._threat_seq += 1
+            heapq.heappush(self._threat_queue,
+                           (-self._threat_priority(threat), self._threat_seq, source, version, threat))
+        if self._stale_threats > len(self._threat_queue) // 2:
+            self._threat_queue = [entry for entry in self._threat_queue
+                                  if entry[3] == self._threat_versions[entry[2]]]
+            heapq.heapify(self._threat_queue)
+            self._stale_threats = 0
+
+    def _refresh_threat_sources(self, world_state: Dict, game_state: Dict) -> List[str]:
+        """Recompute only the threat sources whose inputs changed; returns their names"""
+        dirty = set()
+        for key, sources in self._threat_subscribers.items():
+            value = world_state.get(key)
+            if key not in self._threat_inputs or self._threat_inputs[key] != value:
+                self._threat_inputs[key] = value
+                dirty.update(sources)
+        for name, metric in self.threat_trends.items():
+            key = ("trend", metric)
+            trend = self.metrics.slope(metric, TREND_WINDOW)
+            if key not in self._threat_inputs or self._threat_inputs[key] != trend:
+                self._threat_inputs[key] = trend
+                dirty.add(name)
+        for name in dirty:
+            self._set_source_threats(name, self.threat_sources[name][1](world_state))
+
+        refreshed = sorted(dirty)
+        for key in RECENT_EVENT_ANALYZERS:
+            if self._refresh_event_source(key, game_state.get(key) or []):
+                refreshed.append(key)
+        return refreshed
+
+    def _refresh_event_source(self, key: str, items: List[Dict]) -> bool:
+        """Analyse only the events appended to `items` since the last call"""
+        previous, seen, threats = self._event_cursors.get(key, (None, 0, []))
+        if not items and not threats and key in self._source_threats:
+            return False
+        if previous is not items or len(items) < seen:
+            seen, threats = 0, []
+        if seen == len(items) and key in self._source_threats:
+            return False
+        analyze = RECENT_EVENT_ANALYZERS[key]
+        threats = threats + [
+            self._event_threat(event) for event in (analyze(item) for item in items[seen:])
+            if event and event["threat_level"] > 0.4  # Lowered from 0.5
+        ]
+        self._event_cursors[key] = (items, len(items), threats)
+        self._set_source_threats(key, threats)
+        return True
+
+    def top_threats(self, limit: Optional[int] = None) -> List[ThreatAssessment]:
+        """Current threats, highest priority first (threat level x urgency)"""
+        live = (entry for entry in self._threat_queue if entry[3] == self._threat_versions[entry[2]])
+        if limit is None:
+            return [entry[-1] for entry in sorted(live)]
+        return [entry[-1] for entry in heapq.nsmallest(limit, live)]
+
     def assess_world_threats(self, world_state: Dict, game_state: Dict) -> List[ThreatAssessment]:
         """
         Analyze current world state and identify threats requiring mission response.
         The Director is always watching and analyzing.
+
+        Threat sources are only re-derived when the world-state keys they watch
+        change (or new events arrive); the ranking lives in a priority queue.
         """
-        threats = []
-        
-        # Analyze timeline stability - More sensitive threshold
-        timeline_stability = world_state.get("timeline_stability", 0.8)
-        if timeline_stability < 0.75:  # Lowered from 0.7
-            threats.append(ThreatAssessment(
-                threat_level=1.0 - timeline_stability,
-                threat_type="timeline_crisis",
-                location=self._identify_crisis_location(world_state),
-                urgency=0.9,
-                complexity=0.8,
-                involved_entities=["timeline", "faction", "government"],
-                timeline_impact=0.4,
-                faction_involvement=0.6
-            ))
-        
-        # Analyze faction influence - More sensitive threshold
-        faction_influence = world_state.get("faction_influence", 0.2)
-        if faction_influence > 0.3:  # Lowered from 0.4
-            threats.append(ThreatAssessment(
-                threat_level=faction_influence,
-                threat_type="faction_operation",
-                location=self._identify_faction_activity(world_state),
-                urgency=0.8,
-                complexity=0.7,
-                involved_entities=["faction", "rogue_travelers", "government"],
-                timeline_impact=0.3,
-                faction_involvement=0.9
-            ))
-        
-        # Analyze government detection - More sensitive threshold
-        traveler_exposure = world_state.get("traveler_exposure_risk", 0.1)
-        faction_exposure = world_state.get("faction_exposure_risk", 0.1)
-        
-        if traveler_exposure > 0.5:  # Lowered from 0.6
-            threats.append(ThreatAssessment(
-                threat_level=traveler_exposure,
-                threat_type="government_detection",
-                location=self._identify_detection_location(world_state),
-                urgency=0.7,
-                complexity=0.6,
-                involved_entities=["government", "fbi", "cia", "travelers"],
-                timeline_impact=0.2,
-                faction_involvement=0.3
-            ))
-        
-        if faction_exposure > 0.5:  # Lowered from 0.6
-            threats.append(ThreatAssessment(
-                threat_level=faction_exposure,
-                threat_type="government_detection",
-                location=self._identify_detection_location(world_state),
-                urgency=0.7,
-                complexity=0.6,
-                involved_entities=["government", "fbi", "cia", "faction"],
-                timeline_impact=0.2,
-                faction_involvement=0.8
-            ))
-        
-        # Analyze recent world events
-        recent_events = self._analyze_recent_events(world_state, game_state)
-        for event in recent_events:
-            if event["threat_level"] > 0.4:  # Lowered from 0.5
-                threats.append(ThreatAssessment(
-                    threat_level=event["threat_level"],
-                    threat_type=event["type"],
-                    location=event["location"],
-                    urgency=event["urgency"],
-                    complexity=event["complexity"],
-                    involved_entities=event["entities"],
-                    timeline_impact=event["timeline_impact"],
-                    faction_involvement=event["faction_involvement"]
-                ))
+        self._refresh_threat_sources(world_state, game_state)
+        threats = self.top_threats()
         
         # Generate dynamic proactive missions based on REAL world conditions
         if not threats or len(threats) < 2:
             proactive_mission = self._generate_dynamic_proactive_mission(world_state, game_state)
             if proactive_mission:
-                threats.append(proactive_mission)
-        
-        # Sort threats by priority and add variety
-        threats.sort(key=lambda x: (float(x.threat_level) if isinstance(x.threat_level, (int, float)) else 0.5) * 
-                                   (float(x.urgency) if isinstance(x.urgency, (int, float)) else 0.5), reverse=True)
+                priority = self._threat_priority(proactive_mission)
+                position = next((i for i, t in enumerate(threats) if self._threat_priority(t) < priority),
+                                len(threats))
+                threats.insert(position, proactive_mission)
         
         # Ensure variety - don't always return the same type
         if len(threats) > 1:
@@ -335,7 +446,84 @@ class DynamicMissionSystem:
             if random.random() < 0.4:  # 40% chance to shuffle priorities
                 random.shuffle(threats[:3])  # Shuffle top 3 threats
         
+        self.active_threats = threats
         return threats
+
+    def _timeline_crisis_threats(self, world_state: Dict) -> List[ThreatAssessment]:
+        # Analyze timeline stability - More sensitive threshold
+        timeline_stability = world_state.get("timeline_stability", 0.8)
+        if timeline_stability >= 0.75:  # Lowered from 0.7
+            return []
+        return [ThreatAssessment(
+            threat_level=1.0 - timeline_stability,
+            threat_type="timeline_crisis",
+            location=self._identify_crisis_location(world_state),
+            urgency=self._trend_urgency("timeline_stability", 0.9, direction=-1.0),
+            complexity=0.8,
+            involved_entities=["timeline", "faction", "government"],
+            timeline_impact=0.4,
+            faction_involvement=0.6
+        )]
+
+    def _faction_operation_threats(self, world_state: Dict) -> List[ThreatAssessment]:
+        # Analyze faction influence - More sensitive threshold
+        faction_influence = world_state.get("faction_influence", 0.2)
+        if faction_influence <= 0.3:  # Lowered from 0.4
+            return []
+        return [ThreatAssessment(
+            threat_level=faction_influence,
+            threat_type="faction_operation",
+            location=self._identify_faction_activity(world_state),
+            urgency=self._trend_urgency("faction_influence", 0.8),
+            complexity=0.7,
+            involved_entities=["faction", "rogue_travelers", "government"],
+            timeline_impact=0.3,
+            faction_involvement=0.9
+        )]
+
+    def _traveler_detection_threats(self, world_state: Dict) -> List[ThreatAssessment]:
+        # Analyze government detection - More sensitive threshold
+        traveler_exposure = world_state.get("traveler_exposure_risk", 0.1)
+        if traveler_exposure <= 0.5:  # Lowered from 0.6
+            return []
+        return [ThreatAssessment(
+            threat_level=traveler_exposure,
+            threat_type="government_detection",
+            location=self._identify_detection_location(world_state),
+            urgency=self._trend_urgency("traveler_exposure_risk", 0.7),
+            complexity=0.6,
+            involved_entities=["government", "fbi", "cia", "travelers"],
+            timeline_impact=0.2,
+            faction_involvement=0.3
+        )]
+
+    def _faction_detection_threats(self, world_state: Dict) -> List[ThreatAssessment]:
+        faction_exposure = world_state.get("faction_exposure_risk", 0.1)
+        if faction_exposure <= 0.5:  # Lowered from 0.6
+            return []
+        return [ThreatAssessment(
+            threat_level=faction_exposure,
+            threat_type="government_detection",
+            location=self._identify_detection_location(world_state),
+            urgency=self._trend_urgency("faction_exposure_risk", 0.7),
+            complexity=0.6,
+            involved_entities=["government", "fbi", "cia", "faction"],
+            timeline_impact=0.2,
+            faction_involvement=0.8
+        )]
+
+    @staticmethod
+    def _event_threat(event: Dict) -> ThreatAssessment:
+        return ThreatAssessment(
+            threat_level=event["threat_level"],
+            threat_type=event["type"],
+            location=event["location"],
+            urgency=event["urgency"],
+            complexity=event["complexity"],
+            involved_entities=event["entities"],
+            timeline_impact=event["timeline_impact"],
+            faction_involvement=event["faction_involvement"]
+        )
     
     def _generate_proactive_mission(self, world_state: Dict, game_state: Dict) -> ThreatAssessment:
         """
@@ -507,52 +695,11 @@ class DynamicMissionSystem:
     def _analyze_recent_events(self, world_state: Dict, game_state: Dict) -> List[Dict]:
         """Analyze recent world events for threat assessment"""
         events = []
-        
-        # Check for recent hacking operations
-        if "hacking_operations" in game_state:
-            for op in game_state["hacking_operations"]:
-                if op.get("alert_level", 0) > 0.7:
-                    events.append({
-                        "type": "cyber_threat",
-                        "location": op.get("target", "Unknown"),
-                        "threat_level": op.get("alert_level", 0),
-                        "urgency": 0.8,
-                        "complexity": 0.7,
-                        "entities": ["hackers", "government", "target_system"],
-                        "timeline_impact": 0.3,
-                        "faction_involvement": 0.6
-                    })
-        
-        # Check for recent government responses
-        if "government_responses" in game_state:
-            for response in game_state["government_responses"]:
-                if response.get("intensity", 0) > 0.6:
-                    events.append({
-                        "type": "government_response",
-                        "location": response.get("location", "Unknown"),
-                        "threat_level": response.get("intensity", 0),
-                        "urgency": 0.9,
-                        "complexity": 0.8,
-                        "entities": ["government", "fbi", "cia", "local_police"],
-                        "timeline_impact": 0.4,
-                        "faction_involvement": 0.2
-                    })
-        
-        # Check for recent Traveler activities
-        if "traveler_activities" in game_state:
-            for activity in game_state["traveler_activities"]:
-                if activity.get("exposure_risk", 0) > 0.5:
-                    events.append({
-                        "type": "traveler_exposure",
-                        "location": activity.get("location", "Unknown"),
-                        "threat_level": activity.get("exposure_risk", 0),
-                        "urgency": 0.7,
-                        "complexity": 0.6,
-                        "entities": ["travelers", "host_bodies", "witnesses"],
-                        "timeline_impact": 0.3,
-                        "faction_involvement": 0.1
-                    })
-        
+        for key, analyze in RECENT_EVENT_ANALYZERS.items():
+            for item in game_state.get(key) or []:
+                event = analyze(item)
+                if event:
+                    events.append(event)
         return events
     
     def _analyze_ongoing_effects(self, world_state: Dict, game_state: Dict) -> List[Dict]:
@@ -670,10 +817,12 @@ class DynamicMissionSystem:
             faction_involvement=faction_involvement
         )
     
-    def generate_dynamic_mission(self, threat: ThreatAssessment, team_capabilities: Dict) -> Dict:
+    def generate_dynamic_mission(self, threat: ThreatAssessment, team_capabilities: Dict,
+                                 outcome_odds: Optional[Dict[str, float]] = None) -> Dict:
         """
         Generate a dynamic mission based on threat assessment and team capabilities.
         The Director adapts tactics based on current conditions.
+        `outcome_odds` (from mission_odds) is carried into the briefing when given.
         """
         # Select appropriate mission template
         template = self._select_mission_template(threat)
@@ -707,6 +856,8 @@ class DynamicMissionSystem:
                 "faction_involvement": threat.faction_involvement
             }
         }
+        if outcome_odds:
+            mission["outcome_odds"] = dict(outcome_odds)
         
         # Add to mission history
         self.mission_history.append(mission)
@@ -1050,7 +1201,7 @@ FACTION EFFECTS:
         
         briefing += f"""
 MISSION DETAILS:
-  • Estimated Duration: {mission['estimated_duration']}
+  • Estimated Duration: {mission['estimated_duration']}{self._format_outcome_odds(mission)}
   • Team Size Required: {mission['team_size_required']} members
   • Cover Story: {mission['cover_story']}
 
@@ -1077,6 +1228,12 @@ Protocol 3: Don't take a life; don't save a life, unless otherwise directed.
         
         return briefing
     
+    def _format_outcome_odds(self, mission: Dict) -> str:
+        odds = mission.get("outcome_odds")
+        if not odds:
+            return ""
+        return f"\n  • Projected Success: {success_chance(odds):.0%} ({format_odds(odds)})"
+    
     def analyze_mission_success(self, mission: Dict, outcome: Dict) -> Dict:
         """Analyze mission success and update system accordingly"""
         analysis = {
@@ -1,9 +1,14 @@
 # emergent_narrative_system.py
 # Story that emerges from actual gameplay events
 
+import itertools
 import random
 from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from collections import Counter, deque
+
+# Turns of history the location and NPC pattern checks look back over
+LOCATION_PATTERN_TURNS = 5
+NPC_PATTERN_TURNS = 8
 
 
 class RealEvent:
@@ -17,6 +22,27 @@ class RealEvent:
         self.connected_to = []  # Other events this connects to
 
 
+class TurnWindow:
+    """Events from the last `span` turns, bucketed by turn"""
+
+    def __init__(self, span: int):
+        self.span = span
+        self.buckets = deque()  # (turn, [events]), oldest first
+
+    def add(self, event: RealEvent):
+        if self.buckets and self.buckets[-1][0] == event.turn:
+            self.buckets[-1][1].append(event)
+        else:
+            self.buckets.append((event.turn, [event]))
+
+    def recent(self, current_turn: int) -> List[RealEvent]:
+        """Drop buckets older than the window and return the events left"""
+        cutoff = current_turn - self.span
+        while self.buckets and self.buckets[0][0] < cutoff:
+            self.buckets.popleft()
+        return [event for _, events in self.buckets for event in events]
+
+
 class NarrativeThread:
     """An ongoing storyline built from real events"""
 
@@ -28,6 +54,7 @@ class NarrativeThread:
         self.status = "active"  # active, escalating, climaxing, resolved
         self.main_actors = []  # NPCs/locations involved
         self.description = ""
+        self.sequence = 0  # Creation order; the oldest related thread claims a new event
 
     def add_event(self, event: RealEvent):
         """Add a related event to this thread"""
@@ -50,12 +77,23 @@ class EmergentNarrativeSystem:
     def __init__(self):
         self.turn_count = 0
         self.event_history = []  # All events that happened
-        self.narrative_threads = {}  # Active storylines
-        self.character_involvement = defaultdict(list)  # NPC_ID -> events they're in
-        self.location_hotspots = defaultdict(list)  # Location -> events there
+        self.narrative_threads = {}  # Active storylines; resolved ones are pruned
+        self.resolved_thread_count = 0
+        self._thread_ids = itertools.count(1)
+        # Threads keyed by their latest event's location, NPC and type -> {thread_id: thread}
+        self._threads_by_location = {}
+        self._threads_by_npc = {}
+        self._threads_by_type = {}
+
+        # Recent events per NPC / location; entries with nothing in their window are dropped
+        self.character_involvement = {}  # NPC_ID -> TurnWindow
+        self.location_hotspots = {}  # Location -> TurnWindow
+        self.npc_event_counts = Counter()  # NPC_ID -> events they've ever been in
+        self.location_event_counts = Counter()  # Location -> events ever there
 
         # Pattern detection
         self.patterns_detected = []
+        self._pattern_keys = set()  # Hashable form of each detected pattern, for dedup
 
     def record_event(self, event_type: str, event_data: Dict[str, Any]):
         """Record something that actually happened"""
@@ -70,11 +108,19 @@ class EmergentNarrativeSystem:
 
         # Track character involvement
         if "npc_id" in event_data:
-            self.character_involvement[event_data["npc_id"]].append(event)
+            npc_id = event_data["npc_id"]
+            self.npc_event_counts[npc_id] += 1
+            if npc_id not in self.character_involvement:
+                self.character_involvement[npc_id] = TurnWindow(NPC_PATTERN_TURNS)
+            self.character_involvement[npc_id].add(event)
 
         # Track location hotspots
         if "location" in event_data:
-            self.location_hotspots[event_data["location"]].append(event)
+            location = event_data["location"]
+            self.location_event_counts[location] += 1
+            if location not in self.location_hotspots:
+                self.location_hotspots[location] = TurnWindow(LOCATION_PATTERN_TURNS)
+            self.location_hotspots[location].add(event)
 
         # Try to connect to existing threads or create new one
         self._process_event_for_narrative(event)
@@ -108,12 +154,12 @@ class EmergentNarrativeSystem:
 
         # Increase if it's a repeat location
         location = event.data.get("location")
-        if location and len(self.location_hotspots.get(location, [])) > 2:
+        if location and self.location_event_counts[location] > 2:
             significance += 0.2  # Pattern emerging!
 
         # Increase if same NPC appears multiple times
         npc_id = event.data.get("npc_id")
-        if npc_id and len(self.character_involvement.get(npc_id, [])) > 2:
+        if npc_id and self.npc_event_counts[npc_id] > 2:
             significance += 0.3  # This NPC is becoming important!
 
         return min(1.0, significance)
@@ -122,18 +168,62 @@ class EmergentNarrativeSystem:
         """Connect event to narrative threads or create new one"""
 
         # Check if this connects to existing threads
-        connected_thread = None
+        connected_thread = self._find_related_thread(event)
 
-        for thread in self.narrative_threads.values():
-            if self._events_are_related(event, thread.events[-1]):
-                thread.add_event(event)
-                connected_thread = thread
-                break
+        if connected_thread:
+            self._unindex_thread(connected_thread)
+            connected_thread.add_event(event)
+            self._index_thread(connected_thread)
 
         # If no connection found and event is significant, start new thread
-        if not connected_thread and event.narrative_significance > 0.5:
+        elif event.narrative_significance > 0.5:
             self._create_narrative_thread(event)
 
+    def _find_related_thread(self, event: RealEvent) -> Optional[NarrativeThread]:
+        """Oldest live thread whose latest event is related to `event`
+
+        Looks only at the index buckets that _events_are_related can match,
+        instead of testing every thread.
+        """
+        if event.event_type == "evidence_discovered":
+            # Evidence ties into any storyline
+            return next(iter(self.narrative_threads.values()), None)
+
+        buckets = [
+            self._threads_by_location.get(event.data.get("location")),
+            self._threads_by_type.get("evidence_discovered"),
+        ]
+        if event.data.get("npc_id"):
+            buckets.append(self._threads_by_npc.get(event.data["npc_id"]))
+        if event.event_type == "mission_failure":
+            buckets.append(self._threads_by_type.get("government_investigation_started"))
+
+        candidates = [min(bucket.values(), key=lambda t: t.sequence) for bucket in buckets if bucket]
+        return min(candidates, key=lambda t: t.sequence) if candidates else None
+
+    def _thread_keys(self, thread: NarrativeThread):
+        """(index, key) pairs a thread is filed under, from its latest event"""
+        latest = thread.events[-1]
+        keys = [
+            (self._threads_by_location, latest.data.get("location")),
+            (self._threads_by_type, latest.event_type),
+        ]
+        if latest.data.get("npc_id"):
+            keys.append((self._threads_by_npc, latest.data["npc_id"]))
+        return keys
+
+    def _index_thread(self, thread: NarrativeThread):
+        for index, key in self._thread_keys(thread):
+            index.setdefault(key, {})[thread.thread_id] = thread
+
+    def _unindex_thread(self, thread: NarrativeThread):
+        for index, key in self._thread_keys(thread):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(thread.thread_id, None)
+                if not bucket:
+                    del index[key]
+
     def _events_are_related(self, event1: RealEvent, event2: RealEvent) -> bool:
         """Are these events part of the same storyline?"""
 
@@ -164,8 +254,9 @@ class EmergentNarrativeSystem:
     def _create_narrative_thread(self, initiating_event: RealEvent):
         """Create a new storyline from this event"""
 
-        thread_id = f"thread_{len(self.narrative_threads) + 1}"
-        thread = NarrativeThread(thread_id, initiating_event)
+        sequence = next(self._thread_ids)
+        thread = NarrativeThread(f"thread_{sequence}", initiating_event)
+        thread.sequence = sequence
 
         # Generate description based on event
         thread.description = self._generate_thread_description(thread)
@@ -174,7 +265,8 @@ class EmergentNarrativeSystem:
         if "npc_id" in initiating_event.data:
             thread.main_actors.append(initiating_event.data["npc_id"])
 
-        self.narrative_threads[thread_id] = thread
+        self.narrative_threads[thread.thread_id] = thread
+        self._index_thread(thread)
 
         print(f"\n  📖 NEW STORYLINE EMERGING: {thread.description}")
 
@@ -212,11 +304,15 @@ class EmergentNarrativeSystem:
             self.turn_count = game_turn
         self.turn_count += 1
 
-        # Decay old threads
-        for thread in self.narrative_threads.values():
+        # Decay old threads, pruning the ones that fade out
+        for thread in list(self.narrative_threads.values()):
             turns_since_update = self.turn_count - thread.last_update
             if turns_since_update > 0:
                 thread.decay(turns_since_update)
+            if thread.status == "resolved":
+                self._unindex_thread(thread)
+                del self.narrative_threads[thread.thread_id]
+                self.resolved_thread_count += 1
 
         # Detect patterns
         new_patterns = self._detect_patterns()
@@ -235,11 +331,11 @@ class EmergentNarrativeSystem:
         patterns = []
 
         # Pattern: Player hitting same location repeatedly
-        for location, events in self.location_hotspots.items():
-            recent_events = [
-                e for e in events if e.turn >= self.turn_count - 5
-            ]
-            if len(recent_events) >= 3:
+        for location, window in list(self.location_hotspots.items()):
+            recent_events = window.recent(self.turn_count)
+            if not recent_events:
+                del self.location_hotspots[location]
+            elif len(recent_events) >= 3:
                 patterns.append(
                     {
                         "type": "location_pattern",
@@ -251,11 +347,11 @@ class EmergentNarrativeSystem:
                 )
 
         # Pattern: Same NPC involved in multiple incidents
-        for npc_id, events in self.character_involvement.items():
-            recent_events = [
-                e for e in events if e.turn >= self.turn_count - 8
-            ]
-            if len(recent_events) >= 3:
+        for npc_id, window in list(self.character_involvement.items()):
+            recent_events = window.recent(self.turn_count)
+            if not recent_events:
+                del self.character_involvement[npc_id]
+            elif len(recent_events) >= 3:
                 patterns.append(
                     {
                         "type": "npc_pattern",
@@ -284,7 +380,9 @@ class EmergentNarrativeSystem:
 
         # Store new patterns
         for pattern in patterns:
-            if pattern not in self.patterns_detected:
+            key = tuple(sorted(pattern.items()))
+            if key not in self._pattern_keys:
+                self._pattern_keys.add(key)
                 self.patterns_detected.append(pattern)
 
         return patterns
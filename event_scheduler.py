@@ -0,0 +1,122 @@
+# event_scheduler.py
+"""
+Rate-driven wakeups for turn-based components.
+
+Many systems give each component a fixed chance to act every turn
+(`if random.random() < 0.1: ...`). The turns on which such a component acts
+form a Bernoulli process, so the wait until its next action is geometric with
+the same rate. RateScheduler samples that wait once per action and parks the
+action on a TimerWheel. A turn then only touches the actions that actually
+fire, and the statistics match the per-turn dice roll exactly.
+
+Actions are grouped into stages. A component asks for its stage's due
+payloads at the point in its turn where it used to roll, so the order of
+play within a turn is unchanged. Watches cover actions triggered by world
+state rather than chance: their condition is checked once per advance and the
+payload is due whenever it holds.
+"""
+
+import math
+import random
+from typing import Any, Callable, Dict, List, Optional
+
+from timer_wheel import TimerWheel
+
+
+def geometric_gap(rate: float) -> Optional[int]:
+    """Turns until the next success of a per-turn chance `rate` (>= 1), or None if it never fires"""
+    if rate <= 0.0:
+        return None
+    if rate >= 1.0:
+        return 1
+    u = 1.0 - random.random()  # (0, 1], so log(u) is finite
+    return 1 + int(math.log(u) / math.log(1.0 - rate))
+
+
+class ScheduledAction:
+    """A payload waiting on the scheduler for its next turn"""
+
+    __slots__ = ("order", "stage", "payload", "rate", "recurring", "timer_id")
+
+    def __init__(self, order: int, stage: str, payload: Any, rate: float, recurring: bool):
+        self.order = order
+        self.stage = stage
+        self.payload = payload
+        self.rate = rate
+        self.recurring = recurring
+        self.timer_id = None
+
+
+class RateScheduler:
+    """Geometric-gap scheduling of per-turn chances, bucketed by stage"""
+
+    def __init__(self, current_turn: int = 0):
+        self.wheel = TimerWheel(current_turn=current_turn)
+        self._order = 0
+        self._watches: List[tuple] = []  # (order, stage, payload, condition)
+        self._due: Dict[str, List[Any]] = {}
+
+    def __len__(self):
+        return len(self.wheel)
+
+    def every(self, stage: str, payload: Any, rate: float) -> ScheduledAction:
+        """Let `payload` act with chance `rate` every turn, for as long as it is registered"""
+        return self._register(stage, payload, rate, recurring=True)
+
+    def once(self, stage: str, payload: Any, rate: float) -> ScheduledAction:
+        """Let `payload` act once, on the first turn a per-turn chance `rate` succeeds"""
+        return self._register(stage, payload, rate, recurring=False)
+
+    def watch(self, stage: str, payload: Any, condition: Callable[[Dict], bool]):
+        """Make `payload` due on every advance where `condition(world_state)` holds"""
+        self._order += 1
+        self._watches.append((self._order, stage, payload, condition))
+
+    def cancel(self, action: ScheduledAction):
+        if action.timer_id is not None:
+            self.wheel.cancel(action.timer_id)
+            action.timer_id = None
+
+    def clear(self, stage: Optional[str] = None):
+        """Drop every scheduled action and watch (or only those of one stage)"""
+        for action in self.wheel.pending():
+            if stage is None or action.stage == stage:
+                self.cancel(action)
+        self._watches = [w for w in self._watches if stage is not None and w[1] != stage]
+
+    def advance(self, world_state: Optional[Dict] = None) -> Dict[str, List[Any]]:
+        """Move to the next turn and bucket the payloads due on it by stage"""
+        fired = []
+        for action in self.wheel.tick():
+            fired.append((action.order, action.stage, action.payload))
+            action.timer_id = None
+            if action.recurring:
+                self._schedule(action)
+        if world_state is not None:
+            for order, stage, payload, condition in self._watches:
+                if condition(world_state):
+                    fired.append((order, stage, payload))
+
+        self._due = {}
+        for _, stage, payload in sorted(fired, key=lambda item: item[0]):
+            self._due.setdefault(stage, []).append(payload)
+        return self._due
+
+    def due(self, stage: str) -> List[Any]:
+        """Payloads of `stage` due this turn, in registration order"""
+        return self._due.get(stage, [])
+
+    def is_due(self, stage: str) -> bool:
+        return stage in self._due
+
+    def _register(self, stage: str, payload: Any, rate: float, recurring: bool) -> ScheduledAction:
+        self._order += 1
+        action = ScheduledAction(self._order, stage, payload, rate, recurring)
+        self._schedule(action)
+        return action
+
+    def _schedule(self, action: ScheduledAction):
+        gap = geometric_gap(action.rate)
+        if gap is None:
+            return
+        action.timer_id = self.wheel.schedule_in(gap, payload=action)
@@ -25,7 +25,30 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from d20_decision_system import CharacterDecision
 from world_generation import World
+from metric_series import campaign_metrics
 from turn_narrative_engine import get_turn_narrative_engine, reset_turn_narrative_engine
+from mission_odds import (
+    MISSION_PHASES,
+    MISSION_PHASE_MOD_MAX as _MISSION_PHASE_MOD_MAX,
+    MISSION_PHASE_SKILL_MAX as _MISSION_PHASE_SKILL_MAX,
+    PHASE_T_CRITICAL_SUCCESS as _PHASE_T_CRITICAL_SUCCESS,
+    PHASE_T_SUCCESS as _PHASE_T_SUCCESS,
+    PHASE_T_PARTIAL as _PHASE_T_PARTIAL,
+    PHASE_T_FAILURE as _PHASE_T_FAILURE,
+    MISSION_MOMENTUM_CAP as _MISSION_MOMENTUM_CAP,
+    FIN_COMPLETE as _FIN_COMPLETE,
+    FIN_SUCCESS as _FIN_SUCCESS,
+    FIN_PARTIAL as _FIN_PARTIAL,
+    FIN_FAILURE as _FIN_FAILURE,
+    PHASE_SCORES,
+    SALVAGE_SCORE,
+    final_outcome,
+    format_odds,
+    mission_outcome_odds,
+    momentum,
+    phase_tier,
+    success_chance,
+)
 
 # Substrings matched against lowercased traveler skills for mission phase modifiers.
 # Kept in sync with `travelers/data/skills.json` naming (e.g. "Medicine" not "medical").
@@ -95,23 +118,6 @@ _MISSION_SKILL_EXTRACT_MOBILITY = (
     "aerospace",
 )
 
-# Phase performance: d20 + modifier. Loosened from the ultra-hard band so typical teams see
-# a mix of partials and wins; d20 still matters.
-_MISSION_PHASE_MOD_MAX = 9
-_MISSION_PHASE_SKILL_MAX = 6
-_PHASE_T_CRITICAL_SUCCESS = 22
-_PHASE_T_SUCCESS = 17
-_PHASE_T_PARTIAL = 11
-_PHASE_T_FAILURE = 5
-
-# Final mission roll: d20 + momentum vs these bands. Momentum scales from phase scores.
-_MISSION_MOMENTUM_SCALE = 12  # was 10 — rewards decent phases a bit more on the closing die
-_MISSION_MOMENTUM_CAP = 8
-_FIN_COMPLETE = 24
-_FIN_SUCCESS = 19
-_FIN_PARTIAL = 14
-_FIN_FAILURE = 9
-
 
 class Game:
     def __init__(self, seed=None):
@@ -138,7 +144,7 @@ class Game:
         self.time_system = time_system.TimeSystem()
         self.tribunal_system = tribunal_system.TribunalSystem()
         self.ai_world_controller = ai_world_controller.AIWorldController(world_generator=self.world)
-        self.dialogue_manager = dialogue_system.DialogueManager()
+        self._share_relationship_graph()
         self.hacking_system = hacking_system.HackingSystem()
 
         # Memory + consequence system (EXACT integration: ConsequenceIntegrator)
@@ -232,7 +238,7 @@ class Game:
         self.ai_world_controller.initialize_world()
         
         # Initialize hacking system
-        self.hacking_system.initialize_hacking_world()
+        self.hacking_system.initialize_hacking_world(world=self.world)
         
         # Initialize Dynamic World Events System for real-time NPC and faction actions
         if hasattr(self.messenger_system, 'dynamic_world_events'):
@@ -445,6 +451,7 @@ class Game:
                 "traveler_001_state": self._save_traveler_001_state() if hasattr(self, 'traveler_001_system') and self.traveler_001_system else None,
                 "player_alive": getattr(self, "player_alive", True),
                 "director_reinforcement_pending": getattr(self, "director_reinforcement_pending", False),
+                "metric_history": campaign_metrics.export(),
             }
             
             # Save team members
@@ -677,6 +684,8 @@ class Game:
                     "value": save_data["timeline_stability"],
                     "operation": "set"
                 })
+            # Trend history belongs to the save; older saves start with none
+            campaign_metrics.load(save_data.get("metric_history"))
             if "timeline_fragility" in save_data:
                 self.timeline_fragility = save_data["timeline_fragility"]
             if "timeline_events" in save_data:
@@ -1063,7 +1072,9 @@ class Game:
                 top_threat = threats[0]
                 team_capabilities = self._assess_team_capabilities()
                 
-                mission = self.dynamic_mission_system.generate_dynamic_mission(top_threat, team_capabilities)
+                mission = self.dynamic_mission_system.generate_dynamic_mission(
+                    top_threat, team_capabilities, outcome_odds=self.estimate_mission_odds()
+                )
                 self.current_mission = mission
                 self.mission_status = f"Dynamic Mission Available - {top_threat.threat_type.replace('_', ' ').title()}"
                 
@@ -1094,9 +1105,22 @@ class Game:
         else:
             # Use standard mission briefing
             print(self.mission_generation.get_mission_briefing())
+            odds = self.estimate_mission_odds()
+            if odds:
+                print(f"\nPROJECTED OUTCOME (current team): {success_chance(odds):.0%} success or better")
+                print(f"  {format_odds(odds)}")
         
         print("=" * 40)
 
+    def estimate_mission_odds(self):
+        """Exact outcome odds for the current team on a three-phase mission (None without a team)"""
+        if not getattr(self, "team", None):
+            return None
+        try:
+            return mission_outcome_odds(tuple(self.calculate_team_modifier(phase) for phase in MISSION_PHASES))
+        except Exception:
+            return None
+
     def show_mission_choices(self):
         """Show mission action choices"""
         print("\nMission Actions:")
@@ -2448,7 +2472,7 @@ class Game:
 
     def execute_mission_phases(self, mission):
         """Execute mission phases and return results"""
-        phases = ["infiltration", "execution", "extraction"]
+        phases = MISSION_PHASES
         phase_results = []
 
         print(
@@ -2609,21 +2633,14 @@ class Game:
         )
         
         # Determine success level based on total
-        if total >= _PHASE_T_CRITICAL_SUCCESS:
-            success_level = "CRITICAL_SUCCESS"
-            result_text = "Outstanding performance! The team executes flawlessly."
-        elif total >= _PHASE_T_SUCCESS:
-            success_level = "SUCCESS"
-            result_text = "Good performance. The team accomplishes their objective."
-        elif total >= _PHASE_T_PARTIAL:
-            success_level = "PARTIAL_SUCCESS"
-            result_text = "Adequate performance. Some objectives met with minor complications."
-        elif total >= _PHASE_T_FAILURE:
-            success_level = "FAILURE"
-            result_text = "Poor performance. The team struggles and objectives are compromised."
-        else:
-            success_level = "CRITICAL_FAILURE"
-            result_text = "Catastrophic failure! The mission is severely compromised."
+        success_level = phase_tier(total)
+        result_text = {
+            "CRITICAL_SUCCESS": "Outstanding performance! The team executes flawlessly.",
+            "SUCCESS": "Good performance. The team accomplishes their objective.",
+            "PARTIAL_SUCCESS": "Adequate performance. Some objectives met with minor complications.",
+            "FAILURE": "Poor performance. The team struggles and objectives are compromised.",
+            "CRITICAL_FAILURE": "Catastrophic failure! The mission is severely compromised.",
+        }[success_level]
         
         print(f"📊 Performance Result: {success_level}")
         print(f"💬 {result_text}")
@@ -2638,18 +2655,9 @@ class Game:
         print(f"\n🎯 FINAL MISSION OUTCOME")
         
         # Calculate overall mission score based on phase results
-        phase_scores = {
-            "CRITICAL_SUCCESS": 5,
-            "SUCCESS": 4,
-            "PARTIAL_SUCCESS": 3,
-            "FAILURE": 2,
-            "CRITICAL_FAILURE": 1
-        }
-        
-        total_score = sum(phase_scores.get(result, 0) for result in phase_results)
+        total_score = sum(PHASE_SCORES.get(result, 0) for result in phase_results)
         max_possible = len(phase_results) * 5 if phase_results else 1
-        raw_momentum = int((total_score / max_possible) * _MISSION_MOMENTUM_SCALE) if max_possible else 0
-        score_modifier = min(_MISSION_MOMENTUM_CAP, raw_momentum)
+        score_modifier = momentum(total_score, len(phase_results))
 
         roll = random.randint(1, 20)
         raw_final = roll + score_modifier
@@ -2661,7 +2669,7 @@ class Game:
             p in ("PARTIAL_SUCCESS", "SUCCESS", "CRITICAL_SUCCESS")
             for p in phase_results
         )
-        if no_phase_disaster and total_score >= 9 and final_total < _FIN_PARTIAL:
+        if no_phase_disaster and total_score >= SALVAGE_SCORE and final_total < _FIN_PARTIAL:
             final_total = _FIN_PARTIAL
             floor_msgs.append(
                 f"no phase below partial (score {total_score}/15) — Director salvage: "
@@ -2681,21 +2689,14 @@ class Game:
         )
         
         # Determine final outcome
-        if final_total >= _FIN_COMPLETE:
-            outcome = "COMPLETE_SUCCESS"
-            outcome_text = "Mission accomplished with exceptional results!"
-        elif final_total >= _FIN_SUCCESS:
-            outcome = "SUCCESS"
-            outcome_text = "Mission completed successfully."
-        elif final_total >= _FIN_PARTIAL:
-            outcome = "PARTIAL_SUCCESS"
-            outcome_text = "Mission partially successful with some complications."
-        elif final_total >= _FIN_FAILURE:
-            outcome = "FAILURE"
-            outcome_text = "Mission failed to achieve primary objectives."
-        else:
-            outcome = "CRITICAL_FAILURE"
-            outcome_text = "Mission failed catastrophically!"
+        outcome = final_outcome(final_total)
+        outcome_text = {
+            "COMPLETE_SUCCESS": "Mission accomplished with exceptional results!",
+            "SUCCESS": "Mission completed successfully.",
+            "PARTIAL_SUCCESS": "Mission partially successful with some complications.",
+            "FAILURE": "Mission failed to achieve primary objectives.",
+            "CRITICAL_FAILURE": "Mission failed catastrophically!",
+        }[outcome]
         
         print(f"📊 Mission Outcome: {outcome}")
         print(f"💬 {outcome_text}")
@@ -4537,7 +4538,7 @@ class Game:
                 print(f"  • {faction.title()}: {count} hackers")
             
             # Show active operations
-            active_hackers = [h for h in self.hacking_system.hackers if h.current_operation]
+            active_hackers = list(self.hacking_system.operating_hackers)
             if active_hackers:
                 print(f"\n🟡 Active Hacking Operations:")
                 for hacker in active_hackers:
@@ -4547,7 +4548,7 @@ class Game:
                 print(f"\n🟢 No active hacking operations")
             
             # Show recent breaches
-            breached_targets = [t for t in self.hacking_system.targets if t.current_breach]
+            breached_targets = list(self.hacking_system.breached_targets)
             if breached_targets:
                 print(f"\n🔴 Recently Breached Systems:")
                 for target in breached_targets[:5]:  # Show last 5
@@ -6050,6 +6051,11 @@ class Game:
         """Advance the living world by one turn (one day)"""
         # Advance the time system first
         new_date = self.time_system.advance_one_day()
+        try:
+            from government_news_system import advance_news_turn
+            advance_news_turn(self.time_system.current_turn)
+        except ImportError:
+            pass
         
         # Check for scheduled events
         scheduled_event = self.time_system.check_scheduled_events()
@@ -6251,13 +6257,20 @@ class Game:
         
         return game_state
     
-    def is_npc_available_for_mission(self, npc_name: str, npc_role: str = None) -> bool:
-        """Check if an NPC is available for a mission (alive and in game)"""
+    def is_npc_available_for_mission(self, npc_name: str, npc_role: str = None, seat: str = None) -> bool:
+        """Check if an NPC is available for a mission (alive and in game)
+
+        Senators share names, so pass `seat` to check the member holding that seat.
+        """
         # Check entity tracker if available
         try:
-            from game_entity_tracker import get_entity_tracker
+            from game_entity_tracker import get_entity_tracker, senator_entity_id
             tracker = get_entity_tracker(self)
             if tracker and tracker.entities:
+                if seat:
+                    entity = tracker.get_entity(senator_entity_id(seat))
+                    if entity is not None:
+                        return entity.status == "active"
                 # Look for the NPC by name
                 for entity_id, entity in tracker.entities.items():
                     if entity.name.lower() == npc_name.lower() and entity.status == "active":
@@ -6287,11 +6300,11 @@ class Game:
                 try:
                     if hasattr(self, 'us_political_system') and self.us_political_system:
                         leg = self.us_political_system.legislative_branch
-                        if hasattr(leg, 'senate') and hasattr(leg.senate, 'senators'):
-                            for party, senators in leg.senate.senators.items():
-                                for senator in senators:
-                                    if senator.get('name', '').lower() == npc_name.lower():
-                                        return True
+                        if hasattr(leg, 'senate'):
+                            members = leg.senate.members
+                            held = seat in members.by_seat if seat else bool(members.find(npc_name))
+                            if held:
+                                return True
                 except Exception:
                     pass
         
@@ -6325,15 +6338,16 @@ class Game:
                     
                     # Senators
                     leg = self.us_political_system.legislative_branch
-                    if hasattr(leg, 'senate') and hasattr(leg.senate, 'senators'):
-                        for party, senators in leg.senate.senators.items():
-                            for senator in senators:
-                                targets.append({
-                                    "name": senator.get('name', 'Unknown'),
-                                    "role": "Senator",
-                                    "party": party,
-                                    "state": senator.get('state', 'Unknown')
-                                })
+                    if hasattr(leg, 'senate'):
+                        senators = leg.senate.members
+                        for i in range(len(senators)):
+                            targets.append({
+                                "name": senators.names[i],
+                                "role": "Senator",
+                                "party": senators.party_of(i),
+                                "state": senators.states[i],
+                                "seat": senators.seats[i]
+                            })
             except Exception:
                 pass
         
@@ -6382,7 +6396,7 @@ class Game:
         for t in self.get_available_targets_for_mission("political"):
             name = t.get("name")
             role = t.get("role") or "Public Official"
-            if not name or not self.is_npc_available_for_mission(name, role):
+            if not name or not self.is_npc_available_for_mission(name, role, t.get("seat")):
                 continue
             wnpc = self._find_living_world_npc_by_name(name)
             role_s = str(role)
@@ -6408,7 +6422,7 @@ class Game:
                 if not name:
                     continue
                 role = str((e.metadata or {}).get("role", "Public Official"))
-                if not self.is_npc_available_for_mission(name, role):
+                if not self.is_npc_available_for_mission(name, role, (e.metadata or {}).get("seat")):
                     continue
                 wnpc = self._find_living_world_npc_by_name(name)
                 add_option(name, role, wnpc, 64.0)
@@ -6437,7 +6451,7 @@ class Game:
                 aware = float(getattr(npc, "current_awareness", 0.0) or 0.0)
                 score = clearance * 6.0 + useful * 38.0 + threat * 22.0 + aware * 12.0
                 nid = getattr(npc, "id", None)
-                if narrative_core and nid and len(narrative_core.character_involvement.get(nid, [])) >= 1:
+                if narrative_core and nid and narrative_core.npc_event_counts[nid] >= 1:
                     score += 44.0
                 if faction == "government":
                     score += 16.0
@@ -6534,7 +6548,8 @@ class Game:
         self.present_technologies() 
         self.present_world()
         
-        # Initialize game systems first
+        # Initialize game systems first, with no trend history carried over from a previous campaign
+        campaign_metrics.clear()
         self.setup_game_systems()
         
         # Generate the player's individual character (separate from team)
@@ -6552,6 +6567,15 @@ class Game:
         
         input("\nPress Enter to continue to main menu...")
     
+    def _share_relationship_graph(self):
+        """Put dialogue ties and traveler recruitment on the procedural world's relationship graph"""
+        graph = getattr(self.world, "relationship_graph", None)
+        if graph is None:
+            self.dialogue_manager = dialogue_system.DialogueManager()
+            return
+        self.dialogue_manager = dialogue_system.DialogueManager(graph, npc_lookup=self.world.get_npc_id_by_name)
+        self.messenger_system.dynamic_world_events.use_relationship_graph(graph)
+
     def setup_game_systems(self):
         """Initialize all game systems"""
         print("\n🔧 Initializing game systems...")
@@ -6577,8 +6601,8 @@ class Game:
         self.update_system = traveler_updates.UpdateSystem()
         self.messenger_system = messenger_system.MessengerSystem()
         self.tribunal_system = tribunal_system.TribunalSystem()
-        self.ai_world_controller = ai_world_controller.AIWorldController()
-        self.dialogue_manager = dialogue_system.DialogueManager()
+        self.ai_world_controller = ai_world_controller.AIWorldController(world_generator=self.world)
+        self._share_relationship_graph()
         self.hacking_system = hacking_system.HackingSystem()
         
         # Initialize comprehensive US Political System
@@ -6624,7 +6648,7 @@ class Game:
         print(f"  ✅ Created {hackers} hackers")
         print(f"  ✅ Created {targets} hacking targets")
         print(f"  ✅ Distributed {tools} hacking tools")
-        self.hacking_system.initialize_hacking_world(hackers, targets, tools)
+        self.hacking_system.initialize_hacking_world(hackers, targets, tools, world=getattr(self, "world", None))
         
         # Initialize Director's Programmers
         print("🤖 Initializing Director's Programmers...")
@@ -8776,7 +8800,7 @@ class Game:
                     senate = leg_branch.senate
                     if hasattr(senate, 'majority_party') and hasattr(senate, 'members'):
                         party_str = senate.majority_party.value if hasattr(senate.majority_party, 'value') else str(senate.majority_party)
-                        majority_count = getattr(senate, 'majority_count', len([m for m in senate.members if hasattr(m, 'party') and m.party == senate.majority_party]))
+                        majority_count = getattr(senate, 'majority_seats', senate.members.count(party_str))
                         print(f"   • Senate: {party_str} majority ({majority_count}/{len(senate.members)})")
                         print(f"     Members: {len(senate.members)}")
                     else:
@@ -8786,7 +8810,7 @@ class Game:
                     house = leg_branch.house
                     if hasattr(house, 'majority_party') and hasattr(house, 'members'):
                         party_str = house.majority_party.value if hasattr(house.majority_party, 'value') else str(house.majority_party)
-                        majority_count = getattr(house, 'majority_count', len([m for m in house.members if hasattr(m, 'party') and m.party == house.majority_party]))
+                        majority_count = getattr(house, 'majority_seats', house.members.count(party_str))
                         print(f"   • House: {party_str} majority ({majority_count}/{len(house.members)})")
                         print(f"     Members: {len(house.members)}")
                     else:
@@ -155,20 +155,21 @@ class EntityTracker:
             # Senators from Legislative Branch
             if hasattr(us_pol, 'legislative_branch'):
                 leg = us_pol.legislative_branch
-                if hasattr(leg, 'senate') and hasattr(leg.senate, 'senators'):
-                    for party, senators in leg.senate.senators.items():
-                        for senator in senators:
-                            entity_id = f"senator_{senator.get('name', 'unknown').replace(' ', '_')}"
-                            self.entities[entity_id] = GameEntity(
-                                entity_id=entity_id,
-                                name=senator.get('name', 'Unknown'),
-                                entity_type="political",
-                                metadata={
-                                    "role": "Senator",
-                                    "party": party,
-                                    "state": senator.get('state', 'Unknown')
-                                }
-                            )
+                if hasattr(leg, 'senate'):
+                    senators = leg.senate.members
+                    for i in range(len(senators)):
+                        entity_id = senator_entity_id(senators.seats[i])
+                        self.entities[entity_id] = GameEntity(
+                            entity_id=entity_id,
+                            name=senators.names[i],
+                            entity_type="political",
+                            metadata={
+                                "role": "Senator",
+                                "party": senators.party_of(i),
+                                "state": senators.states[i],
+                                "seat": senators.seats[i]
+                            }
+                        )
                             
         except Exception as e:
             print(f"⚠️  Error collecting political entities: {e}")
@@ -531,6 +532,11 @@ class EntityTracker:
         }
 
 
+def senator_entity_id(seat: str) -> str:
+    """Entity id for a Senate seat's holder (names repeat across the chamber, seats don't)"""
+    return f"senator_{seat.replace(' ', '_')}"
+
+
 # Singleton
 _entity_tracker = None
 
@@ -5,6 +5,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from government_news_system import government_news, report_presidential_assassination
+from timer_wheel import TimerWheel
 
 class GovernmentConsequencesSystem:
     """Handles real-time consequences of major government events on the game world"""
@@ -15,6 +16,8 @@ class GovernmentConsequencesSystem:
         self.government_operations = []
         self.world_state_changes = []
         self.consequence_timeline = []
+        # Operation completions, one tick per process_ongoing_consequences call
+        self.operation_timers = TimerWheel()
         
         # Government response capabilities
         self.government_resources = {
@@ -333,9 +336,12 @@ class GovernmentConsequencesSystem:
         self.crisis_effects["military_alert_level"] = "DEFCON 2"
         self.crisis_effects["federal_buildings_secured"] = True
         
-        # Add government operations to active list
+        # Add government operations to active list and schedule their completion
         for operation in consequence_event["government_operations"]:
             self.government_operations.append(operation)
+            self.operation_timers.schedule_in(
+                self._sample_operation_turns(), self._complete_operation, operation
+            )
         
         # Generate additional government response news
         response_data = {
@@ -357,8 +363,6 @@ class GovernmentConsequencesSystem:
     
     def process_ongoing_consequences(self):
         """Process ongoing consequences and their effects on the game world"""
-        current_time = datetime.now()
-        
         for consequence in self.active_consequences:
             if consequence["status"] != "active":
                 continue
@@ -367,11 +371,9 @@ class GovernmentConsequencesSystem:
             for ongoing in consequence.get("ongoing_consequences", []):
                 if ongoing["duration"] == "ongoing":
                     self._apply_ongoing_effects(ongoing)
-            
-            # Update government operations progress
-            for operation in consequence.get("government_operations", []):
-                if operation["status"] == "active":
-                    self._update_operation_progress(operation)
+        
+        # Government operations complete from the timer wheel
+        self.operation_timers.tick()
     
     def _apply_ongoing_effects(self, ongoing_consequence: Dict):
         """Apply ongoing effects to the game world"""
@@ -388,26 +390,29 @@ class GovernmentConsequencesSystem:
                     new_value = max(0.0, min(1.0, current_value + change))
                     setattr(living_world, attribute, new_value)
     
-    def _update_operation_progress(self, operation: Dict):
-        """Update the progress of government operations"""
-        # Simulate operation progress
-        if operation["status"] == "active":
-            # Random progress increment
-            progress_increment = random.uniform(0.01, 0.05)
-            operation["progress"] = min(1.0, operation["progress"] + progress_increment)
-            
-            # Check if operation is complete
-            if operation["progress"] >= 1.0:
-                operation["status"] = "completed"
-                operation["completion_timestamp"] = datetime.now()
-                
-                # Generate completion news
-                completion_data = {
-                    "response_details": [f"{operation['agency']} operation completed"],
-                    "actions": [f"Successfully completed {operation['description']}"]
-                }
-                
-                government_news.generate_news_story("government_response", completion_data)
+    def _sample_operation_turns(self) -> int:
+        """Sample how many turns an operation takes (progress grows 1-5% per turn)"""
+        progress, turns = 0.0, 0
+        while progress < 1.0:
+            progress += random.uniform(0.01, 0.05)
+            turns += 1
+        return turns
+    
+    def _complete_operation(self, operation: Dict):
+        """Timer callback: mark a government operation as completed"""
+        if operation["status"] != "active":
+            return
+        operation["progress"] = 1.0
+        operation["status"] = "completed"
+        operation["completion_timestamp"] = datetime.now()
+        
+        # Generate completion news
+        completion_data = {
+            "response_details": [f"{operation['agency']} operation completed"],
+            "actions": [f"Successfully completed {operation['description']}"]
+        }
+        
+        government_news.generate_news_story("government_response", completion_data)
     
     def get_active_consequences(self) -> List[Dict]:
         """Get all active consequences"""
@@ -1,11 +1,36 @@
 # government_detection_system.py
 
+import itertools
+import math
 import random
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+from dice_math import check_probability
+from event_scheduler import geometric_gap
+from metric_series import EXPOSURE_METRICS, campaign_metrics
+from timer_wheel import TimerWheel
+
+
+def bernoulli_picks(items: Sequence, chance: float) -> Iterator:
+    """Items that each pass an independent `chance` roll, found by geometric skips
+
+    Same distribution as `[x for x in items if random.random() < chance]`, but
+    the cost is one draw per picked item rather than one per item.
+    """
+    index = -1
+    while True:
+        gap = geometric_gap(chance)
+        if gap is None:
+            return
+        index += gap
+        if index >= len(items):
+            return
+        yield items[index]
+
 @dataclass
 class DetectionEvent:
     """Represents a detection event that increases exposure risk"""
@@ -30,15 +55,28 @@ class Investigation:
     evidence_level: float  # 0.0 to 1.0
     investigation_agencies: List[str]
     current_phase: str  # "surveillance", "evidence_gathering", "analysis", "action_ready"
-    estimated_completion: int  # turns until completion
+    estimated_completion: int  # turns from creation to completion
     risk_level: str  # "low", "medium", "high", "critical"
+    start_turn: int = 0
+    end_turn: int = 0
+    phase_turns: Tuple[Tuple[int, str], ...] = ()  # (turn, phase) for each phase after the first
+    status: str = "active"
+    end_timestamp: Optional[datetime] = None
+
+# Share of an investigation's duration after which each later phase begins
+INVESTIGATION_PHASES = (
+    (0.25, "evidence_gathering"),
+    (0.5, "analysis"),
+    (0.75, "action_ready"),
+)
 
 class GovernmentDetectionSystem:
     """Complex D20-based system for government detection of Traveler teams and Faction"""
     
     def __init__(self):
-        self.detection_events = []
-        self.active_investigations = []
+        self.detection_events = deque()  # FIFO of pending DetectionEvents
+        self.active_investigations = {}  # investigation_id -> Investigation
+        self._investigation_ids = itertools.count(1)
         self.exposure_risk = {
             "traveler_teams": 0.0,  # 0.0 to 1.0
             "faction": 0.0,
@@ -65,6 +103,12 @@ class GovernmentDetectionSystem:
         }
         self.turn_count = 0
         self.detection_history = []
+        # Investigation phase changes and completions, as (investigation, phase or None) keyed by turn
+        self.investigation_timers = TimerWheel(current_turn=self.turn_count)
+        # location -> (surveillance coverage, monitoring agencies); valid until the networks change
+        self._location_cache = {}
+        # Per-turn exposure history (shared campaign store by default)
+        self.metrics = campaign_metrics
         
     def process_turn(self, world_state: Dict, game_state: Dict):
         """Process one turn of the detection system with REAL-TIME event generation"""
@@ -130,39 +174,33 @@ class GovernmentDetectionSystem:
             game_state = {}
         print(f"\n📋 Processing {len(self.detection_events)} detection events...")
         
-        for event in self.detection_events[:]:
-            if event.status == "pending":
-                # Roll D20 for detection
-                detection_result = self.roll_detection_d20(event, world_state)
-                
-                # Display the compelling narrative based on D20 results
-                print(f"\n🎲 D20 DETECTION ROLL:")
-                print(f"    Roll: {detection_result['roll']} vs DC {detection_result['dc']}")
-                if detection_result['advantage_used']:
-                    print(f"    Advantage: {detection_result['advantage_count']} dice")
-                print(f"\n    {detection_result['narrative']}")
-                
-                if detection_result["detected"]:
-                    event.status = "detected"
-                    self.handle_detection(event, detection_result, world_state)
-                    print(f"\n    🚨 DETECTED: Government agencies have successfully identified the threat.")
-                    
-                    # Check if Traveler teams or news can discover this detection
-                    self.check_detection_discovery(event, detection_result, world_state, game_state)
-                else:
-                    event.status = "avoided"
-                    print(f"\n    ✅ AVOIDED: The threat successfully evaded government detection.")
+        # Events queued while these are handled wait for the next turn
+        batch = [self.detection_events.popleft() for _ in range(len(self.detection_events))]
+        batch = [event for event in batch if event.status == "pending"]
+        for event, detection_result in zip(batch, self.roll_detection_batch(batch, world_state)):
+            # Display the compelling narrative based on D20 results
+            print(f"\n🎲 D20 DETECTION ROLL:")
+            print(f"    Roll: {detection_result['roll']} vs DC {detection_result['dc']} (detection odds {detection_result['odds']:.0%})")
+            if detection_result['advantage_used']:
+                print(f"    Advantage: {detection_result['advantage_count']} dice")
+            print(f"\n    {detection_result['narrative']}")
+            
+            if detection_result["detected"]:
+                event.status = "detected"
+                self.handle_detection(event, detection_result, world_state)
+                print(f"\n    🚨 DETECTED: Government agencies have successfully identified the threat.")
                 
-                # Move to history
-                self.detection_history.append(event)
-                self.detection_events.remove(event)
+                # Check if Traveler teams or news can discover this detection
+                self.check_detection_discovery(event, detection_result, world_state, game_state)
+            else:
+                event.status = "avoided"
+                print(f"\n    ✅ AVOIDED: The threat successfully evaded government detection.")
+            
+            # Move to history
+            self.detection_history.append(event)
     
-    def roll_detection_d20(self, event: DetectionEvent, world_state: Dict) -> Dict:
-        """Roll D20 for government detection of an event"""
-        # Base D20 roll
-        base_roll = random.randint(1, 20)
-        
-        # Calculate detection DC (Difficulty Class)
+    def detection_dc(self, event: DetectionEvent, world_state: Dict) -> float:
+        """Difficulty class the agencies must beat to detect an event"""
         base_dc = 15  # Base difficulty
         
         # Adjust DC based on event severity and detection chance
@@ -170,7 +208,7 @@ class GovernmentDetectionSystem:
         detection_modifier = event.detection_chance * 10  # Higher detection chance = easier to detect
         
         # Adjust DC based on surveillance coverage in the area
-        location_surveillance = self.get_location_surveillance_coverage(event.location)
+        location_surveillance = self._location_profile(event.location)[0]
         surveillance_modifier = location_surveillance * 3
         
         # Adjust DC based on government control level
@@ -179,59 +217,76 @@ class GovernmentDetectionSystem:
         
         # Calculate final DC
         final_dc = base_dc - severity_modifier - detection_modifier - surveillance_modifier - control_modifier
-        final_dc = max(5, min(25, final_dc))  # Keep DC between 5 and 25
-        
+        return max(5, min(25, final_dc))  # Keep DC between 5 and 25
+    
+    @staticmethod
+    def detection_advantage(monitoring_agencies: List[str]) -> int:
+        """Extra dice rolled (keep highest) when several agencies watch a location"""
+        # Triple advantage for multiple agencies
+        return 2 if len(monitoring_agencies) > 1 else 0
+    
+    def detection_odds(self, event: DetectionEvent, world_state: Dict) -> float:
+        """Exact chance that the agencies detect `event` on their roll"""
+        advantage = self.detection_advantage(self._location_profile(event.location)[1])
+        return check_probability(math.ceil(self.detection_dc(event, world_state)), 0, advantage)
+    
+    def roll_detection_d20(self, event: DetectionEvent, world_state: Dict) -> Dict:
+        """Roll D20 for government detection of an event"""
+        return self.roll_detection_batch([event], world_state)[0]
+    
+    def roll_detection_batch(self, events: List[DetectionEvent], world_state: Dict) -> List[Dict]:
+        """Roll government detection for many events at once
+        
+        DCs and advantage come from the per-location cache, and every die for
+        the batch is drawn in one pass before the results are assembled.
+        """
+        profiles = [self._location_profile(event.location) for event in events]
+        dcs = [self.detection_dc(event, world_state) for event in events]
         # Roll with advantage if multiple agencies are monitoring
-        monitoring_agencies = self.get_monitoring_agencies(event.location)
-        if len(monitoring_agencies) > 1:
-            roll1 = random.randint(1, 20)
-            roll2 = random.randint(1, 20)
-            roll3 = random.randint(1, 20)
-            final_roll = max(roll1, roll2, roll3)  # Triple advantage for multiple agencies
-            advantage_used = True
-            advantage_count = 3
-        elif len(monitoring_agencies) > 1:
-            roll1 = random.randint(1, 20)
-            roll2 = random.randint(1, 20)
-            final_roll = max(roll1, roll2)
-            advantage_used = True
-            advantage_count = 2
-        else:
-            final_roll = base_roll
-            advantage_used = False
-            advantage_count = 1
-        
-        # Determine success
-        success = final_roll >= final_dc
-        critical_success = final_roll == 20
-        critical_failure = final_roll == 1
-        
-        # Calculate detection quality
-        if success:
-            detection_quality = (final_roll - final_dc) / (20 - final_dc)
-        else:
-            detection_quality = 0.0
-        
-        # Generate narrative based on roll results
-        narrative = self.generate_detection_narrative(
-            event, final_roll, final_dc, success, critical_success, critical_failure,
-            advantage_used, advantage_count, monitoring_agencies, detection_quality
-        )
-        
-        return {
-            "detected": success,
-            "roll": final_roll,
-            "dc": final_dc,
-            "base_roll": base_roll,
-            "advantage_used": advantage_used,
-            "advantage_count": advantage_count,
-            "critical_success": critical_success,
-            "critical_failure": critical_failure,
-            "detection_quality": detection_quality,
-            "monitoring_agencies": monitoring_agencies,
-            "location_surveillance": location_surveillance,
-            "narrative": narrative
-        }
+        advantages = [self.detection_advantage(agencies) for _, agencies in profiles]
+        dice = [[random.randint(1, 20) for _ in range(1 + advantage)] for advantage in advantages]
+        
+        results = []
+        for event, (location_surveillance, agencies), final_dc, advantage, rolls in zip(events, profiles, dcs, advantages, dice):
+            monitoring_agencies = list(agencies)
+            base_roll = rolls[0]
+            final_roll = max(rolls)
+            advantage_used = advantage > 0
+            advantage_count = 1 + advantage
+            
+            # Determine success
+            success = final_roll >= final_dc
+            critical_success = final_roll == 20
+            critical_failure = final_roll == 1
+            
+            # Calculate detection quality
+            if success:
+                detection_quality = (final_roll - final_dc) / (20 - final_dc)
+            else:
+                detection_quality = 0.0
+            
+            # Generate narrative based on roll results
+            narrative = self.generate_detection_narrative(
+                event, final_roll, final_dc, success, critical_success, critical_failure,
+                advantage_used, advantage_count, monitoring_agencies, detection_quality
+            )
+            
+            results.append({
+                "detected": success,
+                "roll": final_roll,
+                "dc": final_dc,
+                "base_roll": base_roll,
+                "advantage_used": advantage_used,
+                "advantage_count": advantage_count,
+                "critical_success": critical_success,
+                "critical_failure": critical_failure,
+                "detection_quality": detection_quality,
+                "monitoring_agencies": monitoring_agencies,
+                "location_surveillance": location_surveillance,
+                "odds": check_probability(math.ceil(final_dc), 0, advantage),
+                "narrative": narrative
+            })
+        return results
     
     def handle_detection(self, event: DetectionEvent, detection_result: Dict, world_state: Dict):
         """Handle a successful detection by government agencies"""
@@ -244,7 +299,7 @@ class GovernmentDetectionSystem:
         # Create investigation if evidence is sufficient
         if evidence_level > 0.3:  # 30% evidence threshold
             investigation = self.create_investigation(event, detecting_agencies, evidence_level)
-            self.active_investigations.append(investigation)
+            self.open_investigation(investigation)
             
             # Update world state
             world_state['government_control'] = min(1.0, world_state.get('government_control', 0.5) + 0.05)
@@ -262,7 +317,7 @@ class GovernmentDetectionSystem:
     
     def create_investigation(self, event: DetectionEvent, agencies: List[str], evidence_level: float) -> Investigation:
         """Create a new government investigation"""
-        investigation_id = f"INV_{len(self.active_investigations):06d}"
+        investigation_id = f"INV_{next(self._investigation_ids):06d}"
         
         # Determine target type based on event
         target_type = "unknown"
@@ -288,6 +343,12 @@ class GovernmentDetectionSystem:
         else:
             risk_level = "low"
         
+        # Phase boundaries are fixed up front; ties collapse onto the later phase
+        start_turn = self.turn_count
+        end_turn = start_turn + estimated_completion
+        phase_turns = tuple((start_turn + max(1, int(estimated_completion * share)), phase)
+                            for share, phase in INVESTIGATION_PHASES)
+        
         return Investigation(
             investigation_id=investigation_id,
             start_timestamp=datetime.now(),
@@ -296,31 +357,34 @@ class GovernmentDetectionSystem:
             investigation_agencies=agencies,
             current_phase="surveillance",
             estimated_completion=estimated_completion,
-            risk_level=risk_level
+            risk_level=risk_level,
+            start_turn=start_turn,
+            end_turn=end_turn,
+            phase_turns=phase_turns
         )
     
+    def open_investigation(self, investigation: Investigation):
+        """Track an investigation and schedule its phase changes and completion"""
+        self.active_investigations[investigation.investigation_id] = investigation
+        for turn, phase in investigation.phase_turns:
+            if turn < investigation.end_turn:
+                self.investigation_timers.schedule(turn, payload=(investigation, phase))
+        self.investigation_timers.schedule(investigation.end_turn, payload=(investigation, None))
+    
     def update_investigations(self, world_state: Dict):
         """Update progress of active investigations"""
         print(f"\n🔍 Updating {len(self.active_investigations)} active investigations...")
         
-        for investigation in self.active_investigations[:]:
-            # Progress investigation
-            investigation.estimated_completion -= 1
-            
-            # Check for phase advancement
-            if investigation.estimated_completion <= investigation.estimated_completion * 0.75:
-                investigation.current_phase = "evidence_gathering"
-            elif investigation.estimated_completion <= investigation.estimated_completion * 0.5:
-                investigation.current_phase = "analysis"
-            elif investigation.estimated_completion <= investigation.estimated_completion * 0.25:
-                investigation.current_phase = "action_ready"
-            
-            # Check for completion
-            if investigation.estimated_completion <= 0:
-                self.complete_investigation(investigation, world_state)
-                self.active_investigations.remove(investigation)
+        # Only investigations changing phase or finishing this turn are touched
+        for investigation, phase in self.investigation_timers.advance(self.turn_count):
+            if investigation.investigation_id not in self.active_investigations:
+                continue
+            if phase is not None:
+                investigation.current_phase = phase
+                print(f"    🔎 Investigation {investigation.investigation_id} entered {phase.replace('_', ' ')} phase")
             else:
-                print(f"    📋 {investigation.investigation_id}: {investigation.current_phase} - {investigation.estimated_completion} turns remaining")
+                del self.active_investigations[investigation.investigation_id]
+                self.complete_investigation(investigation, world_state)
     
     def complete_investigation(self, investigation: Investigation, world_state: Dict):
         """Complete an investigation and apply consequences"""
@@ -376,87 +440,84 @@ class GovernmentDetectionSystem:
         # Check for active missions that could be detected
         active_missions = game_state.get("active_missions", [])
         if active_missions:
-            for mission in active_missions:
-                if random.random() < 0.3:  # 30% chance of detection event per mission
-                    self.add_detection_event(
-                        event_type="mission_activity",
-                        severity=0.6,
-                        location=mission.get("location", "unknown"),
-                        description=f"Government agencies detect suspicious activity consistent with covert operations at {mission.get('location', 'unknown location')}",
-                        involved_entities=["traveler_team"],
-                        detection_chance=0.7,
-                        risk_multiplier=1.2,
-                        context_data={
-                            "mission_type": mission.get("type", "unknown"),
-                            "mission_objective": mission.get("objective", "unknown"),
-                            "mission_location": mission.get("location", "unknown"),
-                            "mission_urgency": mission.get("urgency", 0.5),
-                            "team_size": mission.get("team_size", 1),
-                            "detection_indicators": [
-                                "Unusual communication patterns",
-                                "Coordinated movements",
-                                "Electronic surveillance countermeasures",
-                                "Suspicious timing of activities"
-                            ]
-                        }
-                    )
-                    print(f"    🚨 Mission detection event generated for {mission.get('location', 'unknown')}")
+            for mission in bernoulli_picks(active_missions, 0.3):  # 30% chance of detection event per mission
+                self.add_detection_event(
+                    event_type="mission_activity",
+                    severity=0.6,
+                    location=mission.get("location", "unknown"),
+                    description=f"Government agencies detect suspicious activity consistent with covert operations at {mission.get('location', 'unknown location')}",
+                    involved_entities=["traveler_team"],
+                    detection_chance=0.7,
+                    risk_multiplier=1.2,
+                    context_data={
+                        "mission_type": mission.get("type", "unknown"),
+                        "mission_objective": mission.get("objective", "unknown"),
+                        "mission_location": mission.get("location", "unknown"),
+                        "mission_urgency": mission.get("urgency", 0.5),
+                        "team_size": mission.get("team_size", 1),
+                        "detection_indicators": [
+                            "Unusual communication patterns",
+                            "Coordinated movements",
+                            "Electronic surveillance countermeasures",
+                            "Suspicious timing of activities"
+                        ]
+                    }
+                )
+                print(f"    🚨 Mission detection event generated for {mission.get('location', 'unknown')}")
         
         # Check for hacking operations that could be detected
         hacking_operations = game_state.get("hacking_operations", [])
         if hacking_operations:
-            for op in hacking_operations:
-                if random.random() < 0.4:  # 40% chance of detection event per hacking op
-                    self.add_detection_event(
-                        event_type="cyber_activity",
-                        severity=0.5,
-                        location=op.get("target", "digital_network"),
-                        description=f"Cybersecurity systems detect sophisticated intrusion attempts against {op.get('target', 'digital infrastructure')}",
-                        involved_entities=["faction"],
-                        detection_chance=0.8,
-                        risk_multiplier=1.5,
-                        context_data={
-                            "target_system": op.get("target", "unknown"),
-                            "operation_type": op.get("operation", "unknown"),
-                            "hacker_type": op.get("hacker_type", "unknown"),
-                            "alert_level": op.get("alert_level", 0.0),
-                            "detection_indicators": [
-                                "Unusual network traffic patterns",
-                                "Sophisticated encryption methods",
-                                "Bypass of standard security protocols",
-                                "Traces of advanced hacking tools"
-                            ],
-                            "system_type": op.get("system_type", "unknown")
-                        }
-                    )
-                    print(f"    🚨 Cyber detection event generated for {op.get('target', 'digital infrastructure')}")
+            for op in bernoulli_picks(hacking_operations, 0.4):  # 40% chance of detection event per hacking op
+                self.add_detection_event(
+                    event_type="cyber_activity",
+                    severity=0.5,
+                    location=op.get("target", "digital_network"),
+                    description=f"Cybersecurity systems detect sophisticated intrusion attempts against {op.get('target', 'digital infrastructure')}",
+                    involved_entities=["faction"],
+                    detection_chance=0.8,
+                    risk_multiplier=1.5,
+                    context_data={
+                        "target_system": op.get("target", "unknown"),
+                        "operation_type": op.get("operation", "unknown"),
+                        "hacker_type": op.get("hacker_type", "unknown"),
+                        "alert_level": op.get("alert_level", 0.0),
+                        "detection_indicators": [
+                            "Unusual network traffic patterns",
+                            "Sophisticated encryption methods",
+                            "Bypass of standard security protocols",
+                            "Traces of advanced hacking tools"
+                        ],
+                        "system_type": op.get("system_type", "unknown")
+                    }
+                )
+                print(f"    🚨 Cyber detection event generated for {op.get('target', 'digital infrastructure')}")
         
         # Check for faction activities that could be detected
         faction_activities = world_state.get("faction_activities", [])
         if faction_activities:
-            for activity in faction_activities:
-                if random.random() < 0.25:  # 25% chance of detection event per faction activity
-                    self.add_detection_event(
-                        event_type="faction_operation",
-                        severity=0.7,
-                        location=activity.get("location", "unknown"),
-                        description=f"Intelligence agencies identify patterns consistent with organized subversive activity in {activity.get('location', 'unknown area')}",
-                        involved_entities=["faction"],
-                        detection_chance=0.6,
-                        risk_multiplier=1.3,
-                        context_data={
-                            "activity_type": activity.get("type", "unknown"),
-                            "activity_description": activity.get("description", "unknown"),
-                            "faction_influence": world_state.get("faction_influence", 0.2),
-                            "detection_indicators": [
-                                "Coordinated recruitment efforts",
-                                "Timeline manipulation signatures",
-                                "Organized resistance patterns",
-                                "Subversive communication networks"
-                            ]
-                        }
-                    )
-                    print(f"    🚨 Faction detection event generated for {activity.get('location', 'unknown area')}")
+            for activity in bernoulli_picks(faction_activities, 0.25):  # 25% chance of detection event per faction activity
+                self.add_detection_event(
+                    event_type="faction_operation",
+                    severity=0.7,
+                    location=activity.get("location", "unknown"),
+                    description=f"Intelligence agencies identify patterns consistent with organized subversive activity in {activity.get('location', 'unknown area')}",
+                    involved_entities=["faction"],
+                    detection_chance=0.6,
+                    risk_multiplier=1.3,
+                    context_data={
+                        "activity_type": activity.get("type", "unknown"),
+                        "activity_description": activity.get("description", "unknown"),
+                        "faction_influence": world_state.get("faction_influence", 0.2),
+                        "detection_indicators": [
+                            "Coordinated recruitment efforts",
+                            "Timeline manipulation signatures",
+                            "Organized resistance patterns",
+                            "Subversive communication networks"
+                        ]
+                    }
+                )
+                print(f"    🚨 Faction detection event generated for {activity.get('location', 'unknown area')}")
         
         # Check for timeline instability that could attract government attention
         timeline_stability = world_state.get("timeline_stability", 0.8)
@@ -518,57 +579,55 @@ class GovernmentDetectionSystem:
         # Check for recent world events that could trigger detection
         recent_events = world_state.get("recent_events", [])
         if recent_events:
-            for event in recent_events[-3:]:  # Check last 3 events
-                if random.random() < 0.2:  # 20% chance per recent event
-                    self.add_detection_event(
-                        event_type="world_event_analysis",
-                        severity=0.5,
-                        location=event.get("location", "unknown"),
-                        description=f"Government analysts identify suspicious patterns in recent {event.get('type', 'world')} events at {event.get('location', 'unknown location')}",
-                        involved_entities=["traveler_team", "faction"],
-                        detection_chance=0.6,
-                        risk_multiplier=1.2,
-                        context_data={
-                            "event_type": event.get("type", "unknown"),
-                            "event_description": event.get("description", "unknown"),
-                            "event_location": event.get("location", "unknown"),
-                            "detection_indicators": [
-                                "Pattern analysis reveals anomalies",
-                                "Statistical deviations from normal",
-                                "Correlation with known threat patterns",
-                                "Temporal clustering of incidents"
-                            ]
-                        }
-                    )
-                    print(f"    🚨 World event detection event generated for {event.get('type', 'world')} events!")
+            for event in bernoulli_picks(recent_events[-3:], 0.2):  # 20% chance per recent event
+                self.add_detection_event(
+                    event_type="world_event_analysis",
+                    severity=0.5,
+                    location=event.get("location", "unknown"),
+                    description=f"Government analysts identify suspicious patterns in recent {event.get('type', 'world')} events at {event.get('location', 'unknown location')}",
+                    involved_entities=["traveler_team", "faction"],
+                    detection_chance=0.6,
+                    risk_multiplier=1.2,
+                    context_data={
+                        "event_type": event.get("type", "unknown"),
+                        "event_description": event.get("description", "unknown"),
+                        "event_location": event.get("location", "unknown"),
+                        "detection_indicators": [
+                            "Pattern analysis reveals anomalies",
+                            "Statistical deviations from normal",
+                            "Correlation with known threat patterns",
+                            "Temporal clustering of incidents"
+                        ]
+                    }
+                )
+                print(f"    🚨 World event detection event generated for {event.get('type', 'world')} events!")
         
         # Check for AI traveler team activities
         ai_teams = world_state.get("ai_traveler_teams", [])
         if ai_teams:
-            for team in ai_teams:
-                if random.random() < 0.15:  # 15% chance per AI team
-                    self.add_detection_event(
-                        event_type="ai_team_activity",
-                        severity=0.6,
-                        location=team.get("location", "unknown"),
-                        description=f"Surveillance systems detect coordinated activities by unknown operatives in {team.get('location', 'unknown area')}",
-                        involved_entities=["traveler_team"],
-                        detection_chance=0.5,
-                        risk_multiplier=1.1,
-                        context_data={
-                            "team_designation": team.get("designation", "unknown"),
-                            "team_location": team.get("location", "unknown"),
-                            "team_status": team.get("status", "unknown"),
-                            "active_missions": team.get("active_missions", []),
-                            "detection_indicators": [
-                                "Coordinated movements",
-                                "Unusual communication patterns",
-                                "Electronic surveillance countermeasures",
-                                "Suspicious timing of activities"
-                            ]
-                        }
-                    )
-                    print(f"    🚨 AI team detection event generated for {team.get('location', 'unknown area')}")
+            for team in bernoulli_picks(ai_teams, 0.15):  # 15% chance per AI team
+                self.add_detection_event(
+                    event_type="ai_team_activity",
+                    severity=0.6,
+                    location=team.get("location", "unknown"),
+                    description=f"Surveillance systems detect coordinated activities by unknown operatives in {team.get('location', 'unknown area')}",
+                    involved_entities=["traveler_team"],
+                    detection_chance=0.5,
+                    risk_multiplier=1.1,
+                    context_data={
+                        "team_designation": team.get("designation", "unknown"),
+                        "team_location": team.get("location", "unknown"),
+                        "team_status": team.get("status", "unknown"),
+                        "active_missions": team.get("active_missions", []),
+                        "detection_indicators": [
+                            "Coordinated movements",
+                            "Unusual communication patterns",
+                            "Electronic surveillance countermeasures",
+                            "Suspicious timing of activities"
+                        ]
+                    }
+                )
+                print(f"    🚨 AI team detection event generated for {team.get('location', 'unknown area')}")
         
         # Check for faction influence changes
         faction_influence = world_state.get("faction_influence", 0.2)
@@ -595,7 +654,7 @@ class GovernmentDetectionSystem:
                 )
                 print(f"    🚨 Faction influence detection event generated!")
         
-        print(f"    📊 Generated {len([e for e in self.detection_events if e.status == 'pending'])} new detection events")
+        print(f"    📊 Generated {len(self.detection_events)} new detection events")
     
     def roll_for_detections(self, world_state: Dict):
         """Roll for new detections based on current exposure levels"""
@@ -639,6 +698,7 @@ class GovernmentDetectionSystem:
         
         # Add random fluctuations to make surveillance dynamic
         random_factor = random.uniform(0.95, 1.05)
+        self._location_cache.clear()
         
         # Adjust surveillance coverage based on government control and surveillance level
         self.surveillance_networks["cctv_coverage"] = min(0.8, 0.3 + government_control * 0.3) * random_factor
@@ -682,6 +742,22 @@ class GovernmentDetectionSystem:
     
     def get_location_surveillance_coverage(self, location: str) -> float:
         """Get surveillance coverage for a specific location"""
+        return self._location_profile(location)[0]
+    
+    def get_monitoring_agencies(self, location: str) -> List[str]:
+        """Get which government agencies are monitoring a location"""
+        return list(self._location_profile(location)[1])
+    
+    def _location_profile(self, location: str) -> Tuple[float, Tuple[str, ...]]:
+        """(coverage, monitoring agencies) for a location, drawn once per surveillance update"""
+        profile = self._location_cache.get(location)
+        if profile is None:
+            coverage = self._surveillance_coverage(location)
+            profile = (coverage, self._pick_monitoring_agencies(location, coverage))
+            self._location_cache[location] = profile
+        return profile
+    
+    def _surveillance_coverage(self, location: str) -> float:
         # Base coverage from surveillance networks
         base_coverage = (
             self.surveillance_networks["cctv_coverage"] * 0.4 +
@@ -704,17 +780,14 @@ class GovernmentDetectionSystem:
         modifier = location_modifiers.get(location.lower(), 1.0)
         return min(1.0, base_coverage * modifier)
     
-    def get_monitoring_agencies(self, location: str) -> List[str]:
-        """Get which government agencies are monitoring a location"""
+    def _pick_monitoring_agencies(self, location: str, coverage: float) -> Tuple[str, ...]:
         # All agencies monitor high-value locations
         if location.lower() in ["government_building", "federal_facility"]:
-            return list(self.government_agencies.keys())
+            return tuple(self.government_agencies)
         
         # Random selection for other locations based on surveillance level
-        coverage = self.get_location_surveillance_coverage(location)
         num_agencies = max(1, int(coverage * len(self.government_agencies)))
-        
-        return random.sample(list(self.government_agencies.keys()), num_agencies)
+        return tuple(random.sample(list(self.government_agencies), num_agencies))
     
     def calculate_overall_exposure_risk(self):
         """Calculate overall exposure risk with REAL-TIME dynamics"""
@@ -740,6 +813,7 @@ class GovernmentDetectionSystem:
             self.exposure_risk["traveler_teams"] * 0.6 +
             self.exposure_risk["faction"] * 0.4
         )
+        self.metrics.record(self.turn_count, {EXPOSURE_METRICS[key]: value for key, value in self.exposure_risk.items()})
         
         # Add dramatic narrative for high exposure levels
         if self.exposure_risk["overall"] > 0.8:
@@ -758,6 +832,9 @@ class GovernmentDetectionSystem:
         print(f"  • Traveler Teams Exposure: {self.exposure_risk['traveler_teams']:.1%}")
         print(f"  • Faction Exposure: {self.exposure_risk['faction']:.1%}")
         print(f"  • Overall Exposure: {self.exposure_risk['overall']:.1%}")
+        trend = self.metrics.sparkline(EXPOSURE_METRICS["overall"])
+        if len(trend) > 1:
+            print(f"  • Exposure Trend: {trend}")
         print(f"  • Active Investigations: {len(self.active_investigations)}")
         print(f"  • Pending Events: {len(self.detection_events)}")
         
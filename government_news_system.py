@@ -1,15 +1,37 @@
 # government_news_system.py
 
+import json
+import os
 import random
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional
+
+NEWS_CATEGORY_RING_SIZE = 50  # live stories kept per category; older ones are archived
+NEWS_RETENTION_TURNS = 30     # turns a story stays in the live feed before it is archived
+NEWS_ARCHIVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "news_archive.jsonl")
 
 class GovernmentNewsSystem:
-    """Real-time government news system that reports on game world events"""
+    """Real-time government news system that reports on game world events
+
+    Live stories sit in a bounded ring per category and in one queue per
+    priority level (publication order), so feed reads walk only the stories
+    they return. Stories are stamped with the game turn; past the retention
+    window, or when their category ring overflows, they are appended to a
+    JSON-lines archive on disk and dropped from memory.
+    """
     
-    def __init__(self):
-        self.news_stories = []
+    def __init__(self, archive_path: Optional[str] = NEWS_ARCHIVE_PATH):
+        self.current_turn = 0
+        self.archive_path = archive_path
+        self.archived_count = 0
+        self._story_seq = 0
+        self._live: Dict[str, Dict] = {}  # story_id -> story, in publication order
+        self._category_feeds: Dict[str, Deque[Dict]] = {}
+        self._priority_feeds: Dict[int, Deque[Dict]] = {}
+        self._dead_entries = 0  # archived stories still referenced from priority queues
         self.government_agencies = {
             "White House": {"status": "active", "alert_level": "normal"},
             "FBI": {"status": "active", "alert_level": "normal", "investigations": []},
@@ -49,12 +71,65 @@ class GovernmentNewsSystem:
             story = self._create_general_news_story(event_data, timestamp)
         
         story["timestamp"] = timestamp
+        story["turn"] = self.current_turn
         story["media_outlet"] = random.choice(self.media_outlets)
-        story["story_id"] = f"NEWS_{len(self.news_stories):06d}"
+        story["story_id"] = f"NEWS_{self._story_seq:06d}"
+        self._story_seq += 1
         
-        self.news_stories.append(story)
+        self._publish(story)
         return story
 
+    @property
+    def news_stories(self) -> List[Dict]:
+        """Live (unarchived) stories in publication order"""
+        return list(self._live.values())
+
+    def _publish(self, story: Dict):
+        self._live[story["story_id"]] = story
+        self._priority_feeds.setdefault(self._get_priority_value(story["priority"]), deque()).append(story)
+        ring = self._category_feeds.setdefault(story["category"], deque())
+        ring.append(story)
+        if len(ring) > NEWS_CATEGORY_RING_SIZE:
+            self._archive([self._retire(ring.popleft())])
+
+    def _retire(self, story: Dict) -> Dict:
+        """Drop a story from the live feed (its priority queue entry is purged lazily)"""
+        del self._live[story["story_id"]]
+        self._dead_entries += 1
+        if self._dead_entries > len(self._live):
+            for value, feed in self._priority_feeds.items():
+                self._priority_feeds[value] = deque(s for s in feed if s["story_id"] in self._live)
+            self._dead_entries = 0
+        return story
+
+    def _archive(self, stories: List[Dict]):
+        """Append retired stories to the on-disk archive"""
+        self.archived_count += len(stories)
+        if not self.archive_path or not stories:
+            return
+        try:
+            with open(self.archive_path, "a") as f:
+                for story in stories:
+                    f.write(json.dumps(story, default=str) + "\n")
+        except OSError:
+            pass
+
+    def set_turn(self, turn: int):
+        """Advance the news clock and archive stories older than the retention window"""
+        self.current_turn = turn
+        cutoff = turn - NEWS_RETENTION_TURNS
+        expired = []
+        for story in self._live.values():
+            if story["turn"] >= cutoff:
+                break
+            expired.append(story)
+        for story in expired:
+            ring = self._category_feeds[story["category"]]
+            if ring and ring[0] is story:
+                ring.popleft()
+            self._retire(story)
+        self._archive(expired)
+
     def _create_political_assassination_story(self, event_data: Dict, timestamp: datetime) -> Dict:
         """Create news story for non-presidential political assassination incidents."""
         target_name = event_data.get("target_name", "a U.S. Senator")
@@ -519,18 +594,24 @@ class GovernmentNewsSystem:
             })
     
     def get_current_news(self, limit: int = 10) -> List[Dict]:
-        """Get current news stories"""
-        # Sort by priority and timestamp
-        sorted_stories = sorted(
-            self.news_stories,
-            key=lambda x: (self._get_priority_value(x["priority"]), x["timestamp"]),
-            reverse=True
-        )
-        return sorted_stories[:limit]
+        """Get current news stories, highest priority first and newest first within a priority"""
+        stories = []
+        for value in sorted(self._priority_feeds, reverse=True):
+            for story in reversed(self._priority_feeds[value]):
+                if len(stories) >= limit:
+                    return stories
+                if story["story_id"] in self._live:
+                    stories.append(story)
+        return stories
     
-    def get_breaking_news(self) -> List[Dict]:
-        """Get only breaking news stories"""
-        return [story for story in self.news_stories if story["category"] == "BREAKING_NEWS"]
+    def get_breaking_news(self, limit: Optional[int] = None) -> List[Dict]:
+        """Get only breaking news stories (the most recent `limit`, oldest first)"""
+        ring = self._category_feeds.get("BREAKING_NEWS")
+        if not ring:
+            return []
+        if limit is None:
+            return list(ring)
+        return list(islice(reversed(ring), limit))[::-1]
     
     def get_government_status(self) -> Dict:
         """Get current government operational status"""
@@ -609,10 +690,11 @@ def get_government_news(limit: int = 10):
 
 def get_breaking_news(limit: int = 10):
     """Get breaking news stories (optionally limited)."""
-    stories = government_news.get_breaking_news()
-    if limit is None:
-        return stories
-    return stories[-limit:]
+    return government_news.get_breaking_news(limit)
+
+def advance_news_turn(turn: int):
+    """Move the news feed to a new game turn (archives stories past retention)"""
+    government_news.set_turn(turn)
 
 def get_government_status():
     """Get current government operational status"""
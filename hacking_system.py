@@ -1,8 +1,78 @@
 # hacking_system.py
+"""
+Cyber operations between Traveler, government and Faction hackers.
+
+HackingSystem keeps its hackers and targets in indexed pools (free / breached
+targets, idle / operating hackers per faction, alerted targets) that update
+themselves when a target's breach or alert level or a hacker's operation
+changes, so per-operation work does not grow with the size of the cyber war.
+
+Targets are also nodes of a network graph (RelationshipGraph CSR arrays):
+"link" edges follow the procedural world's connected locations and "trust"
+edges join systems of the same kind. Breaches pivot laterally one hop per
+turn from the newest breaches (a BFS frontier), alerts spread to neighbours,
+and successful containment quarantines the minimum cut between the breached
+cluster and the valuable systems still clean.
+"""
+import heapq
 import random
 import time
+from collections import Counter
 from datetime import datetime, timedelta
 
+from relationship_graph import RelationshipGraph
+from timer_wheel import TimerWheel
+
+
+class IndexedPool:
+    """Unordered set with O(1) add, discard and uniform random choice"""
+    __slots__ = ("items", "_positions")
+
+    def __init__(self, items=()):
+        self.items = []
+        self._positions = {}
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def add(self, item):
+        if item not in self._positions:
+            self._positions[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item):
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self._positions[last] = position
+
+    def choice(self):
+        return random.choice(self.items) if self.items else None
+
+# Tool types suited to each operation, best first; other tools are only a fallback
+OPERATION_TOOL_TYPES = {
+    "intelligence_gathering": ("surveillance", "decrypt"),
+    "cover_maintenance": ("backdoor",),
+    "surveillance": ("surveillance",),
+    "counterintelligence": ("surveillance", "decrypt"),
+    "cyber_defense": ("surveillance", "decrypt"),
+    "sabotage": ("disrupt", "exploit"),
+    "recruitment": ("backdoor", "surveillance"),
+    "timeline_manipulation": ("backdoor", "exploit"),
+}
+
+
 class HackingTool:
     """Individual hacking tool with specific capabilities"""
     def __init__(self, name, tool_type, effectiveness, detection_risk, cost):
@@ -11,8 +81,24 @@ class HackingTool:
         self.effectiveness = effectiveness  # 0.0 to 1.0
         self.detection_risk = detection_risk  # 0.0 to 1.0
         self.cost = cost
-        self.cooldown = 0
+        self.clock = None  # TimerWheel of the owning HackingSystem, if any
+        self.ready_turn = 0
+        self._cooldown = 0
         self.max_cooldown = random.randint(3, 8)
+    
+    @property
+    def cooldown(self):
+        """Turns until the tool can be used again"""
+        if self.clock is None:
+            return self._cooldown
+        return max(0, self.ready_turn - self.clock.current_turn)
+    
+    @cooldown.setter
+    def cooldown(self, turns):
+        if self.clock is None:
+            self._cooldown = turns
+        else:
+            self.ready_turn = self.clock.current_turn + turns
         
     def use_tool(self, target_difficulty):
         """Use the hacking tool and return success/failure"""
@@ -59,10 +145,34 @@ class HackingTarget:
         self.security_level = security_level  # 0.0 to 1.0
         self.value = value  # "low", "medium", "high", "critical"
         self.location = location
-        self.current_breach = None
+        self.location_id = None  # procedural world location this system belongs to, if any
+        self.index = None  # owning HackingSystem; keeps its target pools in sync
+        self._current_breach = None
+        self._alert_level = 0.0
         self.breach_history = []
         self.active_defenses = []
         self.alert_level = 0.0  # 0.0 to 1.0
+    
+    @property
+    def current_breach(self):
+        return self._current_breach
+    
+    @current_breach.setter
+    def current_breach(self, breach):
+        self._current_breach = breach
+        if self.index is not None:
+            self.index._target_changed(self)
+    
+    @property
+    def alert_level(self):
+        return self._alert_level
+    
+    @alert_level.setter
+    def alert_level(self, level):
+        was_alerted = self._alert_level > 0.0
+        self._alert_level = level
+        if self.index is not None and was_alerted != (level > 0.0):
+            self.index._target_changed(self)
         
     def attempt_breach(self, hacker, tool):
         """Attempt to breach this target system"""
@@ -151,18 +261,52 @@ class Hacker:
         self.faction = faction  # "traveler", "government", "faction", "independent"
         self.skill_level = skill_level  # 0.0 to 1.0
         self.resources = resources
+        self.system = None  # owning HackingSystem; keeps its hacker pools in sync
+        self._current_operation = None
         self.tools = []
-        self.current_operation = None
+        self.tools_by_type = {}
+        # Clocked tools: best-first heap of ready tools and a heap of cooling tools by ready turn.
+        # Tools can be shared between hackers, so heap entries are re-checked when they surface.
+        self._ready_tools = []
+        self._cooling_tools = []
+        self._unclocked_tools = 0
         self.operation_history = []
         self.detection_level = 0.0
         self.reputation = 0.0
+    
+    @property
+    def current_operation(self):
+        return self._current_operation
+    
+    @current_operation.setter
+    def current_operation(self, operation):
+        previous = self._current_operation
+        self._current_operation = operation
+        if self.system is not None and (previous is None) != (operation is None):
+            self.system._hacker_changed(self, finished=previous is not None)
         
     def add_tool(self, tool):
         """Add a hacking tool to the hacker's arsenal"""
         self.tools.append(tool)
+        self.tools_by_type.setdefault(tool.tool_type, []).append(tool)
+        if tool.clock is None:
+            self._unclocked_tools += 1
+        else:
+            score = tool.effectiveness * 0.7 + (1.0 - tool.detection_risk) * 0.3
+            heapq.heappush(self._cooling_tools, (tool.ready_turn, len(self.tools), -score, tool))
         
     def select_tool(self, target_type, operation_type):
-        """Select the best tool for a specific operation"""
+        """Select the best tool for a specific operation
+
+        Ready tools of the types suited to `operation_type` are preferred (looked
+        up in tools_by_type); otherwise the best ready tool of any type is used.
+        """
+        for tool_type in OPERATION_TOOL_TYPES.get(operation_type, ()):
+            ready = [t for t in self.tools_by_type.get(tool_type, ()) if t.cooldown == 0]
+            if ready:
+                return max(ready, key=lambda t: t.effectiveness * 0.7 + (1.0 - t.detection_risk) * 0.3)
+        if not self._unclocked_tools:
+            return self._best_ready_tool()
         suitable_tools = [t for t in self.tools if t.cooldown == 0]
         
         if not suitable_tools:
@@ -177,6 +321,27 @@ class Hacker:
         # Return the best tool
         return max(scored_tools, key=lambda x: x[1])[0]
     
+    def _best_ready_tool(self):
+        """Best ready tool by score, moving tools between the ready and cooling heaps as needed"""
+        ready, cooling = self._ready_tools, self._cooling_tools
+        while cooling:
+            ready_turn, order, neg_score, tool = cooling[0]
+            if tool.cooldown > 0:
+                if tool.ready_turn == ready_turn:
+                    break
+                heapq.heapreplace(cooling, (tool.ready_turn, order, neg_score, tool))
+                continue
+            heapq.heappop(cooling)
+            heapq.heappush(ready, (neg_score, order, tool))
+        while ready:
+            neg_score, order, tool = ready[0]
+            if tool.cooldown == 0:
+                return tool
+            # Used since it was ready (possibly by another hacker sharing it)
+            heapq.heappop(ready)
+            heapq.heappush(cooling, (tool.ready_turn, order, neg_score, tool))
+        return None
+    
     def start_operation(self, target, operation_type):
         """Start a hacking operation"""
         if self.current_operation:
@@ -384,9 +549,10 @@ class FactionHacker(Hacker):
 
 class HackingSystem:
     """Main system managing all hacking operations in the game"""
+    STATUS_LISTING_LIMIT = 25  # per-turn status printouts list at most this many hackers / targets
+    
     def __init__(self):
         self.hackers = []
-        self.targets = []
         self.active_operations = []
         self.cyber_events = []
         self.global_alert_level = 0.0
@@ -394,9 +560,92 @@ class HackingSystem:
         self.cyber_threats = 0.0  # Track cyber threat level
         # NEW: Track Traveler-gathered intelligence about Faction activity and infrastructure
         self.faction_intel = []  # Each entry: {"source": hacker_name, "target": target_name, "severity": ..., "timestamp": ...}
+        # Hacking turn clock; tool cooldowns expire against it instead of being decremented
+        self.timers = TimerWheel()
+        
+        # Indexes kept in sync by HackingTarget / Hacker property setters
+        self.operating_hackers = IndexedPool()
+        self.idle_by_faction = {}
+        self.faction_counts = Counter()
+        self.completed_operations = 0
+        self._legacy_breaches_cleared = False
+        self.clear_targets()
+    
+    def clear_targets(self):
+        """Drop every target together with its indexes, pools and network"""
+        self.targets = []
+        self.targets_by_name = {}
+        self.targets_by_type = {}
+        self.free_targets = IndexedPool()
+        self.breached_targets = IndexedPool()
+        self.breached_by_faction = {}  # attacker faction -> pool of targets it holds
+        self.alerted_targets = IndexedPool()  # alert_level > 0
+        
+        # Target network: graph over target names, newest breaches, quarantined links -> expiry turn
+        self.network = RelationshipGraph()
+        self.breach_frontier = IndexedPool()
+        self.quarantined_links = {}
+    
+    def add_hacker(self, hacker):
+        """Register a hacker with the system and its indexes"""
+        hacker.system = self
+        self.hackers.append(hacker)
+        self.faction_counts[hacker.faction] += 1
+        self._hacker_changed(hacker)
+    
+    def add_target(self, target):
+        """Register a target system with the system and its indexes"""
+        target.index = self
+        self.targets.append(target)
+        self.targets_by_name[target.name] = target
+        self.targets_by_type.setdefault(target.system_type, IndexedPool()).add(target)
+        self.network.add_node(target.name, kind="target", group=target.system_type)
+        target._breach_faction = None
+        target._indexed_breach = None
+        self._target_changed(target)
+    
+    def _target_changed(self, target):
+        breach = target.current_breach
+        faction = getattr(breach.get("hacker"), "faction", None) if breach else None
+        if breach:
+            self.free_targets.discard(target)
+            self.breached_targets.add(target)
+            if breach is not target._indexed_breach:
+                self.breach_frontier.add(target)
+        else:
+            self.breached_targets.discard(target)
+            self.free_targets.add(target)
+            self.breach_frontier.discard(target)
+        target._indexed_breach = breach
+        previous = target._breach_faction
+        if previous != faction:
+            if previous is not None:
+                self.breached_by_faction[previous].discard(target)
+            if faction is not None:
+                self.breached_by_faction.setdefault(faction, IndexedPool()).add(target)
+            target._breach_faction = faction
+        if target.alert_level > 0.0:
+            self.alerted_targets.add(target)
+        else:
+            self.alerted_targets.discard(target)
+    
+    def _hacker_changed(self, hacker, finished=False):
+        idle = self.idle_by_faction.setdefault(hacker.faction, IndexedPool())
+        if hacker.current_operation:
+            idle.discard(hacker)
+            self.operating_hackers.add(hacker)
+        else:
+            self.operating_hackers.discard(hacker)
+            idle.add(hacker)
+            if finished:
+                self.completed_operations += 1
         
-    def initialize_hacking_world(self, hackers=None, targets=None, tools_count=None):
-        """Initialize the hacking world with hackers and targets"""
+    def initialize_hacking_world(self, hackers=None, targets=None, tools_count=None, world=None):
+        """Initialize the hacking world with hackers and targets
+
+        With a procedural `world`, targets are derived from its facilities
+        first and the generic catalogue only tops up the count.
+        """
         # Use provided values or defaults
         total_hackers = hackers or 12
         total_targets = targets or 10
@@ -416,7 +665,7 @@ class HackingSystem:
             # Add tools
             for tool in random.sample(tools, random.randint(2, 4)):
                 hacker.add_tool(tool)
-            self.hackers.append(hacker)
+            self.add_hacker(hacker)
         
         # Create Government hackers
         gov_hackers = max(1, total_hackers // 3)  # 33% Government hackers
@@ -429,7 +678,7 @@ class HackingSystem:
             )
             for tool in random.sample(tools, random.randint(3, 5)):
                 hacker.add_tool(tool)
-            self.hackers.append(hacker)
+            self.add_hacker(hacker)
             
         for i in range(3):  # 3 CIA hackers
             hacker = GovernmentHacker(
@@ -440,7 +689,7 @@ class HackingSystem:
             )
             for tool in random.sample(tools, random.randint(3, 5)):
                 hacker.add_tool(tool)
-            self.hackers.append(hacker)
+            self.add_hacker(hacker)
         
         # Create Faction hackers
         faction_hackers = max(1, total_hackers - traveler_hackers - gov_hackers)  # Remaining hackers
@@ -451,13 +700,118 @@ class HackingSystem:
             )
             for tool in random.sample(tools, random.randint(2, 4)):
                 hacker.add_tool(tool)
-            self.hackers.append(hacker)
+            self.add_hacker(hacker)
         
-        # Create hacking targets
-        self.targets = self.generate_hacking_targets(total_targets)
+        # Create hacking targets (a repeat call replaces the previous world's targets)
+        self.clear_targets()
+        world_targets = self.generate_world_targets(world, total_targets) if world is not None else []
+        for target in world_targets + self.generate_hacking_targets(total_targets - len(world_targets)):
+            self.add_target(target)
+        self.build_target_network(world)
         
         # Output is now handled by the calling game.py method
     
+    # Trust between systems of the same kind (shared credentials, federated access)
+    TRUST_WEIGHTS = {"government": 0.7, "financial": 0.6, "infrastructure": 0.6, "corporate": 0.5, "personal": 0.3}
+    LINK_WEIGHT = 0.6          # physical / network connectivity between connected world locations
+    PIVOT_CHANCE = 0.5         # lateral pivot chance per unit of edge weight, before the neighbour's security
+    QUARANTINE_TURNS = 3
+    CONTAINMENT_RADIUS = 3     # hops around a contained target searched for the quarantine cut
+    
+    def build_target_network(self, world=None):
+        """Connect targets: world location links plus a sparse trust ring per system type"""
+        names = [target.name for target in self.targets]
+        for name in names:
+            self.network.add_node(name)
+        
+        if world is not None:
+            by_location = {t.location_id: t for t in self.targets if t.location_id}
+            for location in getattr(world, "locations", None) or []:
+                target = by_location.get(location.id)
+                if target is None:
+                    continue
+                for other_id in location.connected_locations or []:
+                    other = by_location.get(other_id)
+                    if other is not None:
+                        self.network.add_edge(target.name, other.name, "link", self.LINK_WEIGHT)
+        
+        for system_type, pool in self.targets_by_type.items():
+            members = list(pool)
+            if len(members) < 2:
+                continue
+            random.shuffle(members)
+            weight = self.TRUST_WEIGHTS.get(system_type, 0.4)
+            for i, target in enumerate(members):
+                self.network.add_edge(target.name, members[(i + 1) % len(members)].name, "trust", weight)
+        
+        # Catalogue systems have no world location; give each one an outside link
+        unlinked = [t for t in self.targets if not self.network.degree(t.name, "link")]
+        for target in unlinked:
+            other = random.choice(self.targets)
+            if other is not target:
+                self.network.add_edge(target.name, other.name, "link", self.LINK_WEIGHT / 2)
+        self.network.build()
+    
+    def _link_open(self, a, b):
+        expiry = self.quarantined_links.get(frozenset((a, b)))
+        if expiry is None:
+            return True
+        if expiry <= self.timers.current_turn:
+            del self.quarantined_links[frozenset((a, b))]
+            return True
+        return False
+    
+    def propagate_breaches(self):
+        """Pivot active breaches one hop across the network from the newest breaches (BFS frontier)"""
+        frontier = list(self.breach_frontier)
+        self.breach_frontier = IndexedPool()
+        pivots = []
+        for source in frontier:
+            breach = source.current_breach
+            hacker = breach.get("hacker") if breach else None
+            if getattr(hacker, "faction", "government") == "government":
+                continue  # investigators do not spread through systems they get into
+            for name, edge_type, weight in self.network.neighbors(source.name):
+                target = self.targets_by_name.get(name)
+                if target is None or target.current_breach or not self._link_open(source.name, name):
+                    continue
+                chance = self.PIVOT_CHANCE * weight * (1.0 - target.security_level) * breach.get("severity", 0.5)
+                if random.random() < chance:
+                    pivot = {
+                        "hacker": hacker,
+                        "tool": f"lateral pivot from {source.name}",
+                        "timestamp": datetime.now(),
+                        "type": "pivot",
+                        "detected": False,
+                        "severity": round(breach.get("severity", 0.5) * 0.8, 3),
+                        "via": edge_type,
+                    }
+                    target.breach_history.append(pivot)
+                    target.current_breach = pivot
+                    pivots.append(target)
+                    print(f"    🔀 {getattr(hacker, 'name', hacker)} pivoted from {source.name} into {target.name} ({edge_type})")
+        return pivots
+    
+    def _quarantine_around(self, target):
+        """Cut the lightest links between nearby breaches and the valuable systems still clean"""
+        nearby = self.network.within_hops(target.name, self.CONTAINMENT_RADIUS)
+        breached = [name for name in nearby if self.targets_by_name[name].current_breach]
+        protected = [
+            name for name in nearby
+            if not self.targets_by_name[name].current_breach
+            and self.targets_by_name[name].value in ("high", "critical")
+        ]
+        if not breached or not protected:
+            return []
+        now = self.timers.current_turn
+        blocked = {link for link, expiry in self.quarantined_links.items() if expiry > now}
+        cut = self.network.min_cut(breached, protected, nodes=list(nearby) + [target.name], blocked=blocked)
+        for a, b in cut:
+            self.quarantined_links[frozenset((a, b))] = now + self.QUARANTINE_TURNS
+        if cut:
+            print(f"    🧱 Quarantined {len(cut)} network link(s) around {target.name} for {self.QUARANTINE_TURNS} turns")
+        return cut
+    
     def generate_hacking_tools(self):
         """Generate various hacking tools"""
         tools = [
@@ -472,6 +826,8 @@ class HackingSystem:
             HackingTool("DDoS Tool", "disrupt", 0.7, 0.5, 3000),
             HackingTool("System Crasher", "disrupt", 0.8, 0.4, 7000)
         ]
+        for tool in tools:
+            tool.clock = self.timers
         return tools
     
     def generate_hacking_targets(self, count=10):
@@ -493,22 +849,71 @@ class HackingSystem:
             HackingTarget("Tech Startup", "corporate", 0.45, "medium", "Tech Hubs"),
             HackingTarget("Surveillance System", "government", 0.65, "high", "Urban Areas")
         ]
-        # Return a random selection of targets up to the requested count
-        return random.sample(all_targets, min(count, len(all_targets)))
+        if count <= len(all_targets):
+            # Return a random selection of targets up to the requested count
+            return random.sample(all_targets, max(0, count))
+        
+        # Larger cyber wars: regional copies of the catalogue with jittered security
+        targets = list(all_targets)
+        while len(targets) < count:
+            base = all_targets[len(targets) % len(all_targets)]
+            region = len(targets) // len(all_targets) + 1
+            targets.append(HackingTarget(
+                f"{base.name} #{region}", base.system_type,
+                max(0.1, min(0.99, base.security_level + random.uniform(-0.1, 0.1))),
+                base.value, f"{base.location} (Region {region})"
+            ))
+        return targets
+    
+    # Procedural world location type -> (target system type, name suffix)
+    WORLD_TARGET_TYPES = {
+        "government_facility": ("government", "Secure Network"),
+        "research_lab": ("corporate", "Research Network"),
+        "corporate_hq": ("corporate", "Corporate Network"),
+        "medical_facility": ("infrastructure", "Hospital Systems"),
+        "transportation_hub": ("infrastructure", "Transit Control"),
+    }
+    WORLD_SECURITY = {"low": 0.4, "medium": 0.6, "high": 0.75, "critical": 0.9}
+    
+    def generate_world_targets(self, world, limit=None):
+        """Targets for the procedural world's facilities (government, research, corporate, infrastructure)"""
+        sites = []
+        for location in getattr(world, "locations", None) or []:
+            kind = self.WORLD_TARGET_TYPES.get(getattr(location.location_type, "value", location.location_type))
+            if kind:
+                sites.append((location, kind))
+        if limit is not None and limit < len(sites):
+            sites = random.sample(sites, max(0, limit))
+        
+        targets = []
+        names = set(self.targets_by_name)
+        for location, kind in sites:
+            security = getattr(location.security_level, "value", location.security_level)
+            priority = float(getattr(location, "government_priority", 0.5) or 0.5)
+            value = "critical" if priority > 0.8 else "high" if priority > 0.6 else "medium" if priority > 0.3 else "low"
+            name = f"{location.name} {kind[1]}"
+            if name in names:
+                name = f"{name} ({location.id})"
+            names.add(name)
+            target = HackingTarget(name, kind[0], self.WORLD_SECURITY.get(security, 0.6), value, location.name)
+            target.location_id = location.id
+            targets.append(target)
+        return targets
     
     def execute_hacking_turn(self, world_state, time_system):
         """Execute all hacking operations for one turn"""
         print(f"\n🖥️  HACKING TURN - {time_system.get_current_date_string()}")
         print("=" * 60)
         
-        # Clear any old format breach data first
-        self.clear_old_breach_data()
+        # Clear any old format breach data first (only saves from older builds carry it)
+        if not self._legacy_breaches_cleared:
+            self.clear_old_breach_data()
         
         # Reduce cooldowns for all tools
         self.reduce_tool_cooldowns()
         
         # Execute ongoing operations
-        for hacker in self.hackers:
+        for hacker in list(self.operating_hackers):
             if hacker.current_operation:
                 result = hacker.execute_operation()
                 if result:
@@ -524,10 +929,14 @@ class HackingSystem:
                     self.handle_operation_result(result, world_state)
         
         # Start new operations
-        for hacker in self.hackers:
+        idle_hackers = [h for pool in self.idle_by_faction.values() for h in pool]
+        for hacker in idle_hackers:
             if not hacker.current_operation and random.random() < 0.3:
                 self.start_random_operation(hacker, world_state)
 
+        # Breaches pivot laterally through the target network
+        self.propagate_breaches()
+
         # After new operations are started, ensure that any active breaches have at least one defender assigned.
         # This makes breaches feel real-time: if the Faction breaks something, Traveler or government hackers
         # are pushed to respond instead of just leaving the system red.
@@ -567,11 +976,9 @@ class HackingSystem:
     
     def start_random_operation(self, hacker, world_state):
         """Start a random hacking operation for a hacker"""
-        available_targets = [t for t in self.targets if not t.current_breach]
-        if not available_targets:
+        target = self.free_targets.choice()
+        if target is None:
             return
-            
-        target = random.choice(available_targets)
         
         if hacker.faction == "government":
             # Government hackers only operate when there's a legitimate investigation
@@ -593,14 +1000,9 @@ class HackingSystem:
                 operation_types = ["intelligence_gathering", "system_manipulation", "cover_maintenance"]
                 # Travelers primarily use the net to understand the world and find the Faction.
                 # Prefer targets that show signs of Faction activity or previous breaches.
-                faction_scent_targets = [
-                    t for t in self.targets
-                    if t.current_breach
-                    and hasattr(t.current_breach.get("hacker"), "faction")
-                    and t.current_breach["hacker"].faction == "faction"
-                ]
+                faction_scent_targets = self.breached_by_faction.get("faction")
                 if faction_scent_targets:
-                    target = random.choice(faction_scent_targets)
+                    target = faction_scent_targets.choice()
             elif hacker.faction == "faction":
                 operation_types = ["sabotage", "recruitment", "timeline_manipulation"]
             else:
@@ -765,25 +1167,33 @@ class HackingSystem:
         # Government hackers target systems relevant to their investigation
         
         # Check for systems with recent breaches or suspicious activity
-        suspicious_targets = [t for t in self.targets if t.alert_level > 0.1]
+        suspicious_targets = [t for t in self.alerted_targets if t.alert_level > 0.1]
         if suspicious_targets:
             return random.choice(suspicious_targets)
         
         # Check for systems that match the hacker's specialization
         if hacker.agency == "FBI":
             # FBI focuses on domestic threats and law enforcement
-            domestic_targets = [t for t in self.targets if t.system_type in ["government", "corporate", "financial"]]
-            if domestic_targets:
-                return random.choice(domestic_targets)
+            return self._random_target_of_types(["government", "corporate", "financial"])
         elif hacker.agency == "CIA":
             # CIA focuses on foreign threats and intelligence
-            intelligence_targets = [t for t in self.targets if t.system_type in ["government", "military", "infrastructure"]]
-            if intelligence_targets:
-                return random.choice(intelligence_targets)
+            return self._random_target_of_types(["government", "military", "infrastructure"])
         
         # If no specific targets, don't operate
         return None
     
+    def _random_target_of_types(self, system_types):
+        """Uniform pick across the targets of the given system types, or None"""
+        pools = [self.targets_by_type[t] for t in system_types if self.targets_by_type.get(t)]
+        total = sum(len(pool) for pool in pools)
+        if not total:
+            return None
+        pick = random.randrange(total)
+        for pool in pools:
+            if pick < len(pool):
+                return pool.items[pick]
+            pick -= len(pool)
+    
     def check_for_investigation_triggers(self, world_state):
         """Check if current events warrant government investigations"""
         # Create investigation for detected cyber attacks
@@ -838,11 +1248,7 @@ class HackingSystem:
             return
 
         # Find the matching target
-        target = None
-        for t in self.targets:
-            if t.name == target_name:
-                target = t
-                break
+        target = self.targets_by_name.get(target_name)
         if not target or not target.current_breach:
             return
 
@@ -863,6 +1269,8 @@ class HackingSystem:
             target.current_breach = None
             # Reduce alert level a bit after successful containment
             target.alert_level = max(0.0, target.alert_level - 0.2)
+            # Keep what is still breached nearby from reaching valuable systems
+            self._quarantine_around(target)
             # Slightly improve world state based on who fixed it
             if hacker.faction == "government":
                 world_state["government_control"] = min(1.0, world_state.get("government_control", 0.5) + 0.03)
@@ -903,13 +1311,13 @@ class HackingSystem:
         assign Traveler/government hackers to respond in real time.
         """
         # Collect breached targets
-        breached_targets = [t for t in self.targets if t.current_breach]
+        breached_targets = list(self.breached_targets)
         if not breached_targets:
             return
 
         # Map targets to any current defenders already acting on them
         defended_targets = set()
-        for h in self.hackers:
+        for h in self.operating_hackers:
             if h.current_operation:
                 tgt = h.current_operation.get("target")
                 if isinstance(tgt, HackingTarget) and tgt.current_breach:
@@ -925,15 +1333,15 @@ class HackingSystem:
             attacker_faction = getattr(attacker, "faction", "unknown") if attacker else "unknown"
 
             # Prefer government hackers as first responders
-            defenders = [h for h in self.hackers if not h.current_operation and h.faction == "government"]
+            defenders = self.idle_by_faction.get("government")
             # If no government hackers free and the attacker is Faction, Traveler hackers can jump in
             if not defenders and attacker_faction == "faction":
-                defenders = [h for h in self.hackers if not h.current_operation and h.faction == "traveler"]
+                defenders = self.idle_by_faction.get("traveler")
 
             if not defenders:
                 continue
 
-            responder = random.choice(defenders)
+            responder = defenders.choice()
 
             # Choose an appropriate defensive operation type
             if isinstance(responder, GovernmentHacker):
@@ -949,11 +1357,21 @@ class HackingSystem:
                 print(f"    🛡️  {responder.name} auto-started {op_type} to respond to breach on {target.name}")
     
     def update_target_defenses(self):
-        """Update target system defenses"""
-        for target in self.targets:
+        """Update target system defenses (only alerted targets have anything to decay)
+
+        Highly alerted systems warn their network neighbours, so alerts spread
+        one hop per turn along trust and link edges.
+        """
+        for target in list(self.alerted_targets):
             # Reduce alert levels over time
             target.reduce_alert_level()
             
+            if target.alert_level > 0.7:
+                for name, _, weight in self.network.neighbors(target.name):
+                    neighbour = self.targets_by_name.get(name)
+                    if neighbour is not None and self._link_open(target.name, name):
+                        neighbour.alert_level = min(1.0, neighbour.alert_level + 0.05 * weight)
+            
             # May activate new defenses if alert level is high
             if target.alert_level > 0.7 and random.random() < 0.2:
                 defense_types = ["firewall", "intrusion_detection", "encryption"]
@@ -982,8 +1400,8 @@ class HackingSystem:
     
     def show_hacking_summary(self):
         """Show summary of hacking activities"""
-        active_operations = sum(1 for h in self.hackers if h.current_operation)
-        completed_operations = sum(len(h.operation_history) for h in self.hackers)
+        active_operations = len(self.operating_hackers)
+        completed_operations = self.completed_operations
         
         print(f"\n📊 Hacking Summary:")
         print(f"  • Active Operations: {active_operations}")
@@ -992,23 +1410,29 @@ class HackingSystem:
         
         # Show hacker status
         print(f"\n🖥️  HACKER STATUS:")
-        for hacker in self.hackers:
+        for hacker in self.hackers[:self.STATUS_LISTING_LIMIT]:
             status = "🟢 Active" if not hacker.current_operation else "🟡 Operating"
             print(f"  {hacker.name} ({hacker.faction}) - {status} - Rep: {hacker.reputation:.2f}")
             
             if hacker.current_operation:
                 op = hacker.current_operation
                 print(f"    • {op['type']} against {op['target'].name} - {op['progress']}%")
+        self._print_overflow(len(self.hackers), "hackers")
         
         # Show target status
         print(f"\n🎯 TARGET STATUS:")
-        for target in self.targets:
+        for target in self.targets[:self.STATUS_LISTING_LIMIT]:
             status = "🟢 Secure" if not target.current_breach else "🔴 Breached"
             print(f"  {target.name} - {status} - Alert: {target.alert_level:.2f}")
             
             if target.current_breach:
                 breach = target.current_breach
                 print(f"    • Breached by {breach['hacker'].name if hasattr(breach['hacker'], 'name') else breach['hacker']} using {breach['tool']}")
+        self._print_overflow(len(self.targets), "targets", f" ({len(self.breached_targets)} breached)")
+    
+    def _print_overflow(self, total, noun, note=""):
+        if total > self.STATUS_LISTING_LIMIT:
+            print(f"  … and {total - self.STATUS_LISTING_LIMIT} more {noun}{note}")
     
     def show_tool_cooldown_status(self):
         """Show the cooldown status of all hacking tools"""
@@ -1016,7 +1440,7 @@ class HackingSystem:
         print("-" * 40)
         
         # Group tools by hacker
-        for hacker in self.hackers:
+        for hacker in self.hackers[:self.STATUS_LISTING_LIMIT]:
             if hacker.tools:
                 print(f"\n👤 {hacker.name} ({hacker.faction}):")
                 for tool in hacker.tools:
@@ -1024,17 +1448,18 @@ class HackingSystem:
                         print(f"  ⏳ {tool.name}: {tool.cooldown} turns remaining")
                     else:
                         print(f"  ✅ {tool.name}: Ready to use")
+        self._print_overflow(len(self.hackers), "hackers")
     
     def get_hacking_world_state(self):
         """Get current hacking world state"""
         return {
-            "active_operations": sum(1 for h in self.hackers if h.current_operation),
+            "active_operations": len(self.operating_hackers),
             "global_alert_level": self.global_alert_level,
             "cyber_threat_level": self.global_alert_level,
             "hackers_by_faction": {
-                "traveler": len([h for h in self.hackers if h.faction == "traveler"]),
-                "government": len([h for h in self.hackers if h.faction == "government"]),
-                "faction": len([h for h in self.hackers if h.faction == "faction"])
+                "traveler": self.faction_counts["traveler"],
+                "government": self.faction_counts["government"],
+                "faction": self.faction_counts["faction"]
             }
         }
     
@@ -1052,12 +1477,13 @@ class HackingSystem:
                     cleared_count += 1
                     
             # Also check breach history
-            for breach in target.breach_history[:]:
-                if isinstance(breach.get("hacker"), str):
-                    print(f"    🗑️  Clearing old format breach from history on {target.name}")
-                    target.breach_history.remove(breach)
-                    cleared_count += 1
+            kept = [breach for breach in target.breach_history if not isinstance(breach.get("hacker"), str)]
+            if len(kept) != len(target.breach_history):
+                print(f"    🗑️  Clearing old format breach from history on {target.name}")
+                cleared_count += len(target.breach_history) - len(kept)
+                target.breach_history = kept
         
+        self._legacy_breaches_cleared = True
         if cleared_count > 0:
             print(f"    ✅ Cleared {cleared_count} old format breach records")
         else:
@@ -1066,8 +1492,5 @@ class HackingSystem:
         return cleared_count
     
     def reduce_tool_cooldowns(self):
-        """Reduce cooldown for all hacking tools by 1 turn"""
-        for hacker in self.hackers:
-            for tool in hacker.tools:
-                if tool.cooldown > 0:
-                    tool.cooldown -= 1
+        """Advance the hacking clock by 1 turn; tool cooldowns expire against it"""
+        self.timers.tick()
@@ -0,0 +1,257 @@
+# legislature.py
+"""
+Compact member tables for the Senate and House.
+
+Congress is 535 members, but the political turn only ever asks aggregate
+questions of them -- how many seats a party holds, who sits for a state, is
+this name a sitting senator, how would the chamber split on a bill. Members
+therefore live in parallel arrays (one slot per seat) with small indexes by
+seat, state, party and name instead of one dict per member.
+
+Bills are decided by roll-level votes in VoteEngine. Each member's
+propensity (party, loyalty, effectiveness, home-state lean) is gathered once
+per roster version. The yes-probability row for a (chamber, sponsor,
+merit) bill profile is computed once and reused until a seat changes hands,
+so resolving a turn's bills only costs one random draw per member per bill.
+"""
+
+import random
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+PARTIES = ("Democrat", "Republican")
+
+US_STATES = (
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado", "Connecticut",
+    "Delaware", "Florida", "Georgia", "Hawaii", "Idaho", "Illinois", "Indiana", "Iowa",
+    "Kansas", "Kentucky", "Louisiana", "Maine", "Maryland", "Massachusetts", "Michigan",
+    "Minnesota", "Mississippi", "Missouri", "Montana", "Nebraska", "Nevada", "New Hampshire",
+    "New Jersey", "New Mexico", "New York", "North Carolina", "North Dakota", "Ohio",
+    "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina", "South Dakota",
+    "Tennessee", "Texas", "Utah", "Vermont", "Virginia", "Washington", "West Virginia",
+    "Wisconsin", "Wyoming"
+)
+
+FIRST_NAMES = (
+    "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph",
+    "Thomas", "Christopher", "Charles", "Daniel", "Matthew", "Anthony", "Mark",
+    "Donald", "Steven", "Paul", "Andrew", "Joshua", "Kenneth", "Kevin", "Brian",
+    "Sarah", "Jennifer", "Jessica", "Amanda", "Melissa", "Nicole", "Stephanie",
+    "Rebecca", "Laura", "Michelle", "Kimberly", "Amy", "Angela", "Lisa", "Heather"
+)
+
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson"
+)
+
+
+def other_party(party: str) -> str:
+    """The opposing major party"""
+    return PARTIES[1] if party == PARTIES[0] else PARTIES[0]
+
+
+def random_member_name() -> str:
+    return f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
+
+
+class MemberTable:
+    """Array-backed roster for one chamber, indexed by seat, state, party and name"""
+
+    def __init__(self, seat_field: str = "seat"):
+        # Key the seat label goes under in record() dicts ("state" for senators, "district" for the House)
+        self.seat_field = seat_field
+        # Bumped whenever the roster is cleared, a seat is added or a seat changes party
+        self.version = 0
+        self.clear()
+
+    def clear(self):
+        self.names: List[str] = []
+        self.seats: List[str] = []
+        self.states: List[str] = []
+        self.parties = array("b")
+        self.experience = array("h")
+        self.effectiveness = array("d")
+        self.loyalty = array("d")
+        self.committee_assignments = array("b")
+
+        self.by_seat: Dict[str, int] = {}
+        self.by_state: Dict[str, List[int]] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_party = [set() for _ in PARTIES]
+        self.version += 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return (self.record(i) for i in range(len(self.names)))
+
+    def add(self, name: str, state: str, seat: str, party: str, experience: int,
+            effectiveness: float, loyalty: float, committee_assignments: int) -> int:
+        """Seat a member and return their index"""
+        code = PARTIES.index(party)
+        index = len(self.names)
+        self.names.append(name)
+        self.seats.append(seat)
+        self.states.append(state)
+        self.parties.append(code)
+        self.experience.append(experience)
+        self.effectiveness.append(effectiveness)
+        self.loyalty.append(loyalty)
+        self.committee_assignments.append(committee_assignments)
+
+        self.by_seat[seat] = index
+        self.by_state.setdefault(state, []).append(index)
+        self.by_name.setdefault(name.lower(), []).append(index)
+        self.by_party[code].add(index)
+        self.version += 1
+        return index
+
+    def party_of(self, index: int) -> str:
+        return PARTIES[self.parties[index]]
+
+    def set_party(self, index: int, party: str):
+        """Hand a seat to another party (elections, defections)"""
+        code = PARTIES.index(party)
+        old = self.parties[index]
+        if old == code:
+            return
+        self.by_party[old].discard(index)
+        self.by_party[code].add(index)
+        self.parties[index] = code
+        self.version += 1
+
+    def record(self, index: int) -> Dict:
+        """Member as the dict the rest of the game expects"""
+        return {
+            "name": self.names[index],
+            self.seat_field: self.seats[index],
+            "state": self.states[index],
+            "party": PARTIES[self.parties[index]],
+            "experience": self.experience[index],
+            "effectiveness": self.effectiveness[index],
+            "loyalty": self.loyalty[index],
+            "committee_assignments": self.committee_assignments[index],
+        }
+
+    def find(self, name: str) -> List[int]:
+        """Indexes of members with this name (case-insensitive)"""
+        return self.by_name.get(name.strip().lower(), [])
+
+    def in_state(self, state: str) -> List[int]:
+        return self.by_state.get(state, [])
+
+    def count(self, party: str) -> int:
+        return len(self.by_party[PARTIES.index(party)]) if party in PARTIES else 0
+
+    def majority(self, tie_party: Optional[str] = None) -> Tuple[str, int]:
+        """(party, seats) for the larger caucus; a tie goes to `tie_party` (the VP's party)"""
+        counts = [len(members) for members in self.by_party]
+        if counts[0] == counts[1] and tie_party in PARTIES:
+            return tie_party, counts[0]
+        code = 0 if counts[0] > counts[1] else 1
+        return PARTIES[code], counts[code]
+
+
+# How far home-state lean pulls a member who breaks from the party line
+STATE_LEAN_WEIGHT = 0.2
+# Committee seats per chamber, filled by the members with the most assignments, then experience
+COMMITTEE_SIZES = {"senate": 22, "house": 55}
+
+
+class VoteEngine:
+    """Roll-level votes over precomputed member propensities
+
+    A member follows their party line (yes if their party sponsored the bill)
+    with probability equal to their loyalty. Otherwise they vote their
+    conscience: 0.5 shifted by their effectiveness times (merit - 0.5), plus
+    STATE_LEAN_WEIGHT of their home state's lean toward the sponsor. A state's
+    lean is its share of Republican seats minus its Democratic share across
+    all chambers.
+    """
+
+    def __init__(self, **chambers: MemberTable):
+        self.chambers = chambers
+        self._version = None
+        self._state_lean: Dict[str, float] = {}
+        # chamber -> (party codes, loyalty, effectiveness, lean per member)
+        self._propensities: Dict[str, Tuple] = {}
+        self._committees: Dict[str, List[int]] = {}
+        # (chamber, sponsor, merit) -> yes probability per member
+        self._rows: Dict[Tuple[str, str, float], array] = {}
+
+    def _refresh(self):
+        """Rebuild propensities when any chamber's roster has changed"""
+        version = tuple(table.version for table in self.chambers.values())
+        if version == self._version:
+            return
+        self._version = version
+        self._rows.clear()
+
+        seats = {}
+        for table in self.chambers.values():
+            for state, code in zip(table.states, table.parties):
+                counts = seats.setdefault(state, [0, 0])
+                counts[code] += 1
+        self._state_lean = {state: (r - d) / (r + d) for state, (d, r) in seats.items()}
+
+        for name, table in self.chambers.items():
+            lean = array("d", (self._state_lean[state] for state in table.states))
+            self._propensities[name] = (table.parties, table.loyalty, table.effectiveness, lean)
+            ranked = sorted(range(len(table)), key=lambda i: (table.committee_assignments[i], table.experience[i]),
+                            reverse=True)
+            self._committees[name] = sorted(ranked[:COMMITTEE_SIZES.get(name, len(table))])
+
+    def state_lean(self, state: str) -> float:
+        self._refresh()
+        return self._state_lean.get(state, 0.0)
+
+    def committee(self, chamber: str) -> List[int]:
+        """Member indexes sitting on the chamber's committee"""
+        self._refresh()
+        return self._committees[chamber]
+
+    def probabilities(self, chamber: str, sponsor_party: str, merit: float) -> array:
+        """Yes probability for every member of a chamber on a bill profile"""
+        self._refresh()
+        merit = round(merit, 2)
+        key = (chamber, sponsor_party, merit)
+        row = self._rows.get(key)
+        if row is None:
+            parties, loyalty, effectiveness, lean = self._propensities[chamber]
+            sponsor = PARTIES.index(sponsor_party)
+            # State lean is Republican-positive; flip it for Democratic bills
+            toward = STATE_LEAN_WEIGHT if sponsor == 1 else -STATE_LEAN_WEIGHT
+            row = array("d")
+            for code, loyal, effect, tilt in zip(parties, loyalty, effectiveness, lean):
+                conscience = min(1.0, max(0.0, 0.5 + effect * (merit - 0.5) + toward * tilt))
+                row.append(loyal * (code == sponsor) + (1.0 - loyal) * conscience)
+            self._rows[key] = row
+        return row
+
+    def expected_yes(self, chamber: str, sponsor_party: str, merit: float) -> float:
+        return sum(self.probabilities(chamber, sponsor_party, merit))
+
+    def resolve(self, bills: Sequence[Tuple[str, float]], committee: bool = False) -> List[Dict[str, Tuple[int, int]]]:
+        """(yes, no) per chamber for each (sponsor party, merit) bill
+
+        With `committee`, only committee members vote.
+        """
+        self._refresh()
+        roll = random.random
+        results = []
+        for sponsor_party, merit in bills:
+            tallies = {}
+            for chamber in self.chambers:
+                row = self.probabilities(chamber, sponsor_party, merit)
+                if committee:
+                    voters = self._committees[chamber]
+                    yes = sum(1 for i in voters if roll() < row[i])
+                    tallies[chamber] = (yes, len(voters) - yes)
+                else:
+                    yes = sum(1 for p in row if roll() < p)
+                    tallies[chamber] = (yes, len(row) - yes)
+            results.append(tallies)
+        return results
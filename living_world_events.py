@@ -22,6 +22,8 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from metric_series import campaign_metrics
+
 
 class WeatherSystem:
     """Weather affects mission difficulty and NPC behavior"""
@@ -493,6 +495,8 @@ class DirectorFeedbackSystem:
         self.feedback_history = []
         self.last_praise = 0
         self.last_criticism = 0
+        # Detection level is sampled here each turn; the Director reacts to its trend too
+        self.metrics = campaign_metrics
     
     def generate_feedback(self, player_performance: Dict, turn: int) -> Optional[str]:
         """Generate Director feedback based on recent performance"""
@@ -502,6 +506,10 @@ class DirectorFeedbackSystem:
         protocol_violations = player_performance.get("protocol_violations", 0)
         detection_level = player_performance.get("detection_level", 0)
         timeline_stability = player_performance.get("timeline_stability", 0.8)
+        self.metrics.record(turn, {"detection_level": detection_level})
+        # Detection climbing steadily over the last few turns, even if still below the alert line
+        detection_rising = (self.metrics.slope("detection_level", 5) > 0.03 and
+                            self.metrics.mean("detection_level", 5, 0.0) > 0.35)
         
         # Only give feedback every 3+ turns
         if turn - self.last_praise < 3 and turn - self.last_criticism < 3:
@@ -544,6 +552,14 @@ class DirectorFeedbackSystem:
             feedback = random.choice(alert_templates)
             self.last_criticism = turn
         
+        elif detection_rising:
+            trend_templates = [
+                "Government attention has risen every day this week. Lower your profile before it peaks.",
+                "The Director has charted a steady climb in your detection footprint. Reverse it.",
+            ]
+            feedback = random.choice(trend_templates)
+            self.last_criticism = turn
+        
         if feedback:
             self.feedback_history.append({
                 "turn": turn,
@@ -1,8 +1,13 @@
  # messenger_system.py
+import bisect
 import random
 import time
 from datetime import datetime, timedelta
 
+from metric_series import campaign_metrics
+from relationship_graph import RelationshipGraph
+from timer_wheel import TimerWheel
+
 # Optional D20 integration for AI Traveler team decisions (backward compatible)
 try:
     from d20_decision_system import d20_system, CharacterDecision
@@ -120,6 +125,7 @@ class MessengerSystem:
                     "type": key,
                     "value": value,
                     "timestamp": change_data["timestamp"],
+                    "start_turn": global_world_tracker.turn_tracker,
                     "duration": self.calculate_event_duration(key, value),
                     "active": True,
                     "effects": self.get_event_effects(key, value)
@@ -232,19 +238,18 @@ class MessengerSystem:
         self.cleanup_expired_events()
     
     def cleanup_expired_events(self):
-        """Remove expired world events"""
-        current_time = time.time()
-        expired_events = []
+        """Remove world events whose in-game duration has run out"""
+        current_turn = global_world_tracker.turn_tracker
+        still_active = []
         
         for event in self.active_world_events:
-            if event["active"] and current_time - event["timestamp"] > (event["duration"] * 3600):  # Convert turns to hours
+            if event["active"] and current_turn - event.get("start_turn", current_turn) >= event["duration"]:
                 event["active"] = False
-                expired_events.append(event)
+                print(f"🔄 World event expired: {event['type']} - {event['value']}")
+            else:
+                still_active.append(event)
         
-        # Remove expired events
-        for event in expired_events:
-            self.active_world_events.remove(event)
-            print(f"🔄 World event expired: {event['type']} - {event['value']}")
+        self.active_world_events = still_active
     
     def get_world_change_summary(self):
         """Get a summary of recent world changes"""
@@ -1966,6 +1971,22 @@ def import_game_state(world_state_data):
     """Import game state from save data"""
     global_world_tracker.import_world_state(world_state_data)
 
+# In-game turns a world event stays active unless its effect sets a duration
+DEFAULT_WORLD_EVENT_DURATION = 5
+
+# World state attributes clamped to 0.0-1.0 when an effect changes them
+BOUNDED_WORLD_ATTRIBUTES = frozenset([
+    "timeline_stability", "director_control", "faction_influence",
+    "government_control", "national_security", "consciousness_stability",
+    "host_body_survival"
+])
+
+# Compiled effect kinds and attribute operation codes
+EFFECT_ATTRIBUTE, EFFECT_WORLD_EVENT = 0, 1
+OP_SET, OP_ADD, OP_SUBTRACT, OP_MULTIPLY, OP_DIVIDE = range(5)
+EFFECT_OPERATIONS = {"add": OP_ADD, "subtract": OP_SUBTRACT, "multiply": OP_MULTIPLY, "divide": OP_DIVIDE}
+
+
 class GlobalWorldStateTracker:
     """Comprehensive tracker for ALL world state changes in real-time"""
     
@@ -1985,7 +2006,10 @@ class GlobalWorldStateTracker:
         # Initialize only if not already done
         if not hasattr(self, 'world_state_cache') or not self.world_state_cache:
             self.all_world_changes = []           # Every single change that happens
-            self.active_world_events = []         # Currently active events
+            self._segment_turns = []              # Turn of each run of changes in all_world_changes
+            self._segment_starts = []             # Index in all_world_changes where each run starts
+            self._world_events = {}               # Currently active events keyed by (type, value)
+            self._critical_event_count = 0        # Active events whose value mentions "critical"
             self.world_state_cache = {}           # Current world state
             self.change_categories = {
                 "missions": [],                   # All mission outcomes
@@ -2002,8 +2026,11 @@ class GlobalWorldStateTracker:
                 "player_actions": []              # Direct player actions
             }
             self.ongoing_effects = {}            # Active ongoing effects
+            self._compiled_effects = {}          # effect_id -> compiled effect tuples
+            self._negative_effect_ids = set()    # Ongoing effects that mention "negative"
             self.world_history = []              # Complete world history
             self.turn_tracker = 0                # Current turn number
+            self.turn_timers = TimerWheel(current_turn=self.turn_tracker)  # Effect and world event expirations
             # In-game time context (mirrors TimeSystem defaults if game_ref not wired)
             self.game_start_date = datetime.strptime("2018-03-15", "%Y-%m-%d")
             self.game_current_date = self.game_start_date
@@ -2045,6 +2072,50 @@ class GlobalWorldStateTracker:
         }
         print(f"🌍 World state initialized with {len(self.world_state_cache)} default values")
     
+    @property
+    def active_world_events(self):
+        """Currently active world events, oldest first"""
+        return list(self._world_events.values())
+    
+    @active_world_events.setter
+    def active_world_events(self, events):
+        for event in getattr(self, "_world_events", {}).values():
+            self.turn_timers.cancel(event.get("timer_id"))
+        self._world_events = {}
+        self._critical_event_count = 0
+        for event in events or []:
+            if event.get("active", True):
+                self.add_world_event(event)
+    
+    def add_world_event(self, event):
+        """Activate a world event until its in-game duration runs out
+        
+        Re-adding an active event with the same type and value refreshes its
+        expiry instead of stacking a duplicate, so the active set stays bounded.
+        """
+        event.setdefault("start_turn", self.turn_tracker)
+        event.setdefault("duration", DEFAULT_WORLD_EVENT_DURATION)
+        event.setdefault("expires_turn", event["start_turn"] + event["duration"])
+        event["active"] = True
+        key = (event.get("type"), str(event.get("value")))
+        existing = self._world_events.pop(key, None)
+        if existing:
+            self.turn_timers.cancel(existing.get("timer_id"))
+            event["start_turn"] = existing.get("start_turn", event["start_turn"])
+        elif "critical" in key[1].lower():
+            self._critical_event_count += 1
+        self._world_events[key] = event
+        event["timer_id"] = self.turn_timers.schedule(event["expires_turn"], self._expire_world_event, key)
+        return event
+    
+    def _expire_world_event(self, key):
+        """Timer callback: deactivate a world event whose duration has run out"""
+        event = self._world_events.pop(key, None)
+        if event:
+            event["active"] = False
+            if "critical" in key[1].lower():
+                self._critical_event_count -= 1
+    
     def create_sample_ongoing_effects(self):
         """Create some sample ongoing effects to demonstrate the system"""
         sample_effects = [
@@ -2123,14 +2194,14 @@ class GlobalWorldStateTracker:
         # Create the ongoing effects
         for effect_data in sample_effects:
             effect_id = effect_data["id"]
-            self.ongoing_effects[effect_id] = {
+            self.register_ongoing_effect(effect_id, {
                 "source_change": len(self.all_world_changes) + 1,
                 "effects": effect_data["effects"],
                 "duration": effect_data["duration"],
-                "turns_remaining": effect_data["duration"],
+                "expires_turn": self.turn_tracker + effect_data["duration"],
                 "active": True,
                 "description": effect_data["description"]
-            }
+            })
         
         # Create some sample world events
         self.active_world_events = [
@@ -2218,10 +2289,7 @@ class GlobalWorldStateTracker:
         
         # Add these changes to demonstrate the system
         for change in sample_changes:
-            self.all_world_changes.append(change)
-            category = change["category"]
-            if category in self.change_categories:
-                self.change_categories[category].append(change)
+            self.record_change(change)
         
         print(f"🌍 Created {len(sample_changes)} sample world changes for demonstration")
         
@@ -2232,13 +2300,9 @@ class GlobalWorldStateTracker:
         change_data["turn_number"] = self.turn_tracker
         change_data["change_id"] = len(self.all_world_changes) + 1
         
-        # Categorize the change
+        # Categorize the change and add it to the turn-ordered log
         category = change_data.get("category", "unknown")
-        if category in self.change_categories:
-            self.change_categories[category].append(change_data)
-        
-        # Add to main tracking
-        self.all_world_changes.append(change_data)
+        self.record_change(change_data)
         
         # Apply immediate effects
         self.apply_immediate_effects(change_data)
@@ -2255,6 +2319,28 @@ class GlobalWorldStateTracker:
         
         return change_data["change_id"]
     
+    def record_change(self, change_data):
+        """Append a change to the log, its category list and the per-turn index"""
+        category = change_data.get("category", "unknown")
+        if category in self.change_categories:
+            self.change_categories[category].append(change_data)
+        self.all_world_changes.append(change_data)
+        self._index_change(len(self.all_world_changes) - 1)
+    
+    def _index_change(self, index):
+        """Start a new segment when a change belongs to a later turn than the last one"""
+        turn = self.all_world_changes[index].get("turn_number", 0)
+        if not self._segment_turns or turn > self._segment_turns[-1]:
+            self._segment_turns.append(turn)
+            self._segment_starts.append(index)
+    
+    def _rebuild_change_index(self):
+        """Rebuild the per-turn segment index after replacing the change log"""
+        self._segment_turns = []
+        self._segment_starts = []
+        for index in range(len(self.all_world_changes)):
+            self._index_change(index)
+    
     def apply_immediate_effects(self, change_data):
         """Apply immediate effects of a world change"""
         if "immediate_effects" in change_data:
@@ -2265,25 +2351,54 @@ class GlobalWorldStateTracker:
         """Create ongoing effects that persist over time"""
         if "ongoing_effects" in change_data:
             effect_id = f"{change_data['change_id']}_{change_data['category']}"
-            self.ongoing_effects[effect_id] = {
+            duration = change_data.get("duration", 5)  # Default 5 turns
+            self.register_ongoing_effect(effect_id, {
                 "source_change": change_data["change_id"],
                 "effects": change_data["ongoing_effects"],
-                "duration": change_data.get("duration", 5),  # Default 5 turns
-                "turns_remaining": change_data.get("duration", 5),
+                "duration": duration,
+                "expires_turn": self.turn_tracker + duration,
                 "active": True
-            }
+            })
     
-    def apply_single_effect(self, effect):
-        """Apply a single effect to the world state"""
+    def register_ongoing_effect(self, effect_id, effect_data):
+        """Store an ongoing effect and schedule its expiration on the timer wheel"""
+        previous = self.ongoing_effects.get(effect_id)
+        if previous and previous.get("timer_id") is not None:
+            self.turn_timers.cancel(previous["timer_id"])
+        self.ongoing_effects[effect_id] = effect_data
+        self._compiled_effects[effect_id] = self.compile_effects(effect_data["effects"])
+        if any("negative" in str(effect) for effect in effect_data["effects"]):
+            self._negative_effect_ids.add(effect_id)
+        else:
+            self._negative_effect_ids.discard(effect_id)
+        effect_data["timer_id"] = self.turn_timers.schedule(
+            effect_data["expires_turn"], self._expire_ongoing_effect, effect_id
+        )
+    
+    def _expire_ongoing_effect(self, effect_id):
+        """Timer callback: drop an ongoing effect whose duration has run out"""
+        effect_data = self.ongoing_effects.pop(effect_id, None)
+        self._compiled_effects.pop(effect_id, None)
+        self._negative_effect_ids.discard(effect_id)
+        if effect_data:
+            print(f"   ⏰ Effect expired: {effect_data['effects']}")
+    
+    def get_turns_remaining(self, effect_data):
+        """Turns left on an ongoing effect"""
+        return max(0, effect_data.get("expires_turn", self.turn_tracker) - self.turn_tracker)
+    
+    def compile_effect(self, effect):
+        """Parse an effect dict once into a tuple for the apply loop
+        
+        Attribute changes become (EFFECT_ATTRIBUTE, target, op_code, float_value, bounded)
+        and world events become (EFFECT_WORLD_EVENT, target, None, value, duration).
+        Returns None for effects that cannot be applied.
+        """
         effect_type = effect.get("type")
         target = effect.get("target")
         value = effect.get("value")
-        operation = effect.get("operation", "set")
         
         if effect_type == "attribute_change":
-            # Get current value from cache, or use default
-            current_value = self.world_state_cache.get(target, 0.0)
-            
             # Ensure value is numeric
             try:
                 if isinstance(value, str):
@@ -2292,47 +2407,71 @@ class GlobalWorldStateTracker:
                         value = float(value)
                     else:
                         print(f"⚠️  Warning: Cannot convert '{value}' to number for {target}")
-                        return  # Skip this effect
+                        return None
                 elif not isinstance(value, (int, float)):
                     print(f"⚠️  Warning: Invalid value type {type(value)} for {target}: {value}")
-                    return  # Skip this effect
+                    return None
             except (ValueError, TypeError):
                 print(f"⚠️  Warning: Failed to convert value '{value}' to number for {target}")
-                return  # Skip this effect
+                return None
             
-            # Ensure current_value is numeric
-            if not isinstance(current_value, (int, float)):
-                current_value = 0.0
-            
-            # Apply operation
-            if operation == "add":
-                new_value = current_value + value
-            elif operation == "subtract":
-                new_value = current_value - value
-            elif operation == "multiply":
-                new_value = current_value * value
-            elif operation == "divide":
-                new_value = current_value / value if value != 0 else current_value
-            else:  # set
-                new_value = value
-            
-            # Ensure values stay within bounds
-            if target in ["timeline_stability", "director_control", "faction_influence", 
-                         "government_control", "national_security", "consciousness_stability", 
-                         "host_body_survival"]:
-                new_value = max(0.0, min(1.0, new_value))
-            
-            # Update the cache
-            self.world_state_cache[target] = new_value
+            op_code = EFFECT_OPERATIONS.get(effect.get("operation", "set"), OP_SET)
+            return (EFFECT_ATTRIBUTE, target, op_code, float(value), target in BOUNDED_WORLD_ATTRIBUTES)
         
-        elif effect_type == "world_event":
-            self.active_world_events.append({
-                "type": target,
-                "value": value,
-                "timestamp": time.time(),
-                "start_turn": self.turn_tracker,
-                "active": True
-            })
+        if effect_type == "world_event":
+            return (EFFECT_WORLD_EVENT, target, None, value, effect.get("duration", DEFAULT_WORLD_EVENT_DURATION))
+        
+        return None
+    
+    def compile_effects(self, effects):
+        """Compile a list of effect dicts, dropping the ones that cannot be applied"""
+        compiled = []
+        for effect in effects:
+            compiled_effect = self.compile_effect(effect)
+            if compiled_effect is not None:
+                compiled.append(compiled_effect)
+        return compiled
+    
+    def apply_compiled_effects(self, compiled):
+        """Apply pre-compiled effects to the world state"""
+        cache = self.world_state_cache
+        for kind, target, op_code, value, extra in compiled:
+            if kind == EFFECT_ATTRIBUTE:
+                current_value = cache.get(target, 0.0)
+                if not isinstance(current_value, (int, float)):
+                    current_value = 0.0
+                
+                if op_code == OP_ADD:
+                    new_value = current_value + value
+                elif op_code == OP_SUBTRACT:
+                    new_value = current_value - value
+                elif op_code == OP_MULTIPLY:
+                    new_value = current_value * value
+                elif op_code == OP_DIVIDE:
+                    new_value = current_value / value if value != 0 else current_value
+                else:
+                    new_value = value
+                
+                # Ensure values stay within bounds
+                if extra:
+                    new_value = 0.0 if new_value < 0.0 else 1.0 if new_value > 1.0 else new_value
+                
+                cache[target] = new_value
+            else:
+                self.add_world_event({
+                    "type": target,
+                    "value": value,
+                    "timestamp": time.time(),
+                    "start_turn": self.turn_tracker,
+                    "duration": extra,
+                    "active": True
+                })
+    
+    def apply_single_effect(self, effect):
+        """Apply a single effect to the world state"""
+        compiled_effect = self.compile_effect(effect)
+        if compiled_effect is not None:
+            self.apply_compiled_effects((compiled_effect,))
     
     def update_world_state(self, change_data):
         """Update the cached world state"""
@@ -2355,47 +2494,28 @@ class GlobalWorldStateTracker:
         self.game_current_date = self.game_start_date + timedelta(days=self.turn_tracker)
         print(f"\n🔄 Processing Turn {self.turn_tracker} - Ongoing Effects...")
         
-        # Process all ongoing effects
-        expired_effects = []
+        # Apply all ongoing effects from their compiled form
+        compiled_effects = self._compiled_effects
         for effect_id, effect_data in self.ongoing_effects.items():
             if effect_data["active"]:
-                # Apply ongoing effects
-                self.apply_ongoing_effect(effect_data)
-                
-                # Reduce turns remaining
-                effect_data["turns_remaining"] -= 1
-                
-                if effect_data["turns_remaining"] <= 0:
-                    expired_effects.append(effect_id)
-                    print(f"   ⏰ Effect expired: {effect_data['effects']}")
+                self.apply_compiled_effects(compiled_effects[effect_id])
         
-        # Remove expired effects
-        for effect_id in expired_effects:
-            del self.ongoing_effects[effect_id]
-        
-        # Clean up expired world events
+        # Expire only the effects and world events whose timers fall on this turn
         self.cleanup_expired_events()
         
+        # Sample the headline world metrics once per turn for trend queries
+        campaign_metrics.record_world(self.turn_tracker, self.world_state_cache)
+        
         print(f"   Active ongoing effects: {len(self.ongoing_effects)}")
         print(f"   Active world events: {len(self.active_world_events)}")
     
     def apply_ongoing_effect(self, effect_data):
         """Apply an ongoing effect"""
-        for effect in effect_data["effects"]:
-            self.apply_single_effect(effect)
+        self.apply_compiled_effects(self.compile_effects(effect_data["effects"]))
     
     def cleanup_expired_events(self):
-        """Clean up expired world events"""
-        current_time = time.time()
-        expired_events = []
-        
-        for event in self.active_world_events:
-            if event["active"] and current_time - event["timestamp"] > 3600:  # 1 hour
-                event["active"] = False
-                expired_events.append(event)
-        
-        for event in expired_events:
-            self.active_world_events.remove(event)
+        """Expire ongoing effects and world events whose end turn has been reached"""
+        self.turn_timers.advance(self.turn_tracker)
     
     def get_world_summary(self):
         """Get comprehensive summary of world state"""
@@ -2412,10 +2532,9 @@ class GlobalWorldStateTracker:
     
     def calculate_world_status(self):
         """Calculate overall world status based on active events and effects"""
-        critical_events = [e for e in self.active_world_events if "critical" in str(e.get("value", "")).lower()]
-        negative_effects = len([e for e in self.ongoing_effects.values() if any("negative" in str(effect) for effect in e["effects"])])
+        negative_effects = len(self._negative_effect_ids)
         
-        if critical_events or negative_effects > 3:
+        if self._critical_event_count or negative_effects > 3:
             return "CRITICAL"
         elif negative_effects > 1:
             return "UNSTABLE"
@@ -2424,8 +2543,11 @@ class GlobalWorldStateTracker:
     
     def get_recent_changes(self, turns_back):
         """Get changes from the last N turns"""
-        recent_turns = range(max(0, self.turn_tracker - turns_back), self.turn_tracker + 1)
-        return [change for change in self.all_world_changes if change["turn_number"] in recent_turns]
+        # Binary search the per-turn segments, then slice the tail of the log
+        i = bisect.bisect_left(self._segment_turns, max(0, self.turn_tracker - turns_back))
+        if i == len(self._segment_turns):
+            return []
+        return self.all_world_changes[self._segment_starts[i]:]
     
     def get_changes_by_category(self, category):
         """Get all changes of a specific category"""
@@ -2440,7 +2562,7 @@ class GlobalWorldStateTracker:
                 if category not in summary:
                     summary[category] = []
                 summary[category].append({
-                    "turns_remaining": effect_data["turns_remaining"],
+                    "turns_remaining": self.get_turns_remaining(effect_data),
                     "effects": effect_data["effects"]
                 })
         return summary
@@ -2454,18 +2576,31 @@ class GlobalWorldStateTracker:
             "ongoing_effects": self.ongoing_effects,
             "world_state_cache": self.world_state_cache,
             "change_categories": self.change_categories,
-            "world_history": self.world_history
+            "world_history": self.world_history,
+            "metric_history": campaign_metrics.export()
         }
     
     def import_world_state(self, world_state_data):
         """Import world state from save data"""
         self.turn_tracker = world_state_data.get("turn_tracker", 0)
         self.all_world_changes = world_state_data.get("all_world_changes", [])
+        self._rebuild_change_index()
+        self.ongoing_effects = {}
+        self._compiled_effects = {}
+        self._negative_effect_ids = set()
+        self._world_events = {}
+        self.turn_timers = TimerWheel(current_turn=self.turn_tracker)
         self.active_world_events = world_state_data.get("active_world_events", [])
-        self.ongoing_effects = world_state_data.get("ongoing_effects", {})
+        for effect_id, effect_data in world_state_data.get("ongoing_effects", {}).items():
+            # Older saves stored a countdown instead of an expiration turn
+            if "expires_turn" not in effect_data:
+                effect_data["expires_turn"] = self.turn_tracker + effect_data.pop("turns_remaining", 0)
+            self.register_ongoing_effect(effect_id, effect_data)
         self.world_state_cache = world_state_data.get("world_state_cache", {})
         self.change_categories = world_state_data.get("change_categories", self.change_categories)
         self.world_history = world_state_data.get("world_history", [])
+        # Saves from before metric history existed start with an empty history
+        campaign_metrics.load(world_state_data.get("metric_history"))
         
         print(f"🔄 World state imported: {len(self.all_world_changes)} changes, {len(self.ongoing_effects)} active effects")
 
@@ -2482,6 +2617,10 @@ if __name__ == "__main__":
     stats = system.get_messenger_stats()
     print(f"\nMessenger Statistics: {stats}")
 
+# Edge types the agent network adds; recruitment only walks these, even in a shared graph
+AGENT_TIES = ("teammate", "liaison")
+
+
 class DynamicWorldEventsSystem:
     """System that makes NPCs, factions, and timeline events actually happen in real-time"""
     
@@ -2494,6 +2633,7 @@ class DynamicWorldEventsSystem:
         self.faction_agendas = {}            # Faction long-term plans
         self.world_events = []               # Random world events
         self.mission_timers = {}             # Mission progress timers
+        self.mission_clock = TimerWheel()    # Mission completions, one tick per world turn
         self.consequence_trackers = {}       # Track consequences of ongoing events
         self.event_triggers = {}             # What triggers new events
 
@@ -2509,6 +2649,8 @@ class DynamicWorldEventsSystem:
         
         # NEW: Multiple AI Traveler Teams System
         self.ai_traveler_teams = {}         # All AI Traveler teams working simultaneously
+        self.agent_network = RelationshipGraph()  # Teammate/liaison ties between traveler designations
+        self._networked_teams = set()       # Team ids already loaded into agent_network
         self.team_mission_assignments = {}  # Which teams are on which missions
         self.team_competition = {}          # Teams competing for same objectives
         self.team_cooperation = {}          # Teams working together
@@ -3068,7 +3210,7 @@ class DynamicWorldEventsSystem:
                 summary["protection_missions"].append({
                     "mission_id": mission_id,
                     "programmer": mission["npc"],
-                    "time_remaining": mission["time_remaining"],
+                    "time_remaining": self.mission_clock.remaining(mission["timer_id"]),
                     "success_chance": mission["success_chance"]
                 })
         
@@ -3087,27 +3229,24 @@ class DynamicWorldEventsSystem:
         """Process all active mission timers and complete finished missions"""
         completed_missions = []
         
-        for mission_id, mission in list(self.mission_timers.items()):
-            if mission["active"]:
-                # Decrease time remaining
-                mission["time_remaining"] -= 1
+        # Only missions whose timers fall on this turn are touched
+        for mission_id in self.mission_clock.tick():
+            mission = self.mission_timers.get(mission_id)
+            if mission and mission["active"]:
+                # Mission completed - determine success/failure
+                success = random.random() < mission["success_chance"]
                 
-                # Check if mission is complete
-                if mission["time_remaining"] <= 0:
-                    # Mission completed - determine success/failure
-                    success = random.random() < mission["success_chance"]
-                    
-                    if success:
-                        print(f"✅ {mission['npc']} successfully completed {mission['mission_type']} mission")
-                        # Apply positive consequences
-                        self.apply_mission_consequences(mission["consequences"], success=True)
-                    else:
-                        print(f"❌ {mission['npc']} failed {mission['mission_type']} mission")
-                        # Apply negative consequences
-                        self.apply_mission_consequences(mission["consequences"], success=False)
-                    
-                    # Mark for completion with success status
-                    completed_missions.append((mission_id, success))
+                if success:
+                    print(f"✅ {mission['npc']} successfully completed {mission['mission_type']} mission")
+                    # Apply positive consequences
+                    self.apply_mission_consequences(mission["consequences"], success=True)
+                else:
+                    print(f"❌ {mission['npc']} failed {mission['mission_type']} mission")
+                    # Apply negative consequences
+                    self.apply_mission_consequences(mission["consequences"], success=False)
+                
+                # Mark for completion with success status
+                completed_missions.append((mission_id, success))
         
         # Complete finished missions
         print(f"   🔄 Completing {len(completed_missions)} finished missions...")
@@ -3177,11 +3316,12 @@ class DynamicWorldEventsSystem:
         mission_id = f"{npc_name}_{mission_type}_{int(time.time())}"
         
         # Create mission timer and consequences
+        duration = self.calculate_mission_duration(mission_type)
         self.mission_timers[mission_id] = {
             "npc": npc_name,
             "mission_type": mission_type,
-            "duration": self.calculate_mission_duration(mission_type),
-            "time_remaining": self.calculate_mission_duration(mission_type),
+            "duration": duration,
+            "timer_id": self.mission_clock.schedule_in(duration, payload=mission_id),
             "success_chance": npc["success_rate"],
             "consequences": npc["consequences"][mission_type],
             "active": True
@@ -3267,6 +3407,7 @@ class DynamicWorldEventsSystem:
         
         # Remove from active missions
         if mission_id in self.mission_timers:
+            self.mission_clock.cancel(mission.get("timer_id"))
             del self.mission_timers[mission_id]
             print(f"✅ Mission {mission_id} completed for {npc_name} and removed from timers")
         else:
@@ -3559,8 +3700,7 @@ class DynamicWorldEventsSystem:
         # Generate random world events
         self.generate_random_world_events()
         
-        # Update ongoing effects
-        self.update_ongoing_effects()
+        # Ongoing effects expire on the world tracker's turn timers, not here
 
         # Surface important events clearly in end-turn output (so they don't get lost in long logs)
         try:
@@ -3725,21 +3865,23 @@ class DynamicWorldEventsSystem:
         if not candidate_teams:
             return None
 
-        team = random.choice(candidate_teams)
-        members = [m for m in (team.get("members") or []) if isinstance(m, dict) and m.get("designation")]
-        if not members:
-            return None
+        # Defectors are the Faction's way in: work their network before cold approaches
+        approach = self._network_recruitment_approach(candidate_teams)
+        if approach is not None:
+            team, target, contact, hops = approach
+        else:
+            contact, hops = None, None
+            team = random.choice(candidate_teams)
+            members = [m for m in (team.get("members") or []) if isinstance(m, dict) and m.get("designation")]
+            if not members:
+                return None
 
-        # Avoid recruiting already-defected agents
-        eligible = [
-            m for m in members
-            if m.get("designation") not in (self.defected_travelers or {})
-            and m.get("loyalty") not in ("Faction", "defected")
-        ]
-        if not eligible:
-            return None
+            # Avoid recruiting already-defected agents
+            eligible = [m for m in members if self._is_recruitable_traveler(m)]
+            if not eligible:
+                return None
 
-        target = random.choice(eligible)
+            target = random.choice(eligible)
         designation = target.get("designation")
         from_team = team.get("designation")
 
@@ -3747,6 +3889,10 @@ class DynamicWorldEventsSystem:
         recruitment_roll = random.randint(1, 20)
         success_dc = 18
 
+        # A defector vouching directly carries more weight than a friend of a friend
+        if hops is not None:
+            success_dc -= 3 if hops == 1 else 1
+
         # Modifiers: lower success_rate implies more vulnerable agent (approx.)
         try:
             sr = float(target.get("success_rate", 0.75) or 0.75)
@@ -3774,6 +3920,8 @@ class DynamicWorldEventsSystem:
                 "director_control": -0.03 if success else 0.0
             }
         }
+        if contact:
+            event["contact"] = contact
 
         # Apply a simple in-system state change so this is REAL (not just narrative)
         if success:
@@ -3820,6 +3968,71 @@ class DynamicWorldEventsSystem:
 
         return event
     
+    def _is_recruitable_traveler(self, member):
+        return (
+            member.get("designation") not in (self.defected_travelers or {})
+            and member.get("loyalty") not in ("Faction", "defected")
+        )
+
+    def use_relationship_graph(self, graph):
+        """Keep teammate/liaison ties in a shared graph (the procedural world's) instead of a private one"""
+        self.agent_network = graph
+        self._networked_teams = set()
+        self._sync_agent_network()
+
+    def _sync_agent_network(self):
+        """Load teammate and liaison ties for AI traveler teams not yet in the agent network"""
+        previous = None
+        for team_id, team in self.ai_traveler_teams.items():
+            if not isinstance(team, dict):
+                continue
+            designations = [
+                m["designation"] for m in (team.get("members") or [])
+                if isinstance(m, dict) and m.get("designation")
+            ]
+            if not designations:
+                continue
+            if team_id not in self._networked_teams:
+                for designation in designations:
+                    self.agent_network.add_node(designation, kind="traveler", group=team_id)
+                for i, first in enumerate(designations):
+                    for second in designations[i + 1:]:
+                        self.agent_network.add_edge(first, second, "teammate", 0.8)
+                # Teams keep one liaison channel to the team deployed before them
+                if previous:
+                    self.agent_network.add_edge(previous[-1], designations[0], "liaison", 0.4)
+                self._networked_teams.add(team_id)
+            previous = designations
+
+    def _network_recruitment_approach(self, candidate_teams):
+        """Find a recruitable traveler within two hops of a defector -> (team, member, contact, hops)"""
+        defectors = list(self.defected_travelers or {})
+        if not defectors:
+            return None
+        self._sync_agent_network()
+        reach = self.agent_network.within_hops(defectors, 2, edge_type=AGENT_TIES)
+        if not reach:
+            return None
+
+        reachable = []
+        for team in candidate_teams:
+            for member in (team.get("members") or []):
+                if isinstance(member, dict) and member.get("designation") in reach and self._is_recruitable_traveler(member):
+                    reachable.append((team, member))
+        if not reachable:
+            return None
+
+        team, member = random.choice(reachable)
+        designation = member["designation"]
+        hops = reach[designation]
+        contact = None
+        for defector in defectors:
+            path = self.agent_network.shortest_path(designation, defector, edge_type=AGENT_TIES)
+            if path and len(path) - 1 == hops:
+                contact = defector
+                break
+        return team, member, contact, hops
+
     def _generate_system_compromise_event(self):
         """Generate a system compromise event that could affect programmer loyalty"""
         loyal_programmers = [
@@ -4466,28 +4679,6 @@ class DynamicWorldEventsSystem:
         
         return success
     
-    def update_ongoing_effects(self):
-        """Update ongoing effects and their durations"""
-        # Update ongoing world effects
-        if hasattr(global_world_tracker, 'ongoing_effects'):
-            for effect_id, effect in list(global_world_tracker.ongoing_effects.items()):
-                if 'duration' in effect and effect['duration'] > 0:
-                    effect['duration'] -= 1
-                    if effect['duration'] <= 0:
-                        # Effect expired, remove it
-                        del global_world_tracker.ongoing_effects[effect_id]
-                        print(f"⏰ Ongoing effect expired: {effect.get('description', 'Unknown effect')}")
-        
-        # Update ongoing world changes
-        if hasattr(global_world_tracker, 'ongoing_world_changes'):
-            for change_id, change in list(global_world_tracker.ongoing_world_changes.items()):
-                if 'duration' in change and change['duration'] > 0:
-                    change['duration'] -= 1
-                    if change['duration'] <= 0:
-                        # Change expired, remove it
-                        del global_world_tracker.ongoing_world_changes[change_id]
-                        print(f"⏰ Ongoing world change expired: {change.get('description', 'Unknown change')}")
-    
     def increase_programmer_stress(self, programmer_name, stress_amount=0.1):
         """Increase a programmer's stress level (called when events occur)"""
         if programmer_name in self.directors_programmers:
@@ -5031,28 +5222,6 @@ class DynamicWorldEventsSystem:
         
         return success
     
-    def update_ongoing_effects(self):
-        """Update ongoing effects and their durations"""
-        # Update ongoing world effects
-        if hasattr(global_world_tracker, 'ongoing_effects'):
-            for effect_id, effect in list(global_world_tracker.ongoing_effects.items()):
-                if 'duration' in effect and effect['duration'] > 0:
-                    effect['duration'] -= 1
-                    if effect['duration'] <= 0:
-                        # Effect expired, remove it
-                        del global_world_tracker.ongoing_effects[effect_id]
-                        print(f"⏰ Ongoing effect expired: {effect.get('description', 'Unknown effect')}")
-        
-        # Update ongoing world changes
-        if hasattr(global_world_tracker, 'ongoing_world_changes'):
-            for change_id, change in list(global_world_tracker.ongoing_world_changes.items()):
-                if 'duration' in change and change['duration'] > 0:
-                    change['duration'] -= 1
-                    if change['duration'] <= 0:
-                        # Change expired, remove it
-                        del global_world_tracker.ongoing_world_changes[change_id]
-                        print(f"⏰ Ongoing world change expired: {change.get('description', 'Unknown change')}")
-    
     def get_programmer_defection_status(self, programmer_name):
         """Get detailed defection status for a specific programmer"""
         if programmer_name not in self.directors_programmers:
@@ -5323,7 +5492,7 @@ def get_world_activity_feed():
         for effect_id, effect_data in ongoing_effects.items():
             if effect_data["active"]:
                 category = effect_id.split("_")[1] if "_" in effect_id else "other"
-                turns_left = effect_data["turns_remaining"]
+                turns_left = global_world_tracker.get_turns_remaining(effect_data)
                 effects = effect_data["effects"]
                 
                 if "missions" in category:
@@ -0,0 +1,201 @@
+# metric_series.py
+"""
+Fixed-size per-turn history for campaign metrics.
+
+Exposure risks and world-state levels (timeline stability, faction
+influence, Director and government control) used to be kept only as current
+scalars. Anything that wanted a trend had to keep and rescan its own history.
+MetricSeries keeps the last `capacity` samples of one metric in a
+preallocated ring of doubles. Running prefix sums of y and k*y (k being the
+sample index) sit alongside it. Appending is O(1). A windowed mean or
+least-squares slope is then a couple of prefix-sum differences, and a
+percentile only sorts the window it asks about.
+
+MetricStore groups the series by name. `campaign_metrics` is the shared
+store that the detection system and the world-state tracker feed once per
+turn, so other systems can read trends from it.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Samples kept per metric; one sample per turn is a long campaign's worth
+DEFAULT_CAPACITY = 4096
+
+# World-state keys recorded every turn by the world-state tracker
+WORLD_METRICS = ("timeline_stability", "faction_influence", "director_control", "government_control")
+
+# GovernmentDetectionSystem.exposure_risk key -> metric name (matches the world_state keys)
+EXPOSURE_METRICS = {
+    "traveler_teams": "traveler_exposure_risk",
+    "faction": "faction_exposure_risk",
+    "overall": "overall_exposure_risk",
+}
+
+SPARK_LEVELS = "▁▂▃▄▅▆▇█"
+
+
+class MetricSeries:
+    """Ring buffer of (turn, value) samples with prefix sums for windowed queries"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.count = 0  # Samples ever appended; the ring holds the last min(count, capacity)
+        self.values = array("d", bytes(8 * capacity))
+        self.turns = array("q", bytes(8 * capacity))
+        # Prefix sums over the sample index k: sums[k] = y_0 + ... + y_(k-1), weighted[k] = sum of j*y_j.
+        # One extra slot so both ends of a full-capacity window are still in the ring.
+        self._sums = array("d", bytes(8 * (capacity + 1)))
+        self._weighted = array("d", bytes(8 * (capacity + 1)))
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, turn: int, value: float):
+        k = self.count
+        size = self.capacity + 1
+        self.values[k % self.capacity] = value
+        self.turns[k % self.capacity] = turn
+        self._sums[(k + 1) % size] = self._sums[k % size] + value
+        self._weighted[(k + 1) % size] = self._weighted[k % size] + k * value
+        self.count = k + 1
+
+    def latest(self) -> Optional[float]:
+        return self.values[(self.count - 1) % self.capacity] if self.count else None
+
+    def _span(self, window: Optional[int]) -> int:
+        """Number of samples a query over the last `window` samples actually covers"""
+        held = len(self)
+        return held if window is None else max(0, min(window, held))
+
+    def mean(self, window: Optional[int] = None) -> Optional[float]:
+        """Mean of the last `window` samples (all retained samples by default)"""
+        w = self._span(window)
+        if not w:
+            return None
+        size = self.capacity + 1
+        n = self.count
+        return (self._sums[n % size] - self._sums[(n - w) % size]) / w
+
+    def slope(self, window: Optional[int] = None) -> Optional[float]:
+        """Least-squares change per sample over the last `window` samples"""
+        w = self._span(window)
+        if w < 2:
+            return None if not w else 0.0
+        size = self.capacity + 1
+        n = self.count
+        start = n - w
+        sum_y = self._sums[n % size] - self._sums[start % size]
+        # Shift the index so the window runs 0..w-1; keeps the products small
+        sum_xy = self._weighted[n % size] - self._weighted[start % size] - start * sum_y
+        sum_x = w * (w - 1) / 2
+        sum_xx = (w - 1) * w * (2 * w - 1) / 6
+        return (w * sum_xy - sum_x * sum_y) / (w * sum_xx - sum_x * sum_x)
+
+    def window(self, window: Optional[int] = None) -> List[float]:
+        """The last `window` values, oldest first"""
+        w = self._span(window)
+        start = self.count - w
+        return [self.values[k % self.capacity] for k in range(start, self.count)]
+
+    def percentile(self, q: float, window: Optional[int] = None) -> Optional[float]:
+        """q-th percentile (0-100, linear interpolation) of the last `window` samples"""
+        values = sorted(self.window(window))
+        if not values:
+            return None
+        position = (len(values) - 1) * min(100.0, max(0.0, q)) / 100.0
+        lower = int(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def history(self) -> Tuple[List[int], List[float]]:
+        """(turns, values) for every retained sample, oldest first"""
+        start = self.count - len(self)
+        indexes = [k % self.capacity for k in range(start, self.count)]
+        return [self.turns[i] for i in indexes], [self.values[i] for i in indexes]
+
+
+class MetricStore:
+    """Named MetricSeries, created on first record"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.series: Dict[str, MetricSeries] = {}
+
+    def __contains__(self, name: str):
+        return name in self.series
+
+    def clear(self):
+        """Forget every series (a new campaign starts with no history)"""
+        self.series = {}
+
+    def record(self, turn: int, values: Dict[str, float]):
+        """Append one sample per metric for `turn`; non-numeric values are skipped"""
+        for name, value in values.items():
+            if isinstance(value, (int, float)):
+                series = self.series.get(name)
+                if series is None:
+                    series = self.series[name] = MetricSeries(self.capacity)
+                series.append(turn, float(value))
+
+    def record_world(self, turn: int, world_state: Dict, keys: Iterable[str] = WORLD_METRICS):
+        self.record(turn, {key: world_state[key] for key in keys if key in world_state})
+
+    def latest(self, name: str, default: Optional[float] = None) -> Optional[float]:
+        series = self.series.get(name)
+        value = series.latest() if series else None
+        return default if value is None else value
+
+    def mean(self, name: str, window: Optional[int] = None, default: Optional[float] = None) -> Optional[float]:
+        series = self.series.get(name)
+        value = series.mean(window) if series else None
+        return default if value is None else value
+
+    def slope(self, name: str, window: Optional[int] = None, default: float = 0.0) -> float:
+        series = self.series.get(name)
+        value = series.slope(window) if series else None
+        return default if value is None else value
+
+    def percentile(self, name: str, q: float, window: Optional[int] = None,
+                   default: Optional[float] = None) -> Optional[float]:
+        series = self.series.get(name)
+        value = series.percentile(q, window) if series else None
+        return default if value is None else value
+
+    def history(self, name: str) -> Tuple[List[int], List[float]]:
+        series = self.series.get(name)
+        return series.history() if series else ([], [])
+
+    def sparkline(self, name: str, width: int = 40) -> str:
+        """One-line chart of the whole retained history, averaged into `width` buckets"""
+        values = self.history(name)[1]
+        if not values:
+            return ""
+        buckets = min(width, len(values))
+        means = []
+        for b in range(buckets):
+            chunk = values[b * len(values) // buckets:(b + 1) * len(values) // buckets]
+            means.append(sum(chunk) / len(chunk))
+        low, high = min(means), max(means)
+        scale = (len(SPARK_LEVELS) - 1) / (high - low) if high > low else 0.0
+        return "".join(SPARK_LEVELS[int((m - low) * scale)] for m in means)
+
+    def export(self) -> Dict[str, Dict[str, List]]:
+        """Retained samples per metric, for save files"""
+        result = {}
+        for name, series in self.series.items():
+            turns, values = series.history()
+            result[name] = {"turns": turns, "values": values}
+        return result
+
+    def load(self, data: Optional[Dict[str, Dict[str, List]]]):
+        """Replace the store's contents with exported samples (None or {} just clears it)"""
+        self.clear()
+        for name, samples in (data or {}).items():
+            for turn, value in zip(samples.get("turns", []), samples.get("values", [])):
+                self.record(turn, {name: value})
+
+
+# Shared store fed by the detection system and the world-state tracker.
+# Cleared when a new game starts and replaced whenever a save is loaded.
+campaign_metrics = MetricStore()
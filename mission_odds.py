@@ -0,0 +1,151 @@
+# mission_odds.py
+"""
+Exact outcome odds for the mission d20 chains.
+
+A player mission is three phase checks (d20 + team modifier against the phase
+tiers) followed by a closing d20 + momentum roll, where momentum depends only
+on the phase tiers. An AI team mission is three D20DecisionSystem checks
+against a DC. Both chains are small enough to enumerate outright, so the odds
+here are exact rather than sampled, and every table is memoized on the
+numbers that actually move it (the per-phase modifiers, or DC/modifier pairs).
+"""
+
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+MISSION_PHASES = ("infiltration", "execution", "extraction")
+
+# Phase performance: d20 + modifier. Loosened from the ultra-hard band so typical teams see
+# a mix of partials and wins; d20 still matters.
+MISSION_PHASE_MOD_MAX = 9
+MISSION_PHASE_SKILL_MAX = 6
+PHASE_T_CRITICAL_SUCCESS = 22
+PHASE_T_SUCCESS = 17
+PHASE_T_PARTIAL = 11
+PHASE_T_FAILURE = 5
+
+# Final mission roll: d20 + momentum vs these bands. Momentum scales from phase scores.
+MISSION_MOMENTUM_SCALE = 12  # was 10 — rewards decent phases a bit more on the closing die
+MISSION_MOMENTUM_CAP = 8
+FIN_COMPLETE = 24
+FIN_SUCCESS = 19
+FIN_PARTIAL = 14
+FIN_FAILURE = 9
+
+PHASE_SCORES = {
+    "CRITICAL_SUCCESS": 5,
+    "SUCCESS": 4,
+    "PARTIAL_SUCCESS": 3,
+    "FAILURE": 2,
+    "CRITICAL_FAILURE": 1
+}
+# Phase-score total at or above which a mission with no failed phase is floored at partial
+SALVAGE_SCORE = 9
+
+MISSION_OUTCOMES = ("COMPLETE_SUCCESS", "SUCCESS", "PARTIAL_SUCCESS", "FAILURE", "CRITICAL_FAILURE")
+AI_OUTCOMES = ("success", "partial", "failure")
+
+
+def phase_tier(total: int) -> str:
+    """Tier for a phase check total (d20 + team modifier)"""
+    if total >= PHASE_T_CRITICAL_SUCCESS:
+        return "CRITICAL_SUCCESS"
+    if total >= PHASE_T_SUCCESS:
+        return "SUCCESS"
+    if total >= PHASE_T_PARTIAL:
+        return "PARTIAL_SUCCESS"
+    if total >= PHASE_T_FAILURE:
+        return "FAILURE"
+    return "CRITICAL_FAILURE"
+
+
+def final_outcome(total: int) -> str:
+    """Mission outcome for a closing roll total (d20 + momentum, after any salvage floor)"""
+    if total >= FIN_COMPLETE:
+        return "COMPLETE_SUCCESS"
+    if total >= FIN_SUCCESS:
+        return "SUCCESS"
+    if total >= FIN_PARTIAL:
+        return "PARTIAL_SUCCESS"
+    if total >= FIN_FAILURE:
+        return "FAILURE"
+    return "CRITICAL_FAILURE"
+
+
+def momentum(total_score: int, phase_count: int) -> int:
+    """Closing-roll modifier earned from the summed phase scores"""
+    max_possible = phase_count * 5 if phase_count else 1
+    return min(MISSION_MOMENTUM_CAP, int((total_score / max_possible) * MISSION_MOMENTUM_SCALE))
+
+
+@lru_cache(maxsize=None)
+def phase_tier_odds(modifier: int) -> Dict[str, float]:
+    """Probability of each phase tier for d20 + `modifier`"""
+    odds = dict.fromkeys(PHASE_SCORES, 0.0)
+    for roll in range(1, 21):
+        odds[phase_tier(roll + modifier)] += 0.05
+    return odds
+
+
+@lru_cache(maxsize=None)
+def mission_outcome_odds(phase_modifiers: Tuple[int, ...]) -> Dict[str, float]:
+    """Exact distribution of player mission outcomes for the given per-phase modifiers
+
+    Enumerates (summed phase score, no phase below partial) states phase by
+    phase, then applies the closing d20 to each state.
+    """
+    states = {(0, True): 1.0}
+    for modifier in phase_modifiers:
+        tiers = phase_tier_odds(modifier)
+        step = {}
+        for (score, clean), p in states.items():
+            for tier, q in tiers.items():
+                if q:
+                    key = (score + PHASE_SCORES[tier], clean and PHASE_SCORES[tier] >= 3)
+                    step[key] = step.get(key, 0.0) + p * q
+        states = step
+
+    odds = dict.fromkeys(MISSION_OUTCOMES, 0.0)
+    phase_count = len(phase_modifiers)
+    for (score, clean), p in states.items():
+        bonus = momentum(score, phase_count)
+        salvage = phase_count > 0 and clean and score >= SALVAGE_SCORE
+        for roll in range(1, 21):
+            total = roll + bonus
+            if salvage and total < FIN_PARTIAL:
+                total = FIN_PARTIAL
+            odds[final_outcome(total)] += p * 0.05
+    return odds
+
+
+def success_chance(odds: Dict[str, float]) -> float:
+    """Chance of SUCCESS or better from a mission_outcome_odds table"""
+    return odds.get("COMPLETE_SUCCESS", 0.0) + odds.get("SUCCESS", 0.0)
+
+
+@lru_cache(maxsize=None)
+def ai_mission_odds(checks: Tuple[Tuple[int, int], ...]) -> Dict[str, float]:
+    """Exact AI team mission odds for phase checks given as (DC, total modifier) pairs
+
+    Mirrors AITravelerTeam.execute_ai_mission: a natural 1 in any phase fails
+    the mission, otherwise two or more successful phases succeed it.
+    """
+    # successes -> probability, over missions with no natural 1 so far
+    clean = {0: 1.0}
+    for dc, modifier in checks:
+        hit = sum(1 for roll in range(2, 21) if roll + modifier >= dc) / 20.0
+        miss = 0.95 - hit
+        step = {}
+        for successes, p in clean.items():
+            step[successes + 1] = step.get(successes + 1, 0.0) + p * hit
+            step[successes] = step.get(successes, 0.0) + p * miss
+        clean = step
+
+    success = sum(p for successes, p in clean.items() if successes >= 2)
+    partial = sum(p for successes, p in clean.items() if successes < 2)
+    return {"success": success, "partial": partial, "failure": 1.0 - success - partial}
+
+
+def format_odds(odds: Dict[str, float], outcomes: Sequence[str] = MISSION_OUTCOMES) -> str:
+    """One-line summary of an odds table for briefings"""
+    return " | ".join(f"{name.replace('_', ' ').title()} {odds.get(name, 0.0):.0%}" for name in outcomes)
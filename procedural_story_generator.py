@@ -335,6 +335,7 @@ class ProceduralStoryGenerator:
         # Prefer NPCs whose work_location matches or contains the location (e.g. "Metropolitan Social Security Office")
         location_lower = location.lower()
         at_location = []
+        at_location_ids = []
         for npc in npcs:
             name = getattr(npc, "name", None)
             if not name or name in exclude_names:
@@ -342,14 +343,24 @@ class ProceduralStoryGenerator:
             work = (getattr(npc, "work_location", "") or "").lower()
             if location_lower in work or work in location_lower:
                 at_location.append(self._npc_to_dict(npc))
-        # Add civilians not at this location so we have enough variety
-        others = [
+                at_location_ids.append(getattr(npc, "id", None))
+        # Supporting cast comes from the social circle of the people there, then random civilians
+        others = []
+        network = getattr(self.world_generator, "get_npc_network", None)
+        if network and at_location_ids:
+            seen = set(at_location_ids)
+            for npc_id in at_location_ids:
+                for contact in network(npc_id, hops=2, faction="civilian"):
+                    if contact.id not in seen and contact.name not in exclude_names:
+                        seen.add(contact.id)
+                        others.append(self._npc_to_dict(contact))
+        others.extend(
             self._npc_to_dict(npc)
             for npc in npcs
             if getattr(npc, "name", None) and getattr(npc, "name") not in exclude_names
             and getattr(npc, "faction", "civilian") == "civilian"
-        ]
-        # Use location-linked first, then fill with random civilians
+        )
+        # Use location-linked first, then their contacts, then random civilians
         out = list(at_location)
         for o in others:
             if o["name"] not in [x["name"] for x in out] and len(out) < need:
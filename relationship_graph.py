@@ -0,0 +1,433 @@
+# relationship_graph.py
+"""
+Shared social graph for NPCs, host bodies, traveler agents and the player.
+
+Edges are typed ("contact", "host_bond", "teammate", ...) and weighted
+(0.0-1.0 relationship strength). Edits go into an edge map; queries run on a
+compressed sparse row (CSR) copy of it -- one offsets array plus parallel
+target / type / weight arrays -- which is rebuilt lazily after structural
+changes. Weight-only updates on an existing edge are patched into the CSR
+arrays in place, so relationship drift does not force a rebuild.
+"""
+
+import heapq
+from array import array
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class RelationshipGraph:
+    """Typed, weighted adjacency graph stored as CSR arrays"""
+
+    def __init__(self):
+        self.node_ids: List[Hashable] = []
+        self.node_kind: List[Optional[str]] = []
+        self.node_group: List[Optional[str]] = []
+        self._index: Dict[Hashable, int] = {}
+
+        self.edge_types: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+
+        # (source, target, type code) -> weight; the authoritative edge set
+        self._edges: Dict[Tuple[int, int, int], float] = {}
+        self._dirty = False
+
+        # CSR arrays: row i spans offsets[i]:offsets[i + 1]
+        self.offsets = array("l", [0])
+        self.targets = array("l")
+        self.types = array("b")
+        self.weights = array("d")
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __contains__(self, node_id):
+        return node_id in self._index
+
+    @property
+    def edge_count(self):
+        return len(self._edges)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    def add_node(self, node_id, kind: Optional[str] = None, group: Optional[str] = None) -> int:
+        """Add a node (or update its kind/group) and return its index"""
+        index = self._index.get(node_id)
+        if index is None:
+            index = len(self.node_ids)
+            self._index[node_id] = index
+            self.node_ids.append(node_id)
+            self.node_kind.append(kind)
+            self.node_group.append(group)
+            self._dirty = True
+        else:
+            if kind is not None:
+                self.node_kind[index] = kind
+            if group is not None:
+                self.node_group[index] = group
+        return index
+
+    def kind_of(self, node_id):
+        index = self._index.get(node_id)
+        return None if index is None else self.node_kind[index]
+
+    def group_of(self, node_id):
+        index = self._index.get(node_id)
+        return None if index is None else self.node_group[index]
+
+    def _type_code(self, edge_type: str) -> int:
+        code = self._type_codes.get(edge_type)
+        if code is None:
+            code = len(self.edge_types)
+            self._type_codes[edge_type] = code
+            self.edge_types.append(edge_type)
+        return code
+
+    def _type_filter(self, edge_type):
+        """Edge type name(s) -> set of codes, or None for any type"""
+        if edge_type is None:
+            return None
+        if isinstance(edge_type, str):
+            edge_type = (edge_type,)
+        return {self._type_codes[t] for t in edge_type if t in self._type_codes}
+
+    def add_edge(self, a, b, edge_type: str = "contact", weight: float = 1.0, symmetric: bool = True):
+        """Add or update a typed edge; nodes are created as needed"""
+        source = self.add_node(a)
+        target = self.add_node(b)
+        if source == target:
+            return
+        code = self._type_code(edge_type)
+        self._put(source, target, code, weight)
+        if symmetric:
+            self._put(target, source, code, weight)
+
+    def _put(self, source, target, code, weight):
+        key = (source, target, code)
+        if key in self._edges:
+            self._edges[key] = weight
+            if not self._dirty:
+                self._patch_weight(source, target, code, weight)
+        else:
+            self._edges[key] = weight
+            self._dirty = True
+
+    def _patch_weight(self, source, target, code, weight):
+        for pos in range(self.offsets[source], self.offsets[source + 1]):
+            if self.targets[pos] == target and self.types[pos] == code:
+                self.weights[pos] = weight
+                return
+
+    def remove_edge(self, a, b, edge_type: str = "contact", symmetric: bool = True) -> bool:
+        source, target = self._index.get(a), self._index.get(b)
+        code = self._type_codes.get(edge_type)
+        if source is None or target is None or code is None:
+            return False
+        removed = self._edges.pop((source, target, code), None) is not None
+        if symmetric:
+            removed = (self._edges.pop((target, source, code), None) is not None) or removed
+        if removed:
+            self._dirty = True
+        return removed
+
+    def weight(self, a, b, edge_type: str = "contact", default: Optional[float] = None):
+        source, target = self._index.get(a), self._index.get(b)
+        code = self._type_codes.get(edge_type)
+        if source is None or target is None or code is None:
+            return default
+        return self._edges.get((source, target, code), default)
+
+    def adjust_weight(self, a, b, edge_type: str, delta: float, default: float = 0.5,
+                      low: float = 0.0, high: float = 1.0, symmetric: bool = True) -> float:
+        """Shift an edge's weight by `delta` (starting from `default`), clamped to [low, high]"""
+        weight = max(low, min(high, self.weight(a, b, edge_type, default) + delta))
+        self.add_edge(a, b, edge_type, weight, symmetric)
+        return weight
+
+    def build(self):
+        """Compile the edge map into CSR arrays (done automatically before queries)"""
+        count = len(self.node_ids)
+        degree = [0] * (count + 1)
+        for source, _, _ in self._edges:
+            degree[source + 1] += 1
+        for i in range(count):
+            degree[i + 1] += degree[i]
+
+        size = len(self._edges)
+        targets = array("l", bytes(size * array("l").itemsize))
+        types = array("b", bytes(size))
+        weights = array("d", bytes(size * array("d").itemsize))
+        fill = degree[:-1]
+        for (source, target, code), weight in sorted(self._edges.items()):
+            pos = fill[source]
+            targets[pos] = target
+            types[pos] = code
+            weights[pos] = weight
+            fill[source] = pos + 1
+
+        self.offsets = array("l", degree)
+        self.targets, self.types, self.weights = targets, types, weights
+        self._dirty = False
+
+    def _row(self, index):
+        if self._dirty:
+            self.build()
+        return range(self.offsets[index], self.offsets[index + 1])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def neighbors(self, node_id, edge_type=None, min_weight: Optional[float] = None,
+                  kind: Optional[str] = None, group: Optional[str] = None) -> List[Tuple[Hashable, str, float]]:
+        """Direct neighbours as (node id, edge type, weight), optionally filtered"""
+        index = self._index.get(node_id)
+        if index is None:
+            return []
+        codes = self._type_filter(edge_type)
+        out = []
+        for pos in self._row(index):
+            if codes is not None and self.types[pos] not in codes:
+                continue
+            weight = self.weights[pos]
+            if min_weight is not None and weight < min_weight:
+                continue
+            target = self.targets[pos]
+            if kind is not None and self.node_kind[target] != kind:
+                continue
+            if group is not None and self.node_group[target] != group:
+                continue
+            out.append((self.node_ids[target], self.edge_types[self.types[pos]], weight))
+        return out
+
+    def degree(self, node_id, edge_type=None) -> int:
+        return len(self.neighbors(node_id, edge_type))
+
+    def within_hops(self, sources, hops: int = 2, edge_type=None,
+                    min_weight: Optional[float] = None) -> Dict[Hashable, int]:
+        """Breadth-first reach from one or more source ids -> {node id: hop distance}
+
+        Sources themselves are not included in the result.
+        """
+        if not isinstance(sources, (list, tuple, set, frozenset)):
+            sources = (sources,)
+        codes = self._type_filter(edge_type)
+        if self._dirty:
+            self.build()
+
+        dist = {}
+        queue = deque()
+        for source in sources:
+            index = self._index.get(source)
+            if index is not None and index not in dist:
+                dist[index] = 0
+                queue.append(index)
+        seeds = set(dist)
+
+        offsets, targets, types, weights = self.offsets, self.targets, self.types, self.weights
+        while queue:
+            index = queue.popleft()
+            depth = dist[index]
+            if depth >= hops:
+                continue
+            for pos in range(offsets[index], offsets[index + 1]):
+                target = targets[pos]
+                if target in dist:
+                    continue
+                if codes is not None and types[pos] not in codes:
+                    continue
+                if min_weight is not None and weights[pos] < min_weight:
+                    continue
+                dist[target] = depth + 1
+                queue.append(target)
+
+        return {self.node_ids[i]: d for i, d in dist.items() if i not in seeds}
+
+    def shortest_path(self, a, b, edge_type=None, weighted: bool = False) -> Optional[List[Hashable]]:
+        """Shortest path between two ids, or None if unreachable
+
+        Unweighted paths minimise hop count. Weighted paths treat strong ties
+        as short (cost 1 / weight), so the result is the most trusted chain.
+        """
+        start, goal = self._index.get(a), self._index.get(b)
+        if start is None or goal is None:
+            return None
+        if start == goal:
+            return [a]
+        codes = self._type_filter(edge_type)
+        if self._dirty:
+            self.build()
+        offsets, targets, types, weights = self.offsets, self.targets, self.types, self.weights
+
+        previous = {start: None}
+        if not weighted:
+            queue = deque([start])
+            while queue and goal not in previous:
+                index = queue.popleft()
+                for pos in range(offsets[index], offsets[index + 1]):
+                    target = targets[pos]
+                    if target in previous or (codes is not None and types[pos] not in codes):
+                        continue
+                    previous[target] = index
+                    queue.append(target)
+        else:
+            cost = {start: 0.0}
+            heap = [(0.0, start)]
+            done = set()
+            while heap:
+                current, index = heapq.heappop(heap)
+                if index in done:
+                    continue
+                done.add(index)
+                if index == goal:
+                    break
+                for pos in range(offsets[index], offsets[index + 1]):
+                    if codes is not None and types[pos] not in codes:
+                        continue
+                    weight = weights[pos]
+                    if weight <= 0.0:
+                        continue
+                    target = targets[pos]
+                    candidate = current + 1.0 / weight
+                    if candidate < cost.get(target, float("inf")):
+                        cost[target] = candidate
+                        previous[target] = index
+                        heapq.heappush(heap, (candidate, target))
+
+        if goal not in previous:
+            return None
+        path = []
+        index = goal
+        while index is not None:
+            path.append(self.node_ids[index])
+            index = previous[index]
+        path.reverse()
+        return path
+
+    def min_cut(self, sources, sinks, edge_type=None, nodes=None, blocked=None) -> List[Tuple[Hashable, Hashable]]:
+        """Lightest set of links whose removal separates `sources` from `sinks`
+
+        Edge weights are capacities (parallel typed edges add up) and links
+        are treated as undirected. `nodes` limits the search to a subgraph
+        (sources and sinks are always included); `blocked` holds
+        frozenset({a, b}) id pairs that are already cut. Edmonds-Karp max
+        flow; returns the saturated (a, b) links on the source side's edge.
+        """
+        codes = self._type_filter(edge_type)
+        if self._dirty:
+            self.build()
+        src = {self._index[n] for n in sources if n in self._index}
+        snk = {self._index[n] for n in sinks if n in self._index} - src
+        if not src or not snk:
+            return []
+        if nodes is None:
+            members = set(range(len(self.node_ids)))
+        else:
+            members = {self._index[n] for n in nodes if n in self._index} | src | snk
+        offsets, targets, types, weights = self.offsets, self.targets, self.types, self.weights
+
+        capacity: Dict[int, Dict[int, float]] = {}
+        for index in members:
+            row = capacity.setdefault(index, {})
+            for pos in range(offsets[index], offsets[index + 1]):
+                target = targets[pos]
+                if target not in members or (codes is not None and types[pos] not in codes):
+                    continue
+                if blocked and frozenset((self.node_ids[index], self.node_ids[target])) in blocked:
+                    continue
+                row[target] = row.get(target, 0.0) + weights[pos]
+        links = {(a, b) for a, row in capacity.items() for b in row}
+
+        source, sink = -1, -2
+        capacity[source] = {index: float("inf") for index in src}
+        capacity[sink] = {}
+        for index in snk:
+            capacity[index][sink] = float("inf")
+        residual = {a: dict(row) for a, row in capacity.items()}
+        for a, row in capacity.items():
+            for b in row:
+                residual[b].setdefault(a, 0.0)
+
+        def reachable():
+            previous = {source: None}
+            queue = deque([source])
+            while queue:
+                a = queue.popleft()
+                for b, room in residual[a].items():
+                    if room > 1e-12 and b not in previous:
+                        previous[b] = a
+                        queue.append(b)
+            return previous
+
+        while True:
+            previous = reachable()
+            if sink not in previous:
+                break
+            path = []
+            b = sink
+            while previous[b] is not None:
+                path.append((previous[b], b))
+                b = previous[b]
+            flow = min(residual[a][b] for a, b in path)
+            for a, b in path:
+                residual[a][b] -= flow
+                residual[b][a] += flow
+
+        side = set(previous)
+        cut = set()
+        for a, b in links:
+            if a in side and b not in side:
+                cut.add((self.node_ids[a], self.node_ids[b]))
+        return sorted(cut, key=str)
+
+    def communities(self, edge_type=None, min_weight: float = 0.0, rounds: int = 10) -> Dict[Hashable, int]:
+        """Weighted label propagation -> {node id: community label}
+
+        Deterministic: nodes update in index order and ties go to the lowest
+        label. Isolated nodes keep a community of their own.
+        """
+        codes = self._type_filter(edge_type)
+        if self._dirty:
+            self.build()
+        offsets, targets, types, weights = self.offsets, self.targets, self.types, self.weights
+
+        labels = list(range(len(self.node_ids)))
+        for _ in range(rounds):
+            changed = False
+            for index in range(len(labels)):
+                scores = {}
+                for pos in range(offsets[index], offsets[index + 1]):
+                    if codes is not None and types[pos] not in codes:
+                        continue
+                    weight = weights[pos]
+                    if weight < min_weight:
+                        continue
+                    label = labels[targets[pos]]
+                    scores[label] = scores.get(label, 0.0) + weight
+                if not scores:
+                    continue
+                best = max(scores.values())
+                label = min(l for l, s in scores.items() if s == best)
+                if label != labels[index] and scores.get(labels[index], -1.0) < best:
+                    labels[index] = label
+                    changed = True
+            if not changed:
+                break
+
+        return {self.node_ids[i]: label for i, label in enumerate(labels)}
+
+    def community_of(self, node_id, edge_type=None, min_weight: float = 0.0) -> List[Hashable]:
+        """Members of the community containing `node_id`"""
+        labels = self.communities(edge_type, min_weight)
+        label = labels.get(node_id)
+        if label is None:
+            return []
+        return [node for node, other in labels.items() if other == label]
+
+    def nodes(self, kind: Optional[str] = None, group: Optional[str] = None) -> Iterable[Hashable]:
+        for index, node_id in enumerate(self.node_ids):
+            if kind is not None and self.node_kind[index] != kind:
+                continue
+            if group is not None and self.node_group[index] != group:
+                continue
+            yield node_id
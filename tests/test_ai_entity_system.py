@@ -0,0 +1,86 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai_entity_system import PACED_ENTITIES, AIEntityWorld, ComponentStore
+from ai_world_controller import AITravelerTeam
+from time_system import TimeSystem
+
+
+class FakeTeam:
+    def __init__(self, hosts):
+        self.host_lives = [{"name": f"Host-{i}", "stress_level": 0.9, "happiness": 0.5} for i in range(hosts)]
+        self.active_missions = []
+        self.status = "active"
+
+
+class FakeAgent:
+    def __init__(self):
+        self.status = "active"
+        self.turns = 0
+
+    def take_turn(self, world_state, time_system, world_memory=None, peer_agents=None):
+        self.turns += 1
+
+
+class TestComponentStore(unittest.TestCase):
+    def test_remove_keeps_columns_dense(self):
+        store = ComponentStore("value")
+        for entity in (1, 2, 3):
+            store.add(entity, value=entity * 10)
+        self.assertTrue(store.remove(1))
+        self.assertEqual(len(store), 2)
+        self.assertNotIn(1, store)
+        self.assertEqual(store.get(3, "value"), 30)
+        self.assertEqual(store.get(2, "value"), 20)
+        self.assertFalse(store.remove(1))
+
+
+class TestAIEntityWorld(unittest.TestCase):
+    def test_team_hosts_follow_host_list(self):
+        world = AIEntityWorld()
+        team = FakeTeam(3)
+        entity = world.register_team(team)
+        self.assertEqual(len(world.host_life), 3)
+
+        team.host_lives.append({"name": "Host-3", "stress_level": 0.1, "happiness": 0.5})
+        world.register_team(team)
+        self.assertEqual(len(world.host_life), 4)
+        self.assertEqual(len(world.stress), 4)
+
+        world.remove_entity(entity)
+        self.assertEqual(len(world.host_life), 0)
+        self.assertEqual(len(world.mission), 0)
+
+    def test_batched_host_life_updates_host_dicts(self):
+        world = AIEntityWorld()
+        team = AITravelerTeam("T-1", 4, "Seattle", [])
+        team.life_balance_score = 1.0
+        world.register_team(team)
+        world.begin_turn()
+        self.assertFalse(world._team_mode[world.entity_of(team)])
+
+        world.host_life_system(TimeSystem("2018-12-25"))
+        self.assertIsNone(team._ai_host_log_buffer)
+        for host in world.host_life.entities:
+            view = world.host_life.get(host, "view")
+            self.assertTrue(0.0 <= view["stress_level"] <= 1.0)
+            self.assertTrue(0.1 <= view["happiness"] <= 1.0)
+            self.assertEqual(world.stress.get(host, "stress"), view["stress_level"])
+
+    def test_pause_is_capped_per_pass(self):
+        world = AIEntityWorld()
+        agents = [FakeAgent() for _ in range(50)]
+        for agent in agents:
+            world.register_agent(agent)
+        with mock.patch("ai_entity_system.time.sleep") as sleep:
+            world.investigation_system({}, None, pause=0.5)
+        self.assertTrue(all(agent.turns == 1 for agent in agents))
+        self.assertEqual(sleep.call_count, PACED_ENTITIES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import random
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from combat_death_system import (
+    SkirmishBatch,
+    SkirmishOutcomeTable,
+    fast_forward_ai_skirmish,
+    resolve_ai_skirmishes,
+)
+
+
+def hosts(n, wounds=0):
+    return [{"name": f"Host-{i}", "stress_level": 0.3, "wound_level": wounds, "alive": True} for i in range(n)]
+
+
+def enemies(n, cover=1):
+    return [{"label": f"Cell #{i}", "wound_level": 0, "alive": True, "cover": cover} for i in range(n)]
+
+
+class TestSkirmishKernel(unittest.TestCase):
+    def test_fights_end_with_a_side_down_or_round_cap(self):
+        random.seed(5)
+        batch = SkirmishBatch()
+        for _ in range(200):
+            batch.add_fight([0, 0, 1], [1, 2])
+        batch.resolve()
+        for f in range(len(batch)):
+            host_up = any(batch.wounds[i] < 3 for i in range(batch.start[f], batch.split[f]))
+            enemy_up = any(batch.wounds[i] < 3 for i in range(batch.split[f], batch.end[f]))
+            self.assertTrue(batch.rounds[f] == 6 or not (host_up and enemy_up))
+
+    def test_results_written_back_to_dicts(self):
+        random.seed(9)
+        engagements = [(hosts(3), enemies(3)) for _ in range(300)]
+        world_state = {"timeline_stability": 0.8}
+        results = resolve_ai_skirmishes(engagements, world_state)
+        self.assertLess(world_state["timeline_stability"], 0.8)
+
+        for (team, foes), result in zip(engagements, results):
+            dead = [h["name"] for h in team if not h["alive"]]
+            self.assertEqual(dead, result["host_kia_names"])
+            for h in team:
+                self.assertEqual(h["alive"], h["wound_level"] < 3)
+                if h["wound_level"]:
+                    self.assertGreater(h["stress_level"], 0.3)
+            for e in foes:
+                self.assertEqual(e["alive"], e["wound_level"] < 3)
+
+    def test_dead_hosts_stay_out_of_the_fight(self):
+        team = hosts(2)
+        team[0]["alive"] = False
+        team[0]["wound_level"] = 4
+        resolve_ai_skirmishes([(team, enemies(1))])
+        self.assertEqual(team[0]["wound_level"], 4)
+
+    def test_dead_enemies_stay_out_of_the_fight(self):
+        random.seed(10)
+        for _ in range(50):
+            foes = enemies(2)
+            foes[0].update(alive=False, wound_level=5)
+            resolve_ai_skirmishes([(hosts(2), foes)])
+            self.assertEqual(foes[0], {"label": "Cell #0", "wound_level": 5, "alive": False, "cover": 1})
+        downed = enemies(1)
+        downed[0].update(alive=False, wound_level=3)
+        result = resolve_ai_skirmishes([(hosts(2), downed)])[0]
+        self.assertEqual(result["rounds"], 0)
+
+
+class TestSkirmishFastForward(unittest.TestCase):
+    def test_sampled_outcomes_match_the_kernel(self):
+        random.seed(3)
+        table = SkirmishOutcomeTable(path=None, samples=4000)
+        trials = 4000
+        sampled = fought = 0
+        covers = [2, 0, 1]
+        for _ in range(trials):
+            team = hosts(3)
+            fast_forward_ai_skirmish(team, [dict(e, cover=c) for e, c in zip(enemies(3), covers)], table=table)
+            sampled += sum(not h["alive"] for h in team)
+        for _ in range(trials):
+            team = hosts(3)
+            resolve_ai_skirmishes([(team, [dict(e, cover=c) for e, c in zip(enemies(3), covers)])])
+            fought += sum(not h["alive"] for h in team)
+        self.assertAlmostEqual(sampled / trials, fought / trials, delta=0.08)
+        self.assertEqual(len(table), 1)
+
+    def test_enemy_cover_shapes_who_goes_down(self):
+        random.seed(8)
+        table = SkirmishOutcomeTable(path=None, samples=2000)
+        downed = {0: 0, 2: 0}
+        for _ in range(2000):
+            foes = enemies(1, cover=0) + enemies(1, cover=2)
+            fast_forward_ai_skirmish(hosts(3), foes, table=table)
+            for e in foes:
+                downed[e["cover"]] += not e["alive"]
+        # Before covers were keyed, wounds were dealt to enemies at random (no gap)
+        self.assertGreater(downed[0] - downed[2], 80)
+
+    def test_tables_persist_to_disk(self):
+        random.seed(4)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "outcomes.json")
+            table = SkirmishOutcomeTable(path=path, samples=64)
+            first = table.distribution([1, 0], [2, 0])
+            # Nothing is written until the table is flushed
+            self.assertFalse(os.path.exists(path))
+            table.flush()
+            reloaded = SkirmishOutcomeTable(path=path, samples=64)
+            self.assertEqual(len(reloaded), 1)
+            self.assertEqual(reloaded.distribution([0, 1], [0, 2]), first)
+            # Tables built under other combat constants are ignored
+            self.assertEqual(len(SkirmishOutcomeTable(path=path, samples=32)), 0)
+
+    def test_fast_forward_writes_back_like_the_kernel(self):
+        random.seed(6)
+        team, foes = hosts(3, wounds=1), enemies(2)
+        team[2]["alive"] = False
+        world_state = {"timeline_stability": 0.8}
+        result = fast_forward_ai_skirmish(team, foes, world_state, SkirmishOutcomeTable(path=None))
+        self.assertEqual([h["name"] for h in team[:2] if not h["alive"]], result["host_kia_names"])
+        for h in team[:2]:
+            self.assertEqual(h["alive"], h["wound_level"] < 3)
+        for e in foes:
+            self.assertEqual(e["alive"], e["wound_level"] < 3)
+        self.assertEqual(team[2]["wound_level"], 1)
+
+        downed = dict(foes[0], alive=False, wound_level=4)
+        fast_forward_ai_skirmish(hosts(2), [downed] + enemies(1), table=SkirmishOutcomeTable(path=None))
+        self.assertEqual(downed["wound_level"], 4)
+        self.assertGreaterEqual(result["shear_peak"], 5 * result["rounds"])
+
+
+if __name__ == "__main__":
+    unittest.main()
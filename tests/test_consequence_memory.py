@@ -0,0 +1,112 @@
+import io
+import random
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from consequence_memory_system import GOVERNMENT_HEAT_THRESHOLD, HEAT_DECAY_PER_TURN, WorldMemory
+
+
+def failed_mission(location, **extra):
+    return dict({"location": location, "success": False, "security_level": "medium"}, **extra)
+
+
+class TestScheduledConsequences(unittest.TestCase):
+    def setUp(self):
+        self.memory = WorldMemory()
+
+    def test_only_due_consequences_fire_in_trigger_order(self):
+        for turn, name in ((3, "c"), (1, "a"), (2, "b1"), (2, "b2"), (5, "late")):
+            self.memory.schedule_consequence({"trigger_turn": turn, "description": name})
+        fired = [[c["description"] for c in self.memory.process_turn()] for _ in range(3)]
+        self.assertEqual(fired, [["a"], ["b1", "b2"], ["c"]])
+        self.assertEqual([c["description"] for c in self.memory.scheduled_consequences], ["late"])
+
+    def test_overdue_consequences_fire_on_next_turn(self):
+        self.memory.turn_count = 4
+        self.memory.schedule_consequence({"trigger_turn": 2, "description": "missed"})
+        self.memory.schedule_consequence({"description": "default"})
+        self.assertEqual([c["description"] for c in self.memory.process_turn()], ["missed", "default"])
+
+    def test_scheduled_consequences_is_a_copy(self):
+        self.memory.schedule_consequence({"trigger_turn": 2, "description": "b"})
+        self.memory.schedule_consequence({"trigger_turn": 1, "description": "a"})
+        pending = self.memory.scheduled_consequences
+        self.assertEqual([c["description"] for c in pending], ["a", "b"])
+        pending.clear()
+        self.assertEqual(len(self.memory.scheduled_consequences), 2)
+
+    def test_setter_rebuilds_heap(self):
+        self.memory.scheduled_consequences = [{"trigger_turn": 2, "description": "b"},
+                                              {"trigger_turn": 1, "description": "a"}]
+        self.assertEqual([c["description"] for c in self.memory.process_turn()], ["a"])
+        self.memory.scheduled_consequences = None
+        self.assertEqual(self.memory.scheduled_consequences, [])
+
+
+class TestLazyHeatDecay(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.memory = WorldMemory()
+
+    def record(self, mission):
+        with redirect_stdout(io.StringIO()):
+            self.memory.record_player_mission(mission)
+
+    def test_heat_cools_per_turn_on_read(self):
+        self.record(failed_mission("Docks"))
+        start = self.memory.get_location_heat("Docks")
+        self.assertGreater(start, 0.0)
+        for _ in range(3):
+            self.memory.process_turn()
+        self.assertAlmostEqual(self.memory.get_location_heat("Docks"), start - 3 * HEAT_DECAY_PER_TURN)
+        # Stored record is untouched until the next incident
+        self.assertEqual(self.memory.hot_locations["Docks"]["heat_level"], start)
+        for _ in range(50):
+            self.memory.process_turn()
+        self.assertEqual(self.memory.get_location_heat("Docks"), 0.0)
+        self.assertEqual(self.memory.get_location_heat("Nowhere"), 0.0)
+
+    def test_new_incident_builds_on_decayed_heat(self):
+        self.record(failed_mission("Docks"))
+        start = self.memory.get_location_heat("Docks")
+        for _ in range(2):
+            self.memory.process_turn()
+        self.record(failed_mission("Docks"))
+        expected = min(1.0, start - 2 * HEAT_DECAY_PER_TURN + 0.45)
+        self.assertAlmostEqual(self.memory.get_location_heat("Docks"), expected)
+        self.assertEqual(self.memory.hot_locations["Docks"]["heat_turn"], 2)
+
+    def test_government_ranking_and_threshold(self):
+        self.record(failed_mission("Docks"))
+        self.record(failed_mission("Vault", evidence_left=True))
+        self.memory.process_turn()
+        self.record(failed_mission("Park", security_level="low"))
+        hot = self.memory.get_hot_locations_for_government()
+        self.assertEqual([h["location"] for h in hot], ["Vault", "Docks", "Park"])
+        self.assertEqual([h["location"] for h in self.memory.get_hot_locations_for_government(limit=1)],
+                         ["Vault"])
+        self.assertEqual(sorted(hot, key=lambda h: -h["heat_level"]), hot)
+
+        # Cooling drops locations below the threshold in heat order
+        for _ in range(4):
+            self.memory.process_turn()
+        remaining = self.memory.get_hot_locations_for_government()
+        self.assertTrue(all(h["heat_level"] >= GOVERNMENT_HEAT_THRESHOLD - 1e-9 for h in remaining))
+        self.assertEqual([h["location"] for h in remaining], ["Vault"])
+
+    def test_loaded_records_keep_their_heat(self):
+        self.memory.turn_count = 10
+        self.memory.hot_locations = {"Docks": {"heat_level": 0.5, "incident_count": 2,
+                                               "last_incident_turn": 4, "worst_incident": "major"}}
+        self.assertEqual(self.memory.get_location_heat("Docks"), 0.5)
+        self.memory.process_turn()
+        self.assertAlmostEqual(self.memory.get_location_heat("Docks"), 0.5 - HEAT_DECAY_PER_TURN)
+        self.assertEqual([h["location"] for h in self.memory.get_hot_locations_for_government()], ["Docks"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import io
+import random
+import unittest
+import sys
+from datetime import datetime
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from government_detection_system import DetectionEvent, GovernmentDetectionSystem, bernoulli_picks
+
+
+def quiet(fn, *args):
+    with redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+
+class TestDetectionQueue(unittest.TestCase):
+    def setUp(self):
+        random.seed(12)
+        self.system = GovernmentDetectionSystem()
+        self.world = {"government_control": 0.5, "surveillance_level": 0.3}
+
+    def add_events(self, count, location="urban_area"):
+        for i in range(count):
+            quiet(self.system.add_detection_event, "mission_activity", 0.6, location,
+                  f"Event {i}", ["traveler_team"], 0.7)
+
+    def test_bernoulli_picks_rate(self):
+        items = list(range(50000))
+        picked = list(bernoulli_picks(items, 0.2))
+        self.assertAlmostEqual(len(picked) / len(items), 0.2, delta=0.01)
+        self.assertEqual(picked, sorted(set(picked)))
+        self.assertEqual(list(bernoulli_picks(items, 0.0)), [])
+        self.assertEqual(list(bernoulli_picks(items[:5], 1.0)), items[:5])
+
+    def test_location_profile_cached_until_networks_update(self):
+        agencies = self.system.get_monitoring_agencies("urban_area")
+        for _ in range(20):
+            self.assertEqual(self.system.get_monitoring_agencies("urban_area"), agencies)
+        self.assertEqual(len(self.system._location_cache), 1)
+        quiet(self.system.update_surveillance_capabilities, self.world)
+        self.assertEqual(self.system._location_cache, {})
+
+    def test_batch_drains_queue_in_order(self):
+        self.add_events(40)
+        self.add_events(10, "federal_facility")
+        quiet(self.system.process_detection_events, self.world, {})
+        self.assertEqual(len(self.system.detection_events), 0)
+        history = self.system.detection_history
+        self.assertEqual([event.description for event in history[:40]], [f"Event {i}" for i in range(40)])
+        self.assertTrue(all(event.status in ("detected", "avoided") for event in history))
+
+    def test_batch_results_follow_the_dice(self):
+        self.add_events(30)
+        batch = list(self.system.detection_events)
+        results = self.system.roll_detection_batch(batch, self.world)
+        for result in results:
+            self.assertEqual(result["detected"], result["roll"] >= result["dc"])
+            self.assertEqual(result["advantage_count"], 1 + (len(result["monitoring_agencies"]) > 1) * 2)
+
+
+class TestInvestigationLifecycle(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.system = GovernmentDetectionSystem()
+        self.world = {"government_control": 0.5, "surveillance_level": 0.3}
+        self.event = DetectionEvent(datetime.now(), "mission_activity", 0.9, "urban_area", "traveler op",
+                                    ["traveler_team"], 0.7, 1.0, "detected")
+
+    def open(self, evidence=0.5):
+        investigation = self.system.create_investigation(self.event, ["FBI"], evidence)
+        self.system.open_investigation(investigation)
+        return investigation
+
+    def advance(self):
+        self.system.turn_count += 1
+        quiet(self.system.update_investigations, self.world)
+
+    def test_ids_stay_unique_across_completions(self):
+        first = self.open()
+        for _ in range(first.estimated_completion):
+            self.advance()
+        self.assertEqual(first.status, "completed")
+        second = self.open()
+        third = self.open()
+        self.assertEqual(len({first.investigation_id, second.investigation_id, third.investigation_id}), 3)
+
+    def test_phases_follow_precomputed_boundaries(self):
+        investigation = self.open()
+        self.assertEqual(investigation.end_turn - investigation.start_turn, investigation.estimated_completion)
+        seen = []
+        while investigation.status == "active":
+            self.advance()
+            seen.append((self.system.turn_count, investigation.current_phase))
+        for turn, phase in investigation.phase_turns:
+            self.assertIn((turn, phase), seen)
+        self.assertEqual(seen[-2][1], "action_ready")
+        self.assertEqual(self.system.turn_count, investigation.end_turn)
+
+    def test_many_concurrent_investigations(self):
+        investigations = [self.open(random.uniform(0.3, 1.0)) for _ in range(3000)]
+        last = max(inv.end_turn for inv in investigations)
+        while self.system.turn_count < last:
+            self.advance()
+            due = [inv for inv in investigations if inv.end_turn <= self.system.turn_count]
+            self.assertEqual(len(self.system.active_investigations), len(investigations) - len(due))
+        self.assertTrue(all(inv.status == "completed" for inv in investigations))
+
+
+if __name__ == "__main__":
+    unittest.main()
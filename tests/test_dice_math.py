@@ -0,0 +1,52 @@
+import random
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dice_math import band_pmf, check_outcomes, check_probability, d20_pmf, roll_d20
+from us_political_system import D20Result, USPoliticalSystem
+from combat_death_system import strike_odds
+
+
+class TestDiceMath(unittest.TestCase):
+    def test_pmfs_sum_to_one(self):
+        for advantage in (-2, -1, 0, 1, 2):
+            self.assertAlmostEqual(sum(d20_pmf(advantage)), 1.0)
+        self.assertAlmostEqual(d20_pmf(1)[19], 1 - 0.95 ** 2)
+
+    def test_check_probability(self):
+        self.assertAlmostEqual(check_probability(11), 0.5)
+        self.assertAlmostEqual(check_probability(11, advantage=1), 0.75)
+        self.assertAlmostEqual(check_probability(11, advantage=-1), 0.25)
+        self.assertAlmostEqual(check_probability(30, nat20_succeeds=True), 0.05)
+        self.assertAlmostEqual(check_probability(1, 5, nat1_fails=True), 0.95)
+        self.assertAlmostEqual(check_outcomes(15, 2)["success"], 0.4)
+
+    def test_band_pmf_matches_rolling(self):
+        bands = ((18, "high"), (10, "mid"))
+        odds = band_pmf(bands, 1, 2, below="low")
+        rng_state = random.getstate()
+        random.seed(3)
+        counts = {"high": 0, "mid": 0, "low": 0}
+        for _ in range(20000):
+            total = roll_d20(2) + 1
+            counts["high" if total >= 18 else "mid" if total >= 10 else "low"] += 1
+        random.setstate(rng_state)
+        for label, p in odds.items():
+            self.assertAlmostEqual(counts[label] / 20000, p, delta=0.015)
+
+    def test_consumers(self):
+        odds = USPoliticalSystem().d20_result_odds(0, 15)
+        self.assertAlmostEqual(sum(odds.values()), 1.0)
+        # Only a natural 20 reaches DC + 5
+        self.assertAlmostEqual(odds[D20Result.CRITICAL_SUCCESS], 0.05)
+
+        strike = strike_odds("traveler", 12, {})
+        self.assertAlmostEqual(strike["hit"], 0.55)
+        self.assertAlmostEqual(strike["expected_damage"], 0.5 + 0.15)
+
+
+if __name__ == "__main__":
+    unittest.main()
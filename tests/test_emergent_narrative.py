@@ -0,0 +1,112 @@
+import io
+import random
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from emergent_narrative_system import (NPC_PATTERN_TURNS, EmergentNarrativeSystem, RealEvent,
+                                       RealityBasedNarrativeIntegrator)
+from game import Game
+from game_entity_tracker import reset_entity_tracker
+from world_generation import TravelersWorldGenerator
+
+EVENT_TYPES = ("mission_failure", "mission_success", "government_investigation_started",
+               "evidence_discovered", "host_body_suspicion", "combat_casualties", "npc_death")
+
+
+def random_event(rng):
+    data = {}
+    if rng.random() < 0.8:
+        data["location"] = f"Site {rng.randrange(12)}"
+    if rng.random() < 0.5:
+        data["npc_id"] = f"Agent {rng.randrange(8)}"
+    return rng.choice(EVENT_TYPES), data
+
+
+class TestThreadMatching(unittest.TestCase):
+    def test_index_matches_linear_scan(self):
+        rng = random.Random(14)
+        narrative = EmergentNarrativeSystem()
+        with redirect_stdout(io.StringIO()):
+            for _ in range(60):
+                for _ in range(rng.randrange(4)):
+                    event_type, data = random_event(rng)
+                    probe = RealEvent(narrative.turn_count, event_type, data)
+                    expected = next((t for t in narrative.narrative_threads.values()
+                                     if narrative._events_are_related(probe, t.events[-1])), None)
+                    event = narrative.record_event(event_type, data)
+                    owners = [t for t in narrative.narrative_threads.values() if t.events[-1] is event]
+                    if expected is not None:
+                        self.assertEqual(owners, [expected])
+                    else:
+                        self.assertTrue(all(len(t.events) == 1 for t in owners))
+                narrative.advance_turn()
+
+        for thread in narrative.narrative_threads.values():
+            self.assertNotEqual(thread.status, "resolved")
+            latest = thread.events[-1]
+            self.assertIn(thread.thread_id, narrative._threads_by_location[latest.data.get("location")])
+            self.assertIn(thread.thread_id, narrative._threads_by_type[latest.event_type])
+        self.assertGreater(narrative.resolved_thread_count, 0)
+
+    def test_resolved_threads_are_pruned(self):
+        narrative = EmergentNarrativeSystem()
+        with redirect_stdout(io.StringIO()):
+            narrative.record_event("mission_failure", {"location": "Seattle"})
+            for _ in range(3):
+                narrative.advance_turn()
+            self.assertEqual(narrative.narrative_threads, {})
+            self.assertEqual(narrative._threads_by_location, {})
+            narrative.record_event("mission_failure", {"location": "Seattle"})
+        self.assertEqual(list(narrative.narrative_threads), ["thread_2"])
+
+
+class TestPatternWindows(unittest.TestCase):
+    def test_location_pattern_only_counts_recent_turns(self):
+        narrative = EmergentNarrativeSystem()
+        with redirect_stdout(io.StringIO()):
+            for _ in range(3):
+                narrative.record_event("mission_success", {"location": "Docks"})
+            patterns = narrative.advance_turn()["new_patterns"]
+            self.assertEqual([p["location"] for p in patterns if p["type"] == "location_pattern"], ["Docks"])
+            for _ in range(6):
+                narrative.advance_turn()
+        self.assertNotIn("Docks", narrative.location_hotspots)
+        self.assertEqual(narrative.location_event_counts["Docks"], 3)
+
+
+class TestGameConsumers(unittest.TestCase):
+    def setUp(self):
+        reset_entity_tracker()
+        self.game = object.__new__(Game)
+        self.game.world = TravelersWorldGenerator(seed=42)
+        self.game.narrative = RealityBasedNarrativeIntegrator()
+
+    def tearDown(self):
+        reset_entity_tracker()
+
+    def protection_scores(self):
+        # random.choices hands back every weighted option instead of picking one
+        every_option = mock.patch("game.random.choices", side_effect=lambda options, **_: [options])
+        with redirect_stdout(io.StringIO()), every_option:
+            return {o["name"]: o["score"] for o in self.game.pick_story_significant_protection_target()}
+
+    def test_protection_target_counts_past_involvement(self):
+        before = self.protection_scores()
+        npc = next(n for n in self.game.world.npcs if n.name in before)
+        narrative = self.game.narrative.narrative
+        with redirect_stdout(io.StringIO()):
+            narrative.record_event("npc_death", {"npc_id": npc.id, "location": "Docks"})
+            for _ in range(NPC_PATTERN_TURNS + 2):
+                narrative.advance_turn()
+        # The recent-activity window is gone, but the NPC still mattered to the story
+        self.assertNotIn(npc.id, narrative.character_involvement)
+        self.assertAlmostEqual(self.protection_scores()[npc.name], before[npc.name] + 44.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
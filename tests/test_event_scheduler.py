@@ -0,0 +1,76 @@
+import io
+import random
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_scheduler import RateScheduler, geometric_gap
+from us_political_system import USPoliticalSystem
+
+
+class TestRateScheduler(unittest.TestCase):
+    def setUp(self):
+        random.seed(21)
+        self.scheduler = RateScheduler()
+
+    def test_recurring_rate_matches_per_turn_chance(self):
+        self.scheduler.every("event", "a", 0.15)
+        self.scheduler.every("event", "b", 0.6)
+        turns = 20000
+        counts = {"a": 0, "b": 0}
+        for _ in range(turns):
+            self.scheduler.advance()
+            for payload in self.scheduler.due("event"):
+                counts[payload] += 1
+        self.assertAlmostEqual(counts["a"] / turns, 0.15, delta=0.01)
+        self.assertAlmostEqual(counts["b"] / turns, 0.6, delta=0.015)
+
+    def test_gap_edges(self):
+        self.assertIsNone(geometric_gap(0.0))
+        self.assertEqual(geometric_gap(1.0), 1)
+        self.assertGreaterEqual(min(geometric_gap(0.9) for _ in range(200)), 1)
+
+    def test_once_due_in_registration_order(self):
+        first = self.scheduler.once("bills", "first", 1.0)
+        self.scheduler.once("bills", "second", 1.0)
+        self.scheduler.once("other", "skip", 1.0)
+        self.scheduler.cancel(first)
+        self.scheduler.advance()
+        self.assertEqual(self.scheduler.due("bills"), ["second"])
+        self.assertTrue(self.scheduler.is_due("other"))
+        self.scheduler.advance()
+        self.assertFalse(self.scheduler.is_due("bills"))
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_watch_follows_world_state(self):
+        self.scheduler.watch("crisis", None, lambda world: world["stability"] < 0.7)
+        self.scheduler.advance({"stability": 0.9})
+        self.assertFalse(self.scheduler.is_due("crisis"))
+        self.scheduler.advance({"stability": 0.5})
+        self.assertTrue(self.scheduler.is_due("crisis"))
+
+
+class TestScheduledPoliticalTurn(unittest.TestCase):
+    def test_bills_move_through_the_pipeline(self):
+        random.seed(5)
+        politics = USPoliticalSystem()
+        world = {"government_control": 0.5, "timeline_stability": 0.8}
+        with redirect_stdout(io.StringIO()):
+            politics.initialize_political_system()
+            for _ in range(150):
+                politics.process_political_turn(world)
+
+        # Every undecided bill is waiting on the scheduler, exactly once
+        scheduled = [id(action.payload) for action in politics.scheduler.wheel.pending() if action.stage == "bills"]
+        undecided = [id(bill) for bill in politics.legislation.active_bills
+                     if bill["status"] in ("draft", "committee", "floor_vote")]
+        self.assertEqual(sorted(scheduled), sorted(undecided))
+        decided = [bill for bill in politics.legislation.active_bills if bill["status"] == "defeated"]
+        self.assertTrue(politics.legislation.recent_laws or decided)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import contextlib
+import io
+import random
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from hacking_system import FactionHacker, HackingSystem, HackingTarget, HackingTool, IndexedPool
+from time_system import TimeSystem
+from world_generation import TravelersWorldGenerator
+
+
+class TestIndexedPool(unittest.TestCase):
+    def test_add_discard_choice(self):
+        pool = IndexedPool("abcd")
+        pool.discard("b")
+        pool.discard("z")
+        self.assertEqual(sorted(pool), ["a", "c", "d"])
+        self.assertIn(pool.choice(), {"a", "c", "d"})
+        for item in "acd":
+            pool.discard(item)
+        self.assertIsNone(pool.choice())
+
+
+class TestHackingEngine(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.system = HackingSystem()
+
+    def test_tool_selection_tracks_cooldowns(self):
+        hacker = FactionHacker("F-1", 0.9)
+        weak = HackingTool("Weak", "exploit", 0.3, 0.5, 1)
+        strong = HackingTool("Strong", "exploit", 0.9, 0.1, 1)
+        for tool in (weak, strong):
+            tool.clock = self.system.timers
+            tool.max_cooldown = 2
+            hacker.add_tool(tool)
+        self.assertIs(hacker.select_tool("government", "sabotage"), strong)
+        strong.use_tool(0.0)
+        self.assertIs(hacker.select_tool("government", "sabotage"), weak)
+        self.system.reduce_tool_cooldowns()
+        self.system.reduce_tool_cooldowns()
+        self.assertIs(hacker.select_tool("government", "sabotage"), strong)
+        self.assertEqual(hacker.tools_by_type, {"exploit": [weak, strong]})
+
+    def test_tool_selection_prefers_operation_tool_types(self):
+        hacker = FactionHacker("F-1", 0.9)
+        exploit = HackingTool("Zero-Day", "exploit", 0.9, 0.1, 1)
+        crasher = HackingTool("Crasher", "disrupt", 0.6, 0.4, 1)
+        for tool in (exploit, crasher):
+            tool.clock = self.system.timers
+            tool.max_cooldown = 2
+            hacker.add_tool(tool)
+        self.assertIs(hacker.select_tool("infrastructure", "sabotage"), crasher)
+        crasher.use_tool(0.0)
+        self.assertIs(hacker.select_tool("infrastructure", "sabotage"), exploit)
+        # No surveillance tools: fall back to the best ready tool
+        self.assertIs(hacker.select_tool("government", "surveillance"), exploit)
+
+    def test_target_pools_follow_breaches_and_alerts(self):
+        target = HackingTarget("Grid", "infrastructure", 0.5, "high", "Seattle")
+        self.system.add_target(target)
+        hacker = FactionHacker("F-1", 0.9)
+        target.current_breach = {"hacker": hacker, "severity": 0.5}
+        target.alert_level = 0.4
+        self.assertIn(target, self.system.breached_by_faction["faction"])
+        self.assertNotIn(target, self.system.free_targets)
+        self.assertIn(target, self.system.alerted_targets)
+        target.current_breach = None
+        target.alert_level = 0.0
+        self.assertEqual(len(self.system.breached_by_faction["faction"]), 0)
+        self.assertIn(target, self.system.free_targets)
+        self.assertNotIn(target, self.system.alerted_targets)
+
+    def test_large_world_indexes_stay_consistent(self):
+        world = TravelersWorldGenerator(seed=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.system.initialize_hacking_world(400, 300, 10, world=world)
+            for _ in range(10):
+                self.system.execute_hacking_turn({"timeline_stability": 0.7}, TimeSystem())
+        system = self.system
+        self.assertEqual(len(system.targets), 300)
+        self.assertTrue(any(t.location_id for t in system.targets))
+        self.assertEqual(set(system.breached_targets), {t for t in system.targets if t.current_breach})
+        self.assertEqual(set(system.operating_hackers), {h for h in system.hackers if h.current_operation})
+        self.assertEqual(set(system.alerted_targets), {t for t in system.targets if t.alert_level > 0})
+        self.assertEqual(system.completed_operations, sum(len(h.operation_history) for h in system.hackers))
+        state = system.get_hacking_world_state()
+        self.assertEqual(sum(state["hackers_by_faction"].values()), len(system.hackers))
+
+    def test_reinitializing_replaces_targets(self):
+        world = TravelersWorldGenerator(seed=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.system.initialize_hacking_world(12, 14, world=world)
+            self.system.initialize_hacking_world(12, 14, world=world)
+        system = self.system
+        self.assertEqual(len(system.targets), 14)
+        self.assertEqual(set(system.targets_by_name.values()), set(system.targets))
+        self.assertEqual(set(system.free_targets), set(system.targets))
+        self.assertEqual(sum(len(pool) for pool in system.targets_by_type.values()), 14)
+        self.assertEqual(set(system.network.nodes(kind="target")), {t.name for t in system.targets})
+
+
+class TestTargetNetwork(unittest.TestCase):
+    def setUp(self):
+        random.seed(2)
+        self.system = HackingSystem()
+        for name, value in (("Entry", "low"), ("Relay", "medium"), ("Vault", "critical")):
+            self.system.add_target(HackingTarget(name, "corporate", 0.0, value, "Seattle"))
+        self.system.network.add_edge("Entry", "Relay", "link", 1.0)
+        self.system.network.add_edge("Relay", "Vault", "trust", 0.2)
+        self.attacker = FactionHacker("F-1", 0.9)
+
+    def breach(self, name):
+        self.system.targets_by_name[name].current_breach = {"hacker": self.attacker, "severity": 1.0}
+
+    def test_breaches_pivot_one_hop_per_turn(self):
+        self.system.PIVOT_CHANCE = 10.0  # every open link pivots
+        self.breach("Entry")
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = self.system.propagate_breaches()
+            second = self.system.propagate_breaches()
+        self.assertEqual([t.name for t in first], ["Relay"])
+        self.assertEqual([t.name for t in second], ["Vault"])
+        self.assertEqual(self.system.targets_by_name["Vault"].current_breach["type"], "pivot")
+
+    def test_containment_quarantines_min_cut(self):
+        self.breach("Entry")
+        with contextlib.redirect_stdout(io.StringIO()):
+            cut = self.system._quarantine_around(self.system.targets_by_name["Relay"])
+        self.assertEqual(cut, [("Relay", "Vault")])
+        self.assertFalse(self.system._link_open("Vault", "Relay"))
+
+        self.system.PIVOT_CHANCE = 10.0
+        self.breach("Relay")
+        self.system.breach_frontier.discard(self.system.targets_by_name["Entry"])
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(self.system.propagate_breaches(), [])
+        for _ in range(self.system.QUARANTINE_TURNS):
+            self.system.reduce_tool_cooldowns()
+        self.assertTrue(self.system._link_open("Vault", "Relay"))
+
+
+if __name__ == "__main__":
+    unittest.main()
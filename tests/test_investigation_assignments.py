@@ -0,0 +1,99 @@
+import io
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai_world_controller import AIGovernmentAgent, InvestigationAssignmentRegistry
+
+HOTSPOTS = [
+    {"location": "Docks", "heat_level": 0.9},
+    {"location": "Vault", "heat_level": 0.6},
+    {"location": "Park", "heat_level": 0.4},
+]
+
+
+class FakeMemory:
+    def __init__(self, hot):
+        self.hot = hot
+        self.reads = 0
+
+    def get_hot_locations_for_government(self):
+        self.reads += 1
+        return self.hot
+
+
+def make_agent(agent_id):
+    with redirect_stdout(io.StringIO()):
+        return AIGovernmentAgent(agent_id, "FBI", "cyber", "Seattle", 3)
+
+
+class TestAssignmentRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = InvestigationAssignmentRegistry()
+        self.agents = [make_agent(f"A{i}") for i in range(7)]
+
+    def claim(self, agent, max_agents=3):
+        hotspot = self.registry.next_hotspot(max_agents)
+        self.registry.assign(agent, hotspot and hotspot["location"])
+        return hotspot and hotspot["location"]
+
+    def test_claims_spread_to_least_loaded_hottest_spot(self):
+        self.registry.set_hot_locations(HOTSPOTS)
+        claims = [self.claim(agent, max_agents=2) for agent in self.agents]
+        self.assertEqual(claims, ["Docks", "Vault", "Park", "Docks", "Vault", "Park", None])
+        self.assertEqual(self.registry.load, {"Docks": 2, "Vault": 2, "Park": 2})
+
+    def test_release_and_move_requeue_locations(self):
+        self.registry.set_hot_locations(HOTSPOTS)
+        first, second, third = self.agents[:3]
+        for agent in (first, second, third):
+            self.claim(agent)
+        self.registry.assign(second, None)  # Vault frees up
+        self.assertEqual(self.registry.next_hotspot()["location"], "Vault")
+        self.registry.assign(first, "Vault")  # Docks frees up, Vault fills again
+        self.assertEqual(self.registry.load_on("Docks"), 0)
+        self.assertEqual(self.registry.load_on("Vault"), 1)
+        self.assertEqual(self.registry.next_hotspot()["location"], "Docks")
+        self.registry.assign(first, "Vault")  # Re-claiming the same spot is a no-op
+        self.assertEqual(self.registry.load_on("Vault"), 1)
+
+    def test_snapshot_is_loaded_once_per_turn(self):
+        memory = FakeMemory(HOTSPOTS)
+        self.assertIsNone(self.registry.current_hot_locations)
+        self.assertIs(self.registry.hot_locations(memory), HOTSPOTS)
+        self.registry.hot_locations(memory)
+        self.assertEqual(memory.reads, 1)
+        self.assertIs(self.registry.current_hot_locations, HOTSPOTS)
+
+        # Loads carry over into the next turn's queue
+        self.claim(self.agents[0])
+        self.registry.begin_turn()
+        self.assertIsNone(self.registry.current_hot_locations)
+        self.assertIsNone(self.registry.next_hotspot())
+        self.registry.hot_locations(memory)
+        self.assertEqual(memory.reads, 2)
+        self.assertEqual(self.registry.next_hotspot()["location"], "Vault")
+
+    def test_agents_share_the_registry(self):
+        for agent in self.agents[:4]:
+            agent.join_assignments(self.registry)
+        picks = []
+        for agent in self.agents[:3]:
+            hotspot = agent._pick_player_hotspot_investigation(HOTSPOTS, None)
+            agent.current_investigation = {"location": hotspot["location"]}
+            picks.append(hotspot["location"])
+        self.assertEqual(picks, ["Docks", "Vault", "Park"])
+        self.assertIs(self.registry.current_hot_locations, HOTSPOTS)
+
+        # A different snapshot rebuilds the queue around the current load
+        fresh = [{"location": "Docks", "heat_level": 0.9}, {"location": "Mall", "heat_level": 0.1}]
+        self.assertEqual(self.agents[3]._pick_player_hotspot_investigation(fresh, None), fresh[1])
+        self.agents[0].current_investigation = None
+        self.assertEqual(self.registry.load, {"Vault": 1, "Park": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
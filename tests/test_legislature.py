@@ -0,0 +1,131 @@
+import io
+import random
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from game import Game
+from game_entity_tracker import get_entity_tracker, reset_entity_tracker, senator_entity_id
+from legislature import MemberTable, VoteEngine
+from us_political_system import LegislativeBranch
+
+
+class TestMemberTable(unittest.TestCase):
+    def setUp(self):
+        self.table = MemberTable()
+        rng = random.Random(3)
+        for i in range(60):
+            party = "Democrat" if i % 3 else "Republican"
+            self.table.add(f"Member {i}", f"State {i % 5}", f"Seat {i}", party,
+                           10, 0.6, rng.uniform(0.5, 1.0), 2)
+
+    def test_indexes(self):
+        self.assertEqual(self.table.count("Democrat"), 40)
+        self.assertEqual(self.table.majority(), ("Democrat", 40))
+        self.assertEqual(len(self.table.in_state("State 2")), 12)
+        self.assertEqual(self.table.find("member 7"), [7])
+        self.assertEqual(self.table.record(7)["seat"], "Seat 7")
+
+    def test_party_switch_bumps_version(self):
+        version = self.table.version
+        self.table.set_party(1, "Republican")
+        self.assertEqual(self.table.count("Democrat"), 39)
+        self.table.set_party(1, "Republican")
+        self.assertEqual(self.table.version, version + 1)
+
+
+class TestVoteEngine(unittest.TestCase):
+    def setUp(self):
+        self.table = MemberTable()
+        for i in range(40):
+            party = "Democrat" if i < 25 else "Republican"
+            self.table.add(f"Member {i}", "Ohio" if i % 2 else "Utah", f"Seat {i}", party, 10, 0.8, 0.9, 2)
+        self.engine = VoteEngine(senate=self.table)
+
+    def test_propensities(self):
+        self.assertAlmostEqual(self.engine.state_lean("Ohio"), (8 - 12) / 20)
+        self.assertAlmostEqual(self.engine.state_lean("Utah"), (7 - 13) / 20)
+        row = self.engine.probabilities("senate", "Democrat", 0.5)
+        # Seats 0 and 30 are both in Utah; only the party line splits them
+        self.assertAlmostEqual(row[0], 0.9 + 0.1 * (0.5 + 0.2 * 0.3))
+        self.assertAlmostEqual(row[30], 0.1 * (0.5 + 0.2 * 0.3))
+        self.assertIs(self.engine.probabilities("senate", "Democrat", 0.5), row)
+
+    def test_rows_rebuilt_after_roster_change(self):
+        row = self.engine.probabilities("senate", "Republican", 0.7)
+        self.table.set_party(0, "Republican")
+        fresh = self.engine.probabilities("senate", "Republican", 0.7)
+        self.assertIsNot(fresh, row)
+        self.assertGreater(fresh[0], row[0])
+
+    def test_resolve_matches_expected_votes(self):
+        random.seed(8)
+        bills = [("Democrat", 0.3), ("Republican", 0.9)] * 500
+        results = self.engine.resolve(bills)
+        for offset, bill in enumerate(bills[:2]):
+            mean = sum(r["senate"][0] for r in results[offset::2]) / 500
+            self.assertAlmostEqual(mean, self.engine.expected_yes("senate", *bill), delta=0.3)
+        committee = self.engine.resolve(bills[:1], committee=True)[0]["senate"]
+        self.assertEqual(sum(committee), 22)
+
+
+class TestCongress(unittest.TestCase):
+    def test_full_congress_generation_and_vote(self):
+        random.seed(4)
+        branch = LegislativeBranch()
+        with redirect_stdout(io.StringIO()):
+            branch.generate_random_members()
+        self.assertEqual(len(branch.senate.members), 100)
+        self.assertEqual(len(branch.house.members), 435)
+        self.assertEqual(len(branch.senate.members.in_state("Ohio")), 2)
+        self.assertEqual(branch.senate.majority_seats, branch.senate.members.count(branch.senate.majority_party))
+
+        tallies = branch.votes.resolve([(branch.house.majority_party, 0.5)])[0]
+        self.assertEqual(sum(tallies["senate"]), 100)
+        self.assertEqual(sum(tallies["house"]), 435)
+
+        branch.apply_seat_swing("Democrat", 1.0)
+        self.assertEqual(branch.senate.majority_seats, 100)
+        self.assertLess(branch.votes.resolve([("Democrat", 0.5)])[0]["house"][1], 100)
+
+
+class TestSenatorEntities(unittest.TestCase):
+    def setUp(self):
+        random.seed(4)
+        self.branch = LegislativeBranch()
+        with redirect_stdout(io.StringIO()):
+            self.branch.generate_random_members()
+        self.game = object.__new__(Game)
+        self.game.us_political_system = SimpleNamespace(
+            executive_branch=SimpleNamespace(president=None, vice_president=None, cabinet={}),
+            legislative_branch=self.branch,
+        )
+        reset_entity_tracker()
+        self.tracker = get_entity_tracker(self.game)
+        with redirect_stdout(io.StringIO()):
+            self.tracker.initialize_from_game(self.game)
+
+    def tearDown(self):
+        reset_entity_tracker()
+
+    def test_namesakes_get_separate_entities(self):
+        senators = self.branch.senate.members
+        self.assertEqual(len(self.tracker.get_political_entities()), 100)
+        first, second = next(indexes for indexes in senators.by_name.values() if len(indexes) > 1)[:2]
+        name = senators.names[first]
+        seat, other_seat = senators.seats[first], senators.seats[second]
+
+        with redirect_stdout(io.StringIO()):
+            self.tracker.kill_entity(senator_entity_id(seat), 1)
+        self.assertFalse(self.game.is_npc_available_for_mission(name, "Senator", seat))
+        self.assertTrue(self.game.is_npc_available_for_mission(name, "Senator", other_seat))
+        self.assertTrue(self.tracker.get_entity(senator_entity_id(other_seat)).is_alive())
+        self.assertIn(other_seat, {t["seat"] for t in self.game.get_available_targets_for_mission("political")})
+
+
+if __name__ == "__main__":
+    unittest.main()
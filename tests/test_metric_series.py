@@ -0,0 +1,91 @@
+import io
+import random
+import statistics
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from government_detection_system import GovernmentDetectionSystem
+from living_world_events import DirectorFeedbackSystem
+from metric_series import MetricSeries, MetricStore
+
+
+def least_squares_slope(values):
+    xs = range(len(values))
+    mean_x, mean_y = statistics.mean(xs), statistics.mean(values)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, values))
+    return num / sum((x - mean_x) ** 2 for x in xs)
+
+
+class TestMetricSeries(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(9)
+        self.values = [rng.random() + i * 0.01 for i in range(250)]
+        self.series = MetricSeries(capacity=64)
+        for turn, value in enumerate(self.values):
+            self.series.append(turn, value)
+
+    def test_windowed_queries_after_wraparound(self):
+        self.assertEqual(len(self.series), 64)
+        self.assertEqual(self.series.latest(), self.values[-1])
+        for window in (1, 2, 7, 64, 500):
+            tail = self.values[-min(window, 64):]
+            self.assertAlmostEqual(self.series.mean(window), statistics.mean(tail))
+            if len(tail) > 1:
+                self.assertAlmostEqual(self.series.slope(window), least_squares_slope(tail))
+        self.assertAlmostEqual(self.series.percentile(50, 9), statistics.median(self.values[-9:]))
+        self.assertEqual(self.series.percentile(100), max(self.values[-64:]))
+
+    def test_history_and_empty_series(self):
+        turns, values = self.series.history()
+        self.assertEqual(turns, list(range(186, 250)))
+        self.assertEqual(values, self.values[-64:])
+        empty = MetricSeries(capacity=8)
+        self.assertIsNone(empty.mean())
+        self.assertIsNone(empty.slope())
+        self.assertIsNone(empty.percentile(50))
+
+
+class TestMetricStore(unittest.TestCase):
+    def test_store_round_trip_and_defaults(self):
+        store = MetricStore(capacity=16)
+        for turn in range(1, 31):
+            store.record(turn, {"timeline_stability": 1.0 - turn * 0.01, "note": "skip"})
+        self.assertNotIn("note", store)
+        self.assertAlmostEqual(store.slope("timeline_stability", 10), -0.01)
+        self.assertEqual(store.slope("missing"), 0.0)
+        self.assertEqual(store.mean("missing", default=0.5), 0.5)
+        self.assertEqual(len(store.sparkline("timeline_stability", 8)), 8)
+
+        restored = MetricStore(capacity=16)
+        restored.load(store.export())
+        self.assertEqual(restored.history("timeline_stability"), store.history("timeline_stability"))
+
+    def test_detection_system_records_exposure(self):
+        random.seed(2)
+        system = GovernmentDetectionSystem()
+        system.metrics = MetricStore()
+        world = {"government_control": 0.5, "surveillance_level": 0.3}
+        with redirect_stdout(io.StringIO()):
+            for _ in range(6):
+                system.process_turn(world, {})
+        turns, values = system.metrics.history("overall_exposure_risk")
+        self.assertEqual(turns, list(range(1, 7)))
+        self.assertEqual(values[-1], system.exposure_risk["overall"])
+
+    def test_director_flags_rising_detection(self):
+        director = DirectorFeedbackSystem()
+        director.metrics = MetricStore()
+        performance = {"mission_success_rate": 0.6, "protocol_violations": 0}
+        feedback = None
+        for turn, level in enumerate((0.3, 0.35, 0.4, 0.45, 0.5), start=1):
+            feedback = director.generate_feedback(dict(performance, detection_level=level), turn)
+        self.assertIsNotNone(feedback)
+        self.assertEqual(director.last_criticism, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
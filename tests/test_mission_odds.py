@@ -0,0 +1,60 @@
+import random
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mission_odds import (
+    FIN_PARTIAL,
+    PHASE_SCORES,
+    SALVAGE_SCORE,
+    ai_mission_odds,
+    final_outcome,
+    mission_outcome_odds,
+    momentum,
+    phase_tier,
+)
+
+
+def simulate_mission(modifiers, rng):
+    results = [phase_tier(rng.randint(1, 20) + m) for m in modifiers]
+    score = sum(PHASE_SCORES[r] for r in results)
+    total = rng.randint(1, 20) + momentum(score, len(results))
+    if all(PHASE_SCORES[r] >= 3 for r in results) and score >= SALVAGE_SCORE:
+        total = max(total, FIN_PARTIAL)
+    return final_outcome(total)
+
+
+class TestMissionOdds(unittest.TestCase):
+    def test_exact_odds_match_simulation(self):
+        modifiers = (4, 7, 2)
+        odds = mission_outcome_odds(modifiers)
+        self.assertAlmostEqual(sum(odds.values()), 1.0)
+
+        rng = random.Random(7)
+        trials = 40000
+        counts = {}
+        for _ in range(trials):
+            outcome = simulate_mission(modifiers, rng)
+            counts[outcome] = counts.get(outcome, 0) + 1
+        for outcome, p in odds.items():
+            self.assertAlmostEqual(counts.get(outcome, 0) / trials, p, delta=0.01)
+
+    def test_tables_are_memoized(self):
+        self.assertIs(mission_outcome_odds((3, 3, 3)), mission_outcome_odds((3, 3, 3)))
+
+    def test_ai_odds(self):
+        # Impossible DC: only natural 1s and misses
+        odds = ai_mission_odds(((40, 0),) * 3)
+        self.assertAlmostEqual(odds["success"], 0.0)
+        self.assertAlmostEqual(odds["failure"], 1 - 0.95 ** 3)
+
+        # Trivial DC: every non-1 roll succeeds
+        odds = ai_mission_odds(((1, 0),) * 3)
+        self.assertAlmostEqual(odds["success"], 0.95 ** 3)
+        self.assertAlmostEqual(odds["partial"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import government_news_system
+from government_news_system import GovernmentNewsSystem
+
+
+class TestNewsFeed(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive = os.path.join(self.tmp.name, "news.jsonl")
+        self.news = GovernmentNewsSystem(archive_path=self.archive)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def archived(self):
+        with open(self.archive) as f:
+            return [json.loads(line) for line in f]
+
+    def test_current_news_ranks_priority_then_recency(self):
+        general = self.news.generate_news_story("general", {})
+        self.news.set_turn(1)
+        killed = self.news.generate_news_story("political_assassination", {"survived": False})
+        survived = self.news.generate_news_story("political_assassination", {"survived": True})
+        top = self.news.get_current_news(limit=10)
+        self.assertEqual(top[:2], [killed, survived])
+        self.assertIn(general, top)
+        self.assertEqual(self.news.get_current_news(limit=1), [killed])
+        self.assertEqual(killed["turn"], 1)
+
+    def test_breaking_news_returns_most_recent(self):
+        stories = [self.news.generate_news_story("political_assassination", {"survived": True}) for _ in range(4)]
+        self.assertEqual(self.news.get_breaking_news(2), stories[2:])
+        self.assertEqual(self.news.get_breaking_news(), stories)
+
+    def test_category_ring_is_bounded(self):
+        size = government_news_system.NEWS_CATEGORY_RING_SIZE
+        stories = [self.news.generate_news_story("general", {}) for _ in range(size + 3)]
+        self.assertEqual(len(self.news.news_stories), size)
+        self.assertNotIn(stories[0], self.news.get_current_news(limit=size + 3))
+        self.assertEqual([s["story_id"] for s in self.archived()], [s["story_id"] for s in stories[:3]])
+
+    def test_retention_window_archives_old_stories(self):
+        old = self.news.generate_news_story("general", {})
+        self.news.set_turn(government_news_system.NEWS_RETENTION_TURNS)
+        fresh = self.news.generate_news_story("general", {})
+        self.news.set_turn(government_news_system.NEWS_RETENTION_TURNS + 1)
+        self.assertEqual(self.news.news_stories, [fresh])
+        self.assertEqual(self.news.get_current_news(), [fresh])
+        self.assertEqual(self.archived()[0]["content"], old["content"])
+
+
+if __name__ == "__main__":
+    unittest.main()
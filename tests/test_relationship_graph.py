@@ -0,0 +1,122 @@
+import io
+import os
+import tempfile
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai_world_controller import AITravelerTeam
+from relationship_graph import RelationshipGraph
+from dialogue_system import PLAYER_NODE, DialogueManager
+from messenger_system import DynamicWorldEventsSystem
+from world_generation import TravelersWorldGenerator
+
+
+class TestRelationshipGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = RelationshipGraph()
+        for a, b in (("a", "b"), ("b", "c"), ("c", "d"), ("x", "y")):
+            self.graph.add_edge(a, b, "contact", 0.8)
+        self.graph.add_edge("a", "d", "host_bond", 0.2)
+
+    def test_neighbourhood_queries(self):
+        self.assertEqual(self.graph.within_hops("a", 2, edge_type="contact"), {"b": 1, "c": 2})
+        self.assertEqual(self.graph.within_hops("a", 1), {"b": 1, "d": 1})
+        self.assertEqual({n for n, _, _ in self.graph.neighbors("a", min_weight=0.5)}, {"b"})
+
+    def test_shortest_path_prefers_strong_ties_when_weighted(self):
+        self.assertEqual(self.graph.shortest_path("a", "d"), ["a", "d"])
+        self.assertEqual(self.graph.shortest_path("a", "d", weighted=True), ["a", "b", "c", "d"])
+        self.assertIsNone(self.graph.shortest_path("a", "x"))
+
+    def test_weight_updates_without_rebuild(self):
+        self.graph.build()
+        self.graph.adjust_weight("a", "b", "contact", 0.5)
+        self.assertFalse(self.graph._dirty)
+        self.assertEqual(self.graph.neighbors("b", "contact", min_weight=1.0), [("a", "contact", 1.0)])
+
+    def test_min_cut_takes_the_lightest_links(self):
+        graph = RelationshipGraph()
+        for a, b, w in (("s", "a", 1.0), ("s", "b", 1.0), ("a", "c", 0.3), ("b", "c", 0.4), ("c", "t", 5.0)):
+            graph.add_edge(a, b, "link", w)
+        self.assertEqual(graph.min_cut(["s"], ["t"]), [("a", "c"), ("b", "c")])
+        self.assertEqual(graph.min_cut(["s"], ["t"], blocked={frozenset(("a", "c"))}), [("b", "c")])
+        self.assertEqual(graph.min_cut(["s"], ["x"]), [])
+
+    def test_communities_split_components(self):
+        labels = self.graph.communities()
+        self.assertEqual(labels["a"], labels["d"])
+        self.assertEqual(labels["x"], labels["y"])
+        self.assertNotEqual(labels["a"], labels["x"])
+
+
+class TestGraphConsumers(unittest.TestCase):
+    def test_world_contacts_load_into_graph(self):
+        world = TravelersWorldGenerator(seed=42)
+        npc = world.npcs[0]
+        self.assertIs(world.get_npc_by_id(npc.id), npc)
+        known = {other.id for other in world.get_npcs_knowing(npc.id)}
+        self.assertTrue(set(npc.contacts) <= known)
+        self.assertTrue(known <= {n.id for n in world.get_npc_network(npc.id, hops=1)})
+
+    def test_host_bonds_survive_world_reload(self):
+        world = TravelersWorldGenerator(seed=42)
+        with redirect_stdout(io.StringIO()):
+            team = AITravelerTeam("T-1", 2, "Seattle", [], world_generator=world)
+        bonds = {life["npc_id"]: life["npc_relationships"] for life in team.host_lives}
+        self.assertEqual(world.host_bonds, bonds)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "world.json")
+            world.save_world(path)
+            reloaded = TravelersWorldGenerator(seed=7)
+            reloaded.load_world(path)
+        for host_id, contacts in bonds.items():
+            self.assertEqual(reloaded.relationship_graph.kind_of(host_id), "host")
+            ties = {other: weight for other, _, weight in reloaded.relationship_graph.neighbors(host_id, "host_bond")}
+            self.assertEqual(set(ties), set(contacts))
+            for contact_id, weight in contacts.items():
+                self.assertAlmostEqual(ties[contact_id], weight)
+
+    def test_dialogue_levels_live_in_graph(self):
+        manager = DialogueManager()
+        manager.update_relationship("Marcy", 0.7)
+        self.assertEqual(manager.get_npc_relationship("Marcy"), 1.0)
+        self.assertEqual(manager.npc_relationships, {"Marcy": 1.0})
+
+    def test_consumers_share_the_world_graph(self):
+        world = TravelersWorldGenerator(seed=42)
+        graph = world.relationship_graph
+        with redirect_stdout(io.StringIO()):
+            team = AITravelerTeam("T-1", 1, "Seattle", [], world_generator=world)
+            events = DynamicWorldEventsSystem()
+        events.use_relationship_graph(graph)
+        manager = DialogueManager(graph, npc_lookup=world.get_npc_id_by_name)
+
+        host_id = team.host_lives[0]["npc_id"]
+        host_name = team.host_lives[0]["name"]
+        manager.update_relationship(host_name, 0.2)
+        # Dialogue ties land on the host's NPC id, next to its contacts and host bonds
+        self.assertAlmostEqual(graph.weight(PLAYER_NODE, host_id, "dialogue"), 0.7)
+        self.assertEqual(manager.npc_relationships, {host_name: 0.7})
+        self.assertEqual(manager.get_npc_relationship(host_name.upper()), 0.7)
+        knowing = world.get_npcs_knowing(host_id, faction="faction")
+        self.assertTrue(all(npc.faction == "faction" for npc in knowing))
+        self.assertIn(PLAYER_NODE, graph.within_hops(host_id, 1))
+
+        # Traveler teammate ties sit in the same graph, but recruitment only walks them
+        team_record = next(iter(events.ai_traveler_teams.values()))
+        first, second = (m["designation"] for m in team_record["members"][:2])
+        self.assertEqual(graph.kind_of(first), "traveler")
+        self.assertEqual(graph.weight(first, second, "teammate"), 0.8)
+        events.defected_travelers = {first: {}}
+        _, member, contact, hops = events._network_recruitment_approach([team_record])
+        self.assertEqual((contact, hops), (first, 1))
+        self.assertIn(member["designation"], {m["designation"] for m in team_record["members"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
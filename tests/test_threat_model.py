@@ -0,0 +1,65 @@
+import random
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dynamic_mission_system import TREND_WINDOW, DynamicMissionSystem
+from metric_series import MetricStore
+
+
+class TestThreatModel(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+        self.system = DynamicMissionSystem()
+        self.system.metrics = MetricStore()
+        self.world = {"timeline_stability": 0.5, "faction_influence": 0.6, "traveler_exposure_risk": 0.2}
+
+    def test_threats_ranked_by_level_times_urgency(self):
+        self.system._refresh_threat_sources(self.world, self.world)
+        ranked = self.system.top_threats()
+        self.assertEqual([t.threat_type for t in ranked], ["faction_operation", "timeline_crisis"])
+        self.assertEqual(self.system.top_threats(1), ranked[:1])
+
+    def test_only_changed_sources_recompute(self):
+        self.system._refresh_threat_sources(self.world, self.world)
+        self.assertEqual(self.system._refresh_threat_sources(self.world, self.world), [])
+
+        with mock.patch.object(self.system, "_identify_faction_activity", wraps=self.system._identify_faction_activity) as spy:
+            self.world["timeline_stability"] = 0.9
+            self.assertEqual(self.system._refresh_threat_sources(self.world, self.world), ["timeline_crisis"])
+            spy.assert_not_called()
+        self.assertEqual([t.threat_type for t in self.system.top_threats()], ["faction_operation"])
+
+    def test_trend_change_refreshes_urgency(self):
+        self.system._refresh_threat_sources(self.world, self.world)
+        urgency = self.system._source_threats["faction_operation"][0].urgency
+        for turn, influence in enumerate((0.3, 0.4, 0.5, 0.6, 0.7)):
+            self.system.metrics.record(turn, {"faction_influence": influence})
+        # The scalar is unchanged, but its trend now pushes the threat's urgency up
+        refreshed = self.system._refresh_threat_sources(self.world, self.world)
+        self.assertIn("faction_operation", refreshed)
+        self.assertAlmostEqual(self.system._source_threats["faction_operation"][0].urgency,
+                               min(1.0, urgency + 0.1 * TREND_WINDOW))
+
+    def test_new_events_are_analysed_incrementally(self):
+        game_state = {"government_responses": [{"intensity": 0.9, "location": "Seattle"}]}
+        self.system._refresh_threat_sources(self.world, game_state)
+        game_state["government_responses"].append({"intensity": 0.2})
+        game_state["government_responses"].append({"intensity": 0.7, "location": "Tacoma"})
+        self.assertIn("government_responses", self.system._refresh_threat_sources(self.world, game_state))
+        self.assertEqual(self.system._event_cursors["government_responses"][1], 3)
+
+        locations = [t.location for t in self.system.top_threats() if t.threat_type == "government_response"]
+        self.assertEqual(locations, ["Seattle", "Tacoma"])
+
+    def test_assess_tops_up_with_proactive_mission(self):
+        threats = self.system.assess_world_threats({"timeline_stability": 0.9}, {})
+        self.assertEqual(len(threats), 1)
+        self.assertIs(self.system.active_threats, threats)
+
+
+if __name__ == "__main__":
+    unittest.main()
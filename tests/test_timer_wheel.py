@@ -0,0 +1,80 @@
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from timer_wheel import TimerWheel
+from time_system import TimeSystem
+
+
+class TestTimerWheel(unittest.TestCase):
+    def test_timers_fire_on_their_turn(self):
+        wheel = TimerWheel(current_turn=5, slots=4, levels=2)
+        expected = {i: 6 + (i * 7) % 300 for i in range(100)}
+        for payload, turn in expected.items():
+            wheel.schedule(turn, payload=payload)
+
+        for turn in range(6, 310):
+            for payload in wheel.advance(turn):
+                self.assertEqual(expected[payload], turn)
+        self.assertEqual(len(wheel), 0)
+
+    def test_cancel_and_remaining(self):
+        wheel = TimerWheel()
+        keep = wheel.schedule_in(3, payload="keep")
+        drop = wheel.schedule_in(3, payload="drop")
+        self.assertEqual(wheel.remaining(keep), 3)
+        self.assertTrue(wheel.cancel(drop))
+        self.assertEqual(wheel.advance(3), ["keep"])
+        self.assertEqual(wheel.remaining(keep), 0)
+
+    def test_callback_receives_payload(self):
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(2, fired.append, "event")
+        wheel.tick()
+        self.assertEqual(fired, [])
+        wheel.tick()
+        self.assertEqual(fired, ["event"])
+
+    def test_overflow_timers(self):
+        wheel = TimerWheel(slots=2, levels=2)
+        wheel.schedule(50, payload="late")
+        self.assertEqual(wheel.advance(49), [])
+        self.assertEqual(wheel.advance(50), ["late"])
+
+
+class TestTimeSystemScheduledEvents(unittest.TestCase):
+    def test_scheduled_event_triggers_on_date(self):
+        time_system = TimeSystem("2018-04-13")
+        time_system.advance_one_day()
+        self.assertIsNone(time_system.check_scheduled_events())
+        time_system.advance_one_day()
+        event = time_system.check_scheduled_events()
+        self.assertIsNotNone(event)
+        self.assertTrue(event["triggered"])
+        self.assertIn("Tax Day", event["description"])
+        self.assertIsNone(time_system.check_scheduled_events())
+
+    def test_time_context_is_shared_and_precomputed(self):
+        time_system = TimeSystem("2018-12-24")
+        context = time_system.get_time_context()
+        self.assertIs(context, time_system.get_time_context())
+        self.assertEqual(context["day_of_week"], "Monday")
+
+        time_system.advance_one_day()
+        context = time_system.get_time_context()
+        self.assertEqual(context.holiday, "Christmas Day")
+        self.assertEqual(context.seasonal_event, "Christmas")
+        self.assertEqual(context.season, "Winter")
+        self.assertEqual(context["turn"], 2)
+
+        for _ in range(800):
+            time_system.advance_one_day()
+        self.assertEqual(time_system.get_current_date_short(), "2021-03-04")
+        self.assertEqual(time_system.get_day_of_week(), time_system.current_date.strftime("%A"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+import io
+import random
+import unittest
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from messenger_system import GlobalWorldStateTracker
+from metric_series import campaign_metrics
+from timer_wheel import TimerWheel
+
+
+def fresh_tracker():
+    """A tracker of its own, bypassing the process-wide singleton, without the sample effects"""
+    tracker = object.__new__(GlobalWorldStateTracker)
+    with redirect_stdout(io.StringIO()):
+        tracker.__init__()
+    tracker.turn_timers = TimerWheel(current_turn=tracker.turn_tracker)
+    tracker.ongoing_effects = {}
+    tracker._compiled_effects = {}
+    tracker._negative_effect_ids = set()
+    tracker._world_events = {}
+    tracker._critical_event_count = 0
+    return tracker
+
+
+def run_turns(tracker, turns):
+    with redirect_stdout(io.StringIO()):
+        for _ in range(turns):
+            tracker.process_turn()
+
+
+class TestEffectCompilation(unittest.TestCase):
+    def setUp(self):
+        self.tracker = fresh_tracker()
+
+    def test_malformed_values_are_skipped(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertIsNone(self.tracker.compile_effect(
+                {"type": "attribute_change", "target": "timeline_stability", "value": "1.2.3"}))
+            compiled = self.tracker.compile_effects([
+                {"type": "attribute_change", "target": "timeline_stability", "value": "1.2.3"},
+                {"type": "attribute_change", "target": "timeline_stability", "value": "-0.1", "operation": "add"},
+            ])
+        self.assertIn("Failed to convert", out.getvalue())
+        self.assertEqual(len(compiled), 1)
+        before = self.tracker.world_state_cache["timeline_stability"]
+        self.tracker.apply_compiled_effects(compiled)
+        self.assertAlmostEqual(self.tracker.world_state_cache["timeline_stability"], before - 0.1)
+
+
+class TestWorldEvents(unittest.TestCase):
+    def setUp(self):
+        self.tracker = fresh_tracker()
+
+    def test_events_expire_after_their_duration(self):
+        event = self.tracker.add_world_event({"type": "blackout", "value": "Seattle", "duration": 3})
+        self.assertEqual(event["expires_turn"], 3)
+        run_turns(self.tracker, 2)
+        self.assertEqual(self.tracker.active_world_events, [event])
+        run_turns(self.tracker, 1)
+        self.assertEqual(self.tracker.active_world_events, [])
+        self.assertFalse(event["active"])
+
+    def test_readding_an_event_refreshes_it(self):
+        self.tracker.add_world_event({"type": "blackout", "value": "Seattle", "duration": 2})
+        self.tracker.add_world_event({"type": "blackout", "value": "Portland", "duration": 2})
+        run_turns(self.tracker, 1)
+        refreshed = self.tracker.add_world_event({"type": "blackout", "value": "Seattle", "duration": 3})
+        self.assertEqual(len(self.tracker.active_world_events), 2)
+        self.assertEqual(refreshed["start_turn"], 0)
+        run_turns(self.tracker, 1)
+        # The replaced event's timer was cancelled; only Portland expires on turn 2
+        self.assertEqual(self.tracker.active_world_events, [refreshed])
+        run_turns(self.tracker, 2)
+        self.assertEqual(self.tracker.active_world_events, [])
+
+    def test_ongoing_world_event_effect_stays_bounded(self):
+        self.tracker.register_ongoing_effect("1_world_events", {
+            "effects": [{"type": "world_event", "target": "surveillance_sweep", "value": "citywide",
+                         "duration": 2}],
+            "duration": 6,
+            "expires_turn": 6,
+            "active": True,
+        })
+        for turn in range(1, 7):
+            run_turns(self.tracker, 1)
+            self.assertEqual(len(self.tracker.active_world_events), 1, turn)
+        run_turns(self.tracker, 2)
+        self.assertEqual(self.tracker.active_world_events, [])
+
+    def test_import_restores_expiry_turns(self):
+        self.tracker.add_world_event({"type": "blackout", "value": "Seattle", "duration": 4})
+        self.tracker.add_world_event({"type": "riot", "value": "Portland", "duration": 1})
+        run_turns(self.tracker, 1)
+        saved = self.tracker.export_world_state()
+        saved["active_world_events"].append({"type": "old", "value": "gone", "active": False})
+
+        restored = fresh_tracker()
+        with redirect_stdout(io.StringIO()):
+            restored.import_world_state(saved)
+        self.assertEqual([e["type"] for e in restored.active_world_events], ["blackout"])
+        run_turns(restored, 2)
+        self.assertEqual(len(restored.active_world_events), 1)
+        run_turns(restored, 1)
+        self.assertEqual(restored.active_world_events, [])
+
+
+class TestChangeIndex(unittest.TestCase):
+    def setUp(self):
+        self.tracker = fresh_tracker()
+        self.tracker.all_world_changes = []
+        self.tracker._rebuild_change_index()
+
+    def test_recent_changes_match_linear_scan(self):
+        rng = random.Random(4)
+        tracker = self.tracker
+        with redirect_stdout(io.StringIO()):
+            for _ in range(30):
+                for _ in range(rng.randrange(3)):
+                    tracker.track_change({"category": "missions", "description": "op"})
+                tracker.process_turn()
+        for turns_back in (0, 1, 3, 10, 100):
+            cutoff = tracker.turn_tracker - turns_back
+            expected = [c for c in tracker.all_world_changes if c["turn_number"] >= cutoff]
+            self.assertEqual(tracker.get_recent_changes(turns_back), expected)
+
+        restored = fresh_tracker()
+        with redirect_stdout(io.StringIO()):
+            restored.import_world_state(tracker.export_world_state())
+        self.assertEqual(restored.get_recent_changes(5), tracker.get_recent_changes(5))
+
+    def test_status_counters_follow_expiry(self):
+        tracker = self.tracker
+        negative = {"effects": [{"type": "attribute_change", "target": "timeline_stability",
+                                 "value": -0.01, "operation": "add", "note": "negative"}],
+                    "duration": 2, "expires_turn": 2, "active": True}
+        for effect_id in ("1_a", "2_b"):
+            tracker.register_ongoing_effect(effect_id, dict(negative))
+        self.assertEqual(tracker.calculate_world_status(), "UNSTABLE")
+        # Re-registering an effect without a negative marker drops it from the count
+        tracker.register_ongoing_effect("2_b", dict(negative, effects=[]))
+        self.assertEqual(tracker._negative_effect_ids, {"1_a"})
+        self.assertEqual(tracker.calculate_world_status(), "STABLE")
+
+        tracker.add_world_event({"type": "alert", "value": "CRITICAL breach", "duration": 3})
+        tracker.add_world_event({"type": "alert", "value": "CRITICAL breach", "duration": 3})
+        self.assertEqual(tracker._critical_event_count, 1)
+        self.assertEqual(tracker.calculate_world_status(), "CRITICAL")
+        run_turns(tracker, 2)
+        self.assertEqual(tracker._negative_effect_ids, set())
+        run_turns(tracker, 1)
+        self.assertEqual(tracker._critical_event_count, 0)
+        self.assertEqual(tracker.calculate_world_status(), "STABLE")
+
+
+class TestMetricHistory(unittest.TestCase):
+    def setUp(self):
+        campaign_metrics.clear()
+
+    def tearDown(self):
+        campaign_metrics.clear()
+
+    def test_import_replaces_campaign_history(self):
+        tracker = fresh_tracker()
+        with redirect_stdout(io.StringIO()):
+            for _ in range(4):
+                tracker.process_turn()
+            saved = tracker.export_world_state()
+            self.assertEqual(campaign_metrics.history("timeline_stability")[0], [1, 2, 3, 4])
+            tracker.import_world_state(saved)
+            self.assertEqual(campaign_metrics.history("timeline_stability")[0], [1, 2, 3, 4])
+
+            # A save from before metric history existed must not inherit this campaign's trends
+            del saved["metric_history"]
+            tracker.import_world_state(saved)
+        self.assertNotIn("timeline_stability", campaign_metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,81 @@
 # time_system.py
 import random
 from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+
+
+# Days of calendar attributes precomputed at a time; extended as the campaign runs on
+CALENDAR_HORIZON_DAYS = 730
+
+# Major holidays, keyed by (month, day)
+HOLIDAYS = {
+    (1, 1): "New Year's Day",
+    (7, 4): "Independence Day",
+    (12, 25): "Christmas Day"
+}
+
+SEASONS = {
+    12: "Winter", 1: "Winter", 2: "Winter",
+    3: "Spring", 4: "Spring", 5: "Spring",
+    6: "Summer", 7: "Summer", 8: "Summer",
+    9: "Fall", 10: "Fall", 11: "Fall"
+}
+
+# Fixed-date seasonal celebrations, keyed by (month, day)
+SEASONAL_EVENTS = {
+    (12, 25): "Christmas",
+    (12, 31): "New Year's Eve",
+    (1, 1): "New Year's Day",
+    (7, 4): "Independence Day",
+    (11, 25): "Thanksgiving",
+    (10, 31): "Halloween",
+    (2, 14): "Valentine's Day",
+    (3, 17): "St. Patrick's Day",
+    (5, 5): "Cinco de Mayo",
+    (6, 19): "Juneteenth"
+}
+
+class CalendarDay(NamedTuple):
+    """Date attributes for one day of the campaign, computed once"""
+    current_date: datetime
+    date: str
+    date_short: str
+    day_of_week: str
+    is_weekend: bool
+    holiday: Optional[str]
+    season: str
+    seasonal_event: Optional[str]
+
+
+class TimeContext(NamedTuple):
+    """Immutable snapshot of the current day, shared by every subsystem for the turn
+
+    Supports the mapping-style access (context["date"]) that callers of the
+    old get_time_context() dict use.
+    """
+    current_date: datetime
+    date: str
+    date_short: str
+    day_of_week: str
+    is_weekend: bool
+    is_business_hours: bool
+    holiday: Optional[str]
+    season: str
+    seasonal_event: Optional[str]
+    turn: int
+    days_elapsed: int
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
 
 class TimeSystem:
     def __init__(self, start_date="2018-03-15"):
@@ -10,6 +85,11 @@ class TimeSystem:
         self.current_turn = 1
         self.days_elapsed = 0
         
+        # Precomputed day attributes, indexed by days since start_date
+        self.calendar = []
+        self._extend_calendar(CALENDAR_HORIZON_DAYS)
+        self.context = self._build_context()
+        
         # Time-based events and schedules
         self.daily_events = []
         self.weekly_events = []
@@ -18,8 +98,8 @@ class TimeSystem:
         # Mission time tracking
         self.active_missions = {}  # mission_id: {"start_date": date, "estimated_duration": days}
         
-        # World event scheduling
-        self.scheduled_events = []
+        # World event scheduling, keyed by calendar date
+        self.scheduled_events = {}
         
         # Initialize some scheduled events
         self.initialize_scheduled_events()
@@ -38,20 +118,59 @@ class TimeSystem:
         
         for event in historical_events:
             event_date = datetime.strptime(event["date"], "%Y-%m-%d")
-            self.scheduled_events.append({
+            self.schedule_event({
                 "date": event_date,
                 "type": event["type"],
                 "description": event["description"],
                 "triggered": False
             })
     
+    def schedule_event(self, event):
+        """Register a dated world event under its calendar date"""
+        self.scheduled_events.setdefault(event["date"].date(), []).append(event)
+    
+    def _extend_calendar(self, days):
+        """Precompute attributes for the next `days` days of the campaign"""
+        for offset in range(len(self.calendar), len(self.calendar) + days):
+            date = self.start_date + timedelta(days=offset)
+            key = (date.month, date.day)
+            self.calendar.append(CalendarDay(
+                current_date=date,
+                date=date.strftime("%B %d, %Y"),
+                date_short=date.strftime("%Y-%m-%d"),
+                day_of_week=date.strftime("%A"),
+                is_weekend=date.weekday() >= 5,
+                holiday=HOLIDAYS.get(key),
+                season=SEASONS[date.month],
+                seasonal_event=SEASONAL_EVENTS.get(key)
+            ))
+    
+    def _build_context(self):
+        """Build the shared TimeContext for the current day"""
+        if self.days_elapsed >= len(self.calendar):
+            self._extend_calendar(CALENDAR_HORIZON_DAYS)
+        day = self.calendar[self.days_elapsed]
+        return TimeContext(
+            current_date=day.current_date,
+            date=day.date,
+            date_short=day.date_short,
+            day_of_week=day.day_of_week,
+            is_weekend=day.is_weekend,
+            is_business_hours=not day.is_weekend,
+            holiday=day.holiday,
+            season=day.season,
+            seasonal_event=day.seasonal_event,
+            turn=self.current_turn,
+            days_elapsed=self.days_elapsed
+        )
+    
     def get_current_date_string(self):
         """Get current date as a formatted string"""
-        return self.current_date.strftime("%B %d, %Y")
+        return self.context.date
     
     def get_current_date_short(self):
         """Get current date as short format"""
-        return self.current_date.strftime("%Y-%m-%d")
+        return self.context.date_short
     
     def get_current_hour(self):
         """Get current hour of the day (0-23) for daily routine management"""
@@ -61,11 +180,11 @@ class TimeSystem:
     
     def get_day_of_week(self):
         """Get current day of the week"""
-        return self.current_date.strftime("%A")
+        return self.context.day_of_week
     
     def is_weekend(self):
         """Check if current date is weekend"""
-        return self.current_date.weekday() >= 5
+        return self.context.is_weekend
     
     def is_business_hours(self):
         """Check if it's during business hours (simplified)"""
@@ -78,17 +197,14 @@ class TimeSystem:
         self.current_turn += 1
         self.days_elapsed += 1
         
-        # Check for scheduled events
-        self.check_scheduled_events()
+        self.context = self._build_context()
         
         return self.get_current_date_string()
     
     def check_scheduled_events(self):
         """Check if any scheduled events should trigger today"""
-        today = self.current_date.date()
-        
-        for event in self.scheduled_events:
-            if not event["triggered"] and event["date"].date() == today:
+        for event in self.scheduled_events.get(self.current_date.date(), ()):
+            if not event["triggered"]:
                 event["triggered"] = True
                 return event
         
@@ -121,14 +237,7 @@ class TimeSystem:
     
     def get_time_context(self):
         """Get current time context for events and missions"""
-        return {
-            "date": self.get_current_date_string(),
-            "day_of_week": self.get_day_of_week(),
-            "is_weekend": self.is_weekend(),
-            "is_business_hours": self.is_business_hours(),
-            "turn": self.current_turn,
-            "days_elapsed": self.days_elapsed
-        }
+        return self.context
     
     def get_date_difference(self, other_date):
         """Get the difference in days between current date and another date"""
@@ -138,33 +247,15 @@ class TimeSystem:
     
     def is_holiday(self):
         """Check if current date is a major holiday"""
-        month = self.current_date.month
-        day = self.current_date.day
-        
-        holidays = [
-            (1, 1, "New Year's Day"),
-            (7, 4, "Independence Day"),
-            (12, 25, "Christmas Day")
-        ]
-        
-        for h_month, h_day, h_name in holidays:
-            if month == h_month and day == h_day:
-                return h_name
-        
-        return None
+        return self.context.holiday
+    
+    def get_seasonal_event(self):
+        """Get the seasonal celebration falling on the current date, if any"""
+        return self.context.seasonal_event
     
     def get_season(self):
         """Get current season based on date"""
-        month = self.current_date.month
-        
-        if month in [12, 1, 2]:
-            return "Winter"
-        elif month in [3, 4, 5]:
-            return "Spring"
-        elif month in [6, 7, 8]:
-            return "Summer"
-        else:
-            return "Fall"
+        return self.context.season
     
     def format_time_passed(self, start_date):
         """Format how much time has passed since a start date"""
@@ -0,0 +1,149 @@
+# timer_wheel.py
+"""
+Hierarchical timer wheel for turn-based countdowns.
+
+Subsystems register an expiration turn (and optionally a callback) instead of
+decrementing a counter on every pending item each turn. Advancing the wheel by
+one turn only touches the slot for that turn, plus an occasional cascade of the
+next coarser slot, so per-turn cost depends on what fires rather than on how
+much is still pending.
+"""
+
+import heapq
+import itertools
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Timer:
+    """A single scheduled expiration"""
+
+    __slots__ = ("timer_id", "turn", "callback", "payload", "cancelled")
+
+    def __init__(self, timer_id: int, turn: int, callback: Optional[Callable], payload: Any):
+        self.timer_id = timer_id
+        self.turn = turn
+        self.callback = callback
+        self.payload = payload
+        self.cancelled = False
+
+
+class TimerWheel:
+    """Turn-indexed hierarchical timing wheel
+
+    Level 0 holds timers due within the next `slots` turns, one slot per turn.
+    Each higher level covers `slots` times the span of the level below and is
+    cascaded down when the lower level wraps. Timers beyond the top level wait
+    in an overflow heap.
+    """
+
+    def __init__(self, current_turn: int = 0, slots: int = 64, levels: int = 3):
+        self.current_turn = current_turn
+        self.slots = slots
+        self.levels = levels
+        self._wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._overflow = []  # heap of (turn, timer_id, timer)
+        self._timers: Dict[int, Timer] = {}
+        self._ids = itertools.count(1)
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, timer_id):
+        return timer_id in self._timers
+
+    def schedule(self, turn: int, callback: Optional[Callable] = None, payload: Any = None) -> int:
+        """Schedule a timer to fire when the wheel reaches `turn`; returns its id
+
+        `callback`, if given, is called with `payload` when the timer fires.
+        Turns that are already past fire on the next advance.
+        """
+        timer = Timer(next(self._ids), max(int(turn), self.current_turn + 1), callback, payload)
+        self._timers[timer.timer_id] = timer
+        self._insert(timer)
+        return timer.timer_id
+
+    def schedule_in(self, turns: int, callback: Optional[Callable] = None, payload: Any = None) -> int:
+        """Schedule a timer `turns` turns from now"""
+        return self.schedule(self.current_turn + max(1, int(turns)), callback, payload)
+
+    def cancel(self, timer_id: int) -> bool:
+        """Cancel a pending timer (removed lazily when its slot is reached)"""
+        timer = self._timers.pop(timer_id, None)
+        if timer is None:
+            return False
+        timer.cancelled = True
+        return True
+
+    def reschedule(self, timer_id: int, turn: int) -> Optional[int]:
+        """Move a pending timer to a new turn; returns the new timer id"""
+        timer = self._timers.get(timer_id)
+        if timer is None:
+            return None
+        self.cancel(timer_id)
+        return self.schedule(turn, timer.callback, timer.payload)
+
+    def expires_at(self, timer_id: int) -> Optional[int]:
+        """Turn on which a pending timer fires, or None"""
+        timer = self._timers.get(timer_id)
+        return timer.turn if timer else None
+
+    def remaining(self, timer_id: int) -> int:
+        """Turns left before a pending timer fires (0 if fired or cancelled)"""
+        timer = self._timers.get(timer_id)
+        return max(0, timer.turn - self.current_turn) if timer else 0
+
+    def tick(self) -> List[Any]:
+        """Advance one turn and return the payloads of the timers that fired"""
+        return self.advance(self.current_turn + 1)
+
+    def advance(self, to_turn: int) -> List[Any]:
+        """Advance the wheel to `to_turn`, firing due timers in turn order"""
+        fired = []
+        while self.current_turn < to_turn:
+            self.current_turn += 1
+            self._cascade()
+            slot = self._wheels[0][self.current_turn % self.slots]
+            if not slot:
+                continue
+            due, slot[:] = slot[:], []
+            for timer in due:
+                if timer.cancelled:
+                    continue
+                del self._timers[timer.timer_id]
+                if timer.callback is not None:
+                    timer.callback(timer.payload)
+                fired.append(timer.payload)
+        return fired
+
+    def pending(self) -> List[Any]:
+        """Payloads of all pending timers ordered by expiration turn"""
+        timers = sorted(self._timers.values(), key=lambda t: (t.turn, t.timer_id))
+        return [t.payload for t in timers]
+
+    def _insert(self, timer: Timer):
+        delta = timer.turn - self.current_turn
+        span = 1
+        for level in range(self.levels):
+            if delta < span * self.slots:
+                self._wheels[level][(timer.turn // span) % self.slots].append(timer)
+                return
+            span *= self.slots
+        heapq.heappush(self._overflow, (timer.turn, timer.timer_id, timer))
+
+    def _cascade(self):
+        """Redistribute coarser slots whose block starts at the current turn"""
+        span = 1
+        for level in range(1, self.levels):
+            span *= self.slots
+            if self.current_turn % span:
+                break
+            slot = self._wheels[level][(self.current_turn // span) % self.slots]
+            moved, slot[:] = slot[:], []
+            for timer in moved:
+                if not timer.cancelled:
+                    self._insert(timer)
+        top_span = self.slots ** self.levels
+        while self._overflow and self._overflow[0][0] - self.current_turn < top_span:
+            timer = heapq.heappop(self._overflow)[2]
+            if not timer.cancelled:
+                self._insert(timer)
@@ -8,6 +8,10 @@ from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import json
 
+from dice_math import outcome_pmf
+from event_scheduler import RateScheduler
+from legislature import PARTIES, MemberTable, US_STATES, VoteEngine, other_party, random_member_name
+
 class PoliticalParty(Enum):
     DEMOCRAT = "Democrat"
     REPUBLICAN = "Republican"
@@ -35,6 +39,54 @@ class D20Result(Enum):
     FAILURE = "Failure"
     CRITICAL_FAILURE = "Critical Failure"
 
+def classify_d20_result(roll, total, difficulty_class):
+    """Map a government-decision roll to its D20Result band (natural 20/1 shift one band)"""
+    if total >= difficulty_class + 5:
+        result = D20Result.CRITICAL_SUCCESS
+    elif total >= difficulty_class:
+        result = D20Result.SUCCESS
+    elif total >= difficulty_class - 5:
+        result = D20Result.PARTIAL_SUCCESS
+    else:
+        result = D20Result.FAILURE
+    
+    # Natural 20 and Natural 1 modifiers
+    if roll == 20:
+        if result == D20Result.SUCCESS:
+            result = D20Result.CRITICAL_SUCCESS
+        elif result == D20Result.PARTIAL_SUCCESS:
+            result = D20Result.SUCCESS
+    elif roll == 1:
+        if result == D20Result.FAILURE:
+            result = D20Result.CRITICAL_FAILURE
+        elif result == D20Result.PARTIAL_SUCCESS:
+            result = D20Result.FAILURE
+    return result
+
+# Per-turn chance of each scheduled political action; "cabinet", "agency" and "party" apply to each member
+POLITICAL_ACTION_RATES = {
+    "cabinet": 0.1,
+    "vice_president": 0.15,
+    "legislative_event": 0.12,
+    "court_decision": 0.05,
+    "court_event": 0.06,
+    "federal_case": 0.1,
+    "judicial_event": 0.08,
+    "agency": 0.15,
+    "agency_coordination": 0.2,
+    "agency_event": 0.1,
+    "party": 0.12,
+    "party_competition": 0.15,
+    "party_event": 0.08,
+    "campaign_event": 0.15,
+    "new_legislation": 0.1,
+    "opinion_event": 0.1,
+    "political_events": 0.3,
+}
+
+# Per-turn chance that a bill at each status comes up for its next step
+BILL_STAGE_RATES = {"draft": 0.3, "committee": 0.2, "floor_vote": 0.15}
+
 class USPoliticalSystem:
     """Comprehensive US Political System that operates in real-time"""
     
@@ -68,6 +120,9 @@ class USPoliticalSystem:
         self.last_d20_rolls = []
         self.critical_events = []
         
+        # Chance-driven actions wake only on the turns they fire
+        self.scheduler = RateScheduler()
+        
         # Note: System will be initialized when explicitly called
         # to avoid duplicate initialization and ensure consistency
     
@@ -75,28 +130,7 @@ class USPoliticalSystem:
         """Roll D20 for government decisions with modifiers and difficulty class"""
         roll = random.randint(1, 20)
         total = roll + modifier
-        
-        # Determine result based on total vs difficulty class
-        if total >= difficulty_class + 5:
-            result = D20Result.CRITICAL_SUCCESS
-        elif total >= difficulty_class:
-            result = D20Result.SUCCESS
-        elif total >= difficulty_class - 5:
-            result = D20Result.PARTIAL_SUCCESS
-        else:
-            result = D20Result.FAILURE
-        
-        # Natural 20 and Natural 1 modifiers
-        if roll == 20:
-            if result == D20Result.SUCCESS:
-                result = D20Result.CRITICAL_SUCCESS
-            elif result == D20Result.PARTIAL_SUCCESS:
-                result = D20Result.SUCCESS
-        elif roll == 1:
-            if result == D20Result.FAILURE:
-                result = D20Result.CRITICAL_FAILURE
-            elif result == D20Result.PARTIAL_SUCCESS:
-                result = D20Result.FAILURE
+        result = classify_d20_result(roll, total, difficulty_class)
         
         # Store roll for tracking
         roll_record = {
@@ -116,6 +150,12 @@ class USPoliticalSystem:
         
         return result, total, roll
     
+    def d20_result_odds(self, modifier=0, difficulty_class=15):
+        """Exact probability of each D20Result for roll_d20(modifier, difficulty_class)"""
+        odds = dict.fromkeys(D20Result, 0.0)
+        odds.update(outcome_pmf(classify_d20_result, modifier, 0, (difficulty_class,)))
+        return odds
+    
     def get_d20_result_description(self, result):
         """Get description of D20 result"""
         descriptions = {
@@ -145,6 +185,7 @@ class USPoliticalSystem:
         # Generate random members for all branches
         self.executive_branch.generate_random_cabinet()
         self.legislative_branch.generate_random_members()
+        self.schedule_political_actions()
         
         # NOW display the status AFTER everything is set up
         print("✅ US Political System initialized with full complexity")
@@ -172,9 +213,40 @@ class USPoliticalSystem:
         liberal_justices = 9 - conservative_justices
         self.judicial_branch.supreme_court.set_composition(conservative_justices, liberal_justices)
         
+    def schedule_political_actions(self):
+        """Register every chance-driven or threshold-driven political action with the scheduler"""
+        scheduler = self.scheduler
+        rates = POLITICAL_ACTION_RATES
+        scheduler.clear()
+        
+        for position in self.executive_branch.cabinet:
+            scheduler.every("cabinet", position, rates["cabinet"])
+        scheduler.every("vice_president", None, rates["vice_president"])
+        scheduler.watch("presidential_crisis", None, lambda world_state: world_state.get("timeline_stability", 1.0) < 0.7)
+        scheduler.every("legislative_event", None, rates["legislative_event"])
+        for stage in ("court_decision", "court_event", "federal_case", "judicial_event"):
+            scheduler.every(stage, None, rates[stage])
+        for agency_name in self.federal_agencies.agencies:
+            scheduler.every("agency", agency_name, rates["agency"])
+        scheduler.every("agency_coordination", None, rates["agency_coordination"])
+        scheduler.every("agency_event", None, rates["agency_event"])
+        for party_name in self.political_parties.parties:
+            scheduler.every("party", party_name, rates["party"])
+        scheduler.every("party_competition", None, rates["party_competition"])
+        scheduler.every("party_event", None, rates["party_event"])
+        scheduler.watch("election_day", None, lambda world_state: self.elections.days_until_next_election() <= 0)
+        scheduler.every("campaign_event", None, rates["campaign_event"])
+        scheduler.every("new_legislation", None, rates["new_legislation"])
+        for bill in self.legislation.active_bills:
+            if bill["status"] in BILL_STAGE_RATES:
+                scheduler.once("bills", bill, BILL_STAGE_RATES[bill["status"]])
+        scheduler.every("opinion_event", None, rates["opinion_event"])
+        scheduler.every("political_events", None, rates["political_events"])
+    
     def process_political_turn(self, world_state):
         """Process one political turn - called each game turn"""
         self.turn_count += 1
+        self.scheduler.advance(world_state)
         
         print(f"\n🏛️  US Political System - Turn {self.turn_count}")
         print("=" * 60)
@@ -565,7 +637,7 @@ class USPoliticalSystem:
     
     def generate_political_events(self, world_state):
         """Generate random political events that affect the world"""
-        if random.random() < 0.3:  # 30% chance per turn
+        if self.scheduler.is_due("political_events"):
             event = self.generate_random_political_event(world_state)
             if event:
                 self.timeline_events.append(event)
@@ -1202,10 +1274,10 @@ class ExecutiveBranch:
         self.process_crisis_responses(world_state, political_system)
     
     def process_cabinet_actions(self, world_state, political_system):
-        """Process cabinet member actions"""
-        for position, member in self.cabinet.items():
-            if random.random() < 0.1:  # 10% chance per turn
-                self.process_cabinet_member_action(member, world_state, political_system)
+        """Process cabinet member actions due this turn"""
+        for position in political_system.scheduler.due("cabinet"):
+            if position in self.cabinet:
+                self.process_cabinet_member_action(self.cabinet[position], world_state, political_system)
     
     def process_cabinet_member_action(self, member, world_state, political_system):
         """Process a single cabinet member action"""
@@ -1486,8 +1558,8 @@ class President:
     
     def respond_to_crises(self, world_state, political_system):
         """Respond to ongoing crises with D20 system"""
-        # Check for timeline instability
-        if "timeline_stability" in world_state and world_state["timeline_stability"] < 0.7:
+        # Timeline instability wakes the president's crisis response
+        if political_system.scheduler.is_due("presidential_crisis") and "timeline_stability" in world_state:
             # President responds to timeline crisis
             response_effectiveness = min(0.8, self.approval_rating + self.political_capital)
             
@@ -1626,7 +1698,7 @@ class VicePresident:
     
     def perform_role_actions(self, world_state, political_system):
         """Perform actions based on current role"""
-        if random.random() < 0.15:  # 15% chance per turn
+        if political_system.scheduler.is_due("vice_president"):
             if self.current_role == "crisis_manager":
                 self.manage_crisis(world_state, political_system)
             elif self.current_role == "diplomatic_representative":
@@ -1714,6 +1786,7 @@ class LegislativeBranch:
     def __init__(self):
         self.senate = Senate()
         self.house = House()
+        self.votes = VoteEngine(senate=self.senate.members, house=self.house.members)
         self.current_legislation = []
         self.committees = []
         self.legislative_agenda = []
@@ -1733,7 +1806,7 @@ class LegislativeBranch:
         self.process_legislative_coordination(world_state, political_system)
         
         # Generate random legislative events
-        if random.random() < 0.12:  # 12% chance per turn
+        if political_system.scheduler.is_due("legislative_event"):
             self.generate_legislative_event(world_state, political_system)
     
     def process_legislative_coordination(self, world_state, political_system):
@@ -1845,6 +1918,15 @@ class LegislativeBranch:
             else:
                 print(f"      🛡️  Scandal contained")
     
+    def apply_seat_swing(self, party, share):
+        """Hand `share` of the other party's seats in each chamber to `party`"""
+        for chamber in (self.senate, self.house):
+            members = chamber.members
+            opposition = sorted(members.by_party[1 - PARTIES.index(party)])
+            for index in random.sample(opposition, int(len(opposition) * share)):
+                members.set_party(index, party)
+            chamber.majority_party, chamber.majority_seats = members.majority()
+    
     def generate_random_members(self):
         """Generate random congressional members"""
         # Generate random Senate members
@@ -1863,7 +1945,7 @@ class Senate:
         self.majority_seats = 50
         self.total_seats = 100
         self.current_legislation = []
-        self.members = {}
+        self.members = MemberTable(seat_field="seat")
         self.committees = []
         
     def set_majority(self, party, seats):
@@ -1872,65 +1954,26 @@ class Senate:
         self.majority_seats = seats
     
     def generate_random_members(self):
-        """Generate random Senate members"""
-        # Generate 100 senators (2 per state)
-        states = [
-            "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado", "Connecticut",
-            "Delaware", "Florida", "Georgia", "Hawaii", "Idaho", "Illinois", "Indiana", "Iowa",
-            "Kansas", "Kentucky", "Louisiana", "Maine", "Maryland", "Massachusetts", "Michigan",
-            "Minnesota", "Mississippi", "Missouri", "Montana", "Nebraska", "Nevada", "New Hampshire",
-            "New Jersey", "New Mexico", "New York", "North Carolina", "North Dakota", "Ohio",
-            "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina", "South Dakota",
-            "Tennessee", "Texas", "Utah", "Vermont", "Virginia", "Washington", "West Virginia",
-            "Wisconsin", "Wyoming"
-        ]
-        
-        for state in states:
-            # Determine party based on current majority
-            if random.random() < 0.6:  # 60% chance of majority party
-                party = self.majority_party
-            else:
-                party = "Republican" if self.majority_party == "Democrat" else "Democrat"
-            
-            # Generate random senator
-            first_names = [
-                "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph",
-                "Thomas", "Christopher", "Charles", "Daniel", "Matthew", "Anthony", "Mark",
-                "Donald", "Steven", "Paul", "Andrew", "Joshua", "Kenneth", "Kevin", "Brian",
-                "Sarah", "Jennifer", "Jessica", "Amanda", "Melissa", "Nicole", "Stephanie",
-                "Rebecca", "Laura", "Michelle", "Kimberly", "Amy", "Angela", "Lisa", "Heather"
-            ]
-            
-            last_names = [
-                "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-                "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
-                "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson"
-            ]
-            
-            senator = {
-                "name": f"{random.choice(first_names)} {random.choice(last_names)}",
-                "state": state,
-                "party": party,
-                "experience": random.randint(5, 30),
-                "effectiveness": random.uniform(0.5, 0.9),
-                "loyalty": random.uniform(0.7, 1.0),
-                "committee_assignments": random.randint(1, 4)
-            }
-            
-            self.members[state] = senator
+        """Generate random Senate members (two per state)"""
+        self.members.clear()
+        opposition = other_party(self.majority_party)
+        for state in US_STATES:
+            for seat in (1, 2):
+                # Determine party based on current majority
+                party = self.majority_party if random.random() < 0.6 else opposition  # 60% chance of majority party
+                self.members.add(
+                    random_member_name(), state, f"{state} Seat {seat}", party,
+                    experience=random.randint(5, 30),
+                    effectiveness=random.uniform(0.5, 0.9),
+                    loyalty=random.uniform(0.7, 1.0),
+                    committee_assignments=random.randint(1, 4)
+                )
         
         # Update majority based on generated members
-        democrat_count = sum(1 for member in self.members.values() if member["party"] == "Democrat")
-        republican_count = 100 - democrat_count
+        self.majority_party, self.majority_seats = self.members.majority()
+        self.total_seats = len(self.members)
         
-        if democrat_count > republican_count:
-            self.majority_party = "Democrat"
-            self.majority_seats = democrat_count
-        else:
-            self.majority_party = "Republican"
-            self.majority_seats = republican_count
-        
-        print(f"   🏛️  Senate: {self.majority_party} majority ({self.majority_seats}/100)")
+        print(f"   🏛️  Senate: {self.majority_party} majority ({self.majority_seats}/{self.total_seats})")
     
     def process_turn(self, world_state, political_system):
         """Process Senate actions for one turn with D20 integration. Returns True if the chamber had an effective turn."""
@@ -1967,7 +2010,7 @@ class House:
         self.majority_seats = 218
         self.total_seats = 435
         self.current_legislation = []
-        self.members = {}
+        self.members = MemberTable(seat_field="district")
         self.committees = []
         
     def set_majority(self, party, seats):
@@ -1977,53 +2020,25 @@ class House:
     
     def generate_random_members(self):
         """Generate random House members"""
-        # Generate 435 representatives
+        # Generate 435 representatives; districts are dealt out to the states in turn
+        self.members.clear()
+        opposition = other_party(self.majority_party)
         for district in range(1, 436):
             # Determine party based on current majority
-            if random.random() < 0.55:  # 55% chance of majority party
-                party = self.majority_party
-            else:
-                party = "Republican" if self.majority_party == "Democrat" else "Democrat"
-            
-            # Generate random representative
-            first_names = [
-                "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph",
-                "Thomas", "Christopher", "Charles", "Daniel", "Matthew", "Anthony", "Mark",
-                "Donald", "Steven", "Paul", "Andrew", "Joshua", "Kenneth", "Kevin", "Brian",
-                "Sarah", "Jennifer", "Jessica", "Amanda", "Melissa", "Nicole", "Stephanie",
-                "Rebecca", "Laura", "Michelle", "Kimberly", "Amy", "Angela", "Lisa", "Heather"
-            ]
-            
-            last_names = [
-                "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-                "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
-                "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson"
-            ]
-            
-            representative = {
-                "name": f"{random.choice(first_names)} {random.choice(last_names)}",
-                "district": f"District_{district}",
-                "party": party,
-                "experience": random.randint(2, 25),
-                "effectiveness": random.uniform(0.4, 0.8),
-                "loyalty": random.uniform(0.6, 1.0),
-                "committee_assignments": random.randint(1, 3)
-            }
-            
-            self.members[f"District_{district}"] = representative
+            party = self.majority_party if random.random() < 0.55 else opposition  # 55% chance of majority party
+            self.members.add(
+                random_member_name(), US_STATES[(district - 1) % len(US_STATES)], f"District_{district}", party,
+                experience=random.randint(2, 25),
+                effectiveness=random.uniform(0.4, 0.8),
+                loyalty=random.uniform(0.6, 1.0),
+                committee_assignments=random.randint(1, 3)
+            )
         
         # Update majority based on generated members
-        democrat_count = sum(1 for member in self.members.values() if member["party"] == "Democrat")
-        republican_count = 435 - democrat_count
+        self.majority_party, self.majority_seats = self.members.majority()
+        self.total_seats = len(self.members)
         
-        if democrat_count > republican_count:
-            self.majority_party = "Democrat"
-            self.majority_seats = democrat_count
-        else:
-            self.majority_party = "Republican"
-            self.majority_seats = republican_count
-        
-        print(f"   🏛️  House: {self.majority_party} majority ({self.majority_seats}/435)")
+        print(f"   🏛️  House: {self.majority_party} majority ({self.majority_seats}/{self.total_seats})")
     
     def process_turn(self, world_state, political_system):
         """Process House actions for one turn with D20 integration. Returns True if the chamber had an effective turn."""
@@ -2069,13 +2084,13 @@ class JudicialBranch:
         self.process_federal_cases(world_state, political_system)
         
         # Generate random judicial events
-        if random.random() < 0.08:  # 8% chance per turn
+        if political_system.scheduler.is_due("judicial_event"):
             self.generate_judicial_event(world_state, political_system)
     
     def process_federal_cases(self, world_state, political_system):
         """Process federal court cases with D20 system"""
         # Generate new cases
-        if random.random() < 0.1:  # 10% chance per turn
+        if political_system.scheduler.is_due("federal_case"):
             self.generate_new_case(world_state, political_system)
         
         # Process existing cases
@@ -2249,11 +2264,11 @@ class SupremeCourt:
     def process_turn(self, world_state, political_system):
         """Process Supreme Court actions for one turn with D20 integration"""
         # Court decisions based on composition
-        if random.random() < 0.05:  # 5% chance per turn
+        if political_system.scheduler.is_due("court_decision"):
             self.issue_decision(world_state, political_system)
         
         # Generate random court events
-        if random.random() < 0.06:  # 6% chance per turn
+        if political_system.scheduler.is_due("court_event"):
             self.generate_court_event(world_state, political_system)
     
     def issue_decision(self, world_state, political_system):
@@ -2487,16 +2502,16 @@ class FederalAgencies:
     
     def process_turn(self, world_state, political_system):
         """Process federal agency actions for one turn with D20 integration"""
-        # Process each agency
-        for agency_name, agency_data in self.agencies.items():
-            if random.random() < 0.15:  # 15% chance per turn
-                self.process_agency_action(agency_name, agency_data, world_state, political_system)
+        # Process each agency due to act
+        for agency_name in political_system.scheduler.due("agency"):
+            if agency_name in self.agencies:
+                self.process_agency_action(agency_name, self.agencies[agency_name], world_state, political_system)
         
         # Process inter-agency coordination
         self.process_inter_agency_coordination(world_state, political_system)
         
         # Generate random agency events
-        if random.random() < 0.1:  # 10% chance per turn
+        if political_system.scheduler.is_due("agency_event"):
             self.generate_agency_event(world_state, political_system)
     
     def process_agency_action(self, agency_name, agency_data, world_state, political_system):
@@ -2527,7 +2542,7 @@ class FederalAgencies:
     
     def process_inter_agency_coordination(self, world_state, political_system):
         """Process inter-agency coordination with D20 system"""
-        if random.random() < 0.2:  # 20% chance per turn
+        if political_system.scheduler.is_due("agency_coordination"):
             # Roll D20 for coordination success
             result, total, roll = political_system.roll_d20(
                 modifier=2,  # Base coordination bonus
@@ -2715,16 +2730,16 @@ class PoliticalParties:
     
     def process_turn(self, world_state, political_system):
         """Process political party actions for one turn with D20 integration"""
-        # Process each party
-        for party_name, party_data in self.parties.items():
-            if random.random() < 0.12:  # 12% chance per turn
-                self.process_party_action(party_name, party_data, world_state, political_system)
+        # Process each party due to act
+        for party_name in political_system.scheduler.due("party"):
+            if party_name in self.parties:
+                self.process_party_action(party_name, self.parties[party_name], world_state, political_system)
         
         # Process party competition
         self.process_party_competition(world_state, political_system)
         
         # Generate random party events
-        if random.random() < 0.08:  # 8% chance per turn
+        if political_system.scheduler.is_due("party_event"):
             self.generate_party_event(world_state, political_system)
     
     def process_party_action(self, party_name, party_data, world_state, political_system):
@@ -2754,7 +2769,7 @@ class PoliticalParties:
     
     def process_party_competition(self, world_state, political_system):
         """Process party competition with D20 system"""
-        if random.random() < 0.15:  # 15% chance per turn
+        if political_system.scheduler.is_due("party_competition"):
             # Roll D20 for competition outcome
             result, total, roll = political_system.roll_d20(
                 modifier=0,
@@ -2862,6 +2877,12 @@ class PoliticalParties:
                 print(f"      ❌ Grassroots movement failed for {party_name}")
                 party_data["grassroots_support"] = max(0.2, party_data["grassroots_support"] - 0.02)
 
+# Share of the losing party's seats in each chamber that flip to the winner
+ELECTION_SEAT_SWING = {
+    "landslide_victory": 0.08, "victory": 0.04, "narrow_victory": 0.02,
+    "defeat": 0.04, "landslide_defeat": 0.08
+}
+
 class ElectionSystem:
     """Election System with realistic timing and D20 integration"""
     
@@ -3065,15 +3086,15 @@ class ElectionSystem:
     
     def process_turn(self, world_state, political_system):
         """Process election system for one turn with D20 integration"""
-        # Check if election should happen
-        if self.days_until_next_election() <= 0:
+        # Election day is a scheduler watch on the calendar
+        if political_system.scheduler.is_due("election_day"):
             self.hold_election(world_state, political_system)
         
         # Update campaign dynamics
         self.update_campaigns(world_state)
         
         # Generate campaign events
-        if random.random() < 0.15:  # 15% chance per turn
+        if political_system.scheduler.is_due("campaign_event"):
             self.generate_campaign_event(world_state, political_system)
     
     def hold_election(self, world_state, political_system):
@@ -3159,6 +3180,14 @@ class ElectionSystem:
         # Determine which party wins
         current_party = political_system.executive_branch.president.party
         
+        # Congressional seats swing with the result; the vote engine picks up the new roster
+        incumbent = "Democrat" if current_party == "Democratic" else "Republican"
+        winner = incumbent if outcome in ["landslide_victory", "victory", "narrow_victory"] else other_party(incumbent)
+        political_system.legislative_branch.apply_seat_swing(winner, ELECTION_SEAT_SWING.get(outcome, 0.0))
+        senate, house = political_system.legislative_branch.senate, political_system.legislative_branch.house
+        print(f"   🗳️  Congress: {senate.majority_party} Senate ({senate.majority_seats}/{senate.total_seats}), "
+              f"{house.majority_party} House ({house.majority_seats}/{house.total_seats})")
+        
         if outcome in ["landslide_victory", "victory", "narrow_victory"]:
             # Incumbent party wins
             if current_party == "Democratic":
@@ -3298,7 +3327,7 @@ class LegislationSystem:
     def process_turn(self, world_state, political_system):
         """Process legislation for one turn with D20 integration"""
         # Generate new legislation
-        if random.random() < 0.1:  # 10% chance per turn
+        if political_system.scheduler.is_due("new_legislation"):
             self.generate_new_legislation(world_state, political_system)
         
         # Process active bills
@@ -3354,60 +3383,72 @@ class LegislationSystem:
         }
         
         self.active_bills.append(bill)
+        political_system.scheduler.once("bills", bill, BILL_STAGE_RATES["draft"])
     
     def process_active_bills(self, world_state, political_system):
         """Process active bills and determine outcomes"""
-        for bill in self.active_bills[:]:
+        committee_votes = []
+        floor_votes = []
+        # Each bill is scheduled for the turn its next step comes up
+        for bill in political_system.scheduler.due("bills"):
             if bill["status"] == "draft":
                 # Bill moves to committee
-                if random.random() < 0.3:  # 30% chance per turn
-                    bill["status"] = "committee"
-                    print(f"   📋 Bill moved to committee: {bill['type']}")
+                bill["status"] = "committee"
+                political_system.scheduler.once("bills", bill, BILL_STAGE_RATES["committee"])
+                print(f"   📋 Bill moved to committee: {bill['type']}")
             
             elif bill["status"] == "committee":
                 # Committee vote
-                if random.random() < 0.2:  # 20% chance per turn
-                    self.hold_committee_vote(bill, world_state, political_system)
+                committee_votes.append(bill)
             
             elif bill["status"] == "floor_vote":
                 # Floor vote
-                if random.random() < 0.15:  # 15% chance per turn
-                    self.hold_floor_vote(bill, world_state, political_system)
-    
-    def hold_committee_vote(self, bill, world_state, political_system):
-        """Hold a committee vote on a bill"""
-        # Roll D20 for committee success
-        modifier = 2 if bill["sponsor_party"] == "Republican" else 0  # Republican advantage in committees
-        result, total, roll = political_system.roll_d20(
-            modifier=modifier,
-            difficulty_class=14,
-            context=f"committee_vote_{bill['type'].lower().replace(' ', '_')}"
-        )
-        
-        if result in [D20Result.SUCCESS, D20Result.CRITICAL_SUCCESS]:
+                floor_votes.append(bill)
+        
+        # Every vote this turn is resolved in one pass over the member propensities
+        votes = political_system.legislative_branch.votes
+        if committee_votes:
+            tallies = votes.resolve([self.vote_profile(bill) for bill in committee_votes], committee=True)
+            for bill, tally in zip(committee_votes, tallies):
+                self.hold_committee_vote(bill, world_state, political_system, tally)
+        if floor_votes:
+            tallies = votes.resolve([self.vote_profile(bill) for bill in floor_votes])
+            for bill, tally in zip(floor_votes, tallies):
+                self.hold_floor_vote(bill, world_state, political_system, tally)
+    
+    def vote_profile(self, bill):
+        """(sponsor party, merit) the vote engine decides a bill on"""
+        # Members who break from the party line back the bill on its merits
+        return bill["sponsor_party"], 1.0 - bill["controversy_level"]
+    
+    def hold_committee_vote(self, bill, world_state, political_system, tallies=None):
+        """Hold a committee vote on a bill in both chambers"""
+        if tallies is None:
+            tallies = political_system.legislative_branch.votes.resolve([self.vote_profile(bill)], committee=True)[0]
+        bill["committee_votes"] = tallies
+        
+        if all(yes > no for yes, no in tallies.values()):
             bill["status"] = "floor_vote"
+            political_system.scheduler.once("bills", bill, BILL_STAGE_RATES["floor_vote"])
             print(f"   📋 Committee approved: {bill['type']} moves to floor vote")
         else:
             bill["status"] = "defeated"
             print(f"   📋 Committee rejected: {bill['type']}")
     
-    def hold_floor_vote(self, bill, world_state, political_system):
-        """Hold a floor vote on a bill"""
-        # Roll D20 for floor vote success
-        modifier = 1 if bill["sponsor_party"] == "Republican" else -1  # Party control matters
-        result, total, roll = political_system.roll_d20(
-            modifier=modifier,
-            difficulty_class=16,
-            context=f"floor_vote_{bill['type'].lower().replace(' ', '_')}"
-        )
+    def hold_floor_vote(self, bill, world_state, political_system, tallies=None):
+        """Hold a floor vote on a bill in both chambers"""
+        if tallies is None:
+            tallies = political_system.legislative_branch.votes.resolve([self.vote_profile(bill)])[0]
+        bill["floor_votes"] = tallies
+        (senate_yes, senate_no), (house_yes, house_no) = tallies["senate"], tallies["house"]
         
-        if result in [D20Result.SUCCESS, D20Result.CRITICAL_SUCCESS]:
+        if senate_yes > senate_no and house_yes > house_no:
             bill["status"] = "passed"
             self.apply_bill_effects(bill, world_state, political_system)
-            print(f"   📋 Bill passed: {bill['type']}")
+            print(f"   📋 Bill passed: {bill['type']} (Senate {senate_yes}-{senate_no}, House {house_yes}-{house_no})")
         else:
             bill["status"] = "defeated"
-            print(f"   📋 Bill defeated: {bill['type']}")
+            print(f"   📋 Bill defeated: {bill['type']} (Senate {senate_yes}-{senate_no}, House {house_yes}-{house_no})")
     
     def apply_bill_effects(self, bill, world_state, political_system):
         """Apply the effects of a passed bill to the world state"""
@@ -3448,7 +3489,7 @@ class PublicOpinionSystem:
         self.update_public_opinion(world_state, political_system)
         
         # Generate opinion events
-        if random.random() < 0.1:  # 10% chance per turn
+        if political_system.scheduler.is_due("opinion_event"):
             self.generate_opinion_event(world_state, political_system)
     
     def update_public_opinion(self, world_state, political_system):
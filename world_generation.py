@@ -6,6 +6,8 @@ from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 
+from relationship_graph import RelationshipGraph
+
 class LocationType(Enum):
     GOVERNMENT_FACILITY = "government_facility"
     RESEARCH_LAB = "research_lab"
@@ -134,6 +136,10 @@ class TravelersWorldGenerator:
         self.locations = []
         self.npcs = []
         self.world_events = []
+        # Social graph over NPC contacts (and host bonds layered on by the AI teams)
+        self.relationship_graph = RelationshipGraph()
+        self._npc_index = {}
+        self.host_bonds = {}  # host NPC id -> {contact id: bond weight}, replayed when the graph is rebuilt
         # Track unique identifiers to avoid repetitive content
         self._used_npc_names = set()
         
@@ -776,6 +782,40 @@ class TravelersWorldGenerator:
             num_contacts = min(random.randint(2, 6), len(potential_contacts))
             contacts = random.sample(potential_contacts, num_contacts)
             npc.contacts = [contact.id for contact in contacts]
+        
+        self._build_relationship_graph()
+    
+    def _build_relationship_graph(self):
+        """Index NPCs by id and load their contact lists into the relationship graph"""
+        self.relationship_graph = RelationshipGraph()
+        self._npc_index = {}
+        for npc in self.npcs:
+            self._index_npc(npc)
+        for npc in self.npcs:
+            for contact_id in npc.contacts:
+                other = self._npc_index.get(contact_id)
+                if other is None:
+                    continue
+                # Knowing someone is mutual; same-faction ties run stronger
+                weight = 0.7 if other.faction == npc.faction else 0.4
+                if self.relationship_graph.weight(npc.id, contact_id, "contact", 0.0) < weight:
+                    self.relationship_graph.add_edge(npc.id, contact_id, "contact", weight)
+        for host_id, bonds in self.host_bonds.items():
+            self._add_host_bonds(host_id, bonds)
+    
+    def register_host_bonds(self, host_id: str, bonds: Dict[str, float]):
+        """Record a host's personal relationships and layer them onto the relationship graph"""
+        self.host_bonds[host_id] = dict(bonds)
+        self._add_host_bonds(host_id, bonds)
+    
+    def _add_host_bonds(self, host_id: str, bonds: Dict[str, float]):
+        self.relationship_graph.add_node(host_id, kind="host")
+        for contact_id, weight in bonds.items():
+            self.relationship_graph.add_edge(host_id, contact_id, "host_bond", weight)
+    
+    def _index_npc(self, npc: "TravelersNPC"):
+        self._npc_index[npc.id] = npc
+        self.relationship_graph.add_node(npc.id, kind="npc", group=npc.faction)
     
     def _calculate_distance(self, coord1: Tuple[float, float], coord2: Tuple[float, float]) -> float:
         """Calculate simple distance between coordinates"""
@@ -798,11 +838,39 @@ class TravelersWorldGenerator:
     
     def get_npc_by_id(self, npc_id: str) -> Optional[TravelersNPC]:
         """Get NPC by ID"""
+        npc = self._npc_index.get(npc_id)
+        if npc is not None:
+            return npc
+        # NPCs appended to self.npcs directly are picked up on first lookup
         for npc in self.npcs:
             if npc.id == npc_id:
+                self._index_npc(npc)
                 return npc
         return None
     
+    def get_npc_id_by_name(self, name: str) -> Optional[str]:
+        """Id of the NPC with this name (case-insensitive), or None"""
+        key = (name or "").strip().lower()
+        for npc in self.npcs:
+            if npc.name.lower() == key:
+                return npc.id
+        return None
+    
+    def get_npc_network(self, npc_id: str, hops: int = 2, faction: Optional[str] = None) -> List[TravelersNPC]:
+        """NPCs reachable from `npc_id` through at most `hops` contacts, nearest first"""
+        reach = self.relationship_graph.within_hops(npc_id, hops, edge_type=("contact", "host_bond"))
+        out = []
+        for other_id, _ in sorted(reach.items(), key=lambda item: item[1]):
+            npc = self._npc_index.get(other_id)
+            if npc is not None and (faction is None or npc.faction == faction):
+                out.append(npc)
+        return out
+    
+    def get_npcs_knowing(self, npc_id: str, faction: Optional[str] = None) -> List[TravelersNPC]:
+        """NPCs with a direct tie to `npc_id` (e.g. which Faction NPCs know a host)"""
+        known = dict.fromkeys(other_id for other_id, _, _ in self.relationship_graph.neighbors(npc_id, group=faction))
+        return [self._npc_index[other_id] for other_id in known if other_id in self._npc_index]
+    
     def get_world_summary(self) -> Dict[str, Any]:
         """Get summary of generated world"""
         return {
@@ -830,7 +898,8 @@ class TravelersWorldGenerator:
             "world_params": self.world_params,
             "locations": [asdict(loc) for loc in self.locations],
             "npcs": [asdict(npc) for npc in self.npcs],
-            "world_events": [asdict(event) for event in self.world_events]
+            "world_events": [asdict(event) for event in self.world_events],
+            "host_bonds": self.host_bonds
         }
         
         with open(filename, 'w') as f:
@@ -849,6 +918,8 @@ class TravelersWorldGenerator:
         self.locations = [TravelersLocation(**loc_data) for loc_data in save_data["locations"]]
         self.npcs = [TravelersNPC(**npc_data) for npc_data in save_data["npcs"]]
         self.world_events = [WorldEvent(**event_data) for event_data in save_data["world_events"]]
+        self.host_bonds = save_data.get("host_bonds", {})
+        self._build_relationship_graph()
 
 # Legacy World class for backward compatibility
 class World(TravelersWorldGenerator):